@@ -0,0 +1,98 @@
+"""
+Korpus Önbelleği Oluşturma Scripti
+==================================
+
+Dönem bazlı yasama kaynaklarını (kanun teklifleri, yazılı sorular, araştırma
+önergeleri) ayrıştırıp ikili önbelleğe yazar. Sonraki çalıştırmalarda
+update_fair_scores.py, rebuild_mps_collection.py ve diğer scriptler kaynak
+dosya değişmedikçe JSON/regex ayrıştırması yapmadan yükler.
+
+Loader'lar önbelleği eksik veya eski bulduğunda kendisi de yazar; bu script
+önbelleği deploy/cron öncesinde ısıtmak için kullanılır.
+
+Kullanım:
+    python build_corpus_cache.py
+    python build_corpus_cache.py --term 27 --term 28
+    python build_corpus_cache.py --force
+    python build_corpus_cache.py --term 24 --term 25 --workers 16
+"""
+
+import argparse
+import logging
+import time
+from pathlib import Path
+from typing import Optional
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from services.corpus_cache import is_cache_enabled
+from services.legislative_corpus import DATA_DIR, DEFAULT_TERM, get_corpus
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+
+def build_term(data_dir: Path, term: int, force: bool = False, workers: Optional[int] = None) -> dict:
+    """
+    Bir dönemin önbelleğini oluştur.
+
+    Args:
+        data_dir: Veri dizini
+        term: Yasama dönemi
+        force: True ise geçerli önbellek de yeniden yazılır
+        workers: Başlık ayrıştırma süreç sayısı (None ise CORPUS_PARSE_WORKERS env)
+
+    Returns:
+        dict: Kaynak -> 'cached' / 'built' / 'missing'
+    """
+    from fair_scoring import load_proposals_by_mp
+
+    corpus = get_corpus(data_dir, term)
+    if workers is not None:
+        corpus.parse_workers = workers
+    if force and corpus.cache is not None:
+        for source in ('law_proposals', 'questions', 'research'):
+            corpus.cache.entry_path(corpus.path(source)).unlink(missing_ok=True)
+
+    corpus.proposals
+    corpus.question_counts
+    corpus.research_counts
+    # Teklifler sınıflandırılarak yüklenir; sınıflar da önbelleğe girer
+    load_proposals_by_mp(corpus.path('law_proposals'))
+
+    status = {}
+    for source in ('law_proposals', 'questions', 'research'):
+        if not corpus.path(source).exists():
+            status[source] = 'missing'
+        else:
+            status[source] = 'cached' if source in corpus.cache_hits else 'built'
+    return status
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Yasama korpusu ikili önbelleği')
+    parser.add_argument('--data-dir', type=str, default=str(DATA_DIR), help='Veri dizini')
+    parser.add_argument('--term', type=int, action='append', help='Yasama dönemi (tekrarlanabilir)')
+    parser.add_argument('--force', action='store_true', help='Geçerli önbellekleri de yeniden oluştur')
+    parser.add_argument('--workers', type=int, help='Başlık ayrıştırma süreç sayısı (0 = CPU sayısı)')
+    args = parser.parse_args()
+
+    if not is_cache_enabled():
+        logger.error("❌ CORPUS_CACHE kapalı, önbellek yazılmaz")
+        return
+
+    workers = args.workers
+    if workers == 0:
+        workers = os.cpu_count() or 1
+
+    for term in args.term or [DEFAULT_TERM]:
+        start = time.perf_counter()
+        status = build_term(Path(args.data_dir), term, force=args.force, workers=workers)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        logger.info(f"💾 {term}. dönem ({elapsed_ms:.0f} ms): {status}")
+
+
+if __name__ == "__main__":
+    main()
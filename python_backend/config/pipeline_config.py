@@ -0,0 +1,59 @@
+"""
+Puanlama Pipeline Konfigürasyonu
+
+Toplu puanlama job'ının eşzamanlılık ayarları.
+Worker sayısı ve aşama (stage) bazlı eşzamanlılık limitleri bu modülden yönetilir.
+"""
+
+from dataclasses import dataclass
+from typing import Dict
+import os
+
+
+@dataclass
+class PipelineConfig:
+    """Puanlama job'ı eşzamanlılık konfigürasyonu."""
+
+    # Aynı anda işlenecek vekil sayısı (1 = seri çalışma)
+    workers: int = 1
+
+    # Aşama bazlı eşzamanlılık limitleri (pipeline modunda worker havuzu boyutu)
+    news_concurrency: int = 4       # Google News araması
+    scrape_concurrency: int = 8     # Makale içeriği çekme
+    analysis_concurrency: int = 4   # Gemini analizi
+    write_concurrency: int = 4      # Firestore yazma
+
+    # Aşamalı pipeline (producer/consumer) modu
+    pipelined: bool = False
+    queue_size: int = 32            # Aşamalar arası kuyruk kapasitesi (backpressure)
+
+    @property
+    def is_concurrent(self) -> bool:
+        """Eşzamanlı mod aktif mi?"""
+        return self.workers > 1 or self.pipelined
+
+    def stage_limits(self) -> Dict[str, int]:
+        """Aşama adı -> eşzamanlılık limiti."""
+        return {
+            'news': max(1, self.news_concurrency),
+            'scrape': max(1, self.scrape_concurrency),
+            'analysis': max(1, self.analysis_concurrency),
+            'write': max(1, self.write_concurrency),
+        }
+
+    @classmethod
+    def from_env(cls) -> "PipelineConfig":
+        """Environment variables'dan config oluştur."""
+        return cls(
+            workers=int(os.getenv("SCORING_WORKERS", "1")),
+            news_concurrency=int(os.getenv("SCORING_NEWS_CONCURRENCY", "4")),
+            scrape_concurrency=int(os.getenv("SCORING_SCRAPE_CONCURRENCY", "8")),
+            analysis_concurrency=int(os.getenv("SCORING_ANALYSIS_CONCURRENCY", "4")),
+            write_concurrency=int(os.getenv("SCORING_WRITE_CONCURRENCY", "4")),
+            pipelined=os.getenv("SCORING_PIPELINED", "false").lower() == "true",
+            queue_size=int(os.getenv("SCORING_QUEUE_SIZE", "32")),
+        )
+
+
+# Default global config instance
+default_pipeline_config = PipelineConfig()
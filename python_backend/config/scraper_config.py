@@ -6,7 +6,7 @@ Tüm timeout, retry ve diğer ayarlar bu modülden yönetilir.
 """
 
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, Tuple
 import os
 
 
@@ -21,14 +21,26 @@ class ScraperConfig:
     
     # Bekleme süreleri (saniye)
     page_load_wait: float = 2.0
-    rate_limit_wait: float = 0.5
+    rate_limit_wait: float = 0.5      # Host başına başlangıç istek aralığı
     scroll_wait: float = 0.5
     
+    # Uyarlanabilir hız (AIMD) sınırları: aralık bu değerler arasında ayarlanır
+    rate_limit_min_wait: float = 0.1
+    rate_limit_max_wait: float = 5.0
+    rate_limit_burst: int = 2
+    rate_limit_slow_latency: float = 5.0  # Bu süreden uzun yanıtlar hızı düşürür
+    
     # Scroll ayarları
     max_scroll_attempts: int = 10
     
     # Tarayıcı ayarları
     headless: bool = True
+    browser_max_pages: int = 4  # Paylaşılan tarayıcıda aynı anda açık sayfa (context) sınırı
+    
+    # Ağ profili: iptal edilecek kaynak türleri ve üçüncü taraf takip istekleri
+    block_resource_types: Tuple[str, ...] = ("image", "media", "font")
+    block_trackers: bool = True
+    network_baseline_ms: float = 0.0  # Profil kapalıyken ölçülen ortalama sayfa yüklemesi (rapor için)
     
     # URL ayarları
     base_url: str = "https://www.tbmm.gov.tr"
@@ -37,10 +49,21 @@ class ScraperConfig:
     max_retries: int = 3
     retry_delay: float = 1.0
     retry_backoff_multiplier: float = 2.0
+    retry_max_delay: float = 30.0       # Tek bir bekleme için üst sınır (saniye)
+    
+    # Devre kesici: host başına bu kadar ardışık hatada istekler bekletilir
+    circuit_failure_threshold: int = 5
+    circuit_reset_timeout: float = 60.0  # Devre açıkken bekleme (saniye)
     
     # Detay çekme limiti
     max_details_fetch: int = 600
     
+    # Detay sayfalarını paralel çeken sayfa sayısı, 1 = seri (tek tarayıcı, en fazla browser_max_pages)
+    detail_workers: int = 1
+    
+    # Sonuç sayfalarını HTTP ile çekerken eşzamanlı istek (ve bağlantı havuzu) sayısı
+    http_workers: int = 4
+    
     @property
     def mp_list_url(self) -> str:
         """Milletvekili liste URL'i."""
@@ -51,9 +74,22 @@ class ScraperConfig:
         """Environment variables'dan config oluştur."""
         return cls(
             headless=os.getenv("SCRAPER_HEADLESS", "true").lower() == "true",
+            browser_max_pages=int(os.getenv("SCRAPER_BROWSER_MAX_PAGES", "4")),
+            block_resource_types=tuple(
+                t.strip() for t in os.getenv("SCRAPER_BLOCK_RESOURCES", "image,media,font").split(",") if t.strip()
+            ),
+            block_trackers=os.getenv("SCRAPER_BLOCK_TRACKERS", "true").lower() == "true",
+            network_baseline_ms=float(os.getenv("SCRAPER_NETWORK_BASELINE_MS", "0")),
             default_timeout=int(os.getenv("SCRAPER_DEFAULT_TIMEOUT", "30000")),
             max_retries=int(os.getenv("SCRAPER_MAX_RETRIES", "3")),
+            retry_delay=float(os.getenv("SCRAPER_RETRY_DELAY", "1.0")),
+            circuit_failure_threshold=int(os.getenv("SCRAPER_CIRCUIT_THRESHOLD", "5")),
+            circuit_reset_timeout=float(os.getenv("SCRAPER_CIRCUIT_RESET", "60")),
             rate_limit_wait=float(os.getenv("SCRAPER_RATE_LIMIT", "0.5")),
+            rate_limit_min_wait=float(os.getenv("SCRAPER_RATE_LIMIT_MIN", "0.1")),
+            rate_limit_max_wait=float(os.getenv("SCRAPER_RATE_LIMIT_MAX", "5.0")),
+            http_workers=int(os.getenv("SCRAPER_HTTP_WORKERS", "4")),
+            detail_workers=int(os.getenv("SCRAPER_DETAIL_WORKERS", "1")),
         )
 
 
@@ -0,0 +1,149 @@
+"""
+Depolama Konfigürasyonu
+
+Job'ların hangi depolama backend'ine yazacağını belirler:
+- firestore: Canlı Firestore (varsayılan, serviceAccountKey.json gerekir)
+- sqlite: Yerel SQLite dosyası (kimlik bilgisi gerektirmez)
+- memory: Bellek içi SQLite (testler ve tek process'lik profil koşuları)
+
+Tüm servisler ve scriptler client'ı `get_storage_client()` ile alır; dönen
+nesne her backend'de aynı Firestore API alt kümesini sağlar.
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional
+import os
+
+try:
+    from google.cloud.firestore import SERVER_TIMESTAMP
+except ImportError:  # pragma: no cover - firebase_admin kurulu değilse
+    SERVER_TIMESTAMP = None
+
+
+BACKENDS = ('firestore', 'sqlite', 'memory')
+
+DEFAULT_SQLITE_PATH = Path(__file__).parent.parent / "local_db" / "analytica.db"
+
+# Firestore'un tek batch'te izin verdiği maksimum işlem sayısı (tüm backend'ler uyar)
+MAX_BATCH_SIZE = 500
+
+
+@dataclass
+class StorageConfig:
+    """Depolama backend konfigürasyonu."""
+
+    backend: str = 'firestore'
+    sqlite_path: Optional[str] = None     # sqlite backend'i için dosya yolu
+
+    def __post_init__(self):
+        self.backend = self.backend.lower()
+        if self.backend not in BACKENDS:
+            raise ValueError(f"Geçersiz depolama backend'i: {self.backend} ({', '.join(BACKENDS)})")
+
+    @property
+    def is_local(self) -> bool:
+        """Firestore dışında bir backend mi?"""
+        return self.backend != 'firestore'
+
+    def resolved_sqlite_path(self) -> str:
+        """Backend'in kullanacağı SQLite yolu (memory için ':memory:')."""
+        if self.backend == 'memory':
+            return ':memory:'
+        path = Path(self.sqlite_path) if self.sqlite_path else DEFAULT_SQLITE_PATH
+        if not path.is_absolute():
+            path = Path(__file__).parent.parent / path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return str(path)
+
+    @classmethod
+    def from_env(cls) -> "StorageConfig":
+        """Environment variables'dan config oluştur."""
+        return cls(
+            backend=os.getenv("STORAGE_BACKEND", "firestore"),
+            sqlite_path=os.getenv("STORAGE_SQLITE_PATH") or None,
+        )
+
+
+# Aktif konfigürasyon (None ise environment'tan okunur)
+_active_config: Optional[StorageConfig] = None
+
+# Yerel backend client'ları (aynı yol için tek instance)
+_local_clients: Dict[str, Any] = {}
+
+
+def get_storage_config() -> StorageConfig:
+    """Aktif depolama konfigürasyonunu döndür."""
+    return _active_config or StorageConfig.from_env()
+
+
+def set_storage_config(config: Optional[StorageConfig]):
+    """
+    Aktif depolama konfigürasyonunu değiştir (örn. --storage CLI argümanı).
+
+    Args:
+        config: Yeni konfigürasyon (None ise tekrar environment'tan okunur)
+    """
+    global _active_config
+    _active_config = config
+
+
+def get_storage_client(config: Optional[StorageConfig] = None):
+    """
+    Konfigürasyona göre depolama client'ını döndür.
+
+    Args:
+        config: Depolama konfigürasyonu (None ise aktif konfigürasyon)
+
+    Returns:
+        firestore.Client veya LocalStore
+    """
+    config = config or get_storage_config()
+
+    if not config.is_local:
+        from config.firebase_config import get_firestore_client
+        return get_firestore_client()
+
+    from services.local_store import LocalStore
+
+    path = config.resolved_sqlite_path()
+    if path not in _local_clients:
+        _local_clients[path] = LocalStore(path)
+        print(f"💾 Yerel depolama kullanılıyor: {config.backend} ({path})")
+    return _local_clients[path]
+
+
+def test_storage_connection() -> bool:
+    """
+    Aktif depolama backend'inin bağlantısını test et.
+
+    Returns:
+        bool: Bağlantı başarılıysa True
+    """
+    config = get_storage_config()
+    if not config.is_local:
+        from config.firebase_config import test_connection
+        return test_connection()
+
+    try:
+        get_storage_client(config)
+        return True
+    except Exception as e:
+        print(f"❌ Yerel depolama açılamadı: {str(e)}")
+        return False
+
+
+def close_storage_connection():
+    """Açık depolama bağlantılarını kapat."""
+    if not get_storage_config().is_local:
+        from config.firebase_config import close_firebase_connection
+        close_firebase_connection()
+        return
+
+    for client in _local_clients.values():
+        client.close()
+    _local_clients.clear()
+
+
+# Default global config instance
+default_storage_config = StorageConfig()
@@ -11,14 +11,22 @@ Algoritma Kuralları:
 3. Hayalet Vekil Cezası - Sıfır aktivite = -15 puan
 """
 
+import hashlib
 import json
 import logging
 import re
+import unicodedata
 from pathlib import Path
 from dataclasses import dataclass, asdict
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 from collections import defaultdict
 
+from services.legislative_corpus import (
+    COMMISSION_ROLE_BONUS, PROPOSAL_CATEGORY_FIELD, get_corpus_for_file, get_mp_resolver,
+)
+from services.mp_name_resolver import MPNameResolver
+from services.scoring_kernel import ActivityTable, ScoringPolicy
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -96,27 +104,26 @@ OPPOSITION_WEIGHTS = ScoringWeights(
 )
 
 
+def weights_row(weights: ScoringWeights) -> List[float]:
+    """
+    ScoringWeights'i vektörel çekirdeğin sütun sırasına çevir.
+    
+    Komisyon bonusu hazır puan olarak eklendiği için ağırlığı 1'dir.
+    """
+    return [
+        weights.first_signature,
+        weights.support_signature,
+        weights.question,
+        weights.research,
+        1.0,
+        weights.news_weight,
+    ]
+
+
 # ============================================================================
 # YARDIMCI FONKSİYONLAR
 # ============================================================================
 
-def normalize_name(name: str) -> str:
-    """İsmi normalize et - Türkçe karakterleri ASCII'ye çevir."""
-    tr_map = {
-        'ı': 'I', 'İ': 'I', 'i': 'I',
-        'ğ': 'G', 'Ğ': 'G',
-        'ü': 'U', 'Ü': 'U',
-        'ş': 'S', 'Ş': 'S',
-        'ö': 'O', 'Ö': 'O',
-        'ç': 'C', 'Ç': 'C'
-    }
-    name = name.strip().upper()
-    for tr, en in tr_map.items():
-        name = name.replace(tr.upper(), en)
-        name = name.replace(tr, en)
-    return ' '.join(name.split())
-
-
 def get_scoring_strategy(party: str) -> Tuple[str, ScoringWeights]:
     """Parti bazlı puanlama stratejisi belirle."""
     party_upper = party.upper().strip()
@@ -127,22 +134,173 @@ def get_scoring_strategy(party: str) -> Tuple[str, ScoringWeights]:
         return "OPPOSITION", OPPOSITION_WEIGHTS
 
 
+# Vektörel adil puanlama politikası (calculate_fair_score ile aynı formül)
+FAIR_POLICY = ScoringPolicy(
+    name='fair',
+    weights=[weights_row(GOVERNMENT_WEIGHTS), weights_row(OPPOSITION_WEIGHTS)],
+    groups=('GOVERNMENT', 'OPPOSITION'),
+    ghost_penalty=[GOVERNMENT_WEIGHTS.ghost_penalty, OPPOSITION_WEIGHTS.ghost_penalty],
+    min_score=0.0,
+    decimals=1,
+    group_of=lambda party: get_scoring_strategy(party)[0],
+)
+
+
+# ============================================================================
+# TEKLİF SINIFLANDIRMA
+# ============================================================================
+
+PROPOSAL_PROCEDURAL = "procedural"
+PROPOSAL_OMNIBUS = "omnibus"
+PROPOSAL_REGULAR = "regular"
+
+def fold_turkish(text: str) -> str:
+    """
+    Metni Türkçe-duyarlı biçimde küçük harfe ve ASCII'ye katla.
+
+    'ı' önce 'i'ye çevrilir (ayrışımı yoktur), 'İ'.lower() ve NFKD ayrışımından
+    kalan birleşik işaretler ASCII kodlamasında düşer: 'IĞDIR' ve 'Iğdır' -> 'igdir'.
+    Tüm adımlar C seviyesinde çalışır.
+    """
+    return unicodedata.normalize('NFKD', text.replace('ı', 'i').lower()).encode('ascii', 'ignore').decode('ascii')
+
+
+class ProposalClassifier:
+    """
+    Prosedürel ve torba kanun tekliflerini tek geçişte ayıran derlenmiş sınıflandırıcı.
+
+    Tüm anahtar kelimeler Türkçe-katlanmış tek bir alternation regex'inde
+    birleştirilir; metin bir kez taranır ve ilk prosedürel eşleşmede durulur.
+    Sonuçlar (dönem, esas_no) anahtarıyla
+    önbelleğe alınır, böylece bir teklif kaç vekilin imzasını taşırsa taşısın
+    korpus yüklemesi başına bir kez sınıflandırılır.
+    """
+
+    def __init__(
+        self,
+        procedural_keywords: Sequence[str] = PROCEDURAL_KEYWORDS,
+        omnibus_keywords: Sequence[str] = OMNIBUS_KEYWORDS
+    ):
+        """
+        Args:
+            procedural_keywords: Prosedürel (0 puan) teklif anahtar kelimeleri
+            omnibus_keywords: Torba kanun anahtar kelimeleri
+        """
+        self.procedural_keywords = list(procedural_keywords)
+        self.omnibus_keywords = list(omnibus_keywords)
+        self._cache: Dict[Tuple[Optional[str], str], str] = {}
+
+        # Katlanmış anahtar kelime -> kategori (aynı kelime iki listedeyse prosedürel kazanır)
+        self._categories: Dict[str, str] = {}
+        for category, keywords in ((PROPOSAL_OMNIBUS, self.omnibus_keywords),
+                                   (PROPOSAL_PROCEDURAL, self.procedural_keywords)):
+            for keyword in keywords:
+                folded = fold_turkish(keyword).strip()
+                if folded:
+                    self._categories[folded] = category
+
+        # Grupsuz düz alternation: sre'nin literal önek optimizasyonu devrede kalır
+        alternatives = sorted(self._categories, key=len, reverse=True)
+        self._pattern = re.compile('|'.join(map(re.escape, alternatives))) if alternatives else None
+
+    @property
+    def signature(self) -> str:
+        """Anahtar kelime kümesinin özeti (önbelleğe alınmış sınıfların geçerliliği için)."""
+        payload = json.dumps(sorted(self._categories.items()), ensure_ascii=False)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+
+    def classify_text(self, summary: str) -> str:
+        """
+        Teklif özetini sınıflandır (prosedürel, torba veya normal).
+
+        Prosedürel eşleşme torba eşleşmesine göre önceliklidir.
+        """
+        if not summary or self._pattern is None:
+            return PROPOSAL_REGULAR
+
+        category = PROPOSAL_REGULAR
+        for match in self._pattern.finditer(fold_turkish(summary)):
+            category = self._categories[match.group()]
+            if category == PROPOSAL_PROCEDURAL:
+                break
+        return category
+
+    def classify(self, proposal: dict) -> str:
+        """
+        Teklif kaydını sınıflandır; sonuç kayıtta ve esas_no önbelleğinde tutulur.
+
+        Args:
+            proposal: 'summary', 'esas_no' ve 'period' alanlı teklif kaydı
+
+        Returns:
+            str: PROPOSAL_PROCEDURAL, PROPOSAL_OMNIBUS veya PROPOSAL_REGULAR
+        """
+        category = proposal.get(PROPOSAL_CATEGORY_FIELD)
+        if category is not None:
+            return category
+
+        esas_no = proposal.get('esas_no')
+        key = (proposal.get('period'), esas_no)
+        if esas_no and key in self._cache:
+            category = self._cache[key]
+        else:
+            category = self.classify_text(proposal.get('summary', ''))
+            if esas_no:
+                self._cache[key] = category
+
+        proposal[PROPOSAL_CATEGORY_FIELD] = category
+        return category
+
+    def classify_corpus(self, proposals: Iterable[dict]) -> Dict[str, int]:
+        """
+        Korpustaki tüm teklifleri bir kez sınıflandır.
+
+        Returns:
+            Dict[kategori, teklif sayısı]
+        """
+        counts: Dict[str, int] = defaultdict(int)
+        for proposal in proposals:
+            counts[self.classify(proposal)] += 1
+        return dict(counts)
+
+
+_classifier_instance: Optional[ProposalClassifier] = None
+
+
+def get_proposal_classifier() -> ProposalClassifier:
+    """Varsayılan anahtar kelimelerle sınıflandırıcı singleton'ı."""
+    global _classifier_instance
+    if _classifier_instance is None:
+        _classifier_instance = ProposalClassifier()
+    return _classifier_instance
+
+
+def configure_proposal_classifier(
+    procedural_keywords: Optional[Sequence[str]] = None,
+    omnibus_keywords: Optional[Sequence[str]] = None
+) -> ProposalClassifier:
+    """
+    Anahtar kelime listelerini değiştir (None verilen liste varsayılanda kalır).
+
+    Yeni sınıflandırıcı boş önbellekle başlar; daha önce sınıflandırılmış kayıtlar
+    yeniden yüklenmelidir.
+    """
+    global _classifier_instance
+    _classifier_instance = ProposalClassifier(
+        PROCEDURAL_KEYWORDS if procedural_keywords is None else procedural_keywords,
+        OMNIBUS_KEYWORDS if omnibus_keywords is None else omnibus_keywords,
+    )
+    return _classifier_instance
+
+
 def is_procedural_proposal(summary: str) -> bool:
     """Uluslararası anlaşma/prosedürel teklif mi?"""
-    summary_upper = summary.upper()
-    for keyword in PROCEDURAL_KEYWORDS:
-        if keyword.upper() in summary_upper:
-            return True
-    return False
+    return get_proposal_classifier().classify_text(summary) == PROPOSAL_PROCEDURAL
 
 
 def is_omnibus_proposal(summary: str) -> bool:
-    """Torba kanun mu?"""
-    summary_upper = summary.upper()
-    for keyword in OMNIBUS_KEYWORDS:
-        if keyword.upper() in summary_upper:
-            return True
-    return False
+    """Torba kanun mu? (Prosedürel olmayan ve torba anahtar kelimesi içeren)"""
+    return get_proposal_classifier().classify_text(summary) == PROPOSAL_OMNIBUS
 
 
 # ============================================================================
@@ -195,11 +353,12 @@ def calculate_fair_score(
     treaty_count = 0
     omnibus_count = 0
     
+    classifier = get_proposal_classifier()
     for prop in proposals:
-        summary = prop.get('summary', '')
-        if is_procedural_proposal(summary):
+        category = classifier.classify(prop)
+        if category == PROPOSAL_PROCEDURAL:
             treaty_count += 1
-        elif is_omnibus_proposal(summary):
+        elif category == PROPOSAL_OMNIBUS:
             omnibus_count += 1
             valid_proposals.append(prop)  # Torba da sayılır ama tek olarak
         else:
@@ -272,6 +431,53 @@ def calculate_fair_score(
     )
 
 
+def build_fair_activity_table(
+    mps: List[dict],
+    mp_proposals: Dict[str, List[dict]],
+    mp_questions: Dict[str, int],
+    mp_research: Dict[str, int],
+    commission_bonuses: Optional[Dict[str, int]] = None,
+    news_score: float = 5.0,
+    resolver: Optional[MPNameResolver] = None,
+) -> ActivityTable:
+    """
+    FAIR_POLICY için sütunsal aktivite tablosu oluştur.
+    
+    Prosedürel teklifler calculate_fair_score'daki gibi filtrelenir.
+    
+    Args:
+        mps: {'name': ..., 'party': ..., 'city': ...} vekil kayıtları
+        mp_proposals, mp_questions, mp_research: Korpus anahtarı bazlı veriler
+        commission_bonuses: Korpus anahtarı -> komisyon bonusu
+        news_score: Tüm vekiller için haber skoru
+        resolver: Vekil anahtarlarını veren çözümleyici (varsayılan paylaşılan);
+            aynı isimli vekiller seçim çevreleriyle ayrılır
+    
+    Returns:
+        ActivityTable (satırlar mps sırasında)
+    """
+    commission_bonuses = commission_bonuses or {}
+    names = [mp.get('name', '').strip() for mp in mps]
+    resolver = resolver or get_mp_resolver()
+    normalized = [resolver.resolve_record(mp).key for mp in mps]
+    classifier = get_proposal_classifier()
+    
+    valid_counts = [
+        sum(1 for p in mp_proposals.get(key, []) if classifier.classify(p) != PROPOSAL_PROCEDURAL)
+        for key in normalized
+    ]
+    
+    return ActivityTable(
+        names,
+        parties=[mp.get('party', 'Bağımsız') for mp in mps],
+        first_signature=valid_counts,
+        question=[mp_questions.get(key, 0) for key in normalized],
+        research=[mp_research.get(key, 0) for key in normalized],
+        commission=[commission_bonuses.get(key, 0) for key in normalized],
+        news=news_score,
+    )
+
+
 # ============================================================================
 # VERİ YÜKLEME
 # ============================================================================
@@ -280,34 +486,24 @@ def load_proposals_by_mp(proposals_file: Path) -> Dict[str, List[dict]]:
     """
     Kanun tekliflerini MP bazında grupla.
     
+    Dosya paylaşılan yasama korpusundan okunur; aynı süreçte tekrar ayrıştırılmaz.
+    
     Returns:
-        {'ÖZGÜR ÖZEL': [proposal1, proposal2, ...], ...}
+        {'OZGUR OZEL': [proposal1, proposal2, ...], ...}
     """
     if not proposals_file.exists():
         logger.warning(f"Dosya bulunamadı: {proposals_file}")
         return {}
     
-    with open(proposals_file, 'r', encoding='utf-8') as f:
-        proposals = json.load(f)
+    corpus = get_corpus_for_file('law_proposals', proposals_file)
     
-    mp_proposals = defaultdict(list)
+    # Her teklif korpus yüklemesi başına bir kez, imzacılarla aynı akışta sınıflandırılır;
+    # aynı anahtar kelimelerle üretilmiş sınıflar ikili önbellekten gelir
+    classifier = get_proposal_classifier()
+    categories = corpus.classify_proposals(classifier.classify_text, classifier.signature)
+    logger.info(f"  🏷️ Teklif sınıfları: {categories}")
     
-    for prop in proposals:
-        summary = prop.get('summary', '')
-        first_line = summary.split('\n')[0]
-        
-        # "Milletvekili" pattern'i bul
-        pattern = r'Milletvekili\s+([^,]+?)(?:,|$|\s+ve\s+\d+)'
-        matches = re.findall(pattern, first_line)
-        
-        for i, match in enumerate(matches):
-            name = ' '.join(match.split()).strip()
-            words = [w for w in name.split() if w and w[0].isupper()]
-            if len(words) >= 2:
-                clean_name = normalize_name(' '.join(words))
-                mp_proposals[clean_name].append(prop)
-    
-    return dict(mp_proposals)
+    return dict(corpus.proposals.by_mp)
 
 
 def load_questions_by_mp(questions_file: Path) -> Dict[str, int]:
@@ -315,21 +511,7 @@ def load_questions_by_mp(questions_file: Path) -> Dict[str, int]:
     if not questions_file.exists():
         return {}
     
-    with open(questions_file, 'r', encoding='utf-8') as f:
-        questions = json.load(f)
-    
-    mp_counts = defaultdict(int)
-    
-    for q in questions:
-        subject = q.get('subject', '')
-        if 'Milletvekili' in subject:
-            parts = subject.split('Milletvekili')
-            if len(parts) > 1:
-                name = parts[1].strip().split('\n')[0]
-                name = re.sub(r'\s+ve\s+\d+.*', '', name).strip()
-                mp_counts[normalize_name(name)] += 1
-    
-    return dict(mp_counts)
+    return dict(get_corpus_for_file('questions', questions_file).question_counts)
 
 
 def load_research_by_mp(research_file: Path) -> Dict[str, int]:
@@ -337,32 +519,8 @@ def load_research_by_mp(research_file: Path) -> Dict[str, int]:
     if not research_file.exists():
         return {}
     
-    with open(research_file, 'r', encoding='utf-8') as f:
-        research = json.load(f)
-    
-    mp_counts = defaultdict(int)
-    
-    for r in research:
-        summary = r.get('summary', '')
-        if 'Milletvekili' in summary:
-            first_line = summary.split('\n')[0]
-            parts = first_line.split('Milletvekili')
-            if len(parts) > 1:
-                name = parts[1].strip().split('\n')[0]
-                name = re.sub(r'\s+ve\s+\d+.*', '', name).strip()
-                mp_counts[normalize_name(name)] += 1
-    
-    return dict(mp_counts)
-
+    return dict(get_corpus_for_file('research', research_file).research_counts)
 
-# Komisyon Rol Bonusları
-COMMISSION_ROLE_BONUS = {
-    "BAŞKAN": 25,
-    "BAŞKANVEKİLİ": 20,
-    "SÖZCÜ": 18,
-    "KATİP": 18,
-    "ÜYE": 15,
-}
 
 def load_commission_memberships(commissions_file: Path) -> Dict[str, int]:
     """
@@ -375,27 +533,13 @@ def load_commission_memberships(commissions_file: Path) -> Dict[str, int]:
     - ÜYE: 15 puan
     
     Returns:
-        {'CÜNEYT YÜKSEL': 25, 'SÜLEYMAN SOYLU': 25, ...}
+        {'CUNEYT YUKSEL': 25, 'SULEYMAN SOYLU': 25, ...}
     """
     if not commissions_file.exists():
         logger.warning(f"Komisyon dosyası bulunamadı: {commissions_file}")
         return {}
     
-    with open(commissions_file, 'r', encoding='utf-8') as f:
-        commissions = json.load(f)
-    
-    mp_bonuses = defaultdict(int)
-    
-    for commission_name, members in commissions.items():
-        for member in members:
-            name = member.get('name', '')
-            role = member.get('role', 'ÜYE')
-            
-            normalized = normalize_name(name)
-            bonus = COMMISSION_ROLE_BONUS.get(role, 15)
-            
-            # Birden fazla komisyon üyeliği varsa topla
-            mp_bonuses[normalized] += bonus
+    mp_bonuses = get_corpus_for_file('commissions', commissions_file).commissions.bonuses
     
     logger.info(f"  📋 {len(mp_bonuses)} vekil komisyon üyeliği bulundu")
     return dict(mp_bonuses)
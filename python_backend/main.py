@@ -9,6 +9,12 @@ Kullanım:
     python main.py                  # Normal çalıştırma
     python main.py --dry-run        # Firestore'a yazmadan test
     python main.py --mp-id mv_001   # Belirli bir vekili güncelle
+    python main.py --workers 8      # 8 vekili eşzamanlı işle
+    python main.py --pipeline       # Aşamalı producer/consumer pipeline
+    python main.py --resume a1b2c3d4  # Yarıda kalan job'a devam et
+    python main.py --force          # Girdileri değişmeyen vekilleri de puanla
+    python main.py --job-id gece1 --shard 0/4  # 4 shard'ın ilkini çalıştır
+    python main.py --merge-shards gece1        # Shard özetlerini birleştir
     python main.py --seed           # Örnek veri ekle
     python main.py --help           # Yardım
 """
@@ -28,10 +34,18 @@ from dotenv import load_dotenv
 # Environment variables yükle
 load_dotenv()
 
-from config.firebase_config import get_firestore_client, close_firebase_connection, test_connection
+from config.storage_config import (
+    BACKENDS, StorageConfig, close_storage_connection, get_storage_config, set_storage_config,
+    test_storage_connection
+)
 from services.firestore_service import get_firestore_service
 from services.scoring_engine import get_scoring_engine, seed_sample_data
 from models.mp_models import SystemLog
+from config.pipeline_config import PipelineConfig
+from services.checkpoint_store import CheckpointStore
+from services.stage_metrics import StageMetrics
+from services.sharding import ShardSpec, merge_shard_summaries
+from services.job_scheduler import DeadlineScheduler, SchedulerState, parse_duration
 
 
 def print_banner():
@@ -47,7 +61,13 @@ def print_banner():
 def run_scoring_job(
     dry_run: bool = False,
     mp_id: Optional[str] = None,
-    max_news: int = 5
+    max_news: int = 5,
+    pipeline_config: Optional[PipelineConfig] = None,
+    resume_job_id: Optional[str] = None,
+    force: bool = False,
+    job_id: Optional[str] = None,
+    shard: Optional[ShardSpec] = None,
+    time_budget: Optional[float] = None
 ) -> bool:
     """
     Ana puanlama job'ını çalıştır.
@@ -56,74 +76,163 @@ def run_scoring_job(
         dry_run: True ise Firestore'a yazmaz
         mp_id: Belirli bir vekil için çalıştır (None ise hepsi)
         max_news: Her vekil için çekilecek maksimum haber sayısı
+        pipeline_config: Eşzamanlılık ayarları (None ise seri çalışır)
+        resume_job_id: Devam edilecek job'ın ID'si (None ise yeni job)
+        force: True ise girdi parmak izi değişmeyen vekiller de puanlanır
+        job_id: Job ID'si (shard'lar aynı ID ile başlatılır; None ise üretilir)
+        shard: Verilirse sadece bu shard'a düşen vekiller işlenir
+        time_budget: Saniye cinsinden süre bütçesi (None ise sınırsız). Vekiller
+            öncelik sırasıyla işlenir, bütçe dolunca kalanlar sonraki çalıştırmaya ertelenir
         
     Returns:
         bool: Job başarılıysa True
     """
-    job_id = str(uuid.uuid4())[:8]
+    job_id = resume_job_id or job_id or str(uuid.uuid4())[:8]
+    # Shard'lar aynı job_id'yi paylaşır; checkpoint ve rapor shard bazında tutulur
+    run_label = f"{job_id}-{shard.label}" if shard else job_id
     start_time = datetime.now()
+    pipeline_config = pipeline_config or PipelineConfig()
+    checkpoint: Optional[CheckpointStore] = None
+    metrics = StageMetrics()
+    scheduler: Optional[DeadlineScheduler] = None
+    scheduler_state: Optional[SchedulerState] = None
     
     print(f"🆔 Job ID: {job_id}")
     print(f"⏰ Başlangıç: {start_time.strftime('%Y-%m-%d %H:%M:%S')}")
     print(f"🔧 Mod: {'DRY-RUN' if dry_run else 'PRODUCTION'}")
     print(f"📰 Haber/Vekil: {max_news}")
+    print(f"⚡ Worker: {pipeline_config.workers}{' (pipeline)' if pipeline_config.pipelined else ''}")
     
     if mp_id:
         print(f"🎯 Hedef Vekil: {mp_id}")
+    if shard:
+        print(f"🧩 Shard: {shard}")
+    if time_budget:
+        print(f"⏳ Süre bütçesi: {time_budget / 60:.1f} dakika")
     
     print("-" * 60)
     
     try:
         # Firestore bağlantısını test et
-        print("\n🔌 Firebase bağlantısı kontrol ediliyor...")
-        if not test_connection():
-            print("❌ Firebase bağlantısı başarısız!")
-            print("💡 serviceAccountKey.json dosyasını kontrol edin.")
+        print(f"\n🔌 Depolama bağlantısı kontrol ediliyor ({get_storage_config().backend})...")
+        if not test_storage_connection():
+            print("❌ Depolama bağlantısı başarısız!")
+            print("💡 serviceAccountKey.json dosyasını veya STORAGE_BACKEND ayarını kontrol edin.")
             return False
         
         # Firestore servisini al
         firestore = get_firestore_service()
         
+        # Checkpoint deposu (tüm vekiller işlenirken)
+        if not mp_id:
+            try:
+                checkpoint = CheckpointStore(run_label, dry_run=dry_run, resume=resume_job_id is not None)
+            except ValueError as e:
+                print(f"❌ {e}")
+                return False
+            if checkpoint.resumed:
+                print(f"♻️ Job {job_id} checkpoint'ten devam ediyor")
+        
+        # Süre bütçeli zamanlayıcı (önceki çalıştırmada ertelenenler önce)
+        if time_budget and not mp_id:
+            scheduler_state = SchedulerState(scope=shard.label if shard else 'all')
+            parallelism = (pipeline_config.stage_limits()['analysis'] if pipeline_config.pipelined
+                           else pipeline_config.workers)
+            scheduler = DeadlineScheduler(
+                time_budget - (datetime.now() - start_time).total_seconds(),
+                metrics,
+                max_news=max_news,
+                parallelism=parallelism,
+                deferred_ids=scheduler_state.deferred_ids(),
+                news_volume=scheduler_state.news_volume(),
+            )
+            if scheduler.previously_deferred:
+                print(f"⏳ Önceki çalıştırmadan {len(scheduler.previously_deferred)} ertelenmiş vekil önce işlenecek")
+        
         # Job başlangıç logu
         if not dry_run:
             firestore.log_info(
                 f"Puanlama job'ı başlatıldı",
                 job_id=job_id,
-                details={'dry_run': dry_run, 'mp_id': mp_id, 'max_news': max_news}
+                details={
+                    'dry_run': dry_run,
+                    'mp_id': mp_id,
+                    'max_news': max_news,
+                    'workers': pipeline_config.workers,
+                    'stage_limits': pipeline_config.stage_limits(),
+                    'pipelined': pipeline_config.pipelined,
+                    'resumed': bool(checkpoint and checkpoint.resumed),
+                    'force': force,
+                    'shard': str(shard) if shard else None,
+                    'time_budget_s': time_budget,
+                }
             )
         
         # Scoring engine'i al
-        engine = get_scoring_engine(dry_run=dry_run)
+        engine = get_scoring_engine(dry_run=dry_run, pipeline_config=pipeline_config, force=force)
+        engine.metrics = metrics
         
         # Puanlama işlemini çalıştır
         if mp_id:
             result = engine.process_single_mp(mp_id, max_news)
             results = [result] if result else []
         else:
-            results = engine.process_all_mps(max_news_per_mp=max_news)
+            results = engine.process_all_mps(
+                max_news_per_mp=max_news, checkpoint=checkpoint, shard=shard, scheduler=scheduler
+            )
+        
+        # Ertelenenleri sonraki çalıştırma için kaydet
+        schedule_report = None
+        if scheduler:
+            scheduler_state.save(scheduler.deferred_ids, results, job_id=job_id)
+            schedule_report = scheduler.report()
         
         # İşlem istatistikleri
         end_time = datetime.now()
         duration = (end_time - start_time).total_seconds()
         success_count = sum(1 for r in results if r.success)
         fail_count = len(results) - success_count
+        skipped_count = sum(1 for r in results if r.skipped)
         
         print("\n" + "=" * 60)
         print("✅ JOB TAMAMLANDI")
         print("=" * 60)
         print(f"⏱️ Süre: {duration:.1f} saniye")
-        print(f"📊 Başarılı: {success_count} | Başarısız: {fail_count}")
+        print(f"📊 Başarılı: {success_count} | Başarısız: {fail_count} | Değişmeyen: {skipped_count}")
+        if schedule_report:
+            _print_schedule_report(schedule_report)
+        
+        # Aşama metrikleri ve yerel rapor
+        stage_summary = metrics.summary()
+        _print_stage_summary(stage_summary)
+        report_path = metrics.write_report(run_label, extra={
+            'dry_run': dry_run,
+            'shard': str(shard) if shard else None,
+            'duration_ms': int(duration * 1000),
+            'success_count': success_count,
+            'fail_count': fail_count,
+            'skipped_count': skipped_count,
+            'schedule': schedule_report,
+        })
+        print(f"📝 Metrik raporu: {report_path}")
         
         # Job bitiş logu
         if not dry_run:
+            shard_details = {'shard': str(shard)} if shard else {}
             firestore.log_info(
-                f"Puanlama job'ı tamamlandı",
+                f"Puanlama job'ı tamamlandı{f' (shard {shard})' if shard else ''}",
                 job_id=job_id,
                 duration_ms=int(duration * 1000),
                 affected_records=success_count,
                 details={
+                    **shard_details,
+                    'mp_count': len(results),
                     'success_count': success_count,
-                    'fail_count': fail_count
+                    'fail_count': fail_count,
+                    'skipped_count': skipped_count,
+                    'schedule': schedule_report,
+                    **stage_summary,
+                    'report_path': str(report_path)
                 }
             )
         
@@ -139,7 +248,7 @@ def run_scoring_job(
                 firestore.log_error(
                     f"Puanlama job'ı hata ile sonlandı: {str(e)}",
                     job_id=job_id,
-                    details={'error': str(e)}
+                    details={'error': str(e), **metrics.summary()}
                 )
         except:
             pass
@@ -147,8 +256,82 @@ def run_scoring_job(
         return False
     
     finally:
-        # Bağlantıyı kapat
-        close_firebase_connection()
+        # Bağlantıları kapat
+        if checkpoint:
+            checkpoint.close()
+        if scheduler_state:
+            scheduler_state.close()
+        close_storage_connection()
+
+
+def merge_shards(job_id: str, expected_count: Optional[int] = None) -> bool:
+    """
+    Aynı job_id ile çalışan shard'ların bitiş loglarını tek job logunda birleştir.
+    
+    Args:
+        job_id: Shard'ların ortak job ID'si
+        expected_count: Beklenen shard sayısı (None ise loglardan okunur)
+        
+    Returns:
+        bool: Tüm shard'lar tamamlanmışsa True
+    """
+    print(f"🧩 Shard özetleri birleştiriliyor: {job_id}")
+    
+    try:
+        if not test_storage_connection():
+            print("❌ Depolama bağlantısı başarısız!")
+            return False
+        
+        firestore = get_firestore_service()
+        merged = merge_shard_summaries(firestore.get_logs_by_job(job_id), expected_count)
+        
+        if not merged['shards']:
+            print(f"⚠️ {job_id} için tamamlanmış shard logu bulunamadı")
+            return False
+        
+        print(f"📊 Shard'lar: {', '.join(merged['shards'])}")
+        print(f"📊 Vekil: {merged['mp_count']} | Başarılı: {merged['success_count']} | "
+              f"Başarısız: {merged['fail_count']} | Değişmeyen: {merged['skipped_count']}")
+        print(f"⏱️ Süre (en uzun shard): {merged['duration_ms'] / 1000:.1f} saniye")
+        _print_stage_summary(merged)
+        
+        if merged['missing_shards']:
+            print(f"⚠️ Eksik shard'lar: {', '.join(merged['missing_shards'])}")
+        
+        firestore.log_info(
+            f"Shard'lı puanlama job'ı birleştirildi",
+            job_id=job_id,
+            duration_ms=merged['duration_ms'],
+            affected_records=merged['success_count'],
+            details=merged
+        )
+        return not merged['missing_shards']
+    
+    finally:
+        close_storage_connection()
+
+
+def _print_schedule_report(report: dict):
+    """Süre bütçesi kullanımını ve ertelenen vekilleri yazdır."""
+    print(f"\n⏳ Süre bütçesi: {report['elapsed_s']:.0f}/{report['time_budget_s']:.0f} saniye"
+          f"{' (doldu)' if report['budget_exhausted'] else ''}")
+    if report['admitted_count']:
+        print(f"   📰 Haber/vekil: {report['news_per_mp_min']}-{report['news_per_mp_max']} "
+              f"({report['reduced_news_count']} vekilde azaltıldı)")
+    if report['deferred_count']:
+        preview = ', '.join(report['deferred'][:10])
+        more = f" (+{report['deferred_count'] - 10})" if report['deferred_count'] > 10 else ''
+        print(f"   ⏭️ Ertelenen ({report['deferred_count']}, sonraki çalıştırmada ilk sırada): {preview}{more}")
+
+
+def _print_stage_summary(stage_summary: dict):
+    """Aşama bazlı metrik özetini yazdır."""
+    print("\n⏱️ Aşama Süreleri:")
+    for stage, stats in stage_summary['stages'].items():
+        print(
+            f"   {stage}: {stats['calls']} çağrı, ort. {stats['avg_ms']} ms, "
+            f"maks. {stats['max_ms']} ms, {stats['errors']} hata, {stats['bytes']} bayt"
+        )
 
 
 def main():
@@ -165,6 +348,14 @@ def main():
   python main.py --mp-id mv_001     Belirli bir vekili güncelle
   python main.py --seed             Örnek veri ekle
   python main.py --max-news 10      Her vekil için 10 haber çek
+  python main.py --workers 8        8 vekili eşzamanlı işle
+  python main.py --pipeline         Aşamalı pipeline (news → scrape → analiz → yazma)
+  python main.py --resume a1b2c3d4  Yarıda kalan job'a checkpoint'ten devam et
+  python main.py --force            Girdileri değişmeyen vekilleri de puanla
+  python main.py --job-id gece1 --shard 0/4   4 shard'ın ilkini çalıştır
+  python main.py --merge-shards gece1         Shard özetlerini tek job logunda birleştir
+  python main.py --time-budget 45m            45 dakikaya sığdır, kalanları sonraki çalıştırmaya ertele
+  python main.py --storage sqlite --dry-run   Firestore yerine yerel SQLite ile çalıştır
         """
     )
     
@@ -188,6 +379,100 @@ def main():
         help='Her vekil için çekilecek maksimum haber sayısı (varsayılan: 5)'
     )
     
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        help='Eşzamanlı işlenecek vekil sayısı (varsayılan: 1, seri)'
+    )
+    
+    parser.add_argument(
+        '--news-concurrency',
+        type=int,
+        default=4,
+        help='Aynı anda yapılacak maksimum Google News araması (varsayılan: 4)'
+    )
+    
+    parser.add_argument(
+        '--scrape-concurrency',
+        type=int,
+        default=8,
+        help='Aynı anda çekilecek maksimum makale sayısı (varsayılan: 8)'
+    )
+    
+    parser.add_argument(
+        '--analysis-concurrency',
+        type=int,
+        default=4,
+        help='Aynı anda yapılacak maksimum Gemini analizi (varsayılan: 4)'
+    )
+    
+    parser.add_argument(
+        '--write-concurrency',
+        type=int,
+        default=4,
+        help='Aynı anda yapılacak maksimum Firestore yazması (varsayılan: 4)'
+    )
+    
+    parser.add_argument(
+        '--pipeline',
+        action='store_true',
+        help='Aşamalı producer/consumer pipeline kullan (aşama limitleri worker havuzu olur)'
+    )
+    
+    parser.add_argument(
+        '--queue-size',
+        type=int,
+        default=32,
+        help='Pipeline aşamaları arası kuyruk kapasitesi (varsayılan: 32)'
+    )
+    
+    parser.add_argument(
+        '--resume',
+        type=str,
+        default=None,
+        metavar='JOB_ID',
+        help='Yarıda kalan job\'a devam et (tamamlanan vekiller atlanır)'
+    )
+    
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Girdi parmak izi değişmeyen vekilleri de yeniden puanla'
+    )
+    
+    parser.add_argument(
+        '--job-id',
+        type=str,
+        default=None,
+        help='Yeni job\'ın ID\'si (shard\'lar aynı ID ile başlatılmalı; var olan job\'a sadece --resume ile devam edilir)'
+    )
+    
+    parser.add_argument(
+        '--shard',
+        type=ShardSpec.parse,
+        default=None,
+        metavar='i/N',
+        help='Vekillerin sadece i. shard\'ını işle (0 <= i < N, mp.id özetine göre)'
+    )
+    
+    parser.add_argument(
+        '--time-budget',
+        type=parse_duration,
+        default=None,
+        metavar='SÜRE',
+        help='Süre bütçesi (örn. 45m, 1h30m, 90s; birimsiz sayı dakika). '
+             'Vekiller öncelik sırasıyla işlenir, bütçe dolunca kalanlar ertelenir'
+    )
+    
+    parser.add_argument(
+        '--merge-shards',
+        type=str,
+        default=None,
+        metavar='JOB_ID',
+        help='Job\'a ait shard bitiş loglarını tek job logunda birleştir'
+    )
+    
     parser.add_argument(
         '--seed',
         action='store_true',
@@ -197,21 +482,38 @@ def main():
     parser.add_argument(
         '--test-connection',
         action='store_true',
-        help='Sadece Firebase bağlantısını test et'
+        help='Sadece depolama bağlantısını test et'
+    )
+    
+    parser.add_argument(
+        '--storage',
+        choices=BACKENDS,
+        default=None,
+        help='Depolama backend\'i (varsayılan: STORAGE_BACKEND veya firestore)'
     )
     
     args = parser.parse_args()
     
+    if args.storage:
+        set_storage_config(StorageConfig(backend=args.storage, sqlite_path=get_storage_config().sqlite_path))
+    
     # Sadece bağlantı testi
     if args.test_connection:
-        print("🔌 Firebase bağlantısı test ediliyor...")
-        if test_connection():
+        print(f"🔌 Depolama bağlantısı test ediliyor ({get_storage_config().backend})...")
+        if test_storage_connection():
             print("✅ Bağlantı başarılı!")
             sys.exit(0)
         else:
             print("❌ Bağlantı başarısız!")
             sys.exit(1)
     
+    # Shard özetlerini birleştirme
+    if args.merge_shards:
+        sys.exit(0 if merge_shards(args.merge_shards) else 1)
+    
+    if args.shard and not (args.job_id or args.resume):
+        parser.error("--shard için tüm shard'larda ortak --job-id verilmeli")
+    
     # Örnek veri ekleme
     if args.seed:
         print("📝 Örnek veri ekleme modu")
@@ -223,11 +525,27 @@ def main():
             print(f"\n❌ Hata: {str(e)}")
             sys.exit(1)
     
+    pipeline_config = PipelineConfig(
+        workers=args.workers,
+        news_concurrency=args.news_concurrency,
+        scrape_concurrency=args.scrape_concurrency,
+        analysis_concurrency=args.analysis_concurrency,
+        write_concurrency=args.write_concurrency,
+        pipelined=args.pipeline,
+        queue_size=args.queue_size,
+    )
+    
     # Ana job'ı çalıştır
     success = run_scoring_job(
         dry_run=args.dry_run,
         mp_id=args.mp_id,
-        max_news=args.max_news
+        max_news=args.max_news,
+        pipeline_config=pipeline_config,
+        resume_job_id=args.resume,
+        force=args.force,
+        job_id=args.job_id,
+        shard=args.shard,
+        time_budget=args.time_budget
     )
     
     sys.exit(0 if success else 1)
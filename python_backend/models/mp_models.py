@@ -51,6 +51,7 @@ class MP:
     term_count: int = 1  # Dönem sayısı
     law_proposals: int = 0  # Kanun teklifi sayısı
     profile_image_url: Optional[str] = None
+    scoring_fingerprint: Optional[str] = None  # Son puanlamanın girdi parmak izi
     
     def to_dict(self) -> Dict[str, Any]:
         """Firestore'a yazılacak dictionary formatına çevir."""
@@ -64,6 +65,7 @@ class MP:
             'term_count': self.term_count,
             'law_proposals': self.law_proposals,
             'profile_image_url': self.profile_image_url,
+            'scoring_fingerprint': self.scoring_fingerprint,
         }
         # None değerleri filtrele
         return {k: v for k, v in data.items() if v is not None}
@@ -81,6 +83,7 @@ class MP:
             term_count=data.get('term_count', 1),
             law_proposals=data.get('law_proposals', 0),
             profile_image_url=data.get('profile_image_url'),
+            scoring_fingerprint=data.get('scoring_fingerprint'),
         )
 
 
@@ -6,12 +6,10 @@ Firestore MP Collection Düzeltme
 2. Yeni adil puanlama ile yeniden oluştur
 """
 
-import json
 import logging
 from pathlib import Path
 
-import firebase_admin
-from firebase_admin import credentials, firestore
+from config.storage_config import SERVER_TIMESTAMP, get_storage_client
 
 from fair_scoring import (
     calculate_fair_score,
@@ -19,19 +17,16 @@ from fair_scoring import (
     load_questions_by_mp,
     load_research_by_mp,
     load_commission_memberships,
-    normalize_name,
 )
+from services.legislative_corpus import get_corpus
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
 def init_firestore():
-    """Firebase bağlantısını başlat."""
-    if not firebase_admin._apps:
-        cred = credentials.Certificate("serviceAccountKey.json")
-        firebase_admin.initialize_app(cred)
-    return firestore.client()
+    """Depolama client'ını döndür (STORAGE_BACKEND'e göre Firestore veya yerel)."""
+    return get_storage_client()
 
 
 def clean_and_rebuild_mps():
@@ -73,15 +68,9 @@ def clean_and_rebuild_mps():
     mp_commissions = load_commission_memberships(data_dir / "commission_members.json")
     
     # MP listesi
-    with open(data_dir / "mps_static.json", 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    mps = []
-    cities = data.get('cities', {})
-    for city, city_mps in cities.items():
-        for mp in city_mps:
-            mp['city'] = city
-            mps.append(mp)
+    corpus = get_corpus(data_dir)
+    mps = corpus.static_mps
+    resolver = corpus.resolver
     
     logger.info(f"📊 {len(mps)} vekil oluşturulacak...")
     
@@ -109,14 +98,14 @@ def clean_and_rebuild_mps():
         if party == "AK Parti":
             party = "AKP"
         
-        # Normalize name for matching
-        normalized = normalize_name(mp_name)
+        # Korpus anahtarı ve doküman ID'si (aynı isimli vekiller seçim çevresiyle ayrılır)
+        resolved = resolver.resolve_record(mp)
         
         # Verileri bul
-        proposals = mp_proposals.get(normalized, [])
-        questions = mp_questions.get(normalized, 0)
-        research = mp_research.get(normalized, 0)
-        commission_bonus = mp_commissions.get(normalized, 0)
+        proposals = mp_proposals.get(resolved.key, [])
+        questions = mp_questions.get(resolved.key, 0)
+        research = mp_research.get(resolved.key, 0)
+        commission_bonus = mp_commissions.get(resolved.key, 0)
         
         # Adil puan hesapla
         result = calculate_fair_score(
@@ -129,12 +118,13 @@ def clean_and_rebuild_mps():
         )
         
         # Firestore'a yaz (SET - yeni doküman oluştur)
-        mp_ref = db.collection('mps').document(mp_name)
+        mp_ref = db.collection('mps').document(resolved.id)
         
         mp_data = {
             'name': mp_name,
             'party': party,
             'city': city,
+            'constituency': city.title(),
             'current_score': result.calculated_score,
             'scoring_strategy': result.role_strategy,
             'first_signature': result.valid_proposals,
@@ -146,7 +136,7 @@ def clean_and_rebuild_mps():
             'impact_label': result.impact_label,
             'score_explanation': result.explanation,
             'is_passive': result.impact_label == 'Ghost',
-            'last_updated': firestore.SERVER_TIMESTAMP,
+            'last_updated': SERVER_TIMESTAMP,
         }
         
         batch.set(mp_ref, mp_data)
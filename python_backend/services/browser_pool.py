@@ -0,0 +1,265 @@
+"""
+Paylaşılan Tarayıcı Havuzu
+Tüm Playwright scraper'larının tek, uzun ömürlü bir Chromium sürecini paylaşmasını sağlar.
+
+Tarayıcı ilk sayfa istendiğinde bir kez başlatılır; her scraper'a kendi
+`BrowserContext`'i içinde bir sayfa verilir (çerezler ve oturum izole kalır).
+Scraper kapandığında sadece context'i kapatılır, tarayıcı sıcak kalır. Aynı anda
+açık sayfa sayısı `ScraperConfig.browser_max_pages` ile sınırlıdır. Her context'e
+konfigürasyondaki ağ profili (services/network_profile.py) bağlanır.
+
+Playwright'ın senkron API'si thread'e bağlıdır; bu yüzden `get_browser_pool()`
+her thread için ayrı bir havuz döndürür. Paralel çalışan worker thread'leri
+kendi havuzlarını `close_browser_pool()` ile kapatmalıdır. Aynı tarayıcıda
+paralel sayfa gereken işler (örn. vekil detayları) `run_async_pages()` ile
+ayrı bir thread'de async Playwright kullanır.
+"""
+
+import asyncio
+import atexit
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Awaitable, Callable, Dict, Iterator, List, Optional, Tuple
+
+from playwright.async_api import async_playwright
+from playwright.sync_api import sync_playwright
+
+from config.scraper_config import ScraperConfig, default_config
+from services.network_profile import NetworkProfile
+
+logger = logging.getLogger(__name__)
+
+
+class BrowserPoolExhausted(RuntimeError):
+    """Açık sayfa sınırına ulaşıldı."""
+
+
+class BrowserPool:
+    """Tek tarayıcı süreci üzerinde izole context/sayfa dağıtan havuz."""
+
+    def __init__(self, config: Optional[ScraperConfig] = None, headless: Optional[bool] = None,
+                 max_pages: Optional[int] = None):
+        """
+        Args:
+            config: Scraper konfigürasyonu (headless, default_timeout, browser_max_pages)
+            headless: Verilirse config.headless yerine kullanılır
+            max_pages: Verilirse config.browser_max_pages yerine kullanılır
+        """
+        self.config = config or default_config
+        self.headless = self.config.headless if headless is None else headless
+        self.max_pages = max(1, self.config.browser_max_pages if max_pages is None else max_pages)
+        self.network_profile = NetworkProfile.from_config(self.config)
+        self.launches = 0
+        self.pages_opened = 0
+
+        self._owner = threading.get_ident()
+        self._playwright = None
+        self._browser = None
+        self._contexts: Dict[int, object] = {}  # id(page) -> context
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+    @property
+    def open_pages(self) -> int:
+        return len(self._contexts)
+
+    @property
+    def browser(self):
+        """Tarayıcı (ilk erişimde başlatılır)."""
+        if threading.get_ident() != self._owner:
+            raise RuntimeError("BrowserPool sadece oluşturulduğu thread'de kullanılabilir")
+        if self._browser is None or not self._browser.is_connected():
+            logger.info("🌐 Tarayıcı başlatılıyor (paylaşılan havuz)...")
+            if self._playwright is None:
+                self._playwright = sync_playwright().start()
+            self._browser = self._playwright.chromium.launch(headless=self.headless)
+            self.launches += 1
+        return self._browser
+
+    # -------------------------------------------------------------------------
+    # Sayfa ödünç alma
+    # -------------------------------------------------------------------------
+
+    def acquire_page(self, timeout: Optional[int] = None, allow_resources: Tuple[str, ...] = (),
+                     **context_options):
+        """
+        Yeni bir context içinde sayfa aç.
+
+        Args:
+            timeout: Sayfanın varsayılan timeout'u (ms, varsayılan config.default_timeout)
+            allow_resources: Ağ profilinde bu sayfa için engellenmeyecek kaynak türleri (örn. 'image')
+            **context_options: browser.new_context() seçenekleri (user_agent, locale, ...)
+
+        Returns:
+            Page: release_page() ile geri verilmesi gereken sayfa
+
+        Raises:
+            BrowserPoolExhausted: Açık sayfa sayısı max_pages'e ulaştıysa
+        """
+        if self.open_pages >= self.max_pages:
+            raise BrowserPoolExhausted(f"Açık sayfa sınırı aşıldı ({self.max_pages})")
+
+        context = self.browser.new_context(**context_options)
+        page = context.new_page()
+        page.set_default_timeout(self.config.default_timeout if timeout is None else timeout)
+        if self.network_profile is not None:
+            self.network_profile.attach(context, page, allow_resources)
+        self._contexts[id(page)] = context
+        self.pages_opened += 1
+        return page
+
+    def release_page(self, page):
+        """Sayfayı ve context'ini kapat (tarayıcı açık kalır)."""
+        context = self._contexts.pop(id(page), None)
+        if context is None:
+            return
+        try:
+            context.close()
+        except Exception as e:
+            logger.warning(f"⚠️ Context kapatılamadı: {e}")
+
+    @contextmanager
+    def page(self, timeout: Optional[int] = None, allow_resources: Tuple[str, ...] = (),
+             **context_options) -> Iterator:
+        """acquire_page/release_page'i with bloğuna saran kısayol."""
+        page = self.acquire_page(timeout, allow_resources, **context_options)
+        try:
+            yield page
+        finally:
+            self.release_page(page)
+
+    def close(self):
+        """Açık context'leri, tarayıcıyı ve Playwright'ı kapat."""
+        for context in list(self._contexts.values()):
+            try:
+                context.close()
+            except Exception:
+                pass
+        self._contexts.clear()
+
+        if self._browser is not None:
+            self._browser.close()
+            self._browser = None
+        if self._playwright is not None:
+            self._playwright.stop()
+            self._playwright = None
+            logger.info(f"🔒 Tarayıcı kapatıldı ({self.pages_opened} sayfa, {self.launches} başlatma)")
+            if self.network_profile is not None and self.network_profile.pages:
+                logger.info(self.network_profile.summary())
+
+
+# =============================================================================
+# PAYLAŞILAN HAVUZ
+# =============================================================================
+
+_local = threading.local()
+
+
+def get_browser_pool(headless: Optional[bool] = None) -> BrowserPool:
+    """
+    Bu thread'in paylaşılan tarayıcı havuzu.
+
+    Args:
+        headless: Havuz henüz tarayıcı başlatmadıysa uygulanır
+
+    Returns:
+        BrowserPool: Konfigürasyonu ortam değişkenlerinden okunan havuz
+    """
+    pool = getattr(_local, 'pool', None)
+    if pool is None:
+        pool = BrowserPool(ScraperConfig.from_env())
+        _local.pool = pool
+        if threading.current_thread() is threading.main_thread():
+            atexit.register(pool.close)
+
+    if headless is not None and headless != pool.headless:
+        if pool.launches:
+            logger.warning(f"⚠️ Tarayıcı zaten headless={pool.headless} ile çalışıyor")
+        else:
+            pool.headless = headless
+    return pool
+
+
+def close_browser_pool():
+    """Bu thread'in paylaşılan havuzunu kapat (varsa)."""
+    pool = getattr(_local, 'pool', None)
+    if pool is not None:
+        pool.close()
+        _local.pool = None
+
+
+# =============================================================================
+# PARALEL SAYFALAR (ASYNC)
+# =============================================================================
+
+def run_async_pages(
+    worker: Callable[..., Awaitable[None]],
+    count: int,
+    config: Optional[ScraperConfig] = None,
+    headless: Optional[bool] = None,
+    timeout: Optional[int] = None
+) -> int:
+    """
+    Tek bir tarayıcıda `count` sayfa aç ve her sayfada `worker(page)`'i paralel çalıştır.
+
+    Senkron API thread'e bağlı olduğundan, async Playwright kendi event loop'uyla
+    ayrı bir thread'de çalışır; çağıran thread'in havuzu etkilenmez. Sayfa sayısı
+    `browser_max_pages` ile sınırlıdır ve her sayfaya ağ profili bağlanır.
+
+    Args:
+        worker: Sayfayı alan coroutine fonksiyonu
+        count: İstenen sayfa sayısı
+        config: Scraper konfigürasyonu (varsayılan default_config)
+        headless: Verilirse config.headless yerine kullanılır
+        timeout: Sayfaların varsayılan timeout'u (ms, varsayılan config.default_timeout)
+
+    Returns:
+        int: Açılan sayfa sayısı
+
+    Raises:
+        Exception: Tarayıcı başlatılamazsa veya worker'lardan biri hata verirse
+    """
+    config = config or default_config
+    count = max(1, min(count, config.browser_max_pages))
+    errors: List[BaseException] = []
+
+    async def run():
+        network_profile = NetworkProfile.from_config(config)
+        async with async_playwright() as playwright:
+            logger.info(f"🌐 Tarayıcı başlatılıyor ({count} paralel sayfa)...")
+            browser = await playwright.chromium.launch(
+                headless=config.headless if headless is None else headless)
+            try:
+                pages = []
+                for _ in range(count):
+                    context = await browser.new_context()
+                    page = await context.new_page()
+                    page.set_default_timeout(config.default_timeout if timeout is None else timeout)
+                    if network_profile is not None:
+                        await network_profile.attach(context, page)
+                    pages.append(page)
+                await asyncio.gather(*(worker(page) for page in pages))
+            finally:
+                await browser.close()
+                logger.info(f"🔒 Tarayıcı kapatıldı ({count} paralel sayfa)")
+                if network_profile is not None and network_profile.pages:
+                    logger.info(network_profile.summary())
+
+    def target():
+        try:
+            asyncio.run(run())
+        except BaseException as e:
+            errors.append(e)
+
+    thread = threading.Thread(target=target, name='async-pages', daemon=True)
+    thread.start()
+    thread.join()
+    if errors:
+        raise errors[0]
+    return count
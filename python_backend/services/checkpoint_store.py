@@ -0,0 +1,184 @@
+"""
+Checkpoint Servis Modülü
+Uzun puanlama job'ları için job_id bazlı kalıcı checkpoint deposu.
+
+Her vekil tamamlandığında sonucu, her haber analiz edildiğinde de NewsAnalysis
+kaydı yerel bir SQLite veritabanına yazılır. Job yarıda kesilirse
+`python main.py --resume <job_id>` ile tamamlanan vekiller atlanır ve yarım kalan
+vekilin analiz edilmiş haberleri tekrar Gemini'ye gönderilmez.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from dataclasses import asdict
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional, Any, TYPE_CHECKING
+
+from models.mp_models import NewsAnalysis
+
+if TYPE_CHECKING:
+    from services.scoring_engine import ScoringResult
+
+
+DEFAULT_CHECKPOINT_DB = Path(__file__).parent.parent / "checkpoints" / "scoring_checkpoints.db"
+
+
+def get_checkpoint_db_path() -> Path:
+    """Checkpoint veritabanı yolunu döndür (SCORING_CHECKPOINT_DB ile değiştirilebilir)."""
+    path = os.getenv('SCORING_CHECKPOINT_DB')
+    return Path(path) if path else DEFAULT_CHECKPOINT_DB
+
+
+def _json_default(value: Any):
+    """datetime alanlarını ISO formatında serileştir."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Serileştirilemeyen tip: {type(value).__name__}")
+
+
+class CheckpointStore:
+    """SQLite tabanlı, job_id bazlı checkpoint deposu."""
+
+    def __init__(self, job_id: str, dry_run: bool = False, db_path: Optional[Path] = None,
+                 resume: bool = False):
+        """
+        Checkpoint deposunu aç (yoksa oluştur).
+
+        Args:
+            job_id: Job kimliği
+            dry_run: Job'ın dry-run modunda çalışıp çalışmadığı
+            db_path: SQLite dosya yolu (None ise varsayılan)
+            resume: True ise job daha önce başlatılmış olmalı (--resume); False ise
+                job yeni olmalı (var olan job'a sadece --resume ile devam edilir)
+
+        Raises:
+            ValueError: Var olan job farklı bir modda (dry-run/production) başlatılmışsa,
+                resume=True iken job bulunamazsa veya resume=False iken job zaten varsa
+        """
+        self.job_id = job_id
+        self.dry_run = dry_run
+        self.resume = resume
+        self.db_path = Path(db_path) if db_path else get_checkpoint_db_path()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._create_tables()
+        self.resumed = self._register_job()
+
+    def _create_tables(self):
+        """Tabloları oluştur."""
+        with self._lock, self._conn:
+            self._conn.executescript('''
+                CREATE TABLE IF NOT EXISTS jobs (
+                    job_id TEXT PRIMARY KEY,
+                    dry_run INTEGER NOT NULL,
+                    created_at TEXT NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS mp_results (
+                    job_id TEXT NOT NULL,
+                    mp_id TEXT NOT NULL,
+                    result_json TEXT NOT NULL,
+                    completed_at TEXT NOT NULL,
+                    PRIMARY KEY (job_id, mp_id)
+                );
+                CREATE TABLE IF NOT EXISTS news_analyses (
+                    job_id TEXT NOT NULL,
+                    mp_id TEXT NOT NULL,
+                    url TEXT NOT NULL,
+                    analysis_json TEXT NOT NULL,
+                    PRIMARY KEY (job_id, mp_id, url)
+                );
+            ''')
+
+    def _register_job(self) -> bool:
+        """Job'ı kaydet. Job daha önce başlatılmışsa True döner."""
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                'SELECT dry_run FROM jobs WHERE job_id = ?', (self.job_id,)
+            ).fetchone()
+
+            if row is None:
+                if self.resume:
+                    raise ValueError(f"Devam edilecek job bulunamadı: {self.job_id} ({self.db_path})")
+                self._conn.execute(
+                    'INSERT INTO jobs (job_id, dry_run, created_at) VALUES (?, ?, ?)',
+                    (self.job_id, int(self.dry_run), datetime.now().isoformat())
+                )
+                return False
+
+        if not self.resume:
+            raise ValueError(f"Job {self.job_id} zaten başlatılmış; devam etmek için --resume "
+                             f"kullanın veya yeni bir job ID verin")
+        if bool(row[0]) != self.dry_run:
+            mode = 'DRY-RUN' if row[0] else 'PRODUCTION'
+            raise ValueError(f"Job {self.job_id} {mode} modunda başlatılmış, aynı modda devam edilmeli")
+        return True
+
+    # =========================================================================
+    # Vekil sonuçları
+    # =========================================================================
+
+    def mark_completed(self, result: 'ScoringResult'):
+        """Vekili tamamlandı olarak işaretle ve sonucunu sakla."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO mp_results (job_id, mp_id, result_json, completed_at) '
+                'VALUES (?, ?, ?, ?)',
+                (self.job_id, result.mp_id, json.dumps(asdict(result), ensure_ascii=False),
+                 datetime.now().isoformat())
+            )
+            # Tamamlanan vekilin ara analizlerine artık gerek yok
+            self._conn.execute(
+                'DELETE FROM news_analyses WHERE job_id = ? AND mp_id = ?',
+                (self.job_id, result.mp_id)
+            )
+
+    def completed_results(self) -> Dict[str, 'ScoringResult']:
+        """Tamamlanmış vekillerin sonuçları (mp_id -> ScoringResult)."""
+        from services.scoring_engine import ScoringResult
+
+        with self._lock:
+            rows = self._conn.execute(
+                'SELECT mp_id, result_json FROM mp_results WHERE job_id = ?', (self.job_id,)
+            ).fetchall()
+        return {mp_id: ScoringResult(**json.loads(data)) for mp_id, data in rows}
+
+    # =========================================================================
+    # Ara haber analizleri
+    # =========================================================================
+
+    def save_analysis(self, analysis: NewsAnalysis):
+        """Analiz edilmiş haberi sakla."""
+        data = json.dumps(analysis.to_dict(), ensure_ascii=False, default=_json_default)
+        with self._lock, self._conn:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO news_analyses (job_id, mp_id, url, analysis_json) '
+                'VALUES (?, ?, ?, ?)',
+                (self.job_id, analysis.mp_id, analysis.url, data)
+            )
+
+    def get_analysis(self, mp_id: str, url: str) -> Optional[NewsAnalysis]:
+        """Daha önce analiz edilmiş haberi getir."""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT analysis_json FROM news_analyses WHERE job_id = ? AND mp_id = ? AND url = ?',
+                (self.job_id, mp_id, url)
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        data = json.loads(row[0])
+        if isinstance(data.get('created_at'), str):
+            data['created_at'] = datetime.fromisoformat(data['created_at'])
+        return NewsAnalysis.from_dict(data)
+
+    def close(self):
+        """Veritabanı bağlantısını kapat."""
+        with self._lock:
+            self._conn.close()
@@ -5,12 +5,16 @@ TBMM İhtisas Komisyonları üyeliklerini çeker.
 
 import json
 import logging
-import time
 from pathlib import Path
 from dataclasses import dataclass, asdict
-from typing import List, Dict
+from typing import List, Dict, Optional
 
-from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeout
+from playwright.sync_api import TimeoutError as PlaywrightTimeout
+
+from services.browser_pool import BrowserPool, get_browser_pool
+from services.page_extract import extract_cards, extract_table_rows
+from services.rate_limiter import get_rate_controller
+from services.retry_policy import get_retry_policy, retry_navigate
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -50,22 +54,23 @@ class CommissionScraper:
         "Çevre Komisyonu": "cevre-komisyonu",
     }
     
-    def __init__(self):
-        self.playwright = None
-        self.browser = None
+    def __init__(self, pool: Optional[BrowserPool] = None):
+        self.pool = pool
         self.page = None
+        self.rate_controller = get_rate_controller()
+        self.retry_policy = get_retry_policy()
     
     def __enter__(self):
-        self.playwright = sync_playwright().start()
-        self.browser = self.playwright.chromium.launch(headless=True)
-        self.page = self.browser.new_page()
+        # Paylaşılan tarayıcı havuzundan izole bir sayfa al
+        if self.pool is None:
+            self.pool = get_browser_pool()
+        self.page = self.pool.acquire_page()
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        if self.browser:
-            self.browser.close()
-        if self.playwright:
-            self.playwright.stop()
+        if self.page is not None:
+            self.pool.release_page(self.page)
+            self.page = None
     
     def fetch_commission_members(self, commission_name: str, commission_slug: str) -> List[CommissionMember]:
         """Tek bir komisyonun üyelerini çek."""
@@ -74,32 +79,29 @@ class CommissionScraper:
         
         try:
             logger.info(f"  📋 {commission_name} üyeleri çekiliyor...")
-            self.page.goto(url, wait_until='networkidle', timeout=30000)
-            time.sleep(2)
+            retry_navigate(self.page, url, self.rate_controller, self.retry_policy,
+                           wait_until='networkidle', timeout=30000)
             
-            # Tablo satırlarını bul
-            rows = self.page.query_selector_all('table tbody tr')
+            # Tablo satırlarını bul (hücre metinleri tek çağrıda)
+            rows = extract_table_rows(self.page)
             
             if not rows:
                 # Alternatif: Kart yapısı
-                cards = self.page.query_selector_all('.card, .member-card, .uye-card')
-                if cards:
-                    for card in cards:
-                        name_el = card.query_selector('h5, .name, .isim')
-                        role_el = card.query_selector('.role, .gorev, small')
-                        if name_el:
-                            member = CommissionMember(
-                                commission=commission_name,
-                                role=role_el.inner_text().strip() if role_el else "ÜYE",
-                                name=name_el.inner_text().strip()
-                            )
-                            members.append(member)
+                cards = extract_cards(self.page, '.card, .member-card, .uye-card',
+                                      {'name': 'h5, .name, .isim', 'role': '.role, .gorev, small'})
+                for card in cards:
+                    if card['name'] is not None:
+                        member = CommissionMember(
+                            commission=commission_name,
+                            role=card['role'] if card['role'] is not None else "ÜYE",
+                            name=card['name']
+                        )
+                        members.append(member)
             else:
-                for row in rows:
-                    cells = row.query_selector_all('td')
+                for cells in rows:
                     if len(cells) >= 2:
-                        role = cells[0].inner_text().strip() if cells[0] else "ÜYE"
-                        name = cells[1].inner_text().strip() if cells[1] else ""
+                        role = cells[0]
+                        name = cells[1]
                         
                         if name:
                             member = CommissionMember(
@@ -127,7 +129,6 @@ class CommissionScraper:
         for commission_name, slug in self.COMMISSIONS.items():
             members = self.fetch_commission_members(commission_name, slug)
             all_members[commission_name] = members
-            time.sleep(1)  # Rate limiting
         
         return all_members
     
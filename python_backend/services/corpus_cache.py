@@ -0,0 +1,184 @@
+"""
+Korpus Önbellek Modülü
+Ayrıştırılmış yasama korpusunu kaynak JSON dosyalarının yanında ikili (.npz)
+biçimde saklar.
+
+Her kaynak dosya için `<veri dizini>/.corpus_cache/<dosya adı>.npz` yazılır:
+- `__meta__`: biçim sürümü ve kaynak damgası (boyut, mtime, SHA-256) içeren JSON
+- Metin sütunları: ayraçla birleştirilmiş UTF-8 bayt dizileri (tek split ile çözülür)
+- Tam sayı dizileri: tekil isim/şehir ID'leri, ofsetler, sınıf kodları
+
+Önbellek yalnızca kaynak dosyanın boyutu, mtime değeri ve içerik özeti kayıtla
+aynıysa kullanılır; aksi halde kaynak yeniden ayrıştırılır ve önbellek yenilenir.
+Sıkıştırma kullanılmaz, yükleme süresi disk okumasıyla sınırlıdır.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+# Ayrıştırıcı veya dizi düzeni değiştiğinde artırılır (eski önbellekler geçersiz olur)
+CACHE_FORMAT_VERSION = 3
+
+CACHE_DIR_NAME = ".corpus_cache"
+
+# Metin sütunlarında değer ayracı (ASCII unit separator)
+FIELD_SEPARATOR = '\x1f'
+
+META_KEY = '__meta__'
+
+
+def is_cache_enabled() -> bool:
+    """CORPUS_CACHE=0 ile önbellek kapatılabilir."""
+    return os.getenv("CORPUS_CACHE", "1").strip().lower() not in ("0", "false", "off", "no")
+
+
+@dataclass(frozen=True)
+class SourceStamp:
+    """Kaynak dosyanın önbellek geçerliliğini belirleyen damgası."""
+
+    size: int
+    mtime_ns: int
+    sha256: str
+
+    @classmethod
+    def of(cls, path: Path, content: bytes) -> "SourceStamp":
+        """Dosyanın okunan içeriğinden damga oluştur."""
+        stat = path.stat()
+        return cls(size=len(content), mtime_ns=stat.st_mtime_ns, sha256=hashlib.sha256(content).hexdigest())
+
+    @classmethod
+    def of_file(cls, path: Path, chunk_size: int = 1 << 20) -> "SourceStamp":
+        """Dosyayı parça parça okuyarak damga oluştur (içerik belleğe alınmaz)."""
+        stat = path.stat()
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(chunk_size), b''):
+                digest.update(chunk)
+        return cls(size=stat.st_size, mtime_ns=stat.st_mtime_ns, sha256=digest.hexdigest())
+
+
+# ============================================================================
+# SÜTUN KODLAMA
+# ============================================================================
+
+def encode_strings(values: List[str]) -> Optional[np.ndarray]:
+    """
+    Metin listesini tek bir UTF-8 bayt dizisine kodla.
+
+    Returns:
+        Optional[np.ndarray]: Değerlerden biri ayracı içeriyorsa None
+    """
+    if any(FIELD_SEPARATOR in value for value in values):
+        return None
+    return np.frombuffer(FIELD_SEPARATOR.join(values).encode('utf-8'), dtype=np.uint8)
+
+
+def decode_strings(array: np.ndarray, count: int) -> List[str]:
+    """encode_strings çıktısını listeye geri çevir."""
+    if count == 0:
+        return []
+    values = array.tobytes().decode('utf-8').split(FIELD_SEPARATOR)
+    if len(values) != count:
+        raise ValueError(f"Beklenen {count} değer, okunan {len(values)}")
+    return values
+
+
+def intern_strings(values: List[str]) -> Tuple[List[str], List[int]]:
+    """
+    Değerleri ilk görülme sırasıyla tekilleştir.
+
+    Returns:
+        (tekil değerler, her değerin tekil listedeki ID'si)
+    """
+    ids: Dict[str, int] = {}
+    codes = [ids.setdefault(value, len(ids)) for value in values]
+    return list(ids), codes
+
+
+# ============================================================================
+# ÖNBELLEK DOSYALARI
+# ============================================================================
+
+class CorpusCache:
+    """Kaynak dosya başına bir .npz dosyası tutan ikili korpus önbelleği."""
+
+    def __init__(self, cache_dir: Path):
+        """
+        Args:
+            cache_dir: Önbellek dizini (yoksa ilk yazmada oluşturulur)
+        """
+        self.cache_dir = Path(cache_dir)
+
+    def entry_path(self, source_path: Path) -> Path:
+        return self.cache_dir / f"{Path(source_path).name}.npz"
+
+    def load(self, source_path: Path, stamp: SourceStamp, kind: str) -> Optional[Dict[str, np.ndarray]]:
+        """
+        Kaynağın önbelleğini oku.
+
+        Args:
+            source_path: Kaynak JSON dosyası
+            stamp: Kaynağın güncel damgası
+            kind: Beklenen içerik türü ('proposals', 'submitters')
+
+        Returns:
+            Optional[Dict[str, np.ndarray]]: Damga ve sürüm eşleşiyorsa diziler, yoksa None
+        """
+        entry = self.entry_path(source_path)
+        if not entry.exists():
+            return None
+
+        try:
+            with np.load(entry, allow_pickle=False) as data:
+                arrays = {name: data[name] for name in data.files}
+            meta = json.loads(str(arrays.pop(META_KEY)))
+        except Exception as e:
+            logger.warning(f"Korpus önbelleği okunamadı ({entry.name}): {str(e)}")
+            return None
+
+        if (meta.get('version') != CACHE_FORMAT_VERSION or meta.get('kind') != kind
+                or meta.get('source') != asdict(stamp)):
+            return None
+
+        arrays[META_KEY] = meta
+        return arrays
+
+    def store(self, source_path: Path, stamp: SourceStamp, kind: str, arrays: Dict[str, np.ndarray],
+              extra: Optional[dict] = None) -> bool:
+        """
+        Kaynağın önbelleğini (atomik olarak) yaz.
+
+        Args:
+            source_path: Kaynak JSON dosyası
+            stamp: Ayrıştırılan içeriğin damgası
+            kind: İçerik türü
+            arrays: Yazılacak diziler
+            extra: Meta kayda eklenecek alanlar
+
+        Returns:
+            bool: Yazıldıysa True (yazma hatası ayrıştırmayı bozmaz)
+        """
+        entry = self.entry_path(source_path)
+        meta = {'version': CACHE_FORMAT_VERSION, 'kind': kind, 'source': asdict(stamp), **(extra or {})}
+        tmp_path = entry.with_name(f"{entry.name}.{os.getpid()}.tmp")
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                np.savez(f, **{META_KEY: np.array(json.dumps(meta))}, **arrays)
+            os.replace(tmp_path, entry)
+            return True
+        except OSError as e:
+            logger.warning(f"Korpus önbelleği yazılamadı ({entry.name}): {str(e)}")
+            tmp_path.unlink(missing_ok=True)
+            return False
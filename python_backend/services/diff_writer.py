@@ -0,0 +1,171 @@
+"""
+Fark Tabanlı Toplu Yazma Modülü
+Bir koleksiyona sadece değişen alanları, Firestore batch'leriyle yazar.
+
+Koleksiyon bir kez, yalnızca anahtar ve yazılacak alanlara indirgenerek
+(`select`) okunur. Her doküman için istenen değerler mevcut değerlerle
+karşılaştırılır; değişen alanlar 500 işlemlik batch'lerde commit edilir.
+Değerleri aynı kalan dokümanlar için RPC yapılmaz; bu yüzden tipik bir yeniden
+çalıştırma doküman başına bir update yerine birkaç batch commit'iyle biter.
+
+Depolama client'ı `config.storage_config.get_storage_client()` ile alınır;
+Firestore ve yerel backend aynı API'yi sağlar.
+"""
+
+import logging
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+
+from config.storage_config import MAX_BATCH_SIZE
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class DiffWriteResult:
+    """Fark tabanlı yazma sonucu."""
+
+    changed: int = 0                                   # En az bir alanı değişen doküman
+    unchanged: int = 0                                 # Tüm alanları aynı olan doküman
+    missing: List[Hashable] = field(default_factory=list)  # Koleksiyonda dokümanı olmayan anahtarlar
+    fields_written: int = 0
+    batches: int = 0                                   # Commit edilen batch sayısı
+    dry_run: bool = False
+
+    def summary(self) -> str:
+        """Tek satırlık özet."""
+        mode = "DRY-RUN" if self.dry_run else "✅"
+        return (f"{mode}: {self.changed} değişti, {self.unchanged} aynı, {len(self.missing)} eksik "
+                f"({self.fields_written} alan, {self.batches} batch)")
+
+
+def diff_fields(current: Dict[str, Any], desired: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Mevcut dokümandan farklı olan alanları döndür.
+
+    Args:
+        current: Dokümanın okunan (indirgenmiş) alanları
+        desired: Yazılmak istenen alanlar
+
+    Returns:
+        Dict[str, Any]: Eksik veya farklı değerli alanlar
+    """
+    return {
+        name: value for name, value in desired.items()
+        if name not in current or current[name] != value or type(current[name]) is not type(value)
+    }
+
+
+class DiffWriter:
+    """Bir koleksiyonun indirgenmiş görünümü üzerinde fark tabanlı toplu yazıcı."""
+
+    def __init__(
+        self,
+        db,
+        collection: str,
+        fields: Iterable[str],
+        key: Callable[[Dict[str, Any]], Hashable],
+        key_fields: Iterable[str] = ('name',),
+        batch_size: int = MAX_BATCH_SIZE
+    ):
+        """
+        Args:
+            db: Depolama client'ı (Firestore veya yerel)
+            collection: Koleksiyon adı
+            fields: Karşılaştırılacak ve yazılacak alanlar
+            key: Doküman verisinden eşleme anahtarı üreten fonksiyon
+            key_fields: Anahtar için okunacak alanlar
+            batch_size: Batch başına en fazla işlem (Firestore sınırı 500)
+        """
+        self.db = db
+        self.collection = collection
+        self.fields = tuple(fields)
+        self.key = key
+        self.key_fields = tuple(key_fields)
+        self.batch_size = min(batch_size, MAX_BATCH_SIZE)
+        self._snapshot: Optional[Dict[Hashable, List[Tuple[Any, Dict[str, Any]]]]] = None
+
+    # -------------------------------------------------------------------------
+    # Okuma
+    # -------------------------------------------------------------------------
+
+    def snapshot(self) -> Dict[Hashable, List[Tuple[Any, Dict[str, Any]]]]:
+        """
+        Koleksiyonu (ilk çağrıda bir kez) indirgenmiş olarak oku.
+
+        Returns:
+            Dict[anahtar, List[(doküman referansı, alanlar)]]
+        """
+        if self._snapshot is None:
+            projection = list(dict.fromkeys(self.key_fields + self.fields))
+            snapshot = defaultdict(list)
+            for doc in self.db.collection(self.collection).select(projection).stream():
+                data = doc.to_dict() or {}
+                snapshot[self.key(data)].append((doc.reference, data))
+            self._snapshot = dict(snapshot)
+            logger.info(f"📖 {self.collection}: {sum(map(len, self._snapshot.values()))} doküman okundu "
+                        f"({len(projection)} alan)")
+        return self._snapshot
+
+    def current_values(self, field_name: str) -> Dict[Hashable, Any]:
+        """Anahtar -> alanın mevcut değeri (alanı olmayan dokümanlar atlanır)."""
+        values = {}
+        for key, docs in self.snapshot().items():
+            for _, data in docs:
+                if data.get(field_name) is not None:
+                    values[key] = data[field_name]
+        return values
+
+    # -------------------------------------------------------------------------
+    # Yazma
+    # -------------------------------------------------------------------------
+
+    def write(self, updates: Dict[Hashable, Dict[str, Any]], dry_run: bool = False) -> DiffWriteResult:
+        """
+        İstenen değerlerden sadece değişenleri toplu olarak yaz.
+
+        Args:
+            updates: Anahtar -> yazılacak alanlar
+            dry_run: True ise farklar hesaplanır ama commit edilmez
+
+        Returns:
+            DiffWriteResult: Değişen/aynı/eksik doküman sayıları
+        """
+        snapshot = self.snapshot()
+        result = DiffWriteResult(dry_run=dry_run)
+        batch, pending = None, 0
+
+        for key, desired in updates.items():
+            docs = snapshot.get(key)
+            if not docs:
+                result.missing.append(key)
+                continue
+
+            for reference, data in docs:
+                changes = diff_fields(data, desired)
+                if not changes:
+                    result.unchanged += 1
+                    continue
+
+                result.changed += 1
+                result.fields_written += len(changes)
+                if dry_run:
+                    continue
+
+                data.update(changes)
+                if batch is None:
+                    batch = self.db.batch()
+                batch.update(reference, changes)
+                pending += 1
+                if pending >= self.batch_size:
+                    batch.commit()
+                    result.batches += 1
+                    batch, pending = None, 0
+
+        if batch is not None and pending:
+            batch.commit()
+            result.batches += 1
+
+        logger.debug(result.summary())
+        return result
@@ -11,7 +11,7 @@ import os
 # Proje kök dizinini path'e ekle
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from config.firebase_config import get_firestore_client
+from config.storage_config import get_storage_client
 from models.mp_models import MP, NewsAnalysis, SystemLog
 
 
@@ -25,8 +25,8 @@ class FirestoreService:
     """Firestore veritabanı işlemleri için servis sınıfı."""
     
     def __init__(self):
-        """Firestore client'ı initialize et."""
-        self.db = get_firestore_client()
+        """Depolama client'ını initialize et (STORAGE_BACKEND'e göre Firestore veya yerel)."""
+        self.db = get_storage_client()
     
     # =========================================================================
     # MP (Milletvekili) İşlemleri
@@ -71,23 +71,32 @@ class FirestoreService:
         doc_ref.set(mp.to_dict())
         return mp.id
     
-    def update_mp_score(self, mp_id: str, new_score: float) -> bool:
+    def update_mp_score(
+        self,
+        mp_id: str,
+        new_score: float,
+        fingerprint: Optional[str] = None
+    ) -> bool:
         """
         Milletvekili puanını güncelle.
         
         Args:
             mp_id: Milletvekili ID'si
             new_score: Yeni puan
+            fingerprint: Puanlama girdi parmak izi (verilirse puanla birlikte yazılır)
             
         Returns:
             bool: Güncelleme başarılıysa True
         """
         try:
             doc_ref = self.db.collection(COLLECTION_MPS).document(mp_id)
-            doc_ref.update({
+            updates = {
                 'current_score': new_score,
                 'last_updated': datetime.now()
-            })
+            }
+            if fingerprint:
+                updates['scoring_fingerprint'] = fingerprint
+            doc_ref.update(updates)
             return True
         except Exception as e:
             print(f"❌ Puan güncelleme hatası ({mp_id}): {str(e)}")
@@ -269,6 +278,20 @@ class FirestoreService:
                 .stream())
         
         return [SystemLog.from_dict({**doc.to_dict(), 'id': doc.id}) for doc in docs]
+    
+    def get_logs_by_job(self, job_id: str) -> List[SystemLog]:
+        """
+        Bir job'a ait tüm logları getir (shard özetlerini birleştirmek için).
+        
+        Args:
+            job_id: Job ID'si
+            
+        Returns:
+            List[SystemLog]: Zamana göre sıralı loglar
+        """
+        docs = self.db.collection(COLLECTION_LOGS).where('job_id', '==', job_id).stream()
+        logs = [SystemLog.from_dict({**doc.to_dict(), 'id': doc.id}) for doc in docs]
+        return sorted(logs, key=lambda log: log.timestamp)
 
 
 # Singleton instance
@@ -0,0 +1,306 @@
+"""
+Süre Bütçeli Job Zamanlayıcı Modülü
+Puanlama job'ını sabit bir cron penceresine sığdırmak için öncelik ve bütçe yönetimi.
+
+`--time-budget` verildiğinde:
+1. Vekiller önceliğe göre sıralanır: önceki çalıştırmada ertelenenler, sonra en
+   uzun süredir güncellenmeyenler (`last_updated`), sonra haber hacmi yüksek
+   olanlar, sonra görünürlüğü yüksek olanlar (dönem ve kanun teklifi sayısı).
+2. Her vekil başlarken kalan süre ve ölçülen aşama süreleri (StageMetrics)
+   kullanılarak o vekil için çekilecek haber sayısı (`max_news`) ayarlanır.
+3. Kalan süre bir vekili en az haberle bitirmeye yetmiyorsa yeni vekil
+   başlatılmaz; işlenmekte olanlar tamamlanır ve kalanlar ertelenir.
+
+Ertelenen vekiller ve son görülen haber hacimleri checkpoint veritabanındaki
+`scheduler_deferred` / `scheduler_news_volume` tablolarında saklanır; bir
+sonraki çalıştırmada ertelenenler ilk sıraya alınır.
+"""
+
+import re
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, TYPE_CHECKING
+
+from models.mp_models import MP
+from services.checkpoint_store import get_checkpoint_db_path
+
+if TYPE_CHECKING:
+    from services.scoring_engine import ScoringResult
+    from services.stage_metrics import StageMetrics
+
+
+# Ölçüm yokken kullanılan aşama süresi tahminleri (ms)
+DEFAULT_STAGE_ESTIMATES_MS = {
+    'news': 3000.0,
+    'scrape': 2000.0,
+    'gemini': 4000.0,
+    'firestore_write': 200.0,
+}
+
+
+def parse_duration(text: str) -> float:
+    """
+    Süre ifadesini saniyeye çevir.
+
+    '90s', '45m', '1.5h', '1h30m' biçimleri desteklenir; birimsiz sayı dakikadır.
+
+    Raises:
+        ValueError: Biçim hatalıysa veya süre pozitif değilse
+    """
+    text = text.strip().lower()
+    if re.fullmatch(r'\d+(\.\d+)?', text):
+        seconds = float(text) * 60
+    else:
+        parts = re.findall(r'(\d+(?:\.\d+)?)([hms])', text)
+        if not parts or ''.join(n + u for n, u in parts) != text:
+            raise ValueError(f"Geçersiz süre: {text} (örn. 90s, 45m, 1h30m)")
+        seconds = sum(float(n) * {'h': 3600, 'm': 60, 's': 1}[u] for n, u in parts)
+
+    if seconds <= 0:
+        raise ValueError(f"Süre pozitif olmalı: {text}")
+    return seconds
+
+
+def _staleness_days(mp: MP, now: datetime) -> int:
+    """Vekilin son güncellenmesinden bu yana geçen tam gün sayısı."""
+    last = mp.last_updated
+    if not isinstance(last, datetime):
+        return 0
+    reference = datetime.now(last.tzinfo) if last.tzinfo else now
+    return max(0, (reference - last).days)
+
+
+class DeadlineScheduler:
+    """Duvar saati bütçesine göre vekil sırasını ve haber sayısını belirleyen zamanlayıcı."""
+
+    def __init__(
+        self,
+        budget_seconds: float,
+        metrics: 'StageMetrics',
+        max_news: int = 5,
+        min_news: int = 1,
+        parallelism: int = 1,
+        reserve_ratio: float = 0.05,
+        deferred_ids: Sequence[str] = (),
+        news_volume: Optional[Dict[str, int]] = None
+    ):
+        """
+        Args:
+            budget_seconds: Job için toplam süre bütçesi
+            metrics: Aşama sürelerinin okunacağı metrik kayıtçısı
+            max_news: Vekil başına üst haber limiti
+            min_news: Vekil başına alt haber limiti (bütçe daralsa da)
+            parallelism: Aynı anda işlenen vekil sayısı (throughput tahmini için)
+            reserve_ratio: Bütçenin kapanış (log, rapor) için ayrılan oranı
+            deferred_ids: Önceki çalıştırmada ertelenen vekiller (ertelenme sırasıyla)
+            news_volume: Vekil ID -> son çalıştırmadaki haber sayısı
+        """
+        self.budget_seconds = budget_seconds
+        self.metrics = metrics
+        self.max_news = max(1, max_news)
+        self.min_news = max(1, min(min_news, self.max_news))
+        self.parallelism = max(1, parallelism)
+        self.reserve_seconds = budget_seconds * reserve_ratio
+        self.previously_deferred = list(deferred_ids)
+        self.news_volume = news_volume or {}
+
+        self._lock = threading.Lock()
+        self._started_at = time.monotonic()
+        self._remaining_mps = 0
+        self._stopped = False
+        self._news_plan: Dict[str, int] = {}
+        self.deferred: List[MP] = []
+
+    # -------------------------------------------------------------------------
+    # Önceliklendirme
+    # -------------------------------------------------------------------------
+
+    def prioritize(self, mps: Iterable[MP]) -> List[MP]:
+        """
+        Vekilleri işlenme önceliğine göre sırala.
+
+        Returns:
+            List[MP]: Ertelenenler, sonra bayat, haber hacmi yüksek ve görünür vekiller
+        """
+        now = datetime.now()
+        deferred_rank = {mp_id: i for i, mp_id in enumerate(self.previously_deferred)}
+
+        def key(mp: MP):
+            return (
+                deferred_rank.get(mp.id, len(deferred_rank)),
+                -_staleness_days(mp, now),
+                -self.news_volume.get(mp.id, 0),
+                -mp.term_count,
+                -mp.law_proposals,
+            )
+
+        return sorted(mps, key=key)
+
+    # -------------------------------------------------------------------------
+    # Bütçe
+    # -------------------------------------------------------------------------
+
+    def start(self, mp_count: int):
+        """İşlenecek vekil sayısını bildir."""
+        with self._lock:
+            self._remaining_mps = mp_count
+
+    def elapsed_seconds(self) -> float:
+        return time.monotonic() - self._started_at
+
+    def remaining_seconds(self) -> float:
+        """Kapanış payı düşülmüş kalan süre."""
+        return self.budget_seconds - self.reserve_seconds - self.elapsed_seconds()
+
+    def _stage_ms(self, stages: Dict[str, Dict[str, Any]], name: str) -> float:
+        stats = stages.get(name)
+        if stats and stats.get('calls'):
+            return stats['avg_ms']
+        return DEFAULT_STAGE_ESTIMATES_MS[name]
+
+    def _cost_model(self):
+        """
+        Ölçülen ortalamalardan (vekil başı sabit, haber başı) maliyet saniyeleri.
+
+        Haber araması ve puan yazma vekil başına, scraping, Gemini ve analiz
+        yazma haber başına maliyettir.
+        """
+        stages = self.metrics.summary(slowest=0)['stages']
+        fixed_ms = self._stage_ms(stages, 'news') + self._stage_ms(stages, 'firestore_write')
+        per_item_ms = (
+            self._stage_ms(stages, 'scrape')
+            + self._stage_ms(stages, 'gemini')
+            + self._stage_ms(stages, 'firestore_write')
+        )
+        return fixed_ms / 1000, per_item_ms / 1000
+
+    def estimate_mp_seconds(self, news_count: int) -> float:
+        """Bir vekilin `news_count` haberle işlenme süresi tahmini."""
+        fixed, per_item = self._cost_model()
+        return fixed + news_count * per_item
+
+    def admit(self, mp: MP) -> Optional[int]:
+        """
+        Vekil başlamadan önce çağrılır.
+
+        Returns:
+            Optional[int]: Bu vekil için haber sayısı; süre yetmiyorsa None (ertelendi)
+        """
+        with self._lock:
+            remaining = self.remaining_seconds()
+            fixed, per_item = self._cost_model()
+
+            # Bir kez durunca durulur: sonraki vekiller de ertelenir
+            if self._stopped or remaining < fixed + self.min_news * per_item:
+                if not self._stopped:
+                    print(f"\n⏳ Süre bütçesi doldu ({self.elapsed_seconds():.0f}s), "
+                          f"kalan vekiller erteleniyor")
+                self._stopped = True
+                self.deferred.append(mp)
+                self._remaining_mps -= 1
+                return None
+
+            # Kalan süreyi, aynı anda işlenen vekil sayısı kadar paralel kanala böl
+            slots = max(1, self._remaining_mps / self.parallelism)
+            per_mp = remaining / slots
+            affordable = int((per_mp - fixed) / per_item) if per_item > 0 else self.max_news
+            news_count = max(self.min_news, min(self.max_news, affordable))
+
+            self._remaining_mps -= 1
+            self._news_plan[mp.id] = news_count
+            return news_count
+
+    @property
+    def stopped(self) -> bool:
+        return self._stopped
+
+    @property
+    def deferred_ids(self) -> List[str]:
+        return [mp.id for mp in self.deferred]
+
+    def report(self) -> Dict[str, Any]:
+        """Bütçe kullanımı ve ertelenen vekiller (job logu ve rapor için)."""
+        plan = list(self._news_plan.values())
+        return {
+            'time_budget_s': round(self.budget_seconds, 1),
+            'elapsed_s': round(self.elapsed_seconds(), 1),
+            'budget_exhausted': self._stopped,
+            'admitted_count': len(plan),
+            'deferred_count': len(self.deferred),
+            'deferred': self.deferred_ids,
+            'news_per_mp_min': min(plan) if plan else None,
+            'news_per_mp_max': max(plan) if plan else None,
+            'reduced_news_count': sum(1 for n in plan if n < self.max_news),
+        }
+
+
+class SchedulerState:
+    """Çalıştırmalar arası ertelenen vekil ve haber hacmi kaydı (SQLite)."""
+
+    def __init__(self, scope: str = 'all', db_path: Optional[Path] = None):
+        """
+        Args:
+            scope: Kayıt kapsamı (shard'lı çalıştırmalarda shard etiketi)
+            db_path: SQLite dosya yolu (None ise checkpoint veritabanı)
+        """
+        self.scope = scope
+        self.db_path = Path(db_path) if db_path else get_checkpoint_db_path()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._conn = sqlite3.connect(str(self.db_path))
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        with self._conn:
+            self._conn.executescript('''
+                CREATE TABLE IF NOT EXISTS scheduler_deferred (
+                    scope TEXT NOT NULL,
+                    mp_id TEXT NOT NULL,
+                    position INTEGER NOT NULL,
+                    job_id TEXT,
+                    deferred_at TEXT NOT NULL,
+                    PRIMARY KEY (scope, mp_id)
+                );
+                CREATE TABLE IF NOT EXISTS scheduler_news_volume (
+                    mp_id TEXT PRIMARY KEY,
+                    news_count INTEGER NOT NULL,
+                    updated_at TEXT NOT NULL
+                );
+            ''')
+
+    def deferred_ids(self) -> List[str]:
+        """Önceki çalıştırmada ertelenen vekiller (ertelenme sırasıyla)."""
+        rows = self._conn.execute(
+            'SELECT mp_id FROM scheduler_deferred WHERE scope = ? ORDER BY position', (self.scope,)
+        ).fetchall()
+        return [row[0] for row in rows]
+
+    def news_volume(self) -> Dict[str, int]:
+        """Vekil ID -> son görülen haber sayısı."""
+        return dict(self._conn.execute('SELECT mp_id, news_count FROM scheduler_news_volume'))
+
+    def save(self, deferred_ids: Sequence[str], results: Iterable['ScoringResult'], job_id: Optional[str] = None):
+        """
+        Çalıştırma sonucunu kaydet: ertelenen listesi yenilenir, haber hacimleri güncellenir.
+
+        Args:
+            deferred_ids: Bu çalıştırmada ertelenen vekiller
+            results: Bu çalıştırmanın sonuçları
+            job_id: Job kimliği
+        """
+        now = datetime.now().isoformat()
+        with self._conn:
+            self._conn.execute('DELETE FROM scheduler_deferred WHERE scope = ?', (self.scope,))
+            self._conn.executemany(
+                'INSERT INTO scheduler_deferred (scope, mp_id, position, job_id, deferred_at) '
+                'VALUES (?, ?, ?, ?, ?)',
+                [(self.scope, mp_id, i, job_id, now) for i, mp_id in enumerate(deferred_ids)]
+            )
+            self._conn.executemany(
+                'INSERT OR REPLACE INTO scheduler_news_volume (mp_id, news_count, updated_at) VALUES (?, ?, ?)',
+                [(r.mp_id, r.news_count, now) for r in results if r.success]
+            )
+
+    def close(self):
+        self._conn.close()
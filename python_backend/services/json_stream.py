@@ -0,0 +1,160 @@
+"""
+JSON Akış Okuyucu Modülü
+Büyük JSON dizisi dosyalarını (kanun teklifleri, soru ve araştırma önergesi
+arşivleri) tüm dosyayı belleğe almadan kayıt kayıt okur.
+
+Dosya sabit boyutlu parçalar halinde okunur, UTF-8 artımlı olarak çözülür ve her
+dizi elemanı `json.JSONDecoder.raw_decode` ile tek tek ayrıştırılır. Tamponda
+sadece henüz tüketilmemiş metin tutulduğundan en yüksek bellek kullanımı dosya
+boyutundan bağımsızdır (okuma parçası + en büyük tek kayıt).
+
+Kayıtlar istenen alanlara indirgenebilir; başlık alanlarında sadece ilk satır
+tutulur (imzacı/önerge sahibi başlığı), çok paragraflı metinler bırakılır.
+"""
+
+import codecs
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+# Dosyadan bir seferde okunan bayt sayısı
+READ_CHUNK_SIZE = 1 << 20
+
+_WHITESPACE = ' \t\n\r'
+
+
+class JSONStreamError(ValueError):
+    """Dosya bir JSON dizisi değil veya bozuk."""
+
+
+def iter_json_array(path: Path, chunk_size: int = READ_CHUNK_SIZE) -> Iterator[Any]:
+    """
+    Üst seviyesi dizi olan JSON dosyasının elemanlarını sırayla üret.
+
+    Args:
+        path: JSON dosyası
+        chunk_size: Okuma parçası (bayt)
+
+    Yields:
+        Any: Dizinin sıradaki elemanı
+
+    Raises:
+        JSONStreamError: Dosya dizi değilse veya eksik/bozuksa
+    """
+    decoder = json.JSONDecoder()
+    utf8 = codecs.getincrementaldecoder('utf-8-sig')()
+
+    with open(path, 'rb') as f:
+        buffer = ''
+        pos = 0
+        eof = False
+
+        def fill() -> bool:
+            """Tampona bir parça daha ekle; dosya bittiyse False."""
+            nonlocal buffer, pos, eof
+            if eof:
+                return False
+            data = f.read(chunk_size)
+            eof = not data
+            # Tüketilen önek atılır; tampon bir kayıttan uzun kalmaz
+            buffer = buffer[pos:] + utf8.decode(data, final=eof)
+            pos = 0
+            return bool(data)
+
+        def skip_whitespace() -> Optional[str]:
+            """Boşlukları atla ve sıradaki karakteri döndür (dosya sonunda None)."""
+            nonlocal pos
+            while True:
+                while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+                    pos += 1
+                if pos < len(buffer):
+                    return buffer[pos]
+                if not fill():
+                    return None
+
+        if skip_whitespace() != '[':
+            raise JSONStreamError(f"{Path(path).name}: JSON dizisi bekleniyordu")
+        pos += 1
+
+        if skip_whitespace() == ']':
+            return
+
+        while True:
+            if skip_whitespace() is None:
+                raise JSONStreamError(f"{Path(path).name}: dosya dizi kapanmadan bitti")
+
+            while True:
+                try:
+                    value, end = decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError as e:
+                    # Eleman tamponun sonunda yarım kalmış olabilir
+                    if fill():
+                        continue
+                    raise JSONStreamError(f"{Path(path).name}: {e.msg} (karakter {e.pos})") from e
+                # Tampon sonunda biten sayı/sabit devamı okunmadan kesin değildir
+                if end == len(buffer) and fill():
+                    continue
+                break
+
+            pos = end
+            yield value
+
+            separator = skip_whitespace()
+            pos += 1
+            if separator is None:
+                raise JSONStreamError(f"{Path(path).name}: dosya dizi kapanmadan bitti")
+            if separator == ']':
+                return
+            if separator != ',':
+                raise JSONStreamError(f"{Path(path).name}: dizi elemanları arasında ',' bekleniyordu")
+
+
+def project_record(
+    record: dict,
+    fields: Optional[Iterable[str]] = None,
+    header_fields: Iterable[str] = ()
+) -> dict:
+    """
+    Kaydı istenen alanlara indirge.
+
+    Args:
+        record: Ham kayıt
+        fields: Tutulacak alanlar (None ise hepsi); kayıtta olmayanlar atlanır
+        header_fields: Sadece ilk satırı tutulacak metin alanları
+
+    Returns:
+        dict: İndirgenmiş yeni kayıt
+    """
+    projected: Dict[str, Any] = (
+        dict(record) if fields is None else {key: record[key] for key in fields if key in record}
+    )
+    for key in header_fields:
+        value = projected.get(key)
+        if isinstance(value, str):
+            projected[key] = value.split('\n', 1)[0]
+    return projected
+
+
+def iter_records(
+    path: Path,
+    fields: Optional[Iterable[str]] = None,
+    header_fields: Iterable[str] = (),
+    chunk_size: int = READ_CHUNK_SIZE
+) -> Iterator[dict]:
+    """
+    JSON dizisi dosyasındaki kayıtları indirgenmiş olarak sırayla üret.
+
+    Args:
+        path: JSON dosyası
+        fields: Tutulacak alanlar (None ise hepsi)
+        header_fields: Sadece ilk satırı tutulacak metin alanları
+        chunk_size: Okuma parçası (bayt)
+
+    Yields:
+        dict: project_record ile indirgenmiş kayıt (dict olmayan elemanlar atlanır)
+    """
+    fields = tuple(fields) if fields is not None else None
+    header_fields = tuple(header_fields)
+    for record in iter_json_array(path, chunk_size):
+        if isinstance(record, dict):
+            yield project_record(record, fields, header_fields)
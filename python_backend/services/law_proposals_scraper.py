@@ -7,14 +7,20 @@ Browser session gerektirdiği için Playwright kullanır.
 
 import json
 import logging
-import time
 import re
 from pathlib import Path
 from typing import Dict, List, Optional
 from dataclasses import dataclass, field
 from datetime import datetime
 
-from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeout
+from playwright.sync_api import TimeoutError as PlaywrightTimeout
+
+from services.browser_pool import BrowserPool, get_browser_pool
+from services.scrape_watermark import ScrapeWatermark
+from services.page_extract import extract_table_rows
+from services.rate_limiter import get_rate_controller
+from services.retry_policy import IncompleteScrapeError, get_retry_policy, retry_navigate, retry_next_page
+from services.tbmm_http_client import TableRows, capture_paged_request, fetch_rows_over_http
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -47,11 +53,12 @@ class LawProposalsScraper:
     RESULT_URL = "https://www.tbmm.gov.tr/Yasama/Kanun-Teklifleri-Sonuc"
     API_URL = "https://www.tbmm.gov.tr/Yasama/Kanun-Teklifleri-Sonuc-Sayfa"
     
-    def __init__(self, headless: bool = True):
+    def __init__(self, headless: bool = True, pool: Optional[BrowserPool] = None):
         self.headless = headless
-        self.browser = None
+        self.pool = pool
         self.page = None
-        self._playwright = None
+        self.rate_controller = get_rate_controller()
+        self.retry_policy = get_retry_policy()
     
     def __enter__(self):
         self._start_browser()
@@ -62,43 +69,30 @@ class LawProposalsScraper:
         return False
     
     def _start_browser(self):
-        """Tarayıcıyı başlat."""
-        logger.info("🌐 Tarayıcı başlatılıyor...")
-        self._playwright = sync_playwright().start()
-        self.browser = self._playwright.chromium.launch(headless=self.headless)
-        self.page = self.browser.new_page()
-        self.page.set_default_timeout(30000)
+        """Paylaşılan tarayıcı havuzundan izole bir sayfa al."""
+        if self.pool is None:
+            self.pool = get_browser_pool(self.headless)
+        self.page = self.pool.acquire_page(timeout=30000)
     
     def _close_browser(self):
-        """Tarayıcıyı kapat."""
-        if self.browser:
-            self.browser.close()
-        if self._playwright:
-            self._playwright.stop()
-        logger.info("🔒 Tarayıcı kapatıldı")
+        """Sayfayı havuza geri ver (tarayıcı açık kalır)."""
+        if self.page is not None:
+            self.pool.release_page(self.page)
+            self.page = None
     
-    def fetch_all_proposals(
-        self, 
-        period_key: str = "all",
-        max_pages: int = 100
-    ) -> List[LawProposal]:
+    def _submit_query(self, period_key: str) -> bool:
         """
-        Tüm kanun tekliflerini çek.
+        Sorgu formunu doldurup gönder.
         
-        Args:
-            period_key: Dönem anahtarı ("28_4", "28_3", "28_2", "28_1", "all")
-            max_pages: Maksimum sayfa sayısı
-            
         Returns:
-            List[LawProposal]: Kanun teklifleri listesi
+            bool: Sonuç sayfası yüklendiyse True
         """
         period_id = LEGISLATIVE_PERIODS.get(period_key, LEGISLATIVE_PERIODS["all"])
-        logger.info(f"📋 Kanun teklifleri çekiliyor (Dönem: {period_key})...")
         
         # 1. Sorgu formuna git ve session oluştur
         logger.info(f"  🔗 {self.QUERY_URL}")
-        self.page.goto(self.QUERY_URL, wait_until='networkidle')
-        time.sleep(2)
+        retry_navigate(self.page, self.QUERY_URL, self.rate_controller, self.retry_policy,
+                       wait_until='networkidle')
         
         # 2. Dönem seç
         try:
@@ -113,53 +107,102 @@ class LawProposalsScraper:
         try:
             self.page.click('button:has-text("SORGULA"), input[type="submit"]')
             self.page.wait_for_url("**/Kanun-Teklifleri-Sonuc**", timeout=10000)
-            time.sleep(3)
+            self.page.wait_for_selector('table tbody tr')
             logger.info("  ✅ Sorgu başarılı, sonuçlar yükleniyor...")
+            return True
         except PlaywrightTimeout:
             logger.warning("  ⚠️ Sonuç sayfası yüklenemedi")
-            return []
+            return False
+    
+    @staticmethod
+    def _parse_rows(rows: TableRows) -> List[LawProposal]:
+        """Tablo satırlarının hücre metinlerini kanun tekliflerine çevir."""
+        return [
+            LawProposal(period=cells[0], esas_no=cells[1], date=cells[2], summary=cells[3])
+            for cells in rows if len(cells) >= 4
+        ]
+    
+    def fetch_all_proposals(
+        self, 
+        period_key: str = "all",
+        max_pages: int = 100,
+        watermark: Optional[ScrapeWatermark] = None,
+        use_http: bool = False
+    ) -> List[LawProposal]:
+        """
+        Tüm kanun tekliflerini çek.
         
-        # 4. Tablodan verileri çek
+        Args:
+            period_key: Dönem anahtarı ("28_4", "28_3", "28_2", "28_1", "all")
+            max_pages: Maksimum sayfa sayısı
+            watermark: Verilirse tamamı bilinen ilk sayfada durulur (artımlı mod)
+            use_http: True ise sayfalar sonuç endpoint'inden doğrudan HTTP ile çekilir
+                (sayfa isteği yakalanamazsa DOM sayfalamasına dönülür)
+            
+        Returns:
+            List[LawProposal]: Kanun teklifleri listesi
+
+        Raises:
+            IncompleteScrapeError: Sorgu gönderilemezse veya bir sayfa yeniden denemelere
+                rağmen yüklenemezse (eksik sonuç döndürülmez)
+        """
+        logger.info(f"📋 Kanun teklifleri çekiliyor (Dönem: {period_key})...")
+        
+        if use_http:
+            submitted, template = capture_paged_request(
+                self.page, lambda: self._submit_query(period_key), self.API_URL
+            )
+        else:
+            submitted, template = self._submit_query(period_key), None
+        
+        if not submitted:
+            raise IncompleteScrapeError("Sorgu gönderilemedi, sonuç sayfası yüklenmedi")
+        
+        # 4a. Sayfa endpoint'inden HTTP ile çek
+        if template is not None:
+            stop = None
+            if watermark is not None:
+                stop = lambda rows: watermark.is_known_page(x.esas_no for x in self._parse_rows(rows))
+            pages = fetch_rows_over_http(self.page, template, max_pages, stop)
+            if pages is not None:
+                proposals = [proposal for rows in pages for proposal in self._parse_rows(rows)]
+                logger.info(f"✅ Toplam {len(proposals)} kanun teklifi çekildi ({len(pages)} sayfa, HTTP)")
+                return proposals
+        
+        # 4b. Tablodan verileri çek
         proposals = []
         page_num = 0
         
         while page_num < max_pages:
             # Tablodaki satırları parse et
-            rows = self.page.query_selector_all('table tbody tr')
+            rows = self.retry_policy.call(self.page.url, extract_table_rows, self.page)
             
             if not rows:
                 logger.warning("  ⚠️ Tablo satırları bulunamadı")
                 break
             
-            page_proposals = []
-            for row in rows:
-                cells = row.query_selector_all('td')
-                if len(cells) >= 4:
-                    proposal = LawProposal(
-                        period=cells[0].inner_text().strip() if cells[0] else "",
-                        esas_no=cells[1].inner_text().strip() if cells[1] else "",
-                        date=cells[2].inner_text().strip() if cells[2] else "",
-                        summary=cells[3].inner_text().strip() if cells[3] else ""
-                    )
-                    page_proposals.append(proposal)
+            page_proposals = self._parse_rows(rows)
             
             proposals.extend(page_proposals)
-            logger.info(f"  � Sayfa {page_num+1}: {len(page_proposals)} teklif ({len(proposals)} toplam)")
+            logger.info(f"  📄 Sayfa {page_num+1}: {len(page_proposals)} teklif ({len(proposals)} toplam)")
             
             if len(page_proposals) == 0:
                 break
             
+            # Artımlı mod: tamamı bilinen sayfadan sonrası zaten dosyada
+            if watermark is not None and watermark.is_known_page(x.esas_no for x in page_proposals):
+                logger.info(f"  🔖 Sayfa {page_num+1} tamamen bilinen kayıtlar, sayfalama durduruldu")
+                break
+            
             # Sonraki sayfa var mı?
             try:
-                next_btn = self.page.query_selector('a.paginate_button.next:not(.disabled), .dataTables_paginate .next:not(.disabled)')
-                if next_btn:
-                    next_btn.click()
-                    time.sleep(1)
-                    page_num += 1
-                else:
+                if not retry_next_page(self.page, 'a.paginate_button.next:not(.disabled), .dataTables_paginate .next:not(.disabled)',
+                                       self.rate_controller, self.retry_policy):
                     break
-            except Exception:
-                break
+                page_num += 1
+            except Exception as e:
+                # Eksik liste tam sonuç gibi döndürülmez; çağıran yazmayı atlar
+                raise IncompleteScrapeError(f"Sayfa {page_num+2} yüklenemedi: {str(e)}", proposals) from e
         
         logger.info(f"✅ Toplam {len(proposals)} kanun teklifi çekildi")
         return proposals
@@ -197,6 +240,7 @@ def fetch_proposal_count_from_table() -> Dict[str, int]:
 
 if __name__ == "__main__":
     import argparse
+    import sys
     
     parser = argparse.ArgumentParser(description='TBMM Kanun Teklifleri Scraper')
     parser.add_argument('--period', default='all', choices=list(LEGISLATIVE_PERIODS.keys()),
@@ -204,10 +248,26 @@ if __name__ == "__main__":
     parser.add_argument('--headless', action='store_true', default=True,
                        help='Headless mod')
     parser.add_argument('--output', type=str, help='JSON çıktı dosyası')
+    parser.add_argument('--incremental', action='store_true',
+                       help='Sadece yeni kayıtları çekip veri dosyasıyla birleştir (--output yoksa data/law_proposals_28.json)')
+    parser.add_argument('--http', action='store_true',
+                       help='Sonuç sayfalarını tarayıcı yerine doğrudan HTTP ile çek')
     args = parser.parse_args()
     
+    # Artımlı mod: bilinen esas numaraları mevcut veri dosyasından yüklenir
+    watermark = None
+    if args.incremental:
+        from services.legislative_corpus import get_corpus
+        watermark = ScrapeWatermark(Path(args.output) if args.output else get_corpus().path('law_proposals'))
+    
     with LawProposalsScraper(headless=args.headless) as scraper:
-        proposals = scraper.fetch_all_proposals(period_key=args.period)
+        try:
+            proposals = scraper.fetch_all_proposals(period_key=args.period, watermark=watermark,
+                                                   use_http=args.http)
+        except IncompleteScrapeError as e:
+            print(f"\n❌ Tarama yarıda kaldı: {e}")
+            print(f"⚠️ Çekilen {len(e.records)} kayıt eksik olduğu için dosyaya yazılmadı")
+            sys.exit(1)
         
         print(f"\n📊 Toplam {len(proposals)} kanun teklifi")
         
@@ -216,13 +276,18 @@ if __name__ == "__main__":
             for i, prop in enumerate(proposals[:5], 1):
                 print(f"  {i}. [{prop.esas_no}] {prop.summary[:80]}...")
         
-        if args.output:
+        records = [{
+            'esas_no': p.esas_no,
+            'summary': p.summary,
+            'date': p.date,
+            'period': p.period
+        } for p in proposals]
+        
+        if watermark is not None:
+            added = watermark.merge(records)
+            print(f"\n💾 {watermark.path} dosyasına {added} yeni teklif eklendi")
+        elif args.output:
             output_path = Path(args.output)
             with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump([{
-                    'esas_no': p.esas_no,
-                    'summary': p.summary,
-                    'date': p.date,
-                    'period': p.period
-                } for p in proposals], f, ensure_ascii=False, indent=2)
+                json.dump(records, f, ensure_ascii=False, indent=2)
             print(f"\n💾 {output_path} dosyasına kaydedildi")
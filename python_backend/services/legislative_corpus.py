@@ -0,0 +1,818 @@
+"""
+Yasama Korpusu Modülü
+data/ altındaki yasama kaynaklarını (kanun teklifleri, yazılı sorular, araştırma
+önergeleri, komisyon üyelikleri, statik vekil listesi) tek seferde yükler.
+
+Her kaynak süreç başına bir kez okunur ve ayrıştırılır; imzacı başlıkları tek
+geçişte çözülerek vekil bazındaki tüm indeksler (ilk imza, destek imzası, teklif
+listesi, esas numaraları, soru/araştırma sayıları, komisyon rolleri) aynı anda
+kurulur. fair_scoring, update_all_mp_metrics ve count_mp_proposals aynı korpus
+nesnesini `get_corpus()` ile paylaşır.
+
+Dönem bazlı kaynaklar (teklifler, sorular, araştırma önergeleri) ayrıştırıldıktan
+sonra ikili önbelleğe yazılır (bkz. services/corpus_cache.py); kaynak dosya
+değişmedikçe sonraki süreçler JSON ve regex ayrıştırması yapmadan yükler.
+
+Dönem bazlı kaynaklar tamamı belleğe alınmadan kayıt kayıt akıtılır (bkz.
+services/json_stream.py); tekliflerde sadece esas_no, tarih, dönem, imzacı
+başlığı ve sınıf tutulur, çok paragraflı özet metinleri saklanmaz.
+
+Büyük (çok dönemli) korpuslarda başlık ayrıştırması CORPUS_PARSE_WORKERS ile
+süreç havuzuna dağıtılabilir; kayıtlar ardışık parçalara bölünür ve sonuçlar
+kayıt sırasıyla birleştirildiğinden indeksler seri ayrıştırmayla birebir aynıdır.
+"""
+
+import json
+import logging
+import os
+import re
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from functools import cached_property
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+import numpy as np
+
+from services.corpus_cache import (
+    CorpusCache, CACHE_DIR_NAME, META_KEY, SourceStamp,
+    decode_strings, encode_strings, intern_strings, is_cache_enabled,
+)
+from services.json_stream import iter_records
+from services.mp_name_resolver import MPNameResolver, normalize_name
+
+logger = logging.getLogger(__name__)
+
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+
+DEFAULT_TERM = 28
+
+# Kaynak adı -> dosya adı şablonu
+SOURCE_FILES = {
+    'law_proposals': "law_proposals_{term}.json",
+    'questions': "written_questions_{term}.json",
+    'research': "research_proposals_{term}.json",
+    'commissions': "commission_members.json",
+    'mps': "mps_static.json",
+}
+
+# "... Manisa Milletvekili Özgür ÖZEL, ..." / "... Ankara Milletvekili Murat EMİR ve 54 Milletvekili"
+# (şehir, isim) çiftleri
+SIGNATORY_PATTERN = re.compile(r'(?:(\S+)\s+)?Milletvekili\s+([^,]+?)(?:,|$|\s+ve\s+\d+)')
+_CO_SIGNERS_PATTERN = re.compile(r'\s+ve\s+\d+.*')
+
+# Soru başlıklarında büyük harfli isme bitişik konu: "ORHAN SÜMERKamu kurumlarının ..."
+_GLUED_SUBJECT_PATTERN = re.compile(r'(?<=[A-ZÇĞİÖŞÜÂÎÛ]{2})(?=[A-ZÇĞİÖŞÜÂÎÛ][a-zçğıöşüâîû]|\d)')
+
+# Komisyon Rol Bonusları
+COMMISSION_ROLE_BONUS = {
+    "BAŞKAN": 25,
+    "BAŞKANVEKİLİ": 20,
+    "SÖZCÜ": 18,
+    "KATİP": 18,
+    "ÜYE": 15,
+}
+DEFAULT_COMMISSION_BONUS = 15
+
+# Sınıflandırma sonucunun teklif kaydında tutulduğu alan (bkz. fair_scoring.ProposalClassifier)
+PROPOSAL_CATEGORY_FIELD = "_category"
+
+# Korpusta tutulan teklif alanları; özetin sadece ilk satırı (imzacı başlığı) saklanır
+PROPOSAL_FIELDS = ('esas_no', 'date', 'period')
+PROPOSAL_HEADER_FIELD = "header"
+
+# Özet metni sınıflandıran fonksiyon ve anahtar kelime imzası (bkz. LegislativeCorpus.classify_proposals)
+ProposalCategorizer = Tuple[Callable[[str], str], str]
+
+# Paralel ayrıştırmada bir parçadaki en az kayıt sayısı (daha küçük işler seri ayrıştırılır)
+MIN_PARSE_CHUNK = 2000
+
+# İşçi başına parça sayısı (parça süreleri dengesiz olduğunda yükü dengeler)
+CHUNKS_PER_WORKER = 4
+
+
+# ============================================================================
+# AYRIŞTIRMA
+# ============================================================================
+
+def parse_signatory_header(summary: str) -> List[Tuple[str, str]]:
+    """
+    Kanun teklifi özetinin ilk satırındaki imzacıları sırasıyla çıkar.
+
+    Args:
+        summary: Teklif özeti
+
+    Returns:
+        List[(isim, şehir)]: Normalize isim ve seçim çevresi ('' olabilir);
+            ilk eleman ilk imza sahibidir
+    """
+    first_line = summary.split('\n', 1)[0] if summary else ""
+
+    signatories = []
+    for city, match in SIGNATORY_PATTERN.findall(first_line):
+        # Sadece isim kısımlarını al (ilk harfi büyük kelimeler)
+        words = [w for w in match.split() if w[0].isupper()]
+        if len(words) >= 2:
+            signatories.append((normalize_name(' '.join(words)), city))
+    return signatories
+
+
+def parse_signatories(summary: str) -> List[str]:
+    """Kanun teklifi imzacılarının normalize isimleri (ilk eleman ilk imza sahibi)."""
+    return [name for name, _ in parse_signatory_header(summary)]
+
+
+def parse_submitter_header(header: str) -> Optional[Tuple[str, str]]:
+    """
+    Soru/araştırma önergesi başlığından önerge sahibini ve seçim çevresini çıkar.
+
+    Örnek: "İSTANBUL Milletvekili DOĞAN BEKİN ve 20 Milletvekili" -> ("DOGAN BEKIN", "İSTANBUL")
+
+    Returns:
+        Optional[Tuple[str, str]]: (normalize isim, şehir); başlıkta 'Milletvekili' yoksa None
+    """
+    before, found, rest = header.partition('Milletvekili')
+    if not found:
+        return None
+
+    name = rest.strip().split('\n', 1)[0]
+    name = _CO_SIGNERS_PATTERN.sub('', name)
+    glued = _GLUED_SUBJECT_PATTERN.search(name)
+    if glued:
+        name = name[:glued.start()]
+
+    name = normalize_name(name)
+    if not name:
+        return None
+    words = before.split()
+    return name, words[-1] if words else ''
+
+
+def parse_submitter(header: str) -> Optional[str]:
+    """
+    Soru/araştırma önergesi başlığından önerge sahibini çıkar.
+
+    Returns:
+        Optional[str]: Normalize isim; başlıkta 'Milletvekili' yoksa None
+    """
+    parsed = parse_submitter_header(header)
+    return parsed[0] if parsed else None
+
+
+# ============================================================================
+# PARALEL AYRIŞTIRMA
+# ============================================================================
+
+def get_parse_workers() -> int:
+    """
+    Başlık ayrıştırması için süreç sayısı.
+
+    CORPUS_PARSE_WORKERS env: 1 (varsayılan) seri, 0 veya 'auto' CPU sayısı kadar.
+    """
+    value = os.getenv("CORPUS_PARSE_WORKERS", "1").strip().lower()
+    if value in ("0", "auto"):
+        return os.cpu_count() or 1
+    try:
+        return max(1, int(value))
+    except ValueError:
+        logger.warning(f"Geçersiz CORPUS_PARSE_WORKERS değeri: {value}, seri ayrıştırılıyor")
+        return 1
+
+
+def _parse_chunk(task: Tuple[Callable[[str], Any], List[str]]) -> List[Any]:
+    parser, texts = task
+    return [parser(text) for text in texts]
+
+
+def parse_texts(
+    parser: Callable[[str], Any],
+    texts: List[str],
+    workers: int = 1,
+    chunk_size: Optional[int] = None
+) -> List[Any]:
+    """
+    Metinleri ayrıştır; gerekirse ardışık parçalar halinde süreç havuzunda.
+
+    Parçalar sırasıyla birleştirilir, sonuç her zaman seri
+    `[parser(t) for t in texts]` ile aynıdır.
+
+    Args:
+        parser: Modül seviyesinde (pickle edilebilir) ayrıştırıcı fonksiyon
+        texts: Ayrıştırılacak metinler
+        workers: Süreç sayısı (1 ise seri)
+        chunk_size: Parça başına metin (None ise işçi başına CHUNKS_PER_WORKER
+            parça, en az MIN_PARSE_CHUNK metin)
+
+    Returns:
+        List[Any]: texts ile aynı sırada ayrıştırma sonuçları
+    """
+    if chunk_size is None:
+        chunk_size = max(MIN_PARSE_CHUNK, -(-len(texts) // (workers * CHUNKS_PER_WORKER)))
+    chunks = [texts[i:i + chunk_size] for i in range(0, len(texts), chunk_size)]
+
+    if workers <= 1 or len(chunks) < 2:
+        return [parser(text) for text in texts]
+
+    try:
+        with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as executor:
+            results = list(executor.map(_parse_chunk, [(parser, chunk) for chunk in chunks]))
+    except (OSError, BrokenProcessPool) as e:
+        logger.warning(f"Süreç havuzu kullanılamadı, seri ayrıştırılıyor: {str(e)}")
+        return [parser(text) for text in texts]
+
+    logger.debug(f"⚡ {len(texts)} başlık {len(chunks)} parçada {min(workers, len(chunks))} süreçle ayrıştırıldı")
+    return [parsed for chunk in results for parsed in chunk]
+
+
+# ============================================================================
+# İNDEKSLER
+# ============================================================================
+
+@dataclass
+class ProposalIndex:
+    """Kanun teklifi korpusu ve vekil bazlı imza indeksleri."""
+
+    records: List[dict] = field(default_factory=list)
+    signatories: List[List[str]] = field(default_factory=list)      # records ile aynı sırada
+    signatory_cities: List[List[str]] = field(default_factory=list)  # signatories ile aynı sırada
+    by_mp: Dict[str, List[dict]] = field(default_factory=dict)       # imzası olan teklifler
+    first_signature: Dict[str, int] = field(default_factory=dict)
+    support_signature: Dict[str, int] = field(default_factory=dict)
+    ids_by_mp: Dict[str, Set[str]] = field(default_factory=dict)     # esas numaraları
+
+    # Önbellekten gelen sınıflar: (sınıflandırıcı imzası, kayıt sırasıyla sınıflar)
+    cached_categories: Optional[Tuple[str, List[str]]] = None
+
+    # Kayıtlardaki sınıfları üreten sınıflandırıcının imzası (sınıflandırılmadıysa None)
+    category_signature: Optional[str] = None
+
+    @classmethod
+    def build(
+        cls,
+        records: Iterable[dict],
+        resolver: Optional[MPNameResolver] = None,
+        workers: int = 1,
+        categorizer: Optional[ProposalCategorizer] = None
+    ) -> "ProposalIndex":
+        """
+        İmzacı başlıklarını tek geçişte çözerek tüm indeksleri kur.
+
+        Kayıtlar tek geçişte tüketilir ve PROPOSAL_FIELDS ile imzacı başlığına
+        indirgenir; özet metni sadece (verilirse) sınıflandırma için okunur.
+
+        Args:
+            records: Teklif kayıtları (liste veya akış)
+            resolver: Verilirse indeks anahtarları çözümlenen vekilin ismidir
+            workers: Başlık ayrıştırması için süreç sayısı (bkz. parse_texts)
+            categorizer: Verilirse özetler okunurken sınıflandırılır
+        """
+        light_records = []
+        for record in records:
+            summary = record.get('summary', '') or ''
+            light = {key: record[key] for key in PROPOSAL_FIELDS if key in record}
+            light[PROPOSAL_HEADER_FIELD] = summary.split('\n', 1)[0]
+            if categorizer is not None:
+                light[PROPOSAL_CATEGORY_FIELD] = categorizer[0](summary)
+            light_records.append(light)
+
+        # İşçilere sadece ilk satırlar gönderilir (imzacılar orada)
+        headers = parse_texts(
+            parse_signatory_header, [record[PROPOSAL_HEADER_FIELD] for record in light_records], workers
+        )
+        index = cls.from_signatories(
+            light_records,
+            [[name for name, _ in header] for header in headers],
+            [[city for _, city in header] for header in headers],
+            resolver,
+        )
+        if categorizer is not None:
+            index.category_signature = categorizer[1]
+        return index
+
+    @classmethod
+    def from_signatories(
+        cls,
+        records: List[dict],
+        signatories: List[List[str]],
+        cities: Optional[List[List[str]]] = None,
+        resolver: Optional[MPNameResolver] = None
+    ) -> "ProposalIndex":
+        """
+        Ayrıştırılmış imzacı listelerinden vekil indekslerini kur.
+
+        Args:
+            records: Teklif kayıtları
+            signatories: Kayıt başına normalize imzacı isimleri
+            cities: Kayıt başına imzacıların seçim çevreleri
+            resolver: Verilirse indeks anahtarları çözümlenen vekilin ismidir
+        """
+        cities = cities if cities is not None else [[''] * len(names) for names in signatories]
+        by_mp = defaultdict(list)
+        first_sig = defaultdict(int)
+        support_sig = defaultdict(int)
+        ids_by_mp = defaultdict(set)
+
+        # (isim, şehir) -> indeks anahtarı; büyük korpuslarda çözümleyici çağrılarını azaltır
+        keys: Dict[Tuple[str, str], str] = {}
+
+        for record, names, name_cities in zip(records, signatories, cities):
+            esas_no = record.get('esas_no', '')
+
+            for i, name_city in enumerate(zip(names, name_cities)):
+                name = keys.get(name_city)
+                if name is None:
+                    name = resolver.canonical_key(*name_city) if resolver is not None else name_city[0]
+                    keys[name_city] = name
+                by_mp[name].append(record)
+                ids_by_mp[name].add(esas_no)
+                if i == 0:
+                    first_sig[name] += 1
+                else:
+                    support_sig[name] += 1
+
+        return cls(
+            records=records,
+            signatories=signatories,
+            signatory_cities=cities,
+            by_mp=dict(by_mp),
+            first_signature=dict(first_sig),
+            support_signature=dict(support_sig),
+            ids_by_mp=dict(ids_by_mp),
+        )
+
+    # -------------------------------------------------------------------------
+    # İkili önbellek
+    # -------------------------------------------------------------------------
+
+    def to_arrays(self) -> Optional[Dict[str, np.ndarray]]:
+        """
+        İndeksi önbellek dizilerine çevir.
+
+        Kayıtlar sütun sütun, imzacılar tekil isim ID'leri ve ofsetlerle (CSR)
+        saklanır; kayıtlarda sınıf varsa sınıf kodları da eklenir.
+
+        Returns:
+            Optional[Dict[str, np.ndarray]]: Kayıtlar düz metin alanlı değilse None
+        """
+        fields = [key for key in (self.records[0] if self.records else {}) if key != PROPOSAL_CATEGORY_FIELD]
+        if any(len(record) - (PROPOSAL_CATEGORY_FIELD in record) != len(fields) for record in self.records):
+            return None
+        arrays = {'field_names': np.array(fields, dtype=str)}
+
+        for i, key in enumerate(fields):
+            values = [record.get(key) for record in self.records]
+            if not all(isinstance(value, str) for value in values):
+                return None
+            encoded = encode_strings(values)
+            if encoded is None:
+                return None
+            arrays[f'field_{i}'] = encoded
+
+        names, ids = intern_strings([name for names in self.signatories for name in names])
+        encoded_names = encode_strings(names)
+        if encoded_names is None:
+            return None
+
+        arrays['record_count'] = np.array(len(self.records))
+        arrays['mp_names'] = encoded_names
+        arrays['mp_count'] = np.array(len(names))
+        arrays['signatory_ids'] = np.array(ids, dtype=np.int32)
+        arrays['signatory_offsets'] = np.cumsum([0] + [len(names) for names in self.signatories], dtype=np.int64)
+
+        city_names, city_ids = intern_strings([city for cities in self.signatory_cities for city in cities])
+        encoded_cities = encode_strings(city_names)
+        if encoded_cities is None:
+            return None
+        arrays['city_names'] = encoded_cities
+        arrays['city_count'] = np.array(len(city_names))
+        arrays['signatory_city_ids'] = np.array(city_ids, dtype=np.int32)
+
+        categories = [record.get(PROPOSAL_CATEGORY_FIELD) for record in self.records]
+        if self.records and all(categories):
+            category_names, codes = intern_strings(categories)
+            arrays['category_names'] = np.array(category_names, dtype=str)
+            arrays['category_codes'] = np.array(codes, dtype=np.int8)
+        return arrays
+
+    @classmethod
+    def from_arrays(cls, arrays: Dict[str, Any], resolver: Optional[MPNameResolver] = None) -> "ProposalIndex":
+        """to_arrays çıktısından indeksi kur (regex ve JSON ayrıştırması olmadan)."""
+        count = int(arrays['record_count'])
+        fields = arrays['field_names'].tolist()
+        columns = [decode_strings(arrays[f'field_{i}'], count) for i in range(len(fields))]
+        records = [dict(zip(fields, values)) for values in zip(*columns)] if fields else [{} for _ in range(count)]
+
+        names = decode_strings(arrays['mp_names'], int(arrays['mp_count']))
+        ids = arrays['signatory_ids'].tolist()
+        offsets = arrays['signatory_offsets'].tolist()
+        signatories = [[names[j] for j in ids[offsets[i]:offsets[i + 1]]] for i in range(count)]
+
+        city_names = decode_strings(arrays['city_names'], int(arrays['city_count']))
+        city_ids = arrays['signatory_city_ids'].tolist()
+        cities = [[city_names[j] for j in city_ids[offsets[i]:offsets[i + 1]]] for i in range(count)]
+
+        index = cls.from_signatories(records, signatories, cities, resolver)
+
+        signature = arrays[META_KEY].get('category_signature')
+        if signature and 'category_codes' in arrays:
+            category_names = arrays['category_names'].tolist()
+            index.cached_categories = (signature, [category_names[c] for c in arrays['category_codes'].tolist()])
+        return index
+
+    def restore_categories(self, signature: str) -> bool:
+        """
+        Önbellekteki sınıfları kayıtlara işle.
+
+        Args:
+            signature: Güncel sınıflandırıcının imzası
+
+        Returns:
+            bool: Önbellekte aynı sınıflandırıcıyla üretilmiş sınıflar varsa True
+        """
+        if not self.cached_categories or self.cached_categories[0] != signature:
+            return False
+        for record, category in zip(self.records, self.cached_categories[1]):
+            record[PROPOSAL_CATEGORY_FIELD] = category
+        self.category_signature = signature
+        return True
+
+
+@dataclass
+class CommissionIndex:
+    """Komisyon üyeliklerinin vekil bazlı indeksi."""
+
+    bonuses: Dict[str, int] = field(default_factory=dict)               # rol bonusları toplamı
+    roles: Dict[str, List[Tuple[str, str]]] = field(default_factory=dict)  # [(komisyon, rol)]
+
+    @classmethod
+    def build(
+        cls,
+        commissions: Dict[str, List[dict]],
+        resolver: Optional[MPNameResolver] = None
+    ) -> "CommissionIndex":
+        bonuses = defaultdict(int)
+        roles = defaultdict(list)
+
+        for commission_name, members in commissions.items():
+            for member in members:
+                name = member.get('name', '')
+                if resolver is not None:
+                    name = resolver.canonical_key(name, member.get('constituency'))
+                else:
+                    name = normalize_name(name)
+                role = member.get('role', 'ÜYE')
+
+                # Birden fazla komisyon üyeliği varsa topla
+                bonuses[name] += COMMISSION_ROLE_BONUS.get(role, DEFAULT_COMMISSION_BONUS)
+                roles[name].append((commission_name, role))
+
+        return cls(bonuses=dict(bonuses), roles=dict(roles))
+
+
+def parse_submitters(
+    records: Iterable[dict],
+    text_field: str,
+    first_line_only: bool = False,
+    workers: int = 1
+) -> List[Tuple[str, str]]:
+    """
+    Önerge kayıtlarının sahiplerini çıkar.
+
+    Args:
+        records: Soru veya araştırma önergesi kayıtları (liste veya akış)
+        text_field: Başlığı içeren alan ('subject' veya 'summary')
+        first_line_only: Sadece metnin ilk satırına bakılsın mı
+        workers: Başlık ayrıştırması için süreç sayısı (bkz. parse_texts)
+
+    Returns:
+        List[(isim, şehir)]: Kayıt sırasıyla; sahibi bulunamayan kayıtlar için ('', '')
+    """
+    texts = [record.get(text_field, '') for record in records]
+    if first_line_only:
+        texts = [text.split('\n', 1)[0] for text in texts]
+    return [parsed or ('', '') for parsed in parse_texts(parse_submitter_header, texts, workers)]
+
+
+def count_submitters(
+    submitters: List[Tuple[str, str]],
+    resolver: Optional[MPNameResolver] = None
+) -> Dict[str, int]:
+    """Önerge sahiplerini say (resolver verilirse çözümlenen vekil ismine göre)."""
+    counts = defaultdict(int)
+    for name, city in submitters:
+        if name:
+            counts[resolver.canonical_key(name, city) if resolver is not None else name] += 1
+    return dict(counts)
+
+
+def submitters_to_arrays(submitters: List[Tuple[str, str]]) -> Optional[Dict[str, np.ndarray]]:
+    """Önerge sahiplerini önbellek dizilerine çevir (tekil isim ve şehir ID'leri)."""
+    names, name_ids = intern_strings([name for name, _ in submitters])
+    cities, city_ids = intern_strings([city for _, city in submitters])
+    encoded_names, encoded_cities = encode_strings(names), encode_strings(cities)
+    if encoded_names is None or encoded_cities is None:
+        return None
+    return {
+        'mp_names': encoded_names,
+        'mp_count': np.array(len(names)),
+        'submitter_ids': np.array(name_ids, dtype=np.int32),
+        'city_names': encoded_cities,
+        'city_count': np.array(len(cities)),
+        'city_ids': np.array(city_ids, dtype=np.int32),
+    }
+
+
+def submitters_from_arrays(arrays: Dict[str, Any]) -> List[Tuple[str, str]]:
+    """submitters_to_arrays çıktısını listeye geri çevir."""
+    names = decode_strings(arrays['mp_names'], int(arrays['mp_count']))
+    cities = decode_strings(arrays['city_names'], int(arrays['city_count']))
+    return [(names[n], cities[c]) for n, c in zip(arrays['submitter_ids'].tolist(), arrays['city_ids'].tolist())]
+
+
+# ============================================================================
+# KORPUS
+# ============================================================================
+
+class LegislativeCorpus:
+    """
+    data/ kaynaklarının süreç içi paylaşılan görünümü.
+
+    Her kaynak ilk erişimde bir kez okunur ve indekslenir; sonraki erişimler
+    aynı nesneleri döndürür. Dönen yapılar paylaşılır, değiştirilmemelidir.
+    """
+
+    def __init__(
+        self,
+        data_dir: Optional[Path] = None,
+        term: int = DEFAULT_TERM,
+        paths: Optional[Dict[str, Path]] = None,
+        cache_dir: Optional[Path] = None,
+        use_cache: Optional[bool] = None,
+        parse_workers: Optional[int] = None
+    ):
+        """
+        Args:
+            data_dir: Veri dizini (None ise python_backend/data)
+            term: Yasama dönemi (dosya adlarında kullanılır)
+            paths: Kaynak adı -> dosya yolu (varsayılan dosya adlarını ezer)
+            cache_dir: İkili önbellek dizini (None ise <veri dizini>/.corpus_cache)
+            use_cache: Önbellek kullanılsın mı (None ise CORPUS_CACHE env)
+            parse_workers: Başlık ayrıştırma süreç sayısı (None ise CORPUS_PARSE_WORKERS env)
+        """
+        self.data_dir = Path(data_dir) if data_dir else DATA_DIR
+        self.term = term
+        self._paths = {name: Path(path) for name, path in (paths or {}).items()}
+
+        if use_cache is None:
+            use_cache = is_cache_enabled()
+        self.cache = CorpusCache(Path(cache_dir) if cache_dir else self.data_dir / CACHE_DIR_NAME) if use_cache else None
+        self._stamps: Dict[str, SourceStamp] = {}
+        self.cache_hits: List[str] = []
+        self.parse_workers = parse_workers if parse_workers is not None else get_parse_workers()
+        self._categorizer: Optional[ProposalCategorizer] = None
+
+    def path(self, source: str) -> Path:
+        """Kaynağın dosya yolu."""
+        if source in self._paths:
+            return self._paths[source]
+        return self.data_dir / SOURCE_FILES[source].format(term=self.term)
+
+    def _read(self, source: str, default: Any) -> Any:
+        path = self.path(source)
+        if not path.exists():
+            logger.warning(f"Dosya bulunamadı: {path}")
+            return default
+
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def _stream(
+        self,
+        source: str,
+        fields: Optional[Iterable[str]] = None,
+        header_fields: Iterable[str] = ()
+    ) -> Iterator[dict]:
+        """Kaynağın kayıtlarını indirgenmiş olarak akıt (dosya yoksa boş)."""
+        path = self.path(source)
+        if not path.exists():
+            logger.warning(f"Dosya bulunamadı: {path}")
+            return iter(())
+        return iter_records(path, fields, header_fields)
+
+    def _load_cached(
+        self,
+        source: str,
+        kind: str,
+        parse: Callable[[Iterator[dict]], Any],
+        encode: Callable[[Any], Optional[Dict[str, np.ndarray]]],
+        decode: Callable[[Dict[str, Any]], Any],
+        fields: Optional[Iterable[str]] = None,
+        header_fields: Iterable[str] = (),
+        meta: Optional[Callable[[Any], dict]] = None
+    ) -> Any:
+        """
+        Kaynağı önbellekten yükle; önbellek yoksa veya eskiyse akıtarak ayrıştırıp yaz.
+
+        Args:
+            source: Kaynak adı
+            kind: Önbellek içerik türü
+            parse: Kayıt akışından indeks kuran fonksiyon
+            encode: İndeksi önbellek dizilerine çeviren fonksiyon
+            decode: Önbellek dizilerinden indeks kuran fonksiyon
+            fields: Akışta tutulacak kayıt alanları (None ise hepsi)
+            header_fields: Akışta sadece ilk satırı tutulacak alanlar
+            meta: İndeksten önbellek meta kaydına eklenecek alanları üreten fonksiyon
+        """
+        path = self.path(source)
+        if self.cache is None or not path.exists():
+            return parse(self._stream(source, fields, header_fields))
+
+        stamp = SourceStamp.of_file(path)
+        self._stamps[source] = stamp
+
+        arrays = self.cache.load(path, stamp, kind)
+        if arrays is not None:
+            try:
+                value = decode(arrays)
+                self.cache_hits.append(source)
+                return value
+            except (KeyError, ValueError, IndexError) as e:
+                logger.warning(f"Korpus önbelleği bozuk ({path.name}), yeniden ayrıştırılıyor: {str(e)}")
+
+        value = parse(self._stream(source, fields, header_fields))
+        stat = path.stat()
+        if (stat.st_size, stat.st_mtime_ns) != (stamp.size, stamp.mtime_ns):
+            # Kaynak akış sırasında değişti; damga içerikle eşleşmeyebilir
+            logger.warning(f"Kaynak okunurken değişti ({path.name}), önbelleğe yazılmadı")
+            return value
+
+        encoded = encode(value)
+        if encoded is not None:
+            self.cache.store(path, stamp, kind, encoded, extra=meta(value) if meta else None)
+        return value
+
+    @cached_property
+    def proposals(self) -> ProposalIndex:
+        """Kanun teklifleri ve imza indeksleri."""
+        resolver = self.resolver
+        categorizer = self._categorizer
+        index = self._load_cached(
+            'law_proposals', 'proposals',
+            lambda records: ProposalIndex.build(records, resolver, self.parse_workers, categorizer),
+            ProposalIndex.to_arrays,
+            lambda arrays: ProposalIndex.from_arrays(arrays, resolver),
+            fields=PROPOSAL_FIELDS + ('summary',),
+            meta=lambda index: {'category_signature': index.category_signature} if index.category_signature else {},
+        )
+        logger.info(f"📚 Korpus: {len(index.records)} kanun teklifi, {len(index.by_mp)} imzacı vekil")
+        return index
+
+    def classify_proposals(self, classify_text: Callable[[str], str], signature: str) -> Dict[str, int]:
+        """
+        Teklifleri sınıflandır; sınıflar kayıtların PROPOSAL_CATEGORY_FIELD alanına yazılır.
+
+        Korpus henüz yüklenmediyse özetler imzacılarla aynı akışta sınıflandırılır.
+        Aynı imzalı sınıflar önbellekte varsa kullanılır; yoksa kaynak sadece özet
+        alanıyla yeniden akıtılır.
+
+        Args:
+            classify_text: Özet metninden sınıf üreten fonksiyon
+            signature: Sınıflandırıcının anahtar kelime imzası
+
+        Returns:
+            Dict[sınıf, teklif sayısı]
+        """
+        if 'proposals' not in self.__dict__:
+            self._categorizer = (classify_text, signature)
+        index = self.proposals
+
+        if index.category_signature != signature and not index.restore_categories(signature):
+            count = 0
+            for record, source in zip(index.records, self._stream('law_proposals', ('summary',))):
+                record[PROPOSAL_CATEGORY_FIELD] = classify_text(source.get('summary', '') or '')
+                count += 1
+            if count != len(index.records):
+                logger.warning(f"⚠️ Teklif dosyası yüklemeden sonra değişmiş: {count}/{len(index.records)} sınıflandırıldı")
+            index.category_signature = signature
+            self.save_categories(signature)
+
+        counts = defaultdict(int)
+        for record in index.records:
+            counts[record.get(PROPOSAL_CATEGORY_FIELD)] += 1
+        return dict(counts)
+
+    def save_categories(self, signature: str) -> bool:
+        """
+        Kayıtlara işlenmiş teklif sınıflarını önbelleğe ekle.
+
+        Args:
+            signature: Sınıfları üreten sınıflandırıcının imzası
+
+        Returns:
+            bool: Önbellek güncellendiyse True
+        """
+        stamp = self._stamps.get('law_proposals')
+        if self.cache is None or stamp is None:
+            return False
+
+        index = self.proposals
+        arrays = index.to_arrays()
+        if arrays is None or 'category_codes' not in arrays:
+            return False
+
+        stored = self.cache.store(self.path('law_proposals'), stamp, 'proposals', arrays,
+                                  extra={'category_signature': signature})
+        if stored:
+            index.cached_categories = (signature, [r[PROPOSAL_CATEGORY_FIELD] for r in index.records])
+        return stored
+
+    @cached_property
+    def question_counts(self) -> Dict[str, int]:
+        """Vekil -> yazılı soru önergesi sayısı."""
+        submitters = self._load_cached(
+            'questions', 'submitters',
+            lambda records: parse_submitters(records, 'subject', workers=self.parse_workers),
+            submitters_to_arrays, submitters_from_arrays,
+            fields=('subject',), header_fields=('subject',)
+        )
+        return count_submitters(submitters, self.resolver)
+
+    @cached_property
+    def research_counts(self) -> Dict[str, int]:
+        """Vekil -> araştırma önergesi sayısı."""
+        submitters = self._load_cached(
+            'research', 'submitters',
+            lambda records: parse_submitters(records, 'summary', first_line_only=True, workers=self.parse_workers),
+            submitters_to_arrays, submitters_from_arrays,
+            fields=('summary',), header_fields=('summary',)
+        )
+        return count_submitters(submitters, self.resolver)
+
+    @cached_property
+    def commissions(self) -> CommissionIndex:
+        """Komisyon üyelikleri."""
+        return CommissionIndex.build(self._read('commissions', {}), self.resolver)
+
+    @cached_property
+    def static_mps(self) -> List[dict]:
+        """mps_static.json'daki vekiller, 'city' alanı eklenmiş düz liste olarak."""
+        cities = self._read('mps', {}).get('cities', {})
+        return [{**mp, 'city': city} for city, city_mps in cities.items() for mp in city_mps]
+
+    @cached_property
+    def resolver(self) -> MPNameResolver:
+        """Statik vekil listesinden kurulan isim çözümleyici."""
+        return MPNameResolver(self.static_mps)
+
+
+# Paylaşılan korpuslar: (veri dizini, dönem, ezilen yollar) -> korpus
+_corpus_instances: Dict[Tuple, LegislativeCorpus] = {}
+
+
+def get_corpus(
+    data_dir: Optional[Path] = None,
+    term: int = DEFAULT_TERM,
+    paths: Optional[Dict[str, Path]] = None
+) -> LegislativeCorpus:
+    """
+    Paylaşılan korpus instance'ını döndür (aynı kaynaklar için tek instance).
+
+    Args:
+        data_dir: Veri dizini (None ise python_backend/data)
+        term: Yasama dönemi
+        paths: Kaynak adı -> dosya yolu (varsayılan dosya adlarını ezer)
+    """
+    data_dir = Path(data_dir).resolve() if data_dir else DATA_DIR.resolve()
+    overrides = tuple(sorted((name, str(Path(p).resolve())) for name, p in (paths or {}).items()))
+    key = (str(data_dir), term, overrides)
+
+    if key not in _corpus_instances:
+        _corpus_instances[key] = LegislativeCorpus(data_dir, term, dict(overrides))
+    return _corpus_instances[key]
+
+
+def get_corpus_for_file(source: str, path: Path) -> LegislativeCorpus:
+    """
+    Tek bir kaynak dosyası için paylaşılan korpusu döndür.
+
+    Dosya, dizinindeki varsayılan korpusun aynı kaynağıysa o korpus kullanılır;
+    böylece dosya yolu alan eski yükleyiciler de aynı ayrıştırmayı paylaşır.
+    """
+    path = Path(path)
+    corpus = get_corpus(path.parent)
+    if corpus.path(source).resolve() == path.resolve():
+        return corpus
+    return get_corpus(path.parent, paths={source: path})
+
+
+def get_mp_resolver() -> MPNameResolver:
+    """Varsayılan korpusun paylaşılan isim çözümleyicisi."""
+    return get_corpus().resolver
+
+
+def reset_corpus():
+    """Paylaşılan korpusları unut (veri dosyaları yenilendikten sonra)."""
+    _corpus_instances.clear()
@@ -0,0 +1,410 @@
+"""
+Yerel Depolama Modülü
+Firestore client'ının SQLite üzerinde çalışan çevrimdışı karşılığı.
+
+`FirestoreService` ve scriptlerin kullandığı Firestore API alt kümesini
+(koleksiyon/doküman referansları, set/update/delete, add, batch,
+where/order_by/limit/select sorguları) aynı imzalarla sağlar; böylece tüm
+job'lar canlı kimlik bilgisi olmadan uçtan uca çalıştırılıp profillenebilir.
+
+Dokümanlar `docs(collection, doc_id, data)` tablosunda JSON olarak tutulur.
+`datetime` değerleri etiketlenerek saklanır ve okunurken geri çevrilir.
+`db_path=':memory:'` ile tamamen bellek içi çalışır.
+"""
+
+import json
+import sqlite3
+import threading
+import uuid
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+try:
+    from google.cloud.firestore import SERVER_TIMESTAMP as _FIRESTORE_SERVER_TIMESTAMP
+except ImportError:  # pragma: no cover - firebase_admin kurulu değilse
+    _FIRESTORE_SERVER_TIMESTAMP = None
+
+from config.storage_config import MAX_BATCH_SIZE
+
+
+_DATETIME_TAG = '__datetime__'
+
+
+class DocumentNotFoundError(Exception):
+    """Var olmayan bir doküman güncellenmeye çalışıldı."""
+
+
+# =========================================================================
+# Değer dönüşümleri
+# =========================================================================
+
+def _encode(value: Any) -> Any:
+    """Değeri JSON'a yazılabilir biçime çevir (datetime etiketlenir)."""
+    if isinstance(value, datetime):
+        return {_DATETIME_TAG: value.isoformat()}
+    if isinstance(value, dict):
+        return {key: _encode(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_encode(item) for item in value]
+    return value
+
+
+def _decode(value: Any) -> Any:
+    """_encode'un tersi."""
+    if isinstance(value, dict):
+        if len(value) == 1 and _DATETIME_TAG in value:
+            return datetime.fromisoformat(value[_DATETIME_TAG])
+        return {key: _decode(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_decode(item) for item in value]
+    return value
+
+
+def _resolve_sentinels(value: Any) -> Any:
+    """Firestore SERVER_TIMESTAMP işaretlerini yerel saate çevir."""
+    if _FIRESTORE_SERVER_TIMESTAMP is not None and value is _FIRESTORE_SERVER_TIMESTAMP:
+        return datetime.now()
+    if isinstance(value, dict):
+        return {key: _resolve_sentinels(item) for key, item in value.items()}
+    return value
+
+
+_MISSING = object()
+
+
+def _get_path(data: Dict[str, Any], path: str) -> Any:
+    """'a.b' biçimindeki alan yolunun değerini döndür (yoksa _MISSING)."""
+    current: Any = data
+    for part in path.split('.'):
+        if not isinstance(current, dict) or part not in current:
+            return _MISSING
+        current = current[part]
+    return current
+
+
+def _set_path(data: Dict[str, Any], path: str, value: Any):
+    """'a.b' biçimindeki alan yoluna değer yaz (ara sözlükler oluşturulur)."""
+    parts = path.split('.')
+    current = data
+    for part in parts[:-1]:
+        if not isinstance(current.get(part), dict):
+            current[part] = {}
+        current = current[part]
+    current[parts[-1]] = value
+
+
+def _deep_merge(target: Dict[str, Any], updates: Dict[str, Any]) -> Dict[str, Any]:
+    """set(merge=True) semantiği: iç içe sözlükleri birleştir."""
+    for key, value in updates.items():
+        if isinstance(value, dict) and isinstance(target.get(key), dict):
+            _deep_merge(target[key], value)
+        else:
+            target[key] = value
+    return target
+
+
+# Firestore'un karışık tipleri sıralama düzeni
+_TYPE_ORDER = {type(None): 0, bool: 1, int: 2, float: 2, datetime: 3, str: 4, list: 5, dict: 6}
+
+
+def _sort_key(value: Any) -> Tuple[int, Any]:
+    rank = _TYPE_ORDER.get(type(value), 7)
+    if rank in (5, 6, 7):
+        return rank, json.dumps(_encode(value), sort_keys=True, default=str)
+    if isinstance(value, datetime) and value.tzinfo is not None:
+        # Aware ve naive datetime'lar karşılaştırılabilsin diye UTC naive'e indir
+        value = value.replace(tzinfo=None) - value.utcoffset()
+    return rank, value
+
+
+def _matches(value: Any, op: str, expected: Any) -> bool:
+    """Tek bir where koşulunu değerlendir."""
+    if value is _MISSING:
+        return False
+    if op == '==':
+        return value == expected
+    if op == '!=':
+        return value != expected
+    if op == 'in':
+        return value in expected
+    if op == 'not-in':
+        return value not in expected
+    if op == 'array_contains':
+        return isinstance(value, list) and expected in value
+    if op == 'array_contains_any':
+        return isinstance(value, list) and any(item in value for item in expected)
+    if op in ('<', '<=', '>', '>='):
+        left, right = _sort_key(value), _sort_key(expected)
+        if left[0] != right[0]:
+            return False
+        return {
+            '<': left < right, '<=': left <= right, '>': left > right, '>=': left >= right
+        }[op]
+    raise ValueError(f"Desteklenmeyen sorgu operatörü: {op}")
+
+
+# =========================================================================
+# Doküman ve sorgu nesneleri
+# =========================================================================
+
+class LocalDocumentSnapshot:
+    """Firestore DocumentSnapshot karşılığı."""
+
+    def __init__(self, reference: 'LocalDocumentReference', data: Optional[Dict[str, Any]]):
+        self.reference = reference
+        self.id = reference.id
+        self.exists = data is not None
+        self._data = data
+
+    def to_dict(self) -> Optional[Dict[str, Any]]:
+        return dict(self._data) if self._data is not None else None
+
+    def get(self, field_path: str) -> Any:
+        value = _get_path(self._data or {}, field_path)
+        if value is _MISSING:
+            raise KeyError(field_path)
+        return value
+
+
+class LocalDocumentReference:
+    """Firestore DocumentReference karşılığı."""
+
+    def __init__(self, store: 'LocalStore', collection: str, doc_id: str):
+        self._store = store
+        self._collection = collection
+        self.id = doc_id
+
+    @property
+    def path(self) -> str:
+        return f"{self._collection}/{self.id}"
+
+    def get(self) -> LocalDocumentSnapshot:
+        return LocalDocumentSnapshot(self, self._store._read(self._collection, self.id))
+
+    def set(self, document_data: Dict[str, Any], merge: bool = False):
+        self._store._apply([('set', self, document_data, merge)])
+
+    def update(self, field_updates: Dict[str, Any]):
+        self._store._apply([('update', self, field_updates, False)])
+
+    def delete(self):
+        self._store._apply([('delete', self, None, False)])
+
+
+class LocalQuery:
+    """Firestore Query karşılığı (değişmez; her çağrı yeni sorgu döndürür)."""
+
+    def __init__(
+        self,
+        store: 'LocalStore',
+        collection: str,
+        filters: Sequence[Tuple[str, str, Any]] = (),
+        orders: Sequence[Tuple[str, str]] = (),
+        limit_count: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None
+    ):
+        self._store = store
+        self._collection = collection
+        self._filters = tuple(filters)
+        self._orders = tuple(orders)
+        self._limit = limit_count
+        self._fields = tuple(fields) if fields is not None else None
+
+    def _copy(self, **changes) -> 'LocalQuery':
+        params = {
+            'filters': self._filters, 'orders': self._orders,
+            'limit_count': self._limit, 'fields': self._fields,
+        }
+        params.update(changes)
+        return LocalQuery(self._store, self._collection, **params)
+
+    def where(self, field_path: str, op_string: str, value: Any) -> 'LocalQuery':
+        return self._copy(filters=self._filters + ((field_path, op_string, value),))
+
+    def order_by(self, field_path: str, direction: str = 'ASCENDING') -> 'LocalQuery':
+        direction = str(direction).upper()
+        if direction not in ('ASCENDING', 'DESCENDING'):
+            raise ValueError(f"Geçersiz sıralama yönü: {direction}")
+        return self._copy(orders=self._orders + ((field_path, direction),))
+
+    def limit(self, count: int) -> 'LocalQuery':
+        return self._copy(limit_count=count)
+
+    def select(self, field_paths: Sequence[str]) -> 'LocalQuery':
+        return self._copy(fields=list(field_paths))
+
+    def stream(self) -> Iterator[LocalDocumentSnapshot]:
+        # Eşitlik koşulları SQL'e indirilir, kalanı Python'da değerlendirilir
+        rows = self._store._scan(self._collection, [f for f in self._filters if f[1] == '=='])
+        docs = [
+            (doc_id, data) for doc_id, data in rows
+            if all(_matches(_get_path(data, path), op, value) for path, op, value in self._filters)
+        ]
+
+        # Firestore gibi: order_by alanı olmayan dokümanlar sonuçtan çıkar
+        for path, _ in self._orders:
+            docs = [(doc_id, data) for doc_id, data in docs if _get_path(data, path) is not _MISSING]
+        for path, direction in reversed(self._orders):
+            docs.sort(key=lambda doc: _sort_key(_get_path(doc[1], path)),
+                      reverse=direction == 'DESCENDING')
+
+        if self._limit is not None:
+            docs = docs[:self._limit]
+
+        for doc_id, data in docs:
+            if self._fields is not None:
+                projected: Dict[str, Any] = {}
+                for path in self._fields:
+                    value = _get_path(data, path)
+                    if value is not _MISSING:
+                        _set_path(projected, path, value)
+                data = projected
+            yield LocalDocumentSnapshot(LocalDocumentReference(self._store, self._collection, doc_id), data)
+
+    def get(self) -> List[LocalDocumentSnapshot]:
+        return list(self.stream())
+
+
+class LocalCollectionReference(LocalQuery):
+    """Firestore CollectionReference karşılığı."""
+
+    def __init__(self, store: 'LocalStore', collection: str):
+        super().__init__(store, collection)
+        self.id = collection
+
+    def document(self, document_id: Optional[str] = None) -> LocalDocumentReference:
+        return LocalDocumentReference(self._store, self._collection, document_id or uuid.uuid4().hex[:20])
+
+    def add(self, document_data: Dict[str, Any],
+            document_id: Optional[str] = None) -> Tuple[datetime, LocalDocumentReference]:
+        doc_ref = self.document(document_id)
+        doc_ref.set(document_data)
+        return datetime.now(), doc_ref
+
+
+class LocalWriteBatch:
+    """Firestore WriteBatch karşılığı; commit atomiktir."""
+
+    def __init__(self, store: 'LocalStore'):
+        self._store = store
+        self._ops: List[Tuple[str, LocalDocumentReference, Any, bool]] = []
+
+    def __len__(self) -> int:
+        return len(self._ops)
+
+    def set(self, reference: LocalDocumentReference, document_data: Dict[str, Any], merge: bool = False):
+        self._ops.append(('set', reference, document_data, merge))
+
+    def update(self, reference: LocalDocumentReference, field_updates: Dict[str, Any]):
+        self._ops.append(('update', reference, field_updates, False))
+
+    def delete(self, reference: LocalDocumentReference):
+        self._ops.append(('delete', reference, None, False))
+
+    def commit(self) -> List[datetime]:
+        if len(self._ops) > MAX_BATCH_SIZE:
+            raise ValueError(f"Batch en fazla {MAX_BATCH_SIZE} işlem içerebilir ({len(self._ops)} verildi)")
+        self._store._apply(self._ops)
+        now = datetime.now()
+        results = [now] * len(self._ops)
+        self._ops = []
+        return results
+
+
+# =========================================================================
+# Client
+# =========================================================================
+
+class LocalStore:
+    """SQLite tabanlı, thread-safe Firestore client karşılığı."""
+
+    def __init__(self, db_path: str = ':memory:'):
+        """
+        Args:
+            db_path: SQLite dosya yolu (':memory:' ise bellek içi)
+        """
+        self.db_path = str(db_path)
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        if self.db_path != ':memory:':
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS docs (
+                collection TEXT NOT NULL,
+                doc_id TEXT NOT NULL,
+                data TEXT NOT NULL,
+                PRIMARY KEY (collection, doc_id)
+            );
+        """)
+        self._conn.commit()
+
+    def collection(self, collection_path: str) -> LocalCollectionReference:
+        return LocalCollectionReference(self, collection_path)
+
+    def batch(self) -> LocalWriteBatch:
+        return LocalWriteBatch(self)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    # -------------------------------------------------------------------------
+    # SQLite erişimi
+    # -------------------------------------------------------------------------
+
+    def _read(self, collection: str, doc_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM docs WHERE collection = ? AND doc_id = ?", (collection, doc_id)
+            ).fetchone()
+        return _decode(json.loads(row[0])) if row else None
+
+    def _scan(self, collection: str,
+              equalities: Sequence[Tuple[str, str, Any]] = ()) -> List[Tuple[str, Dict[str, Any]]]:
+        sql = "SELECT doc_id, data FROM docs WHERE collection = ?"
+        params: List[Any] = [collection]
+        for path, _, value in equalities:
+            # Sadece SQLite'ın JSON karşılığıyla birebir eşleşen skalerler indirilir
+            if isinstance(value, (str, int, float)) and not isinstance(value, bool):
+                sql += " AND json_extract(data, ?) = ?"
+                params.extend(['$.' + '.'.join(f'"{part}"' for part in path.split('.')), value])
+        sql += " ORDER BY doc_id"
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [(doc_id, _decode(json.loads(data))) for doc_id, data in rows]
+
+    def _apply(self, ops: Sequence[Tuple[str, LocalDocumentReference, Any, bool]]):
+        """Yazma işlemlerini tek transaction içinde uygula."""
+        with self._lock:
+            try:
+                pending: Dict[Tuple[str, str], Optional[Dict[str, Any]]] = {}
+                for kind, ref, payload, merge in ops:
+                    key = (ref._collection, ref.id)
+                    current = pending[key] if key in pending else self._read(*key)
+
+                    if kind == 'delete':
+                        pending[key] = None
+                    elif kind == 'set':
+                        data = _resolve_sentinels(dict(payload))
+                        pending[key] = _deep_merge(current or {}, data) if merge else data
+                    elif kind == 'update':
+                        if current is None:
+                            raise DocumentNotFoundError(f"Doküman bulunamadı: {ref.path}")
+                        for path, value in _resolve_sentinels(dict(payload)).items():
+                            _set_path(current, path, value)
+                        pending[key] = current
+
+                for (collection, doc_id), data in pending.items():
+                    if data is None:
+                        self._conn.execute(
+                            "DELETE FROM docs WHERE collection = ? AND doc_id = ?", (collection, doc_id)
+                        )
+                    else:
+                        self._conn.execute(
+                            "INSERT OR REPLACE INTO docs (collection, doc_id, data) VALUES (?, ?, ?)",
+                            (collection, doc_id, json.dumps(_encode(data), ensure_ascii=False, default=str))
+                        )
+                self._conn.commit()
+            except Exception:
+                self._conn.rollback()
+                raise
@@ -7,11 +7,13 @@ TBMM Milletvekilleri - Hibrit Veri Kaynağı
 
 import re
 import hashlib
-import time
 from typing import List, Optional
 from dataclasses import dataclass
 from datetime import datetime
-from playwright.sync_api import sync_playwright
+from config.scraper_config import ScraperConfig
+from services.browser_pool import get_browser_pool
+from services.rate_limiter import scroll_and_wait_for_growth
+from services.retry_policy import retry_navigate
 
 
 @dataclass
@@ -199,25 +201,24 @@ def scrape_tbmm_names() -> List[str]:
     print("🌐 TBMM sitesinden isimler çekiliyor...")
     
     names = []
+    config = ScraperConfig.from_env()
     
     try:
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page()
-            page.goto(url, wait_until='networkidle', timeout=30000)
+        with get_browser_pool().page() as page:
+            # İstek paylaşılan hız denetleyicisinden geçer
+            retry_navigate(page, url, wait_until='networkidle', timeout=30000)
             
             # Tüm listeye tıkla
             try:
-                page.click('text=TÜM LİSTE', timeout=5000)
+                page.click('text=TÜM LİSTE', timeout=config.button_click_timeout)
                 page.wait_for_load_state('networkidle')
-                time.sleep(2)
             except:
                 pass
             
-            # Scroll down
-            for _ in range(10):
-                page.evaluate('window.scrollTo(0, document.body.scrollHeight)')
-                time.sleep(0.3)
+            # Yeni satırlar gelmeyene kadar scroll et
+            for _ in range(config.max_scroll_attempts):
+                if not scroll_and_wait_for_growth(page, int(config.scroll_wait * 1000)):
+                    break
             
             # Tüm isimleri çek
             names = page.evaluate('''() => {
@@ -238,8 +239,6 @@ def scrape_tbmm_names() -> List[str]:
                 
                 return [...new Set(names)];
             }''')
-            
-            browser.close()
     except Exception as e:
         print(f"❌ Hata: {e}")
     
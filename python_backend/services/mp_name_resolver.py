@@ -0,0 +1,247 @@
+"""
+Milletvekili İsim Çözümleme Modülü
+Teklif, soru ve komisyon kayıtlarındaki isimleri mps_static.json'daki vekillere eşler.
+
+İsimler Türkçe karakterleri ASCII'ye katlayan önceden hesaplanmış bir translate
+tablosuyla normalize edilir. Vekil listesinden dört indeks kurulur ve her isim
+sırasıyla bunlarda aranır:
+1. Birebir isim ("Özgür ÖZEL")
+2. Katlanmış tam isim ("OZGUR OZEL")
+3. Ön ad öneki + soyad ("MUSTAFA TANRIKULU" -> "Mustafa Sezgin TANRIKULU")
+4. Tam isim veya soyad + seçim çevresi ("TANRIKULU" + "DİYARBAKIR"), sadece
+   şehir biliniyorsa; aynı isimli vekiller de böylece ayrılır
+
+Bir anahtar birden fazla vekile karşılık geliyorsa o indekste belirsiz sayılır
+ve bir sonraki indekse geçilir; böylece yanlış vekile eşleme yapılmaz. Her arama
+O(1)'dir ve sonuçlar (isim, şehir) anahtarıyla önbelleğe alınır.
+
+Aynı isimli vekillerin (iki "Mustafa DEMİR") ID'si ve indeks anahtarı seçim
+çevresini de içerir ("MUSTAFA DEMIR (KILIS)"); korpus sayımları ve mps
+dokümanları böylece birleşmez.
+"""
+
+import hashlib
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from services.static_mp_loader import StaticMP
+
+
+# Türkçe (ve şapkalı) büyük harfler -> ASCII; normalize_name önce upper() uygular.
+# 'İ'.lower()/title() sonrası kalan birleşik nokta (U+0307) atılır ("Ki̇li̇s" -> "KILIS").
+TURKISH_ASCII_TABLE = str.maketrans({
+    'Ç': 'C', 'Ğ': 'G', 'İ': 'I', 'Ö': 'O', 'Ş': 'S', 'Ü': 'U',
+    'Â': 'A', 'Î': 'I', 'Û': 'U', '\u0307': None,
+})
+
+# Birden fazla vekile karşılık gelen anahtarlar için işaret
+_AMBIGUOUS = object()
+
+
+def normalize_name(name: str) -> str:
+    """İsmi normalize et - Türkçe karakterleri ASCII'ye çevir."""
+    return ' '.join(name.upper().translate(TURKISH_ASCII_TABLE).split())
+
+
+def mp_id(name: str, city: Optional[str] = None) -> str:
+    """
+    Vekilin statik ID'si (sync_firestore_mps ile aynı).
+
+    Args:
+        name: mps_static.json'daki isim
+        city: Sadece aynı isimli vekiller için verilir; özete seçim çevresi de katılır
+    """
+    base = StaticMP(name=name, party='', city='').id
+    if not city:
+        return base
+    hash_suffix = hashlib.sha256(f"{name}|{normalize_name(city)}".encode()).hexdigest()[:8]
+    return f"{base.rsplit('_', 1)[0]}_{hash_suffix}"
+
+
+def mp_key(name: str, city: Optional[str] = None) -> str:
+    """Vekilin indeks anahtarı: katlanmış isim, aynı isimliler için '(ŞEHİR)' ekli."""
+    key = normalize_name(name)
+    return f"{key} ({normalize_name(city)})" if city else key
+
+
+@dataclass(frozen=True)
+class ResolvedMP:
+    """İsmi çözümlenmiş vekil."""
+
+    id: str         # Statik vekil ID'si (sync_firestore_mps ile aynı)
+    name: str       # mps_static.json'daki isim
+    party: str
+    city: str
+    key: str        # Korpus indekslerinin anahtarı (katlanmış isim; aynı isimlilerde + şehir)
+
+
+def split_surname(name: str) -> Tuple[List[str], List[str]]:
+    """
+    İsmi ön adlar ve soyad olarak ayır.
+
+    mps_static.json'da soyad büyük harfle yazılır ("Nermin YILDIRIM KARA");
+    sondaki büyük harfli kelimeler soyaddır, hiç yoksa son kelime soyad sayılır.
+
+    Returns:
+        (ön adlar, soyad kelimeleri)
+    """
+    words = name.split()
+    i = len(words)
+    while i > 1 and words[i - 1].isupper():
+        i -= 1
+    if i == len(words):
+        i = len(words) - 1
+    return words[:i], words[i:]
+
+
+class MPNameResolver:
+    """mps_static.json vekilleri üzerinde indeksli ve önbellekli isim çözümleyici."""
+
+    def __init__(self, mps: Iterable[dict]):
+        """
+        Args:
+            mps: 'name', 'party' ve 'city' alanlı vekil kayıtları
+        """
+        self.mps: List[ResolvedMP] = []
+        self._exact: Dict[str, object] = {}
+        self._folded: Dict[str, object] = {}
+        self._given_prefix: Dict[str, object] = {}
+        self._surname_city: Dict[Tuple[str, str], object] = {}
+        self._memo: Dict[Tuple[str, Optional[str]], Optional[ResolvedMP]] = {}
+        self.stats: Counter = Counter()
+
+        records = [record for record in mps if record.get('name', '').strip()]
+        # Katlanmış ismi birden fazla vekilde geçenler seçim çevresiyle ayrılır
+        namesakes = Counter(normalize_name(record['name']) for record in records)
+
+        for record in records:
+            name = ' '.join(record['name'].split())
+            city = record.get('city', '')
+            namesake_city = city if namesakes[normalize_name(name)] > 1 else None
+            mp = ResolvedMP(
+                id=mp_id(record['name'], namesake_city),
+                name=record['name'],
+                party=record.get('party', ''),
+                city=city,
+                key=mp_key(name, namesake_city),
+            )
+            self.mps.append(mp)
+            self._index(mp, name)
+
+    @staticmethod
+    def _add(index: Dict, key, mp: ResolvedMP):
+        existing = index.get(key)
+        if existing is None:
+            index[key] = mp
+        elif existing is not mp:
+            index[key] = _AMBIGUOUS
+
+    def _index(self, mp: ResolvedMP, name: str):
+        folded = normalize_name(name)
+        self._add(self._exact, name, mp)
+        self._add(self._folded, folded, mp)
+        if mp.key != folded:
+            # Aynı isimlinin şehirli anahtarı kendisine çözümlenir
+            self._add(self._folded, mp.key, mp)
+
+        given, surname = split_surname(name)
+        folded_surname = normalize_name(' '.join(surname))
+        for n in range(1, len(given)):
+            self._add(self._given_prefix, normalize_name(' '.join(given[:n] + surname)), mp)
+
+        city = normalize_name(mp.city)
+        if city:
+            # Tam isim + şehir aynı isimli vekilleri ayırır ("MUSTAFA DEMIR" + "KILIS")
+            self._add(self._surname_city, (folded, city), mp)
+            self._add(self._surname_city, (folded_surname, city), mp)
+            if len(surname) > 1:
+                # Çift soyadlılar son soyadla da bulunur ("KARA" + "HATAY")
+                self._add(self._surname_city, (normalize_name(surname[-1]), city), mp)
+
+    @staticmethod
+    def _get(index: Dict, key) -> Optional[ResolvedMP]:
+        mp = index.get(key)
+        return None if mp is _AMBIGUOUS else mp
+
+    def resolve(self, name: str, city: Optional[str] = None) -> Optional[ResolvedMP]:
+        """
+        İsmi vekile çözümle.
+
+        Args:
+            name: Kayıttaki isim (ham veya normalize)
+            city: Seçim çevresi (biliniyorsa soyad + şehir eşlemesi için)
+
+        Returns:
+            Optional[ResolvedMP]: Eşleşen tek vekil; yoksa veya belirsizse None
+        """
+        memo_key = (name, city)
+        if memo_key in self._memo:
+            return self._memo[memo_key]
+
+        mp, tier = self._lookup(name, city)
+        self.stats[tier] += 1
+        self._memo[memo_key] = mp
+        return mp
+
+    def _lookup(self, name: str, city: Optional[str]) -> Tuple[Optional[ResolvedMP], str]:
+        clean = ' '.join(name.split())
+        mp = self._get(self._exact, clean)
+        if mp:
+            return mp, 'exact'
+
+        folded = normalize_name(clean)
+        mp = self._get(self._folded, folded)
+        if mp:
+            return mp, 'folded'
+
+        mp = self._get(self._given_prefix, folded)
+        if mp:
+            return mp, 'given_prefix'
+
+        if city:
+            folded_city = normalize_name(city)
+            words = folded.split()
+            candidates = [folded] + [' '.join(words[-size:]) for size in (2, 1) if len(words) > size]
+            for key in candidates:
+                mp = self._get(self._surname_city, (key, folded_city))
+                if mp:
+                    return mp, 'surname_city'
+
+        return None, 'unresolved'
+
+    def resolve_record(self, record: dict) -> ResolvedMP:
+        """
+        mps_static.json kaydını ('name', 'party', 'city') vekile çözümle.
+
+        Kayıt tam isim + seçim çevresiyle aranır; aynı isimli vekiller böylece
+        kendi anahtarlarını ve ID'lerini alır. Listede olmayan kayıt için
+        katlanmış isim anahtarlı bir ResolvedMP kurulur.
+        """
+        name = ' '.join(record.get('name', '').split())
+        city = record.get('city', '')
+        mp = self._get(self._surname_city, (normalize_name(name), normalize_name(city))) if city else None
+        mp = mp or self.resolve(name, city or None)
+        if mp is not None:
+            return mp
+        return ResolvedMP(id=mp_id(name), name=name, party=record.get('party', ''), city=city,
+                          key=normalize_name(name))
+
+    def resolve_id(self, name: str, city: Optional[str] = None) -> Optional[str]:
+        """İsmin vekil ID'si (çözümlenemezse None)."""
+        mp = self.resolve(name, city)
+        return mp.id if mp else None
+
+    def canonical_key(self, name: str, city: Optional[str] = None) -> str:
+        """
+        İsmin indeks anahtarı: çözümlenen vekilin anahtarı, yoksa katlanmış isim.
+
+        Şehirsiz aynı isim ("Mustafa DEMİR") çözümlenmez ve hiçbir vekilin
+        anahtarıyla eşleşmez.
+        """
+        mp = self.resolve(name, city)
+        return mp.key if mp else normalize_name(name)
+
+    def document_key(self, data: dict) -> str:
+        """mps koleksiyonundaki dokümanın indeks anahtarı ('name' ve 'constituency' alanlarından)."""
+        return self.canonical_key(data.get('name', ''), data.get('constituency'))
@@ -0,0 +1,186 @@
+"""
+Scraper Ağ Profili
+Playwright route interception ile görsel, medya, font ve üçüncü taraf takip
+isteklerini iptal eder; scraper'lar sadece ihtiyaç duydukları HTML/JS/XHR'ı indirir.
+
+Profil `ScraperConfig.block_resource_types` ve `block_trackers` ile ayarlanır ve
+tarayıcı havuzu (services/browser_pool.py) tarafından her context'e bağlanır.
+Bir scraper ihtiyaç duyduğu türleri sayfa alırken `allow_resources` ile açabilir.
+
+Engellenen istekler tür ve sayfa bazında sayılır; her sayfanın yükleme süresi
+(ilk doküman isteğinden `load` olayına) ölçülür. Sayfa başına kazanılan süre,
+aynı işin profil kapalıyken (SCRAPER_BLOCK_RESOURCES="" ve SCRAPER_BLOCK_TRACKERS=false)
+ölçülen ortalama yükleme süresi SCRAPER_NETWORK_BASELINE_MS olarak verilirse raporlanır.
+"""
+
+import logging
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+
+# Üçüncü taraf analitik/takip host'ları (alt alan adları dahil)
+TRACKER_HOSTS = (
+    'google-analytics.com',
+    'googletagmanager.com',
+    'doubleclick.net',
+    'googlesyndication.com',
+    'facebook.net',
+    'connect.facebook.net',
+    'hotjar.com',
+    'mc.yandex.ru',
+    'clarity.ms',
+    'addthis.com',
+    'sharethis.com',
+)
+
+
+def is_tracker(url: str, hosts: Iterable[str] = TRACKER_HOSTS) -> bool:
+    """URL'nin host'u bilinen bir takip servisine (veya alt alan adına) mı ait?"""
+    host = urlsplit(url).hostname or ''
+    return any(host == tracker or host.endswith('.' + tracker) for tracker in hosts)
+
+
+@dataclass
+class PageNetworkStats:
+    """Tek bir sayfa yüklemesinin ağ istatistikleri."""
+
+    url: str
+    started: float
+    load_seconds: Optional[float] = None
+    requests: int = 0
+    blocked: Counter = field(default_factory=Counter)  # kaynak türü (veya 'tracker') -> adet
+
+    @property
+    def blocked_total(self) -> int:
+        return sum(self.blocked.values())
+
+
+class NetworkProfile:
+    """Kaynak türü ve takip host'u bazlı istek engelleme profili."""
+
+    def __init__(self, block_types: Iterable[str] = (), block_trackers: bool = True,
+                 baseline_ms: float = 0.0, clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            block_types: İptal edilecek Playwright kaynak türleri (image, media, font, stylesheet, ...)
+            block_trackers: Üçüncü taraf takip isteklerini iptal et
+            baseline_ms: Profil kapalıyken ölçülen ortalama sayfa yükleme süresi (0 = bilinmiyor)
+            clock: Monoton saat (testler için değiştirilebilir)
+        """
+        self.block_types = frozenset(block_types)
+        self.block_trackers = block_trackers
+        self.baseline_ms = baseline_ms
+        self._clock = clock
+        self.pages: List[PageNetworkStats] = []
+
+    @classmethod
+    def from_config(cls, config) -> Optional["NetworkProfile"]:
+        """Konfigürasyondan profil oluştur; hiçbir şey engellenmiyorsa None."""
+        if not config.block_resource_types and not config.block_trackers:
+            return None
+        return cls(config.block_resource_types, config.block_trackers, config.network_baseline_ms)
+
+    # -------------------------------------------------------------------------
+    # Karar ve kayıt
+    # -------------------------------------------------------------------------
+
+    def block_reason(self, resource_type: str, url: str, allow: Tuple[str, ...] = ()) -> Optional[str]:
+        """
+        İstek engellenecekse sebebini (kaynak türü veya 'tracker') döndür.
+
+        Args:
+            resource_type: Playwright request.resource_type
+            url: İstek URL'si
+            allow: Bu sayfa için engellenmeyecek kaynak türleri
+        """
+        if resource_type in allow:
+            return None
+        if self.block_trackers and resource_type != 'document' and is_tracker(url):
+            return 'tracker'
+        if resource_type in self.block_types:
+            return resource_type
+        return None
+
+    def start_page(self, url: str) -> PageNetworkStats:
+        """Yeni bir sayfa yüklemesi için istatistik kaydı aç."""
+        stats = PageNetworkStats(url, self._clock())
+        self.pages.append(stats)
+        return stats
+
+    def finish_page(self, stats: PageNetworkStats) -> None:
+        """Sayfanın load olayında yükleme süresini kaydet."""
+        if stats.load_seconds is None:
+            stats.load_seconds = self._clock() - stats.started
+            logger.debug(f"🚫 {stats.url}: {stats.blocked_total}/{stats.requests} istek engellendi, "
+                         f"yükleme {stats.load_seconds * 1000:.0f} ms")
+
+    # -------------------------------------------------------------------------
+    # Playwright bağlantısı
+    # -------------------------------------------------------------------------
+
+    def attach(self, context, page, allow: Iterable[str] = ()):
+        """
+        Profili bir context'e (route) ve sayfasına (load zamanlaması) bağla.
+
+        Senkron ve async Playwright API'siyle çalışır: handler route çağrısının
+        sonucunu döndürür (async API bunu bekler).
+
+        Args:
+            context: Playwright BrowserContext
+            page: Context'in sayfası
+            allow: Bu sayfada engellenmeyecek kaynak türleri
+
+        Returns:
+            context.route() sonucu (async API'de beklenmesi gereken coroutine)
+        """
+        allow = tuple(allow)
+        current: List[PageNetworkStats] = []  # sayfanın son ana doküman yüklemesi
+
+        def handle(route):
+            request = route.request
+            if request.resource_type == 'document' and request.frame == page.main_frame:
+                current[:] = [self.start_page(request.url)]
+            stats = current[0] if current else None
+            if stats is not None:
+                stats.requests += 1
+
+            reason = self.block_reason(request.resource_type, request.url, allow)
+            if reason is None:
+                return route.continue_()
+            if stats is not None:
+                stats.blocked[reason] += 1
+            return route.abort()
+
+        page.on('load', lambda _: current and self.finish_page(current[0]))
+        return context.route('**/*', handle)
+
+    # -------------------------------------------------------------------------
+    # Rapor
+    # -------------------------------------------------------------------------
+
+    def summary(self) -> str:
+        """Tek satırlık özet: engellenen istekler, ortalama yükleme ve (baseline varsa) kazanç."""
+        blocked = Counter()
+        for page in self.pages:
+            blocked.update(page.blocked)
+        by_type = ', '.join(f"{name}: {count}" for name, count in blocked.most_common()) or "yok"
+        requests = sum(page.requests for page in self.pages)
+        summary = (f"🚫 Ağ profili: {len(self.pages)} sayfa, {sum(blocked.values())}/{requests} istek "
+                   f"engellendi ({by_type})")
+
+        average_ms = self.average_load_ms()
+        if average_ms is not None:
+            summary += f"; ortalama yükleme {average_ms:.0f} ms/sayfa"
+            if self.baseline_ms > 0:
+                summary += f" (kazanç {self.baseline_ms - average_ms:.0f} ms/sayfa)"
+        return summary
+
+    def average_load_ms(self) -> Optional[float]:
+        """Yüklemesi tamamlanan sayfaların ortalama süresi (ms); hiç yoksa None."""
+        loads = [page.load_seconds for page in self.pages if page.load_seconds is not None]
+        return sum(loads) / len(loads) * 1000 if loads else None
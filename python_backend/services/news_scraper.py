@@ -10,6 +10,8 @@ from datetime import datetime
 import requests
 from bs4 import BeautifulSoup
 
+from services.rate_limiter import get_rate_controller, is_throttled
+
 try:
     from GoogleNews import GoogleNews
     GOOGLE_NEWS_AVAILABLE = True
@@ -42,7 +44,7 @@ class NewsScraper:
         """
         self.language = language
         self.region = region
-        self.request_delay = 1.0  # İstekler arası bekleme süresi (saniye)
+        self.rate_controller = get_rate_controller()  # Haber sitesi başına uyarlanabilir hız
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
@@ -106,9 +108,15 @@ class NewsScraper:
             str veya None: Makale metni
         """
         try:
-            time.sleep(self.request_delay)  # Rate limiting
-            
-            response = requests.get(url, headers=self.headers, timeout=10)
+            self.rate_controller.wait(url)
+            started = time.monotonic()
+            try:
+                response = requests.get(url, headers=self.headers, timeout=10)
+            except requests.RequestException:
+                self.rate_controller.record(url, time.monotonic() - started, ok=False)
+                raise
+            self.rate_controller.record(url, response.elapsed.total_seconds(),
+                                        ok=not is_throttled(response.status_code))
             response.raise_for_status()
             
             soup = BeautifulSoup(response.content, 'lxml')
@@ -171,8 +171,8 @@ class NewsCacheService:
     
     def __init__(self):
         """Firestore client'ı initialize et."""
-        from config.firebase_config import get_firestore_client
-        self.db = get_firestore_client()
+        from config.storage_config import get_storage_client
+        self.db = get_storage_client()
     
     def save_news(self, category: str, articles: List[Dict[str, Any]]) -> bool:
         """
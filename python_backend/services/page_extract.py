@@ -0,0 +1,63 @@
+"""
+Toplu Sayfa Çıkarma Modülü
+Playwright scraper'ları için tablo ve kart verisini tek `page.evaluate` çağrısıyla çeker.
+
+`row.query_selector_all('td')` ve her hücre için `inner_text()` çağrısı tarayıcıya
+ayrı birer IPC gidiş-dönüşüdür; 50 satırlık bir sayfa 250'den fazla çağrı eder.
+Buradaki yardımcılar aynı metinleri (`innerText`, kırpılmış) tarayıcı içinde
+toplayıp tek seferde döndürür.
+"""
+
+from typing import Dict, List, Optional
+
+from services.tbmm_http_client import TableRows
+
+
+# Satır seçicisine uyan her satırın hücre (td) metinleri
+_TABLE_ROWS_JS = """
+(selector) => Array.from(
+    document.querySelectorAll(selector),
+    row => Array.from(row.querySelectorAll('td'), cell => cell.innerText.trim())
+)
+"""
+
+# Kart seçicisine uyan her kart için alan -> alt seçicinin ilk eşleşmesinin metni (yoksa null)
+_CARDS_JS = """
+([selector, fields]) => Array.from(document.querySelectorAll(selector), card => {
+    const values = {};
+    for (const [name, fieldSelector] of Object.entries(fields)) {
+        const element = card.querySelector(fieldSelector);
+        values[name] = element ? element.innerText.trim() : null;
+    }
+    return values;
+})
+"""
+
+
+def extract_table_rows(page, row_selector: str = 'table tbody tr') -> TableRows:
+    """
+    Tablo satırlarının hücre metinlerini tek çağrıda çek.
+
+    Args:
+        page: Playwright sayfası
+        row_selector: Satır seçicisi
+
+    Returns:
+        TableRows: Satır başına kırpılmış hücre metinleri (satır yoksa boş liste)
+    """
+    return page.evaluate(_TABLE_ROWS_JS, row_selector)
+
+
+def extract_cards(page, card_selector: str, fields: Dict[str, str]) -> List[Dict[str, Optional[str]]]:
+    """
+    Kart yapısındaki alanları tek çağrıda çek.
+
+    Args:
+        page: Playwright sayfası
+        card_selector: Kart seçicisi
+        fields: Alan adı -> kart içindeki seçici
+
+    Returns:
+        List[Dict[str, Optional[str]]]: Kart başına alan metinleri (eleman yoksa None)
+    """
+    return page.evaluate(_CARDS_JS, [card_selector, fields])
@@ -7,14 +7,20 @@ Browser session gerektirdiği için Playwright kullanır.
 
 import json
 import logging
-import time
 import re
 from pathlib import Path
 from typing import Dict, List, Optional
 from dataclasses import dataclass, field
 from datetime import datetime
 
-from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeout
+from playwright.sync_api import TimeoutError as PlaywrightTimeout
+
+from services.browser_pool import BrowserPool, get_browser_pool
+from services.scrape_watermark import ScrapeWatermark
+from services.page_extract import extract_table_rows
+from services.rate_limiter import get_rate_controller
+from services.retry_policy import IncompleteScrapeError, get_retry_policy, retry_navigate, retry_next_page
+from services.tbmm_http_client import TableRows, capture_paged_request, fetch_rows_over_http
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -46,11 +52,12 @@ class WrittenQuestionsScraper:
     
     QUERY_URL = "https://www.tbmm.gov.tr/denetim/yazili-soru-onergeleri"
     
-    def __init__(self, headless: bool = True):
+    def __init__(self, headless: bool = True, pool: Optional[BrowserPool] = None):
         self.headless = headless
-        self.browser = None
+        self.pool = pool
         self.page = None
-        self._playwright = None
+        self.rate_controller = get_rate_controller()
+        self.retry_policy = get_retry_policy()
     
     def __enter__(self):
         self._start_browser()
@@ -61,43 +68,30 @@ class WrittenQuestionsScraper:
         return False
     
     def _start_browser(self):
-        """Tarayıcıyı başlat."""
-        logger.info("🌐 Tarayıcı başlatılıyor...")
-        self._playwright = sync_playwright().start()
-        self.browser = self._playwright.chromium.launch(headless=self.headless)
-        self.page = self.browser.new_page()
-        self.page.set_default_timeout(30000)
+        """Paylaşılan tarayıcı havuzundan izole bir sayfa al."""
+        if self.pool is None:
+            self.pool = get_browser_pool(self.headless)
+        self.page = self.pool.acquire_page(timeout=30000)
     
     def _close_browser(self):
-        """Tarayıcıyı kapat."""
-        if self.browser:
-            self.browser.close()
-        if self._playwright:
-            self._playwright.stop()
-        logger.info("🔒 Tarayıcı kapatıldı")
+        """Sayfayı havuza geri ver (tarayıcı açık kalır)."""
+        if self.page is not None:
+            self.pool.release_page(self.page)
+            self.page = None
     
-    def fetch_all_questions(
-        self, 
-        period_key: str = "all",
-        max_pages: int = 100
-    ) -> List[WrittenQuestion]:
+    def _submit_query(self, period_key: str) -> bool:
         """
-        Tüm yazılı soru önergelerini çek.
+        Sorgu formunu doldurup gönder.
         
-        Args:
-            period_key: Dönem anahtarı
-            max_pages: Maksimum sayfa sayısı
-            
         Returns:
-            List[WrittenQuestion]: Yazılı soru listesi
+            bool: Sonuçlar aranabilirse True
         """
         period_id = LEGISLATIVE_PERIODS.get(period_key, LEGISLATIVE_PERIODS["all"])
-        logger.info(f"📋 Yazılı soru önergeleri çekiliyor (Dönem: {period_key})...")
         
         # 1. Sorgu formuna git
         logger.info(f"  🔗 {self.QUERY_URL}")
-        self.page.goto(self.QUERY_URL, wait_until='networkidle')
-        time.sleep(2)
+        retry_navigate(self.page, self.QUERY_URL, self.rate_controller, self.retry_policy,
+                       wait_until='networkidle')
         
         # 2. Dönem seç
         try:
@@ -111,58 +105,108 @@ class WrittenQuestionsScraper:
         # 3. Sorgula butonuna tıkla
         try:
             self.page.click('button:has-text("SORGULA"), input[type="submit"]')
-            time.sleep(3)
             self.page.wait_for_load_state('networkidle')
+            self.page.wait_for_selector('table tbody tr')
             logger.info("  ✅ Sorgu başarılı, sonuçlar yükleniyor...")
+            return True
         except PlaywrightTimeout:
             logger.warning("  ⚠️ Sonuç sayfası yüklenemedi")
-            return []
+            return False
+    
+    @staticmethod
+    def _parse_rows(rows: TableRows) -> List[WrittenQuestion]:
+        """Tablo satırlarının hücre metinlerini yazılı sorulara çevir."""
+        questions = []
+        for cells in rows:
+            if len(cells) >= 3:
+                # Sütun yapısı: [0] Dönem, [1] Esas No, [2] Tarih, [3] Önerge içeriği (MP + Konu + Durum)
+                raw_content = cells[3] if len(cells) > 3 else ""
+                
+                # MP ismini ilk satırdan çıkar (ŞEHIR MİLLETVEKİLİ İSİM SOYAD formatı)
+                mp_name = ""
+                subject = raw_content
+                lines = raw_content.split('\n')
+                
+                if lines:
+                    first_line = lines[0].strip()
+                    if "MİLLETVEKİLİ" in first_line.upper():
+                        mp_name = first_line
+                        subject = '\n'.join(lines[1:]).strip() if len(lines) > 1 else ""
+                
+                # Durumu bul
+                status = ""
+                for line in lines:
+                    if "SON DURUMU" in line.upper():
+                        status = line.strip()
+                
+                questions.append(WrittenQuestion(
+                    period=cells[0],
+                    esas_no=cells[1],
+                    date=cells[2],
+                    mp_name=mp_name,
+                    subject=subject[:500],  # Truncate long subjects
+                    status=status
+                ))
+        return questions
+    
+    def fetch_all_questions(
+        self, 
+        period_key: str = "all",
+        max_pages: int = 100,
+        watermark: Optional[ScrapeWatermark] = None,
+        use_http: bool = False
+    ) -> List[WrittenQuestion]:
+        """
+        Tüm yazılı soru önergelerini çek.
+        
+        Args:
+            period_key: Dönem anahtarı
+            max_pages: Maksimum sayfa sayısı
+            watermark: Verilirse tamamı bilinen ilk sayfada durulur (artımlı mod)
+            use_http: True ise sayfalar doğrudan HTTP ile çekilir
+                (sayfa isteği yakalanamazsa DOM sayfalamasına dönülür)
+            
+        Returns:
+            List[WrittenQuestion]: Yazılı soru listesi
+
+        Raises:
+            IncompleteScrapeError: Sorgu gönderilemezse veya bir sayfa yeniden denemelere
+                rağmen yüklenemezse (eksik sonuç döndürülmez)
+        """
+        logger.info(f"📋 Yazılı soru önergeleri çekiliyor (Dönem: {period_key})...")
+        
+        if use_http:
+            submitted, template = capture_paged_request(self.page, lambda: self._submit_query(period_key))
+        else:
+            submitted, template = self._submit_query(period_key), None
+        
+        if not submitted:
+            raise IncompleteScrapeError("Sorgu gönderilemedi, sonuç sayfası yüklenmedi")
         
-        # 4. Tablodan verileri çek
+        # 4a. Sayfa endpoint'inden HTTP ile çek
+        if template is not None:
+            stop = None
+            if watermark is not None:
+                stop = lambda rows: watermark.is_known_page(x.esas_no for x in self._parse_rows(rows))
+            pages = fetch_rows_over_http(self.page, template, max_pages, stop)
+            if pages is not None:
+                questions = [item for rows in pages for item in self._parse_rows(rows)]
+                logger.info(f"✅ Toplam {len(questions)} yazılı soru önergesi çekildi ({len(pages)} sayfa, HTTP)")
+                return questions
+        
+        # 4b. Tablodan verileri çek
         questions = []
         page_num = 0
         
         while page_num < max_pages:
             # Tablodaki satırları parse et
-            rows = self.page.query_selector_all('table tbody tr')
+            rows = self.retry_policy.call(self.page.url, extract_table_rows, self.page)
             
             if not rows:
                 logger.warning("  ⚠️ Tablo satırları bulunamadı")
                 break
             
-            page_questions = []
-            for row in rows:
-                cells = row.query_selector_all('td')
-                if len(cells) >= 3:
-                    # Sütun yapısı: [0] Dönem, [1] Esas No, [2] Tarih, [3] Önerge içeriği (MP + Konu + Durum)
-                    raw_content = cells[3].inner_text().strip() if len(cells) > 3 else ""
-                    
-                    # MP ismini ilk satırdan çıkar (ŞEHIR MİLLETVEKİLİ İSİM SOYAD formatı)
-                    mp_name = ""
-                    subject = raw_content
-                    lines = raw_content.split('\n')
-                    
-                    if lines:
-                        first_line = lines[0].strip()
-                        if "MİLLETVEKİLİ" in first_line.upper():
-                            mp_name = first_line
-                            subject = '\n'.join(lines[1:]).strip() if len(lines) > 1 else ""
-                    
-                    # Durumu bul
-                    status = ""
-                    for line in lines:
-                        if "SON DURUMU" in line.upper():
-                            status = line.strip()
-                    
-                    question = WrittenQuestion(
-                        period=cells[0].inner_text().strip() if len(cells) > 0 else "",
-                        esas_no=cells[1].inner_text().strip() if len(cells) > 1 else "",
-                        date=cells[2].inner_text().strip() if len(cells) > 2 else "",
-                        mp_name=mp_name,
-                        subject=subject[:500],  # Truncate long subjects
-                        status=status
-                    )
-                    page_questions.append(question)
+            page_questions = self._parse_rows(rows)
             
             questions.extend(page_questions)
             logger.info(f"  📄 Sayfa {page_num+1}: {len(page_questions)} soru ({len(questions)} toplam)")
@@ -170,17 +214,20 @@ class WrittenQuestionsScraper:
             if len(page_questions) == 0:
                 break
             
+            # Artımlı mod: tamamı bilinen sayfadan sonrası zaten dosyada
+            if watermark is not None and watermark.is_known_page(x.esas_no for x in page_questions):
+                logger.info(f"  🔖 Sayfa {page_num+1} tamamen bilinen kayıtlar, sayfalama durduruldu")
+                break
+            
             # Sonraki sayfa var mı?
             try:
-                next_btn = self.page.query_selector('a.paginate_button.next:not(.disabled), .dataTables_paginate .next:not(.disabled)')
-                if next_btn:
-                    next_btn.click()
-                    time.sleep(1)
-                    page_num += 1
-                else:
+                if not retry_next_page(self.page, 'a.paginate_button.next:not(.disabled), .dataTables_paginate .next:not(.disabled)',
+                                       self.rate_controller, self.retry_policy):
                     break
-            except Exception:
-                break
+                page_num += 1
+            except Exception as e:
+                # Eksik liste tam sonuç gibi döndürülmez; çağıran yazmayı atlar
+                raise IncompleteScrapeError(f"Sayfa {page_num+2} yüklenemedi: {str(e)}", questions) from e
         
         logger.info(f"✅ Toplam {len(questions)} yazılı soru önergesi çekildi")
         return questions
@@ -198,16 +245,33 @@ def count_questions_per_mp(questions: List[WrittenQuestion]) -> Dict[str, int]:
 
 if __name__ == "__main__":
     import argparse
+    import sys
     
     parser = argparse.ArgumentParser(description='TBMM Yazılı Soru Önergeleri Scraper')
     parser.add_argument('--period', default='all', choices=list(LEGISLATIVE_PERIODS.keys()),
                        help='Yasama dönemi')
     parser.add_argument('--max-pages', type=int, default=100, help='Maksimum sayfa')
     parser.add_argument('--output', type=str, help='JSON çıktı dosyası')
+    parser.add_argument('--incremental', action='store_true',
+                       help='Sadece yeni kayıtları çekip veri dosyasıyla birleştir (--output yoksa data/written_questions_28.json)')
+    parser.add_argument('--http', action='store_true',
+                       help='Sonuç sayfalarını tarayıcı yerine doğrudan HTTP ile çek')
     args = parser.parse_args()
     
+    # Artımlı mod: bilinen esas numaraları mevcut veri dosyasından yüklenir
+    watermark = None
+    if args.incremental:
+        from services.legislative_corpus import get_corpus
+        watermark = ScrapeWatermark(Path(args.output) if args.output else get_corpus().path('questions'))
+    
     with WrittenQuestionsScraper(headless=True) as scraper:
-        questions = scraper.fetch_all_questions(period_key=args.period, max_pages=args.max_pages)
+        try:
+            questions = scraper.fetch_all_questions(period_key=args.period, max_pages=args.max_pages,
+                                                    watermark=watermark, use_http=args.http)
+        except IncompleteScrapeError as e:
+            print(f"\n❌ Tarama yarıda kaldı: {e}")
+            print(f"⚠️ Çekilen {len(e.records)} kayıt eksik olduğu için dosyaya yazılmadı")
+            sys.exit(1)
         
         print(f"\n📊 Toplam {len(questions)} yazılı soru önergesi")
         
@@ -220,15 +284,20 @@ if __name__ == "__main__":
             for i, (name, count) in enumerate(sorted_counts, 1):
                 print(f"  {i:2}. {name}: {count} soru")
         
-        if args.output:
+        records = [{
+            'esas_no': q.esas_no,
+            'mp_name': q.mp_name,
+            'subject': q.subject,
+            'date': q.date,
+            'status': q.status,
+            'period': q.period
+        } for q in questions]
+        
+        if watermark is not None:
+            added = watermark.merge(records)
+            print(f"\n💾 {watermark.path} dosyasına {added} yeni soru eklendi")
+        elif args.output:
             output_path = Path(args.output)
             with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump([{
-                    'esas_no': q.esas_no,
-                    'mp_name': q.mp_name,
-                    'subject': q.subject,
-                    'date': q.date,
-                    'status': q.status,
-                    'period': q.period
-                } for q in questions], f, ensure_ascii=False, indent=2)
+                json.dump(records, f, ensure_ascii=False, indent=2)
             print(f"\n💾 {output_path} dosyasına kaydedildi")
@@ -0,0 +1,344 @@
+"""
+Uyarlanabilir Hız Denetleyicisi
+Scraper'ların aynı siteye yaptığı istekleri, kaç worker çalışırsa çalışsın,
+host başına paylaşılan bir token bucket'tan geçirir.
+
+Bucket'ın hızı AIMD (additive increase, multiplicative decrease) ile ayarlanır:
+hızlı ve başarılı her yanıt hızı sabit bir adım artırır; hata, 429/5xx veya
+yavaş yanıt hızı yarıya indirir. Böylece scraper'lar sabit, en kötü duruma göre
+seçilmiş beklemeler yerine sitenin kaldırabildiği hızda çalışır.
+
+Hız sınırları ScraperConfig'ten gelir: başlangıç aralığı `rate_limit_wait`,
+aralık sınırları `rate_limit_min_wait`/`rate_limit_max_wait`, yavaş yanıt eşiği
+`rate_limit_slow_latency`.
+
+Sabit `time.sleep` beklemeleri yerine sayfa yardımcıları kullanılır:
+`navigate` (goto + isteğe bağlı seçici beklemesi; async API için
+`navigate_async`), `click_and_wait_for_change`
+(sayfalama tıklamasından sonra tablo değişene kadar bekleme) ve
+`scroll_and_wait_for_growth` (sonsuz kaydırmada sayfa uzayana kadar bekleme).
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from typing import Callable, Dict, Optional
+from urllib.parse import urlsplit
+
+from playwright.sync_api import TimeoutError as PlaywrightTimeout
+
+from config.scraper_config import ScraperConfig
+
+logger = logging.getLogger(__name__)
+
+
+def is_throttled(status: int) -> bool:
+    """Yanıt durumu sunucunun yük altında olduğunu mu gösteriyor?"""
+    return status == 429 or status >= 500
+
+
+class TokenBucket:
+    """Saniyede `rate` token dolan, en fazla `burst` token biriktiren kova."""
+
+    def __init__(self, rate: float, burst: float, now: float):
+        self.rate = rate
+        self.burst = max(1.0, burst)
+        self.tokens = self.burst
+        self.updated = now
+
+    def _refill(self, now: float):
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def reserve(self, now: float) -> float:
+        """
+        Bir token ayır; token yoksa borç olarak ayrılır.
+
+        Returns:
+            float: Token'ın kullanılabileceği ana kadar beklenecek süre (saniye)
+        """
+        self._refill(now)
+        self.tokens -= 1
+        return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+    def set_rate(self, rate: float, now: float):
+        self._refill(now)
+        self.rate = rate
+
+
+class RateController:
+    """Thread-safe, host başına token bucket + AIMD hız denetleyicisi."""
+
+    INCREASE_STEP = 0.25      # Hızlı başarılı yanıt başına artış (istek/saniye)
+    DECREASE_FACTOR = 0.5     # Hata veya yavaş yanıtta hız çarpanı
+
+    def __init__(
+        self,
+        initial_rate: float,
+        min_rate: float,
+        max_rate: float,
+        burst: float = 2,
+        slow_latency: float = 5.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        """
+        Args:
+            initial_rate: Başlangıç hızı (istek/saniye)
+            min_rate: Hatalarda inilebilecek en düşük hız
+            max_rate: Başarılarda çıkılabilecek en yüksek hız
+            burst: Boşta biriken en fazla token (art arda istek)
+            slow_latency: Bu süreden (saniye) uzun yanıtlar yavaşlama sayılır
+            clock: Monoton saat (testler için değiştirilebilir)
+            sleep: Bekleme fonksiyonu
+        """
+        self.min_rate = min_rate
+        self.max_rate = max(min_rate, max_rate)
+        self.initial_rate = min(self.max_rate, max(min_rate, initial_rate))
+        self.burst = burst
+        self.slow_latency = slow_latency
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._buckets: Dict[str, TokenBucket] = {}
+
+    @classmethod
+    def from_config(cls, config: ScraperConfig, **kwargs) -> "RateController":
+        """Konfigürasyondaki bekleme aralıklarından denetleyici oluştur."""
+        def rate(wait: float) -> float:
+            return 1.0 / wait if wait > 0 else float('inf')
+
+        return cls(
+            initial_rate=rate(config.rate_limit_wait),
+            min_rate=rate(config.rate_limit_max_wait),
+            max_rate=rate(config.rate_limit_min_wait),
+            burst=config.rate_limit_burst,
+            slow_latency=config.rate_limit_slow_latency,
+            **kwargs
+        )
+
+    @staticmethod
+    def _host(url: str) -> str:
+        return urlsplit(url).netloc.lower()
+
+    def _bucket(self, host: str, now: float) -> TokenBucket:
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = self._buckets[host] = TokenBucket(self.initial_rate, self.burst, now)
+        return bucket
+
+    def rate(self, url: str) -> float:
+        """Host'un güncel hızı (istek/saniye)."""
+        with self._lock:
+            return self._bucket(self._host(url), self._clock()).rate
+
+    def reserve(self, url: str) -> float:
+        """
+        URL'nin host'u için token ayır, beklemeden dön (async çağıranlar kendisi bekler).
+
+        Returns:
+            float: Token'ın kullanılabilmesi için beklenmesi gereken süre (saniye)
+        """
+        with self._lock:
+            now = self._clock()
+            return self._bucket(self._host(url), now).reserve(now)
+
+    def wait(self, url: str) -> float:
+        """
+        URL'nin host'u için token ayır ve gerekirse bekle.
+
+        Returns:
+            float: Beklenen süre (saniye)
+        """
+        delay = self.reserve(url)
+        if delay > 0:
+            self._sleep(delay)
+        return delay
+
+    def record(self, url: str, latency: float, ok: bool = True):
+        """
+        Yanıtı hıza yansıt (AIMD).
+
+        Args:
+            url: İstek URL'si
+            latency: Yanıt süresi (saniye)
+            ok: Yanıt başarılı mı (hata, 429 veya 5xx ise False)
+        """
+        host = self._host(url)
+        with self._lock:
+            now = self._clock()
+            bucket = self._bucket(host, now)
+            if ok and latency <= self.slow_latency:
+                rate = min(self.max_rate, bucket.rate + self.INCREASE_STEP)
+            else:
+                rate = max(self.min_rate, bucket.rate * self.DECREASE_FACTOR)
+                logger.debug(f"🐢 {host}: hız {bucket.rate:.2f} -> {rate:.2f} istek/sn "
+                             f"({'hata' if not ok else f'{latency:.1f} sn'})")
+            bucket.set_rate(rate, now)
+
+
+# =============================================================================
+# PAYLAŞILAN DENETLEYİCİ
+# =============================================================================
+
+_controller: Optional[RateController] = None
+_controller_lock = threading.Lock()
+
+
+def get_rate_controller() -> RateController:
+    """Tüm scraper ve worker'ların paylaştığı denetleyici (ortam değişkenlerinden)."""
+    global _controller
+    with _controller_lock:
+        if _controller is None:
+            _controller = RateController.from_config(ScraperConfig.from_env())
+        return _controller
+
+
+# =============================================================================
+# OLAY TABANLI BEKLEMELER
+# =============================================================================
+
+def navigate(
+    page,
+    url: str,
+    controller: Optional[RateController] = None,
+    wait_until: str = 'domcontentloaded',
+    ready_selector: Optional[str] = None,
+    timeout: Optional[int] = None
+):
+    """
+    Hız sınırına uyarak sayfaya git ve hazır olmasını bekle.
+
+    Args:
+        page: Playwright sayfası
+        url: Hedef URL
+        controller: Hız denetleyicisi (varsayılan paylaşılan denetleyici)
+        wait_until: goto yükleme koşulu
+        ready_selector: Verilirse bu seçici görünene kadar beklenir
+        timeout: goto ve seçici beklemesi için timeout (ms, varsayılan sayfanınki)
+
+    Returns:
+        Response: goto yanıtı (olabilir None)
+    """
+    controller = controller or get_rate_controller()
+    options = {'timeout': timeout} if timeout is not None else {}
+    controller.wait(url)
+    started = time.monotonic()
+    try:
+        response = page.goto(url, wait_until=wait_until, **options)
+        if ready_selector:
+            page.wait_for_selector(ready_selector, **options)
+    except Exception:
+        controller.record(url, time.monotonic() - started, ok=False)
+        raise
+
+    controller.record(url, time.monotonic() - started,
+                      ok=response is None or not is_throttled(response.status))
+    return response
+
+
+async def navigate_async(
+    page,
+    url: str,
+    controller: Optional[RateController] = None,
+    wait_until: str = 'domcontentloaded',
+    ready_selector: Optional[str] = None,
+    timeout: Optional[int] = None
+):
+    """
+    `navigate`'in Playwright async API karşılığı (bekleme event loop'u bloklamaz).
+
+    Args ve dönüş değeri `navigate` ile aynıdır.
+    """
+    controller = controller or get_rate_controller()
+    options = {'timeout': timeout} if timeout is not None else {}
+    delay = controller.reserve(url)
+    if delay > 0:
+        await asyncio.sleep(delay)
+    started = time.monotonic()
+    try:
+        response = await page.goto(url, wait_until=wait_until, **options)
+        if ready_selector:
+            await page.wait_for_selector(ready_selector, **options)
+    except Exception:
+        controller.record(url, time.monotonic() - started, ok=False)
+        raise
+
+    controller.record(url, time.monotonic() - started,
+                      ok=response is None or not is_throttled(response.status))
+    return response
+
+
+# Seçiciye uyan ilk elemanın metni (yoksa null)
+_FIRST_TEXT_JS = "(selector) => { const el = document.querySelector(selector); return el ? el.innerText : null; }"
+
+# İlk elemanın metni öncekinden farklı olana kadar
+_CHANGED_JS = """
+([selector, before]) => {
+    const el = document.querySelector(selector);
+    return !!el && el.innerText !== before;
+}
+"""
+
+
+def first_text(page, selector: str) -> Optional[str]:
+    """Seçiciye uyan ilk elemanın metni (eleman yoksa None)."""
+    return page.evaluate(_FIRST_TEXT_JS, selector)
+
+
+def click_and_wait_for_change(
+    page,
+    element,
+    watch_selector: str = 'table tbody tr',
+    controller: Optional[RateController] = None,
+    timeout: Optional[int] = None,
+    before: Optional[str] = None
+):
+    """
+    Elemana tıkla ve izlenen içerik değişene kadar bekle (örn. tablo sonraki sayfa).
+
+    Args:
+        page: Playwright sayfası
+        element: Tıklanacak eleman (örn. "sonraki" butonu)
+        watch_selector: İlk eşleşmesinin metni değişmesi beklenen seçici
+        controller: Hız denetleyicisi (varsayılan paylaşılan denetleyici)
+        timeout: Bekleme timeout'u (ms, varsayılan sayfanınki)
+        before: İzlenen içeriğin tıklamadan önceki metni (verilmezse şimdi okunur)
+
+    Raises:
+        PlaywrightTimeout: İçerik timeout içinde değişmezse
+    """
+    controller = controller or get_rate_controller()
+    if before is None:
+        before = first_text(page, watch_selector)
+    options = {'timeout': timeout} if timeout is not None else {}
+    controller.wait(page.url)
+    started = time.monotonic()
+    try:
+        element.click()
+        page.wait_for_function(_CHANGED_JS, arg=[watch_selector, before], **options)
+    except Exception:
+        controller.record(page.url, time.monotonic() - started, ok=False)
+        raise
+    controller.record(page.url, time.monotonic() - started)
+
+
+def scroll_and_wait_for_growth(page, timeout: int) -> bool:
+    """
+    Sayfanın sonuna kaydır ve yeni içerik yüklenip sayfa uzayana kadar bekle.
+
+    Args:
+        page: Playwright sayfası
+        timeout: Uzamanın bekleneceği en uzun süre (ms)
+
+    Returns:
+        bool: Sayfa uzadıysa True (kaydırma bitti ise False)
+    """
+    height = page.evaluate('document.body.scrollHeight')
+    page.evaluate('window.scrollTo(0, document.body.scrollHeight)')
+    try:
+        page.wait_for_function('(height) => document.body.scrollHeight > height', arg=height, timeout=timeout)
+        return True
+    except PlaywrightTimeout:
+        return False
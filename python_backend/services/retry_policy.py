@@ -0,0 +1,387 @@
+"""
+Yeniden Deneme ve Devre Kesici
+Scraper'ların sayfa geçişlerini, sayfalamalarını ve çıkarma çağrılarını geçici
+hatalarda yeniden dener; tek bir timeout uzun bir taramayı yarıda bırakmaz.
+
+- `RetryPolicy`: ScraperConfig'teki `max_retries`, `retry_delay` ve
+  `retry_backoff_multiplier` ile jitter'lı üstel bekleme (tenacity). Sadece
+  `is_retryable` ile geçici sayılan hatalar (timeout, ağ hatası, 429/5xx)
+  yeniden denenir; diğerleri hemen yükseltilir.
+- `CircuitBreaker`: Host başına ardışık geçici hataları sayar; eşik aşılınca
+  devre açılır ve aynı host'a giden tüm scraper/worker istekleri
+  `circuit_reset_timeout` boyunca bekletilir. Bekleme sonrası ilk istek
+  başarılıysa devre kapanır, değilse yeniden açılır.
+
+Tüm scraper'lar `get_retry_policy()` ile aynı devre kesiciyi paylaşır.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+from playwright.sync_api import Error as PlaywrightError, TimeoutError as PlaywrightTimeout
+from tenacity import AsyncRetrying, RetryCallState, Retrying, retry_if_exception, stop_after_attempt, wait_exponential_jitter
+
+from config.scraper_config import ScraperConfig
+from services.rate_limiter import (
+    RateController, click_and_wait_for_change, first_text, is_throttled, navigate, navigate_async
+)
+
+logger = logging.getLogger(__name__)
+
+
+# Geçici sayılan Playwright ağ hatalarının mesaj parçaları
+RETRYABLE_MESSAGES = (
+    'net::ERR_',
+    'NS_ERROR_',
+    'ECONNRESET',
+    'ECONNREFUSED',
+    'Navigation failed because page crashed',
+)
+
+
+class ThrottledResponse(Exception):
+    """Sunucu 429 veya 5xx döndürdü (geçici hata)."""
+
+    def __init__(self, url: str, status: int):
+        super().__init__(f"HTTP {status}: {url}")
+        self.url = url
+        self.status = status
+
+
+class IncompleteScrapeError(RuntimeError):
+    """
+    Tarama yeniden denemelere rağmen yarıda kaldı.
+
+    `records` o ana kadar çekilen kayıtlardır; eksik oldukları için veri
+    dosyasına yazılmamalı veya birleştirilmemelidir.
+    """
+
+    def __init__(self, message: str, records: Optional[list] = None):
+        super().__init__(message)
+        self.records = records or []
+
+
+def is_retryable(error: BaseException) -> bool:
+    """
+    Hata geçici mi (yeniden denemeye değer mi)?
+
+    Timeout'lar, bağlantı hataları ve 429/5xx yanıtları geçicidir; seçici
+    bulunamaması, ayrıştırma hataları veya kapanmış sayfa gibi hatalar değildir.
+    """
+    if isinstance(error, (PlaywrightTimeout, ThrottledResponse)):
+        return True
+    if isinstance(error, requests.HTTPError):
+        return error.response is not None and is_throttled(error.response.status_code)
+    if isinstance(error, (requests.ConnectionError, requests.Timeout)):
+        return True
+    if isinstance(error, PlaywrightError):
+        return any(message in str(error) for message in RETRYABLE_MESSAGES)
+    return False
+
+
+class CircuitBreaker:
+    """Thread-safe, host başına ardışık hata sayan devre kesici."""
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        """
+        Args:
+            failure_threshold: Devreyi açan ardışık geçici hata sayısı
+            reset_timeout: Devre açıkken bekleme süresi (saniye)
+            clock: Monoton saat (testler için değiştirilebilir)
+            sleep: Bekleme fonksiyonu
+        """
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._failures: Dict[str, int] = {}
+        self._open_until: Dict[str, float] = {}
+
+    @classmethod
+    def from_config(cls, config: ScraperConfig, **kwargs) -> "CircuitBreaker":
+        return cls(config.circuit_failure_threshold, config.circuit_reset_timeout, **kwargs)
+
+    @staticmethod
+    def _host(url: str) -> str:
+        return urlsplit(url).netloc.lower()
+
+    def is_open(self, url: str) -> bool:
+        """Host'un devresi şu an açık mı?"""
+        with self._lock:
+            return self._open_until.get(self._host(url), 0.0) > self._clock()
+
+    def remaining(self, url: str) -> float:
+        """Devre açıksa kapanmasına kalan süre (saniye), kapalıysa 0."""
+        with self._lock:
+            return max(0.0, self._open_until.get(self._host(url), 0.0) - self._clock())
+
+    def wait(self, url: str) -> float:
+        """
+        Devre açıksa kapanma zamanına kadar bekle.
+
+        Returns:
+            float: Beklenen süre (saniye)
+        """
+        delay = self.remaining(url)
+        if delay > 0:
+            self._sleep(delay)
+            return delay
+        return 0.0
+
+    def record_success(self, url: str):
+        """Başarılı istek: hata sayacını sıfırla, devre açılmışsa kapat."""
+        host = self._host(url)
+        with self._lock:
+            if self._failures.pop(host, 0) >= self.failure_threshold:
+                logger.info(f"🔌 {host}: devre kapandı, istekler devam ediyor")
+            self._open_until.pop(host, None)
+
+    def record_failure(self, url: str):
+        """Geçici hata: eşiğe ulaşıldıysa devreyi aç (veya yeniden aç)."""
+        host = self._host(url)
+        with self._lock:
+            failures = self._failures.get(host, 0) + 1
+            self._failures[host] = failures
+            if failures >= self.failure_threshold:
+                self._open_until[host] = self._clock() + self.reset_timeout
+                logger.warning(f"🔌 {host}: {failures} ardışık hata, devre açıldı; "
+                               f"tüm istekler {self.reset_timeout:.0f} sn bekletiliyor")
+
+
+class RetryPolicy:
+    """Geçici hatalarda jitter'lı üstel beklemeyle yeniden deneme politikası."""
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        delay: float = 1.0,
+        multiplier: float = 2.0,
+        max_delay: float = 30.0,
+        breaker: Optional[CircuitBreaker] = None,
+        sleep: Callable[[float], None] = time.sleep,
+        async_sleep: Callable[[float], Awaitable[None]] = asyncio.sleep
+    ):
+        """
+        Args:
+            max_retries: İlk denemeden sonraki en fazla deneme sayısı
+            delay: İlk bekleme (saniye); jitter olarak da eklenir
+            multiplier: Her denemede beklemenin çarpanı
+            max_delay: Tek bir beklemenin üst sınırı (saniye)
+            breaker: Devre kesici (varsayılan paylaşılan devre kesici)
+            sleep: Bekleme fonksiyonu
+            async_sleep: call_async() için bekleme coroutine'i
+        """
+        self.max_retries = max(0, max_retries)
+        self.delay = delay
+        self.multiplier = multiplier
+        self.max_delay = max_delay
+        self.breaker = breaker or get_circuit_breaker()
+        self._sleep = sleep
+        self._async_sleep = async_sleep
+
+    @classmethod
+    def from_config(cls, config: ScraperConfig, **kwargs) -> "RetryPolicy":
+        return cls(
+            max_retries=config.max_retries,
+            delay=config.retry_delay,
+            multiplier=config.retry_backoff_multiplier,
+            max_delay=config.retry_max_delay,
+            **kwargs
+        )
+
+    @staticmethod
+    def _log_retry(state: RetryCallState):
+        error = state.outcome.exception()
+        logger.warning(f"  🔁 {type(error).__name__}: {str(error).splitlines()[0] if str(error) else ''} "
+                       f"— {state.next_action.sleep:.1f} sn sonra yeniden denenecek "
+                       f"(deneme {state.attempt_number + 1})")
+
+    def _retry_options(self) -> Dict[str, Any]:
+        """Retrying/AsyncRetrying için ortak seçenekler."""
+        return dict(
+            stop=stop_after_attempt(self.max_retries + 1),
+            wait=wait_exponential_jitter(initial=self.delay, max=self.max_delay,
+                                         exp_base=self.multiplier, jitter=self.delay),
+            retry=retry_if_exception(is_retryable),
+            before_sleep=self._log_retry,
+            reraise=True,
+        )
+
+    def call(self, url: str, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Fonksiyonu devre kesiciye uyarak çağır, geçici hatalarda yeniden dene.
+
+        Args:
+            url: İşlemin gittiği URL (devre kesici host'u için)
+            fn: Çağrılacak fonksiyon
+            *args, **kwargs: Fonksiyon argümanları
+
+        Returns:
+            Fonksiyonun dönüş değeri
+
+        Raises:
+            Exception: Geçici olmayan hata veya denemeler bittiğinde son hata
+        """
+        def attempt():
+            self.breaker.wait(url)
+            try:
+                result = fn(*args, **kwargs)
+            except Exception as e:
+                if is_retryable(e):
+                    self.breaker.record_failure(url)
+                raise
+            self.breaker.record_success(url)
+            return result
+
+        return Retrying(sleep=self._sleep, **self._retry_options())(attempt)
+
+    async def call_async(self, url: str, fn: Callable[..., Awaitable[Any]], *args, **kwargs) -> Any:
+        """
+        `call`'ın coroutine fonksiyonlar için karşılığı (bekleme event loop'u bloklamaz).
+
+        Args ve dönüş değeri `call` ile aynıdır.
+        """
+        async def attempt():
+            delay = self.breaker.remaining(url)
+            if delay > 0:
+                await self._async_sleep(delay)
+            try:
+                result = await fn(*args, **kwargs)
+            except Exception as e:
+                if is_retryable(e):
+                    self.breaker.record_failure(url)
+                raise
+            self.breaker.record_success(url)
+            return result
+
+        return await AsyncRetrying(sleep=self._async_sleep, **self._retry_options())(attempt)
+
+
+# =============================================================================
+# PAYLAŞILAN POLİTİKA
+# =============================================================================
+
+_breaker: Optional[CircuitBreaker] = None
+_policy: Optional[RetryPolicy] = None
+_shared_lock = threading.Lock()
+
+
+def get_circuit_breaker() -> CircuitBreaker:
+    """Tüm scraper ve worker'ların paylaştığı devre kesici (ortam değişkenlerinden)."""
+    global _breaker
+    with _shared_lock:
+        if _breaker is None:
+            _breaker = CircuitBreaker.from_config(ScraperConfig.from_env())
+        return _breaker
+
+
+def get_retry_policy() -> RetryPolicy:
+    """Paylaşılan devre kesiciyi kullanan yeniden deneme politikası (ortam değişkenlerinden)."""
+    global _policy
+    breaker = get_circuit_breaker()
+    with _shared_lock:
+        if _policy is None:
+            _policy = RetryPolicy.from_config(ScraperConfig.from_env(), breaker=breaker)
+        return _policy
+
+
+# =============================================================================
+# YENİDEN DENENEN SAYFA İŞLEMLERİ
+# =============================================================================
+
+def retry_navigate(
+    page,
+    url: str,
+    controller: Optional[RateController] = None,
+    policy: Optional[RetryPolicy] = None,
+    **kwargs
+):
+    """
+    `navigate` ile sayfaya git; timeout, ağ hatası ve 429/5xx yanıtlarında yeniden dene.
+
+    Args:
+        page: Playwright sayfası
+        url: Hedef URL
+        controller: Hız denetleyicisi (varsayılan paylaşılan denetleyici)
+        policy: Yeniden deneme politikası (varsayılan paylaşılan politika)
+        **kwargs: navigate() seçenekleri (wait_until, ready_selector, timeout)
+
+    Returns:
+        Response: goto yanıtı (olabilir None)
+    """
+    def attempt():
+        response = navigate(page, url, controller, **kwargs)
+        if response is not None and is_throttled(response.status):
+            raise ThrottledResponse(url, response.status)
+        return response
+
+    return (policy or get_retry_policy()).call(url, attempt)
+
+
+async def retry_navigate_async(
+    page,
+    url: str,
+    controller: Optional[RateController] = None,
+    policy: Optional[RetryPolicy] = None,
+    **kwargs
+):
+    """`retry_navigate`'in Playwright async API karşılığı."""
+    async def attempt():
+        response = await navigate_async(page, url, controller, **kwargs)
+        if response is not None and is_throttled(response.status):
+            raise ThrottledResponse(url, response.status)
+        return response
+
+    return await (policy or get_retry_policy()).call_async(url, attempt)
+
+
+def retry_next_page(
+    page,
+    button_selector: str,
+    controller: Optional[RateController] = None,
+    policy: Optional[RetryPolicy] = None,
+    watch_selector: str = 'table tbody tr'
+) -> bool:
+    """
+    "Sonraki" butonuna tıkla ve tablo değişene kadar bekle; geçici hatalarda yeniden dene.
+
+    Tıklama gerçekleşip sadece bekleme zaman aşımına uğradıysa, yeniden denemede
+    tablonun değişmiş olduğu görülür ve ikinci kez tıklanmaz (sayfa atlanmaz).
+
+    Args:
+        page: Playwright sayfası
+        button_selector: Etkin "sonraki" butonunun seçicisi
+        controller: Hız denetleyicisi (varsayılan paylaşılan denetleyici)
+        policy: Yeniden deneme politikası (varsayılan paylaşılan politika)
+        watch_selector: Değişmesi beklenen içeriğin seçicisi
+
+    Returns:
+        bool: Sonraki sayfaya geçildiyse True, buton yoksa (son sayfa) False
+    """
+    before = first_text(page, watch_selector)
+    clicked = False
+
+    def attempt() -> bool:
+        nonlocal clicked
+        if clicked and first_text(page, watch_selector) != before:
+            return True
+        clicked = True
+        button = page.query_selector(button_selector)
+        if button is None:
+            return False
+        click_and_wait_for_change(page, button, watch_selector, controller, before=before)
+        return True
+
+    return (policy or get_retry_policy()).call(page.url, attempt)
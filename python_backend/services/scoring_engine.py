@@ -5,6 +5,9 @@ Milletvekili puanlarını hesaplayan ve güncelleyen servis.
 
 import sys
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass
 from datetime import datetime
@@ -12,10 +15,18 @@ from datetime import datetime
 # Proje kök dizinini path'e ekle
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from config.pipeline_config import PipelineConfig, default_pipeline_config
 from models.mp_models import MP, NewsAnalysis
 from services.firestore_service import get_firestore_service
 from services.news_scraper import get_news_scraper, NewsItem
 from services.gemini_analyzer import get_gemini_analyzer, AnalysisResult
+from services.scoring_pipeline import ScoringPipeline
+from services.checkpoint_store import CheckpointStore
+from services.scoring_fingerprint import compute_fingerprint, weights_version
+from services.scoring_kernel import ActivityTable, PolicyResult, ScoringPolicy
+from services.stage_metrics import StageMetrics
+from services.sharding import ShardSpec
+from services.job_scheduler import DeadlineScheduler
 
 
 @dataclass
@@ -33,6 +44,8 @@ class ScoringResult:
     is_passive: bool
     success: bool
     error_message: Optional[str] = None
+    fingerprint: Optional[str] = None   # Puanlama girdi parmak izi
+    skipped: bool = False               # Girdiler değişmediği için yeniden puanlanmadı
 
 
 class ScoringEngine:
@@ -46,17 +59,51 @@ class ScoringEngine:
     RESEARCH_WEIGHT = 4.0           # A: Araştırma Önergesi
     NEWS_IMPACT_WEIGHT = 1.0        # H: Haber Etki Puanı
     
-    def __init__(self, dry_run: bool = False):
+    # Parmak izi için puanlayıcı adı
+    FINGERPRINT_SCORER = 'news'
+    
+    def __init__(
+        self,
+        dry_run: bool = False,
+        pipeline_config: Optional[PipelineConfig] = None,
+        force: bool = False
+    ):
         """
         Puanlama motorunu initialize et.
         
         Args:
             dry_run: True ise Firestore'a yazmaz, sadece simülasyon yapar
+            pipeline_config: Eşzamanlılık ayarları (None ise varsayılan)
+            force: True ise girdi parmak izi aynı olsa da tüm vekiller yeniden puanlanır
         """
         self.dry_run = dry_run
+        self.force = force
+        self.pipeline_config = pipeline_config or default_pipeline_config
+        self.weights_version = weights_version({
+            'first_signature': self.FIRST_SIGNATURE_WEIGHT,
+            'support_signature': self.SUPPORT_SIGNATURE_WEIGHT,
+            'question': self.QUESTION_WEIGHT,
+            'research': self.RESEARCH_WEIGHT,
+            'news_impact': self.NEWS_IMPACT_WEIGHT,
+        })
         self.firestore = get_firestore_service()
         self.scraper = get_news_scraper()
         self.analyzer = get_gemini_analyzer()
+        
+        # Aşama bazlı zamanlama metrikleri (job başında yenilenebilir)
+        self.metrics = StageMetrics()
+        
+        # Resume için checkpoint deposu (process_all_mps tarafından atanır)
+        self.checkpoint: Optional[CheckpointStore] = None
+        
+        # --time-budget zamanlayıcısı (process_all_mps tarafından atanır)
+        self.scheduler: Optional[DeadlineScheduler] = None
+        
+        # Aşama bazlı eşzamanlılık limitleri
+        self._stage_slots = {
+            name: threading.BoundedSemaphore(limit)
+            for name, limit in self.pipeline_config.stage_limits().items()
+        }
     
     def calculate_score(
         self, 
@@ -89,6 +136,30 @@ class ScoringEngine:
         
         return round(t_ilk + t_imza + s_bonus + a_bonus + h_bonus, 2)
     
+    @classmethod
+    def scoring_policy(cls) -> ScoringPolicy:
+        """calculate_score formülünün vektörel politikası."""
+        return ScoringPolicy.linear(
+            'engine',
+            first_signature=cls.FIRST_SIGNATURE_WEIGHT,
+            support_signature=cls.SUPPORT_SIGNATURE_WEIGHT,
+            question=cls.QUESTION_WEIGHT,
+            research=cls.RESEARCH_WEIGHT,
+            news=cls.NEWS_IMPACT_WEIGHT,
+        )
+    
+    def calculate_scores(self, table: ActivityTable) -> PolicyResult:
+        """
+        calculate_score ve check_passivity'yi tüm tablo için tek geçişte uygula.
+        
+        Args:
+            table: Vekil aktivite tablosu ('news' sütunu haber etki ortalaması)
+            
+        Returns:
+            PolicyResult: Puanlar ve pasiflik bayrakları
+        """
+        return self.scoring_policy().evaluate(table)
+    
     def check_passivity(
         self,
         first_signature: int = 0,
@@ -130,125 +201,363 @@ class ScoringEngine:
         try:
             # 1. Haberleri çek
             print(f"  📰 Haberler çekiliyor...")
-            news_items = self.scraper.search_and_scrape(
-                mp_name=mp.name,
-                max_results=max_news,
-                scrape_content=True
-            )
+            news_items = self._search_news(mp, max_news)
             print(f"  ✅ {len(news_items)} haber bulundu")
             
-            # 2. Haberleri analiz et
+            # Girdiler değişmediyse analiz ve yazma atlanır
+            unchanged = self._unchanged_result(mp, news_items)
+            if unchanged:
+                print(f"  ⏭️ Girdiler değişmedi, puan korunuyor: {mp.current_score}")
+                return unchanged
+            
+            # 2. İçerikleri çek ve analiz et (checkpoint'te olanlar atlanır)
             print(f"  🤖 AI analizi yapılıyor...")
             analyses: List[NewsAnalysis] = []
-            impact_scores: List[float] = []
             
             for item in news_items:
-                result = self.analyzer.analyze_news_impact(
-                    mp_name=mp.name,
-                    news_title=item.title,
-                    news_content=item.content
-                )
-                
-                impact_scores.append(result.impact_score)
-                
-                # NewsAnalysis modeli oluştur
-                analysis = NewsAnalysis(
-                    mp_id=mp.id,
-                    title=item.title,
-                    url=item.url,
-                    sentiment_score=result.sentiment_score,
-                    impact_score=result.impact_score,
-                    source=item.source,
-                    summary=result.summary,
-                    keywords=result.keywords,
-                    raw_analysis=result.raw_response
-                )
+                analysis = self._cached_analysis(mp, item)
+                if analysis is None:
+                    self._scrape_item(mp, item)
+                    analysis = self._analyze_item(mp, item)
                 analyses.append(analysis)
             
             # 3. Puanı hesapla
-            news_impact_avg = sum(impact_scores) / len(impact_scores) if impact_scores else 5.0
-            law_bonus = mp.law_proposals * self.LAW_PROPOSAL_WEIGHT
-            new_score = self.calculate_score(mp.law_proposals, news_impact_avg)
+            scoring_result = self._build_result(mp, analyses)
             
-            print(f"  📊 Puan: {mp.current_score} → {new_score}")
-            print(f"     Kanun Bonusu: {law_bonus} ({mp.law_proposals} teklif)")
-            print(f"     Haber Etkisi: {news_impact_avg:.1f}")
+            print(f"  📊 Puan: {mp.current_score} → {scoring_result.new_score}")
+            print(f"     Kanun Bonusu: {scoring_result.law_bonus} ({mp.law_proposals} teklif)")
+            print(f"     Haber Etkisi: {scoring_result.news_impact:.1f}")
             
             # 4. Firestore'a yaz (dry_run değilse)
-            if not self.dry_run:
-                # MP puanını güncelle
-                self.firestore.update_mp_score(mp.id, new_score)
-                
-                # Haber analizlerini kaydet
-                for analysis in analyses:
-                    self.firestore.add_news_analysis(analysis)
-                
-                print(f"  💾 Firestore güncellendi")
-            else:
-                print(f"  ⏭️ DRY-RUN: Firestore'a yazılmadı")
+            self._persist(mp, scoring_result, analyses)
             
-            return ScoringResult(
-                mp_id=mp.id,
-                mp_name=mp.name,
-                old_score=mp.current_score,
-                new_score=new_score,
-                law_bonus=law_bonus,
-                news_impact=news_impact_avg,
-                news_count=len(news_items),
-                success=True
-            )
+            return scoring_result
             
         except Exception as e:
             error_msg = str(e)
             print(f"  ❌ Hata: {error_msg}")
-            
-            return ScoringResult(
-                mp_id=mp.id,
+            return self._build_error_result(mp, error_msg)
+    
+    # =========================================================================
+    # Aşamalar (seri mod ve pipeline tarafından ortak kullanılır)
+    # =========================================================================
+    
+    def _search_news(self, mp: MP, max_news: int) -> List[NewsItem]:
+        """Aşama 1: Vekil için Google News araması."""
+        with self._stage('news'), self.metrics.measure('news', mp.id, mp.name) as span:
+            items = self.scraper.search_news_for_mp(
+                mp_name=mp.name,
+                max_results=max_news
+            )
+            span.add_bytes([(item.title, item.url) for item in items])
+        return items
+    
+    def _scrape_item(self, mp: MP, item: NewsItem) -> NewsItem:
+        """Aşama 2: Haber içeriğini çek."""
+        with self._stage('scrape'), self.metrics.measure('scrape', mp.id, mp.name) as span:
+            item.content = self.scraper.scrape_article_content(item.url)
+            if item.content is None:
+                span.fail()
+            span.add_bytes(item.content)
+        return item
+    
+    def _analyze_item(self, mp: MP, item: NewsItem) -> NewsAnalysis:
+        """Aşama 3: Haberi Gemini ile analiz et."""
+        with self._stage('analysis'), self.metrics.measure('gemini', mp.id, mp.name) as span:
+            result = self.analyzer.analyze_news_impact(
                 mp_name=mp.name,
-                old_score=mp.current_score,
-                new_score=mp.current_score,
-                law_bonus=0,
-                news_impact=0,
-                news_count=0,
-                success=False,
-                error_message=error_msg
+                news_title=item.title,
+                news_content=item.content
             )
+            span.add_bytes(item.title)
+            span.add_bytes(item.content)
+            span.add_bytes(result.raw_response)
+        analysis = self._build_analysis(mp, item, result)
+        
+        if self.checkpoint is not None:
+            self.checkpoint.save_analysis(analysis)
+        return analysis
+    
+    def _input_fingerprint(self, mp: MP, news_urls: List[str]) -> str:
+        """Vekilin puanlama girdilerinin parmak izi."""
+        return compute_fingerprint(
+            scorer=self.FINGERPRINT_SCORER,
+            weights_ver=self.weights_version,
+            news_urls=news_urls,
+            extra={'law_proposals': mp.law_proposals},
+        )
     
-    def process_all_mps(self, max_news_per_mp: int = 5) -> List[ScoringResult]:
+    def _unchanged_result(self, mp: MP, news_items: List[NewsItem]) -> Optional[ScoringResult]:
+        """
+        Girdi parmak izi MP dokümanındakiyle aynıysa atlanmış sonuç döndür.
+        
+        Puan yazılmaz ama `last_updated` yenilenir (dry_run değilse); aksi halde
+        süre bütçeli zamanlayıcı bu vekili her çalıştırmada en bayat sayıp önce işler.
+        
+        Returns:
+            ScoringResult veya None (vekil yeniden puanlanmalıysa)
+        """
+        if self.force or not mp.scoring_fingerprint:
+            return None
+        
+        fingerprint = self._input_fingerprint(mp, [item.url for item in news_items])
+        if fingerprint != mp.scoring_fingerprint:
+            return None
+        
+        result = ScoringResult(
+            mp_id=mp.id,
+            mp_name=mp.name,
+            old_score=mp.current_score,
+            new_score=mp.current_score,
+            law_bonus=mp.law_proposals * self.FIRST_SIGNATURE_WEIGHT,
+            question_bonus=0.0,
+            speech_bonus=0.0,
+            news_impact=0.0,
+            news_count=len(news_items),
+            is_passive=self.check_passivity(first_signature=mp.law_proposals),
+            success=True,
+            fingerprint=fingerprint,
+            skipped=True
+        )
+        
+        if not self.dry_run:
+            with self._stage('write'), self.metrics.measure('firestore_write', mp.id, mp.name) as span:
+                if not self.firestore.update_mp(mp.id, {}):
+                    span.fail()
+        
+        if self.checkpoint is not None:
+            self.checkpoint.mark_completed(result)
+        return result
+    
+    def _cached_analysis(self, mp: MP, item: NewsItem) -> Optional[NewsAnalysis]:
+        """Devam eden (resume) job'da bu haber daha önce analiz edildiyse döndür."""
+        if self.checkpoint is None:
+            return None
+        return self.checkpoint.get_analysis(mp.id, item.url)
+    
+    def _build_analysis(
+        self,
+        mp: MP,
+        item: NewsItem,
+        result: AnalysisResult
+    ) -> NewsAnalysis:
+        """Haber ve AI analiz sonucundan NewsAnalysis modeli oluştur."""
+        return NewsAnalysis(
+            mp_id=mp.id,
+            title=item.title,
+            url=item.url,
+            sentiment_score=result.sentiment_score,
+            impact_score=result.impact_score,
+            source=item.source,
+            summary=result.summary,
+            keywords=result.keywords,
+            raw_analysis=result.raw_response
+        )
+    
+    def _build_result(self, mp: MP, analyses: List[NewsAnalysis]) -> ScoringResult:
+        """Toplanan analizlerden puanlama sonucunu hesapla."""
+        impact_scores = [a.impact_score for a in analyses]
+        news_impact_avg = sum(impact_scores) / len(impact_scores) if impact_scores else 5.0
+        law_bonus = mp.law_proposals * self.FIRST_SIGNATURE_WEIGHT
+        new_score = self.calculate_score(
+            first_signature=mp.law_proposals,
+            news_impact_avg=news_impact_avg
+        )
+        
+        return ScoringResult(
+            mp_id=mp.id,
+            mp_name=mp.name,
+            old_score=mp.current_score,
+            new_score=new_score,
+            law_bonus=law_bonus,
+            question_bonus=0.0,
+            speech_bonus=0.0,
+            news_impact=news_impact_avg,
+            news_count=len(analyses),
+            is_passive=self.check_passivity(first_signature=mp.law_proposals),
+            success=True,
+            fingerprint=self._input_fingerprint(mp, [a.url for a in analyses])
+        )
+    
+    def _build_error_result(self, mp: MP, error_msg: str) -> ScoringResult:
+        """Hata durumunda puanı değiştirmeyen sonuç oluştur."""
+        return ScoringResult(
+            mp_id=mp.id,
+            mp_name=mp.name,
+            old_score=mp.current_score,
+            new_score=mp.current_score,
+            law_bonus=0,
+            question_bonus=0,
+            speech_bonus=0,
+            news_impact=0,
+            news_count=0,
+            is_passive=False,
+            success=False,
+            error_message=error_msg
+        )
+    
+    def _persist(
+        self,
+        mp: MP,
+        result: ScoringResult,
+        analyses: List[NewsAnalysis]
+    ):
+        """Puanı ve haber analizlerini Firestore'a yaz (dry_run değilse) ve checkpoint al."""
+        if self.dry_run:
+            print(f"  ⏭️ DRY-RUN: Firestore'a yazılmadı")
+        else:
+            with self._stage('write'):
+                # MP puanını güncelle
+                with self.metrics.measure('firestore_write', mp.id, mp.name) as span:
+                    if not self.firestore.update_mp_score(mp.id, result.new_score, fingerprint=result.fingerprint):
+                        span.fail()
+                    span.add_bytes({'current_score': result.new_score, 'scoring_fingerprint': result.fingerprint})
+                
+                # Haber analizlerini kaydet
+                for analysis in analyses:
+                    with self.metrics.measure('firestore_write', mp.id, mp.name) as span:
+                        self.firestore.add_news_analysis(analysis)
+                        span.add_bytes(analysis.to_dict())
+            
+            print(f"  💾 Firestore güncellendi")
+        
+        if self.checkpoint is not None:
+            self.checkpoint.mark_completed(result)
+    
+    @contextmanager
+    def _stage(self, name: str):
+        """Aşama bazlı eşzamanlılık limitini uygula."""
+        slot = self._stage_slots[name]
+        with slot:
+            yield
+    
+    def process_all_mps(
+        self,
+        max_news_per_mp: int = 5,
+        workers: Optional[int] = None,
+        pipelined: Optional[bool] = None,
+        checkpoint: Optional[CheckpointStore] = None,
+        shard: Optional[ShardSpec] = None,
+        scheduler: Optional[DeadlineScheduler] = None
+    ) -> List[ScoringResult]:
         """
         Tüm milletvekillerini işle.
         
         Args:
             max_news_per_mp: Her vekil için çekilecek maksimum haber sayısı
+            workers: Eşzamanlı işlenecek vekil sayısı (None ise config'den alınır)
+            pipelined: True ise aşamalı producer/consumer pipeline kullanılır
+                (None ise config'den alınır)
+            checkpoint: Tamamlanan vekilleri ve ara analizleri saklayan depo.
+                Devam eden bir job'da tamamlanmış vekiller tekrar işlenmez.
+            shard: Verilirse sadece bu shard'a düşen vekiller işlenir
+                (mp.id özetine göre deterministik bölümleme)
+            scheduler: Verilirse vekiller öncelik sırasıyla, süre bütçesine göre
+                ayarlanan haber sayısıyla işlenir; bütçe dolunca kalanlar ertelenir
             
         Returns:
-            List[ScoringResult]: Tüm işlem sonuçları
+            List[ScoringResult]: İşlenen vekillerin sonuçları (vekil listesi sırasıyla,
+                ertelenenler hariç)
         """
         print("\n" + "="*60)
         print("🚀 Toplu Puanlama Başlatılıyor")
         print("="*60)
         
         # Tüm vekilleri getir
-        mps = self.firestore.get_all_mps()
+        with self.metrics.measure('firestore_read') as span:
+            mps = self.firestore.get_all_mps()
+            span.add_bytes([mp.to_dict() for mp in mps])
         
         if not mps:
             print("⚠️ Hiç milletvekili kaydı bulunamadı!")
             print("💡 Önce örnek veriler ekleyin veya seed_sample_data() fonksiyonunu çalıştırın.")
             return []
         
+        if shard is not None:
+            total = len(mps)
+            mps = shard.filter(mps)
+            print(f"🧩 Shard {shard}: {total} vekilden {len(mps)} tanesi bu process'te")
+        
+        workers = workers if workers is not None else self.pipeline_config.workers
+        pipelined = pipelined if pipelined is not None else self.pipeline_config.pipelined
+        
+        # Checkpoint'te tamamlanmış vekilleri atla
+        completed = checkpoint.completed_results() if checkpoint else {}
+        pending = [mp for mp in mps if mp.id not in completed]
+        
         print(f"📋 Toplam {len(mps)} milletvekili işlenecek")
+        if completed:
+            print(f"♻️ Checkpoint: {len(mps) - len(pending)} vekil zaten tamamlanmış, atlanıyor")
         
-        results = []
-        for i, mp in enumerate(mps, 1):
-            print(f"\n[{i}/{len(mps)}]", end="")
-            result = self.process_mp(mp, max_news_per_mp)
-            results.append(result)
+        if scheduler is not None:
+            pending = scheduler.prioritize(pending)
+            scheduler.start(len(pending))
+            print(f"⏳ Süre bütçesi: {scheduler.budget_seconds:.0f}s, vekiller öncelik sırasıyla işlenecek")
+        
+        self.checkpoint = checkpoint
+        self.scheduler = scheduler
+        try:
+            if pipelined:
+                new_results = ScoringPipeline(self, self.pipeline_config).run(pending, max_news_per_mp)
+            elif workers > 1:
+                new_results = self._process_concurrently(pending, max_news_per_mp, workers)
+            else:
+                new_results = []
+                for i, mp in enumerate(pending, 1):
+                    print(f"\n[{i}/{len(pending)}]", end="")
+                    new_results.append(self._process_scheduled(mp, max_news_per_mp))
+        finally:
+            self.checkpoint = None
+            self.scheduler = None
+        
+        # Sonuçları vekil listesi sırasıyla birleştir (ertelenenler None döner)
+        by_id = {r.mp_id: r for r in new_results if r is not None}
+        results = [completed.get(mp.id) or by_id[mp.id] for mp in mps if mp.id in completed or mp.id in by_id]
+        
+        if scheduler is not None and scheduler.deferred:
+            print(f"\n⏳ {len(scheduler.deferred)} vekil süre bütçesi nedeniyle ertelendi")
         
         # Özet
         self._print_summary(results)
         
         return results
     
+    def _process_concurrently(
+        self,
+        mps: List[MP],
+        max_news: int,
+        workers: int
+    ) -> List[ScoringResult]:
+        """
+        Vekilleri thread havuzunda eşzamanlı işle.
+        
+        Ağ beklemesi ağırlıklı olduğu için thread kullanılır. Aşama limitleri
+        (_stage) Google News, scraping, Gemini ve Firestore yükünü ayrı ayrı sınırlar.
+        Sonuçlar seri modla aynı sırada döner.
+        """
+        print(f"⚡ Eşzamanlı mod: {workers} worker, aşama limitleri: {self.pipeline_config.stage_limits()}")
+        
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='scoring') as executor:
+            return list(executor.map(lambda mp: self._process_scheduled(mp, max_news), mps))
+    
+    def _admit(self, mp: MP, max_news: int) -> Optional[int]:
+        """
+        Zamanlayıcı varsa vekil için haber sayısını al.
+        
+        Returns:
+            Optional[int]: Haber sayısı; süre bütçesi dolduysa None (vekil ertelenir)
+        """
+        if self.scheduler is None:
+            return max_news
+        return self.scheduler.admit(mp)
+    
+    def _process_scheduled(self, mp: MP, max_news: int) -> Optional[ScoringResult]:
+        """Vekili zamanlayıcının verdiği haber sayısıyla işle (ertelendiyse None)."""
+        news_count = self._admit(mp, max_news)
+        if news_count is None:
+            return None
+        return self.process_mp(mp, news_count)
+    
     def process_single_mp(self, mp_id: str, max_news: int = 5) -> Optional[ScoringResult]:
         """
         Belirli bir milletvekilini işle.
@@ -260,7 +569,9 @@ class ScoringEngine:
         Returns:
             ScoringResult veya None
         """
-        mp = self.firestore.get_mp_by_id(mp_id)
+        with self.metrics.measure('firestore_read') as span:
+            mp = self.firestore.get_mp_by_id(mp_id)
+            span.add_bytes(mp.to_dict() if mp else None)
         
         if not mp:
             print(f"❌ Milletvekili bulunamadı: {mp_id}")
@@ -276,8 +587,10 @@ class ScoringEngine:
         
         success_count = sum(1 for r in results if r.success)
         fail_count = len(results) - success_count
+        skipped_count = sum(1 for r in results if r.skipped)
         
         print(f"✅ Başarılı: {success_count}")
+        print(f"⏭️ Değişmeyen (atlanan): {skipped_count}")
         print(f"❌ Başarısız: {fail_count}")
         
         if results:
@@ -364,11 +677,20 @@ def seed_sample_data(firestore_service=None):
 _engine_instance: Optional[ScoringEngine] = None
 
 
-def get_scoring_engine(dry_run: bool = False) -> ScoringEngine:
+def get_scoring_engine(
+    dry_run: bool = False,
+    pipeline_config: Optional[PipelineConfig] = None,
+    force: bool = False
+) -> ScoringEngine:
     """ScoringEngine singleton instance döndür."""
     global _engine_instance
-    if _engine_instance is None or _engine_instance.dry_run != dry_run:
-        _engine_instance = ScoringEngine(dry_run=dry_run)
+    if (
+        _engine_instance is None
+        or _engine_instance.dry_run != dry_run
+        or _engine_instance.force != force
+        or (pipeline_config is not None and _engine_instance.pipeline_config != pipeline_config)
+    ):
+        _engine_instance = ScoringEngine(dry_run=dry_run, pipeline_config=pipeline_config, force=force)
     return _engine_instance
 
 
@@ -379,10 +701,11 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description='Scoring Engine Test')
     parser.add_argument('--dry-run', action='store_true', help='Firestore yazma')
     parser.add_argument('--seed', action='store_true', help='Örnek veri ekle')
+    parser.add_argument('--force', action='store_true', help='Değişmeyen vekilleri de puanla')
     args = parser.parse_args()
     
     if args.seed:
         seed_sample_data()
     else:
-        engine = get_scoring_engine(dry_run=args.dry_run)
+        engine = get_scoring_engine(dry_run=args.dry_run, force=args.force)
         engine.process_all_mps(max_news_per_mp=3)
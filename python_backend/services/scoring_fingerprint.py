@@ -0,0 +1,86 @@
+"""
+Puanlama Girdi Parmak İzi Modülü
+Artımlı (incremental) puanlama için vekil bazlı girdi parmak izi hesaplar.
+
+Bir vekilin puanını belirleyen girdiler (kanun teklifi esas no kümesi, soru ve
+araştırma önergesi sayıları, komisyon rolleri, haber URL'leri ve ağırlık sürümü)
+tek bir özet değere indirgenir ve MP dokümanında `scoring_fingerprint` alanında
+saklanır. Sonraki çalıştırmada parmak izi aynıysa vekil yeniden puanlanmaz ve
+Firestore'a yazılmaz.
+
+Parmak izine puanlayıcının adı da dahildir; böylece aynı `current_score` alanını
+yazan farklı bir script çalıştıysa parmak izi tutmaz ve vekil yeniden puanlanır.
+"""
+
+import hashlib
+import json
+from dataclasses import asdict, is_dataclass
+from typing import Any, Dict, Iterable, Optional
+
+
+# MP dokümanındaki alan adı
+FINGERPRINT_FIELD = 'scoring_fingerprint'
+
+
+def _digest(payload: Any, length: int) -> str:
+    """Kanonik JSON'un SHA-256 özetini döndür."""
+    data = json.dumps(payload, sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha256(data.encode('utf-8')).hexdigest()[:length]
+
+
+def weights_version(weights: Any) -> str:
+    """
+    Ağırlık setinin sürümünü döndür.
+
+    Sürüm ağırlık değerlerinden türetilir; ağırlıklardan biri değiştiğinde
+    tüm vekillerin parmak izi değişir ve hepsi yeniden puanlanır.
+
+    Args:
+        weights: Ağırlık dataclass'ı (örn. ScoringWeights) veya dict
+
+    Returns:
+        str: 8 karakterlik sürüm özeti
+    """
+    if is_dataclass(weights):
+        weights = asdict(weights)
+    return _digest(weights, 8)
+
+
+def compute_fingerprint(
+    scorer: str,
+    weights_ver: str,
+    proposal_ids: Iterable[str] = (),
+    question_count: int = 0,
+    research_count: int = 0,
+    commission_roles: Iterable[str] = (),
+    news_urls: Iterable[str] = (),
+    extra: Optional[Dict[str, Any]] = None
+) -> str:
+    """
+    Bir vekilin puanlama girdilerinin parmak izini hesapla.
+
+    Kümeler sıralanarak özetlenir; girdilerin okunma sırası sonucu etkilemez.
+
+    Args:
+        scorer: Puanlayıcı adı (örn. 'news', 'metrics', 'fair')
+        weights_ver: weights_version() çıktısı
+        proposal_ids: Vekilin imzası bulunan kanun tekliflerinin esas numaraları
+        question_count: Yazılı soru önergesi sayısı
+        research_count: Araştırma önergesi sayısı
+        commission_roles: Komisyon rolleri (örn. ['BAŞKAN', 'ÜYE'])
+        news_urls: Puana katılan haberlerin URL'leri
+        extra: Puanlayıcıya özgü ek girdiler
+
+    Returns:
+        str: 16 karakterlik parmak izi
+    """
+    return _digest({
+        'scorer': scorer,
+        'weights': weights_ver,
+        'proposals': sorted({str(p) for p in proposal_ids if p}),
+        'questions': question_count,
+        'research': research_count,
+        'commissions': sorted(commission_roles),
+        'news': sorted(set(news_urls)),
+        'extra': extra or {},
+    }, 16)
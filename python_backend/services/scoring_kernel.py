@@ -0,0 +1,236 @@
+"""
+Vektörel Puanlama Çekirdeği
+Sütunsal (columnar) vekil aktivite tablosu üzerinde NumPy tabanlı puanlama.
+
+Repodaki üç puanlama formülü (ScoringEngine.calculate_score,
+update_all_mp_metrics.calculate_scores ve fair_scoring.calculate_fair_score)
+aynı yapıdadır: aktivite sayılarının ağırlıklı toplamı, isteğe bağlı hayalet
+vekil cezası, alt sınır ve yuvarlama. Bu modül formülleri `ScoringPolicy`
+olarak ifade eder ve tüm vekiller için tek bir matris çarpımıyla hesaplar.
+
+Tablonun satırları vekil olmak zorunda değildir; (vekil, dönem) çiftleri de
+olabilir. Böylece çok dönemli geçmiş ve birden fazla politika aynı tabloda,
+Python döngüsü olmadan değerlendirilir.
+"""
+
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+
+# Tablo sütunları (ağırlık vektörlerindeki sıra)
+ACTIVITY_COLUMNS = (
+    'first_signature',      # Kanun teklifi ilk imza
+    'support_signature',    # Kanun teklifi destek imzası
+    'question',             # Yazılı soru önergesi
+    'research',             # Meclis araştırma önergesi
+    'commission',           # Komisyon bonusu (hazır puan)
+    'news',                 # Haber etki puanı
+)
+
+# Hayalet/pasiflik kontrolünde kullanılan bireysel faaliyet sütunları
+_ACTIVITY_INDEXES = [ACTIVITY_COLUMNS.index(c) for c in ('first_signature', 'question', 'research')]
+
+# Etki etiketleri (fair_scoring ile aynı eşikler)
+GHOST_LABEL = 'Ghost'
+DEFAULT_LABEL_THRESHOLDS = ((100.0, 'High'), (30.0, 'Medium'))
+DEFAULT_LOW_LABEL = 'Low'
+
+
+ColumnInput = Union[Mapping[str, float], Sequence[float], np.ndarray, float, int]
+
+
+class ActivityTable:
+    """Vekil bazlı aktivite sayılarının sütunsal tablosu."""
+
+    def __init__(
+        self,
+        names: Sequence[str],
+        parties: Optional[Sequence[str]] = None,
+        **columns: ColumnInput
+    ):
+        """
+        Tabloyu oluştur.
+
+        Args:
+            names: Satır adları (vekil adı veya vekil+dönem anahtarı)
+            parties: Satırların partileri (rol bazlı politikalar için)
+            **columns: ACTIVITY_COLUMNS sütunları. Her değer isim -> sayı
+                sözlüğü, satır sırasında dizi veya tüm satırlar için sabit olabilir.
+                Verilmeyen sütunlar 0 kabul edilir.
+
+        Raises:
+            ValueError: Bilinmeyen sütun veya uzunluğu uyuşmayan dizi verilirse
+        """
+        unknown = set(columns) - set(ACTIVITY_COLUMNS)
+        if unknown:
+            raise ValueError(f"Bilinmeyen aktivite sütunu: {sorted(unknown)}")
+
+        self.names = list(names)
+        self.parties = list(parties) if parties is not None else [''] * len(self.names)
+        if len(self.parties) != len(self.names):
+            raise ValueError("parties ve names aynı uzunlukta olmalı")
+
+        self.columns: Dict[str, np.ndarray] = {
+            column: self._to_array(columns.get(column, 0.0)) for column in ACTIVITY_COLUMNS
+        }
+        self._matrix: Optional[np.ndarray] = None
+
+    def _to_array(self, values: ColumnInput) -> np.ndarray:
+        """Sütun girdisini satır sırasında float dizisine çevir."""
+        count = len(self.names)
+        if isinstance(values, Mapping):
+            return np.fromiter((values.get(name, 0) for name in self.names), dtype=float, count=count)
+        if np.isscalar(values):
+            return np.full(count, float(values))
+
+        array = np.asarray(values, dtype=float)
+        if array.shape != (count,):
+            raise ValueError(f"Sütun uzunluğu {array.shape}, beklenen ({count},)")
+        return array
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    @property
+    def matrix(self) -> np.ndarray:
+        """(satır × sütun) aktivite matrisi."""
+        if self._matrix is None:
+            self._matrix = np.column_stack([self.columns[c] for c in ACTIVITY_COLUMNS]) \
+                if self.names else np.zeros((0, len(ACTIVITY_COLUMNS)))
+        return self._matrix
+
+    def individual_activity(self) -> np.ndarray:
+        """İlk imza + soru + araştırma toplamı (hayalet vekil kontrolü)."""
+        return self.matrix[:, _ACTIVITY_INDEXES].sum(axis=1)
+
+    def zero_activity_count(self) -> np.ndarray:
+        """İlk imza, soru ve araştırmadan kaçının sıfır olduğu (pasiflik kontrolü)."""
+        return (self.matrix[:, _ACTIVITY_INDEXES] == 0).sum(axis=1)
+
+
+@dataclass
+class PolicyResult:
+    """Bir politikanın tüm tablo için sonucu (satır sırasında diziler)."""
+    policy: str
+    names: List[str]
+    scores: np.ndarray          # Yuvarlanmış puanlar
+    raw_scores: np.ndarray      # Yuvarlanmamış puanlar
+    groups: np.ndarray          # Satır başına rol grubu adı
+    is_passive: np.ndarray      # 3 ana kriterden 2+ sıfır
+    is_ghost: np.ndarray        # Hiç bireysel faaliyet yok
+    impact_labels: np.ndarray   # High | Medium | Low | Ghost
+
+    def as_dict(self) -> Dict[str, float]:
+        """İsim -> puan sözlüğü."""
+        return dict(zip(self.names, self.scores.tolist()))
+
+
+@dataclass
+class ScoringPolicy:
+    """
+    Bir puanlama formülünün vektörel tanımı.
+
+    Her rol grubu için bir ağırlık satırı bulunur; satırlar partilerine göre
+    bir gruba atanır. Tek gruplu politikalarda tüm satırlar aynı ağırlığı kullanır.
+    """
+    name: str
+    weights: np.ndarray                                 # (grup × sütun)
+    groups: Tuple[str, ...] = ('DEFAULT',)
+    ghost_penalty: np.ndarray = field(default_factory=lambda: np.zeros(1))  # (grup,)
+    min_score: Optional[float] = None                   # Alt sınır (örn. negatif puan olmasın)
+    decimals: int = 2
+    passive_zero_threshold: int = 2
+    group_of: Optional[Callable[[str], str]] = None     # parti -> grup adı
+    label_thresholds: Tuple[Tuple[float, str], ...] = DEFAULT_LABEL_THRESHOLDS
+
+    def __post_init__(self):
+        self.weights = np.atleast_2d(np.asarray(self.weights, dtype=float))
+        self.ghost_penalty = np.broadcast_to(
+            np.asarray(self.ghost_penalty, dtype=float), (len(self.groups),)
+        ).copy()
+        if self.weights.shape != (len(self.groups), len(ACTIVITY_COLUMNS)):
+            raise ValueError(
+                f"Ağırlık matrisi {self.weights.shape}, beklenen "
+                f"({len(self.groups)}, {len(ACTIVITY_COLUMNS)})"
+            )
+
+    @classmethod
+    def linear(cls, name: str, decimals: int = 2, **weights: float) -> 'ScoringPolicy':
+        """
+        Tek gruplu doğrusal politika oluştur.
+
+        Args:
+            name: Politika adı
+            decimals: Yuvarlama basamağı
+            **weights: Sütun adı -> ağırlık (verilmeyenler 0)
+        """
+        return cls(
+            name=name,
+            weights=np.array([[weights.get(c, 0.0) for c in ACTIVITY_COLUMNS]]),
+            decimals=decimals,
+        )
+
+    def group_indices(self, table: ActivityTable) -> np.ndarray:
+        """Her satırın ağırlık grubu indeksi (parti başına bir kez hesaplanır)."""
+        if self.group_of is None or len(self.groups) == 1:
+            return np.zeros(len(table), dtype=int)
+
+        unique_parties, inverse = np.unique(np.asarray(table.parties, dtype=object), return_inverse=True)
+        lookup = np.array([self.groups.index(self.group_of(p)) for p in unique_parties], dtype=int)
+        return lookup[inverse] if len(table) else np.zeros(0, dtype=int)
+
+    def evaluate(self, table: ActivityTable) -> PolicyResult:
+        """
+        Politikayı tablonun tüm satırları için tek geçişte hesapla.
+
+        Args:
+            table: Aktivite tablosu
+
+        Returns:
+            PolicyResult
+        """
+        group_idx = self.group_indices(table)
+
+        # (satır × grup) puanlarından satırın kendi grubunu seç
+        per_group = table.matrix @ self.weights.T
+        raw = np.take_along_axis(per_group, group_idx[:, None], axis=1)[:, 0] \
+            if len(table) else np.zeros(0)
+
+        activity = table.individual_activity()
+        is_ghost = activity == 0
+        raw = raw + np.where(is_ghost, self.ghost_penalty[group_idx], 0.0)
+
+        if self.min_score is not None:
+            raw = np.maximum(raw, self.min_score)
+
+        return PolicyResult(
+            policy=self.name,
+            names=table.names,
+            scores=np.round(raw, self.decimals),
+            raw_scores=raw,
+            groups=np.asarray(self.groups, dtype=object)[group_idx],
+            is_passive=table.zero_activity_count() >= self.passive_zero_threshold,
+            is_ghost=is_ghost,
+            impact_labels=self._labels(raw, is_ghost),
+        )
+
+    def _labels(self, raw: np.ndarray, is_ghost: np.ndarray) -> np.ndarray:
+        """Etki etiketlerini eşiklere göre ata."""
+        conditions = [is_ghost] + [raw >= threshold for threshold, _ in self.label_thresholds]
+        choices = [GHOST_LABEL] + [label for _, label in self.label_thresholds]
+        return np.select(conditions, choices, default=DEFAULT_LOW_LABEL).astype(object)
+
+
+def evaluate_policies(
+    table: ActivityTable,
+    policies: Iterable[ScoringPolicy]
+) -> Dict[str, PolicyResult]:
+    """
+    Birden fazla politikayı aynı tablo üzerinde yan yana değerlendir.
+
+    Returns:
+        Dict[politika adı, PolicyResult]
+    """
+    return {policy.name: policy.evaluate(table) for policy in policies}
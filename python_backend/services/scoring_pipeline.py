@@ -0,0 +1,294 @@
+"""
+Aşamalı Puanlama Pipeline Modülü
+Puanlama job'ını sınırlı kuyruklarla bağlanmış dört aşamaya böler.
+
+Aşamalar:
+1. news     - Google News araması (vekil başına)
+2. scrape   - Makale içeriği çekme (haber başına)
+3. analysis - Gemini analizi (haber başına)
+4. persist  - Puan hesaplama ve Firestore yazma (vekil başına)
+
+Her aşamanın kendi worker havuzu vardır. Kuyruklar sınırlı olduğu için yavaş
+bir aşama, üst aşamaları bekletir (backpressure) ve bellek kullanımı sabit kalır.
+Böylece Gemini bir haberi analiz ederken scraper sonraki haberleri çekmeye devam eder.
+
+Bir işte beklenmeyen hata worker'ı durdurmaz: vekil hatalı sayılır ve iş yine
+alt aşamaya iletilir; aksi halde sınırlı kuyruklar ve aşama kapanışı kilitlenirdi.
+"""
+
+import queue
+import threading
+from dataclasses import dataclass, field
+from typing import List, Optional, Callable, Any, TYPE_CHECKING
+
+from config.pipeline_config import PipelineConfig
+from models.mp_models import MP, NewsAnalysis
+
+if TYPE_CHECKING:
+    from services.news_scraper import NewsItem
+    from services.scoring_engine import ScoringEngine, ScoringResult
+
+
+# Worker'lara kapanma sinyali
+_STOP = object()
+
+
+@dataclass
+class _MPJob:
+    """Pipeline içinde dolaşan tek bir vekilin iş durumu."""
+    index: int
+    mp: MP
+    max_news: int
+    items: List['NewsItem'] = field(default_factory=list)
+    analyses: List[Optional[NewsAnalysis]] = field(default_factory=list)
+    pending: int = 0
+    error: Optional[str] = None
+    unchanged: Optional['ScoringResult'] = None
+    deferred: bool = False
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def fail(self, error_msg: str):
+        """İlk hatayı kaydet; sonraki aşamalar bu işi atlar."""
+        with self.lock:
+            if self.error is None:
+                self.error = error_msg
+
+    def complete_item(self) -> bool:
+        """Bir haberin analizi bitti. Vekilin tüm haberleri bittiyse True döner."""
+        with self.lock:
+            self.pending -= 1
+            return self.pending == 0
+
+
+class ScoringPipeline:
+    """Producer/consumer tabanlı aşamalı puanlama pipeline'ı."""
+
+    def __init__(self, engine: 'ScoringEngine', config: Optional[PipelineConfig] = None):
+        """
+        Pipeline'ı initialize et.
+
+        Args:
+            engine: Aşama fonksiyonlarını sağlayan ScoringEngine
+            config: Worker havuzu ve kuyruk ayarları
+        """
+        self.engine = engine
+        self.config = config or engine.pipeline_config
+
+        queue_size = max(1, self.config.queue_size)
+        self.news_queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self.scrape_queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self.analysis_queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self.persist_queue: queue.Queue = queue.Queue(maxsize=queue_size)
+
+        self._results: List[Optional['ScoringResult']] = []
+        self._deferred: set = set()
+        self._completed = 0
+        self._total = 0
+        self._progress_lock = threading.Lock()
+
+    def run(self, mps: List[MP], max_news: int = 5) -> List['ScoringResult']:
+        """
+        Vekilleri pipeline üzerinden işle.
+
+        Args:
+            mps: İşlenecek vekiller
+            max_news: Vekil başına maksimum haber sayısı
+
+        Returns:
+            List[Optional[ScoringResult]]: Vekil listesi sırasıyla sonuçlar
+                (süre bütçesi nedeniyle ertelenen vekiller için None)
+        """
+        limits = self.config.stage_limits()
+        self._results = [None] * len(mps)
+        self._deferred = set()
+        self._completed = 0
+        self._total = len(mps)
+
+        print(f"🏭 Pipeline modu: {limits}, kuyruk kapasitesi: {self.config.queue_size}")
+
+        stages = [
+            (self.news_queue, self._news_worker, self._news_failed, limits['news'], 'news'),
+            (self.scrape_queue, self._scrape_worker, self._scrape_failed, limits['scrape'], 'scrape'),
+            (self.analysis_queue, self._analysis_worker, self._analysis_failed, limits['analysis'], 'analysis'),
+            (self.persist_queue, self._persist_worker, self._persist_failed, limits['write'], 'persist'),
+        ]
+        pools = [
+            (work_queue, self._start_workers(work_queue, handler, recover, count, name))
+            for work_queue, handler, recover, count, name in stages
+        ]
+
+        # Producer: vekilleri news kuyruğuna besle (kuyruk doluysa bekler)
+        for index, mp in enumerate(mps):
+            self.news_queue.put(_MPJob(index=index, mp=mp, max_news=max_news))
+
+        # Aşamaları sırayla kapat: bir aşamanın tüm worker'ları bittiğinde
+        # alt aşamaya yeni iş gelmeyeceği kesinleşir.
+        for work_queue, threads in pools:
+            for _ in threads:
+                work_queue.put(_STOP)
+            for thread in threads:
+                thread.join()
+
+        return [
+            None if i in self._deferred
+            else result if result is not None
+            else self.engine._build_error_result(mps[i], "Pipeline sonucu üretilemedi")
+            for i, result in enumerate(self._results)
+        ]
+
+    def _start_workers(
+        self,
+        work_queue: queue.Queue,
+        handler: Callable[[Any], None],
+        recover: Callable[[Any, str], None],
+        count: int,
+        name: str
+    ) -> List[threading.Thread]:
+        """Bir aşama için worker havuzunu başlat."""
+        threads = []
+        for i in range(count):
+            thread = threading.Thread(
+                target=self._worker_loop,
+                args=(work_queue, handler, recover),
+                name=f"scoring-{name}-{i}",
+                daemon=True
+            )
+            thread.start()
+            threads.append(thread)
+        return threads
+
+    @staticmethod
+    def _worker_loop(
+        work_queue: queue.Queue,
+        handler: Callable[[Any], None],
+        recover: Callable[[Any, str], None]
+    ):
+        """
+        Kapanma sinyali gelene kadar kuyruktaki işleri işle.
+
+        Handler hata verirse worker ölmez; `recover` vekili hatalı işaretleyip
+        işi alt aşamaya iletir.
+        """
+        while True:
+            task = work_queue.get()
+            if task is _STOP:
+                break
+            try:
+                handler(task)
+            except Exception as e:
+                recover(task, str(e))
+
+    # =========================================================================
+    # Aşama worker'ları
+    # =========================================================================
+
+    def _news_worker(self, job: _MPJob):
+        """Aşama 1: Haber araması, her haber scrape kuyruğuna gönderilir."""
+        try:
+            # Süre bütçesi: haber sayısı ayarlanır veya vekil ertelenir
+            news_count = self.engine._admit(job.mp, job.max_news)
+            if news_count is None:
+                job.deferred = True
+                self.persist_queue.put(job)
+                return
+            job.max_news = news_count
+
+            job.items = self.engine._search_news(job.mp, job.max_news)
+            job.unchanged = self.engine._unchanged_result(job.mp, job.items)
+        except Exception as e:
+            job.fail(str(e))
+
+        # Hata, haber yok veya girdiler değişmedi: doğrudan son aşamaya
+        if job.error or not job.items or job.unchanged:
+            self.persist_queue.put(job)
+            return
+
+        job.analyses = [None] * len(job.items)
+        job.pending = len(job.items)
+        for item_index in range(len(job.items)):
+            self.scrape_queue.put((job, item_index))
+
+    def _scrape_worker(self, task):
+        """Aşama 2: Makale içeriğini çek (checkpoint'te analizi olanlar atlanır)."""
+        job, item_index = task
+        if not job.error:
+            try:
+                item = job.items[item_index]
+                cached = self.engine._cached_analysis(job.mp, item)
+                if cached is not None:
+                    job.analyses[item_index] = cached
+                else:
+                    self.engine._scrape_item(job.mp, item)
+            except Exception as e:
+                job.fail(str(e))
+        self.analysis_queue.put(task)
+
+    def _analysis_worker(self, task):
+        """Aşama 3: Gemini analizi; vekilin son haberi bitince persist'e gönder."""
+        job, item_index = task
+        if not job.error and job.analyses[item_index] is None:
+            try:
+                job.analyses[item_index] = self.engine._analyze_item(
+                    job.mp, job.items[item_index]
+                )
+            except Exception as e:
+                job.fail(str(e))
+        if job.complete_item():
+            self.persist_queue.put(job)
+
+    def _persist_worker(self, job: _MPJob):
+        """Aşama 4: Puanı hesapla ve Firestore'a yaz."""
+        if job.deferred:
+            self._deferred.add(job.index)
+            return
+
+        if job.error:
+            print(f"  ❌ Hata ({job.mp.name}): {job.error}")
+            result = self.engine._build_error_result(job.mp, job.error)
+        elif job.unchanged:
+            result = job.unchanged
+        else:
+            try:
+                analyses = [a for a in job.analyses if a is not None]
+                result = self.engine._build_result(job.mp, analyses)
+                self.engine._persist(job.mp, result, analyses)
+            except Exception as e:
+                print(f"  ❌ Hata ({job.mp.name}): {str(e)}")
+                result = self.engine._build_error_result(job.mp, str(e))
+
+        self._record(job, result)
+
+    # =========================================================================
+    # Hata kurtarma (handler'dan kaçan hatalar)
+    # =========================================================================
+
+    def _news_failed(self, job: _MPJob, error_msg: str):
+        job.fail(error_msg)
+        self.persist_queue.put(job)
+
+    def _scrape_failed(self, task, error_msg: str):
+        job, _ = task
+        job.fail(error_msg)
+        self.analysis_queue.put(task)
+
+    def _analysis_failed(self, task, error_msg: str):
+        job, _ = task
+        job.fail(error_msg)
+        if job.complete_item():
+            self.persist_queue.put(job)
+
+    def _persist_failed(self, job: _MPJob, error_msg: str):
+        print(f"  ❌ Hata ({job.mp.name}): {error_msg}")
+        if job.deferred:
+            self._deferred.add(job.index)
+        else:
+            self._record(job, self.engine._build_error_result(job.mp, error_msg))
+
+    def _record(self, job: _MPJob, result: 'ScoringResult'):
+        """Vekilin sonucunu kaydet ve ilerlemeyi yazdır."""
+        self._results[job.index] = result
+
+        with self._progress_lock:
+            self._completed += 1
+            completed = self._completed
+        print(f"[{completed}/{self._total}] 👤 {job.mp.name}: {result.old_score} → {result.new_score}")
@@ -0,0 +1,104 @@
+"""
+Artımlı Scraping Modülü
+Kanun teklifi, yazılı soru ve araştırma önergesi scraper'larının sadece yeni
+kayıtları çekmesini sağlar.
+
+Mevcut veri dosyasındaki (data/*.json) esas numaraları filigran olarak yüklenir.
+TBMM sonuç tabloları en yeni kayıtla başladığından, tamamı bilinen kayıtlardan
+oluşan ilk sayfada sayfalama durdurulur. Çekilen kayıtlar dosyanın başına
+eklenir; tekrar çekilen bilinen kayıtlar güncel halleriyle değiştirilir (örn.
+soru önergesinin durumu).
+
+Dosya kayıt kayıt okunur ve yazılır (bkz. services/json_stream.py); yazma geçici
+dosya üzerinden atomiktir.
+"""
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Iterable, List, Set
+
+from services.json_stream import iter_records
+
+logger = logging.getLogger(__name__)
+
+
+class ScrapeWatermark:
+    """Bir veri dosyasındaki bilinen kayıt anahtarları."""
+
+    def __init__(self, path: Path, key: str = 'esas_no'):
+        """
+        Args:
+            path: Kayıtların birleştirileceği JSON dizisi dosyası (yoksa boş başlar)
+            key: Kayıtları tekil tanımlayan alan
+        """
+        self.path = Path(path)
+        self.key = key
+        self.known: Set[str] = set()
+
+        if self.path.exists():
+            self.known = {record[key] for record in iter_records(self.path, (key,)) if record.get(key)}
+        logger.info(f"🔖 {self.path.name}: {len(self.known)} bilinen kayıt")
+
+    def __len__(self) -> int:
+        return len(self.known)
+
+    def is_known_page(self, keys: Iterable[str]) -> bool:
+        """
+        Sayfadaki kayıtların hepsi zaten dosyada mı?
+
+        Boş sayfa bilinen sayılmaz (sayfalama kendi koşuluyla biter).
+        """
+        keys = list(keys)
+        return bool(keys) and all(key in self.known for key in keys)
+
+    def merge(self, fetched: List[dict]) -> int:
+        """
+        Çekilen kayıtları dosyayla birleştirip yaz.
+
+        Çekilen kayıtlar (çekilme sırasıyla) başa yazılır, dosyadaki diğer
+        kayıtlar mevcut sıralarıyla ardından gelir.
+
+        Args:
+            fetched: Çekilen kayıtlar
+
+        Returns:
+            int: Dosyaya yeni eklenen kayıt sayısı
+        """
+        seen = set()
+        head = []
+        for record in fetched:
+            if record.get(self.key) and record[self.key] not in seen:
+                seen.add(record[self.key])
+                head.append(record)
+
+        added = sum(1 for key in seen if key not in self.known)
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write('[')
+                first = True
+                tail = iter_records(self.path) if self.path.exists() else iter(())
+                for record in head:
+                    first = self._write_record(f, record, first)
+                for record in tail:
+                    if record.get(self.key) not in seen:
+                        first = self._write_record(f, record, first)
+                f.write('\n]' if not first else ']')
+            os.replace(tmp_path, self.path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+        self.known.update(seen)
+        logger.info(f"💾 {self.path.name}: {added} yeni, {len(head) - added} güncellenen kayıt")
+        return added
+
+    @staticmethod
+    def _write_record(f, record: dict, first: bool) -> bool:
+        """Kaydı json.dump(indent=2) biçiminde dizinin elemanı olarak yaz."""
+        body = json.dumps(record, ensure_ascii=False, indent=2).replace('\n', '\n  ')
+        f.write(('\n  ' if first else ',\n  ') + body)
+        return False
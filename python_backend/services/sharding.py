@@ -0,0 +1,139 @@
+"""
+Shard Modülü
+Puanlama job'ını birden fazla process veya makineye bölmek için yardımcılar.
+
+Vekil listesi `mp.id`'nin SHA-256 özetine göre deterministik olarak N parçaya
+ayrılır; `--shard i/N` ile başlatılan her process yalnızca kendi parçasını
+puanlar. Python'un `hash()` fonksiyonu process başına rastgele tohumlandığı
+için kullanılmaz. Tüm shard'lar bittiğinde aynı job_id'ye ait shard logları
+tek bir job özetinde birleştirilir.
+"""
+
+import hashlib
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, TypeVar
+
+from models.mp_models import SystemLog
+
+
+T = TypeVar('T')
+
+
+def shard_of(mp_id: str, count: int) -> int:
+    """Vekil ID'sinin ait olduğu shard indeksini döndür (0 ile count-1 arası)."""
+    digest = hashlib.sha256(mp_id.encode('utf-8')).digest()
+    return int.from_bytes(digest[:8], 'big') % count
+
+
+@dataclass(frozen=True)
+class ShardSpec:
+    """Bir process'in işleyeceği shard (0 tabanlı indeks / toplam shard)."""
+    index: int
+    count: int
+
+    def __post_init__(self):
+        if self.count < 1 or not 0 <= self.index < self.count:
+            raise ValueError(f"Geçersiz shard: {self.index}/{self.count} (0 <= i < N olmalı)")
+
+    @classmethod
+    def parse(cls, text: str) -> 'ShardSpec':
+        """
+        'i/N' biçimindeki shard tanımını çöz.
+
+        Raises:
+            ValueError: Biçim veya aralık hatalıysa
+        """
+        try:
+            index, count = (int(part) for part in text.split('/'))
+        except ValueError:
+            raise ValueError(f"Shard 'i/N' biçiminde olmalı: {text}")
+        return cls(index, count)
+
+    def __str__(self) -> str:
+        return f"{self.index}/{self.count}"
+
+    @property
+    def label(self) -> str:
+        """Dosya ve checkpoint adlarında kullanılacak etiket."""
+        return f"shard{self.index}of{self.count}"
+
+    def owns(self, mp_id: str) -> bool:
+        """Vekil bu shard'a mı ait?"""
+        return shard_of(mp_id, self.count) == self.index
+
+    def filter(self, items: Iterable[T], key=lambda mp: mp.id) -> List[T]:
+        """Listeden bu shard'a ait öğeleri sırayı koruyarak seç."""
+        return [item for item in items if self.owns(key(item))]
+
+
+# =========================================================================
+# Shard özetlerini birleştirme
+# =========================================================================
+
+_COUNT_FIELDS = ('success_count', 'fail_count', 'skipped_count', 'mp_count')
+
+
+def _merge_stages(stage_maps: Iterable[Dict[str, Dict[str, Any]]]) -> Dict[str, Dict[str, Any]]:
+    """StageMetrics.summary()['stages'] sözlüklerini topla."""
+    merged: Dict[str, Dict[str, Any]] = {}
+    for stages in stage_maps:
+        for name, stats in stages.items():
+            target = merged.setdefault(name, {
+                'calls': 0, 'errors': 0, 'bytes': 0, 'total_ms': 0.0, 'max_ms': 0.0, 'histogram': {}
+            })
+            for field in ('calls', 'errors', 'bytes', 'total_ms'):
+                target[field] += stats.get(field, 0)
+            target['max_ms'] = max(target['max_ms'], stats.get('max_ms', 0.0))
+            for bucket, n in stats.get('histogram', {}).items():
+                target['histogram'][bucket] = target['histogram'].get(bucket, 0) + n
+
+    for stats in merged.values():
+        stats['total_ms'] = round(stats['total_ms'], 1)
+        stats['avg_ms'] = round(stats['total_ms'] / stats['calls'], 1) if stats['calls'] else 0.0
+    return merged
+
+
+def merge_shard_summaries(logs: List[SystemLog], expected_count: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Shard bitiş loglarını tek bir job özetinde birleştir.
+
+    Aynı shard için birden fazla log varsa (örn. --resume sonrası) en yenisi kullanılır.
+
+    Args:
+        logs: Aynı job_id'ye ait loglar (shard bitiş logları details['shard'] içerir)
+        expected_count: Beklenen shard sayısı (None ise loglardan okunur)
+
+    Returns:
+        Dict: Birleşik sayaçlar, aşama metrikleri, süre ve eksik shard listesi
+    """
+    latest: Dict[str, SystemLog] = {}
+    for log in sorted(logs, key=lambda l: l.timestamp):
+        details = log.details or {}
+        if 'shard' in details and 'success_count' in details:
+            latest[details['shard']] = log
+
+    shards = sorted(latest, key=lambda s: ShardSpec.parse(s).index)
+    count = expected_count or (ShardSpec.parse(shards[0]).count if shards else 0)
+    missing = [str(ShardSpec(i, count)) for i in range(count) if str(ShardSpec(i, count)) not in latest]
+
+    merged: Dict[str, Any] = {field: 0 for field in _COUNT_FIELDS}
+    for log in latest.values():
+        for field in _COUNT_FIELDS:
+            merged[field] += (log.details or {}).get(field, 0)
+
+    slowest = sorted(
+        (mp for log in latest.values() for mp in (log.details or {}).get('slowest_mps', [])),
+        key=lambda mp: mp.get('total_ms', 0),
+        reverse=True
+    )[:5]
+
+    merged.update({
+        'shard_count': count,
+        'shards': shards,
+        'missing_shards': missing,
+        # Shard'lar paralel çalıştığı için job süresi en uzun shard'ın süresidir
+        'duration_ms': max((log.duration_ms or 0 for log in latest.values()), default=0),
+        'stages': _merge_stages((log.details or {}).get('stages', {}) for log in latest.values()),
+        'slowest_mps': slowest,
+    })
+    return merged
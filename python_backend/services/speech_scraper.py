@@ -9,7 +9,6 @@ Not: Bu scraper milletvekillerinin konuşma sayısını tespit eder.
 
 import json
 import logging
-import time
 import re
 from pathlib import Path
 from typing import Dict, List, Optional
@@ -17,7 +16,11 @@ from dataclasses import dataclass
 from datetime import datetime
 from collections import defaultdict
 
-from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeout
+from playwright.sync_api import TimeoutError as PlaywrightTimeout
+
+from services.browser_pool import BrowserPool, get_browser_pool
+from services.rate_limiter import get_rate_controller
+from services.retry_policy import get_retry_policy, retry_navigate
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -39,11 +42,12 @@ class SpeechScraper:
     TUTANAK_URL = "https://www.tbmm.gov.tr/genel-kurul/tutanaklar"
     MUZAKERE_URL = "https://www.tbmm.gov.tr/genel-kurul/muzakereler"
     
-    def __init__(self, headless: bool = True):
+    def __init__(self, headless: bool = True, pool: Optional[BrowserPool] = None):
         self.headless = headless
-        self.browser = None
+        self.pool = pool
         self.page = None
-        self._playwright = None
+        self.rate_controller = get_rate_controller()
+        self.retry_policy = get_retry_policy()
     
     def __enter__(self):
         self._start_browser()
@@ -54,20 +58,16 @@ class SpeechScraper:
         return False
     
     def _start_browser(self):
-        """Tarayıcıyı başlat."""
-        logger.info("🌐 Tarayıcı başlatılıyor...")
-        self._playwright = sync_playwright().start()
-        self.browser = self._playwright.chromium.launch(headless=self.headless)
-        self.page = self.browser.new_page()
-        self.page.set_default_timeout(30000)
+        """Paylaşılan tarayıcı havuzundan izole bir sayfa al."""
+        if self.pool is None:
+            self.pool = get_browser_pool(self.headless)
+        self.page = self.pool.acquire_page(timeout=30000)
     
     def _close_browser(self):
-        """Tarayıcıyı kapat."""
-        if self.browser:
-            self.browser.close()
-        if self._playwright:
-            self._playwright.stop()
-        logger.info("🔒 Tarayıcı kapatıldı")
+        """Sayfayı havuza geri ver (tarayıcı açık kalır)."""
+        if self.page is not None:
+            self.pool.release_page(self.page)
+            self.page = None
     
     def fetch_speeches_from_muzakereler(
         self,
@@ -78,8 +78,7 @@ class SpeechScraper:
         """
         logger.info(f"📋 Müzakereler sayfasından konuşmalar çekiliyor...")
         
-        self.page.goto(self.MUZAKERE_URL, wait_until='networkidle')
-        time.sleep(3)
+        retry_navigate(self.page, self.MUZAKERE_URL, self.rate_controller, self.retry_policy, wait_until='networkidle')
         
         speeches = []
         
@@ -96,8 +95,7 @@ class SpeechScraper:
                 
                 if href:
                     full_url = href if href.startswith('http') else f"https://www.tbmm.gov.tr{href}"
-                    self.page.goto(full_url, wait_until='networkidle')
-                    time.sleep(1)
+                    retry_navigate(self.page, full_url, self.rate_controller, self.retry_policy, wait_until='networkidle')
                     
                     # Konuşmacı isimlerini bul (genellikle bold veya link olarak)
                     speakers = self.page.query_selector_all('strong, b, .speaker-name')
@@ -0,0 +1,218 @@
+"""
+Aşama Metrikleri Modülü
+Puanlama job'ı için hafif, thread-safe aşama bazlı zamanlama ölçümü.
+
+Her aşama (Google News araması, makale çekme, Gemini analizi, Firestore okuma
+ve yazma) için çağrı sayısı, hata sayısı, aktarılan bayt ve gecikme histogramı
+hem vekil bazında hem job genelinde toplanır. Job özeti son SystemLog'un
+`details` alanına, vekil bazlı döküm yerel JSON raporuna yazılır.
+
+Bayt değerleri çağrı noktasındaki yük boyutlarıdır (çekilen makale metni,
+Gemini'ye giden istem ve gelen yanıt, Firestore'a yazılan doküman).
+"""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+
+# Histogram kova üst sınırları (ms); sonuncusu taşma kovası
+LATENCY_BUCKETS_MS = (50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+
+DEFAULT_REPORT_DIR = Path(__file__).parent.parent / "reports"
+
+
+def get_report_dir() -> Path:
+    """JSON rapor dizinini döndür (SCORING_REPORT_DIR ile değiştirilebilir)."""
+    path = os.getenv('SCORING_REPORT_DIR')
+    return Path(path) if path else DEFAULT_REPORT_DIR
+
+
+def payload_size(value: Any) -> int:
+    """Bir yükün yaklaşık UTF-8 bayt boyutu."""
+    if value is None:
+        return 0
+    if isinstance(value, bytes):
+        return len(value)
+    if isinstance(value, str):
+        return len(value.encode('utf-8'))
+    return len(json.dumps(value, ensure_ascii=False, default=str).encode('utf-8'))
+
+
+@dataclass
+class _StageStats:
+    """Tek bir aşamanın birikmiş istatistikleri."""
+    calls: int = 0
+    errors: int = 0
+    bytes: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    histogram: List[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS_MS) + 1))
+
+    def add(self, duration_ms: float, error: bool, size: int):
+        self.calls += 1
+        self.errors += int(error)
+        self.bytes += size
+        self.total_ms += duration_ms
+        self.max_ms = max(self.max_ms, duration_ms)
+
+        bucket = len(LATENCY_BUCKETS_MS)
+        for i, limit in enumerate(LATENCY_BUCKETS_MS):
+            if duration_ms <= limit:
+                bucket = i
+                break
+        self.histogram[bucket] += 1
+
+    def to_dict(self, with_histogram: bool = True) -> Dict[str, Any]:
+        data = {
+            'calls': self.calls,
+            'errors': self.errors,
+            'bytes': self.bytes,
+            'total_ms': round(self.total_ms, 1),
+            'avg_ms': round(self.total_ms / self.calls, 1) if self.calls else 0.0,
+            'max_ms': round(self.max_ms, 1),
+        }
+        if with_histogram:
+            labels = [f"<={b}ms" for b in LATENCY_BUCKETS_MS] + [f">{LATENCY_BUCKETS_MS[-1]}ms"]
+            data['histogram'] = {label: n for label, n in zip(labels, self.histogram) if n}
+        return data
+
+
+class StageSpan:
+    """Ölçülen tek bir çağrı; çağıran bayt ve hata bilgisini ekleyebilir."""
+
+    def __init__(self):
+        self.bytes = 0
+        self.error = False
+
+    def add_bytes(self, value: Any):
+        """Yük boyutunu ekle."""
+        self.bytes += payload_size(value)
+
+    def fail(self):
+        """Çağrı exception fırlatmadan başarısız olduysa işaretle."""
+        self.error = True
+
+
+class StageMetrics:
+    """Job boyunca aşama bazlı metrikleri toplayan thread-safe kayıtçı."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._job: Dict[str, _StageStats] = {}
+        self._per_mp: Dict[str, Dict[str, _StageStats]] = {}
+        self._mp_names: Dict[str, str] = {}
+        self.started_at = datetime.now()
+
+    @contextmanager
+    def measure(self, stage: str, mp_id: Optional[str] = None, mp_name: Optional[str] = None):
+        """
+        Bir çağrıyı ölç.
+
+        Exception fırlatan çağrılar hata olarak sayılır ve exception yeniden fırlatılır.
+
+        Args:
+            stage: Aşama adı (örn. 'news', 'scrape', 'gemini', 'firestore_write')
+            mp_id: Çağrının ait olduğu vekil (None ise sadece job geneline yazılır)
+            mp_name: Raporda gösterilecek vekil adı
+
+        Yields:
+            StageSpan
+        """
+        span = StageSpan()
+        start = time.perf_counter()
+        try:
+            yield span
+        except Exception:
+            span.error = True
+            raise
+        finally:
+            self.record(stage, (time.perf_counter() - start) * 1000, span.error, span.bytes, mp_id, mp_name)
+
+    def record(
+        self,
+        stage: str,
+        duration_ms: float,
+        error: bool = False,
+        size: int = 0,
+        mp_id: Optional[str] = None,
+        mp_name: Optional[str] = None
+    ):
+        """Tek bir ölçümü kaydet."""
+        with self._lock:
+            self._job.setdefault(stage, _StageStats()).add(duration_ms, error, size)
+            if mp_id is not None:
+                self._per_mp.setdefault(mp_id, {}).setdefault(stage, _StageStats()).add(duration_ms, error, size)
+                if mp_name:
+                    self._mp_names[mp_id] = mp_name
+
+    def summary(self, slowest: int = 5) -> Dict[str, Any]:
+        """
+        Job geneli özet (SystemLog details için).
+
+        Args:
+            slowest: Toplam süresi en yüksek kaç vekilin ekleneceği
+
+        Returns:
+            Dict: {'stages': {...}, 'slowest_mps': [...]}
+        """
+        with self._lock:
+            stages = {name: stats.to_dict() for name, stats in self._job.items()}
+            totals = sorted(
+                (
+                    (sum(s.total_ms for s in mp_stages.values()), mp_id)
+                    for mp_id, mp_stages in self._per_mp.items()
+                ),
+                reverse=True
+            )[:slowest]
+            slowest_mps = [
+                {'mp_id': mp_id, 'name': self._mp_names.get(mp_id), 'total_ms': round(total, 1)}
+                for total, mp_id in totals
+            ]
+        return {'stages': stages, 'slowest_mps': slowest_mps}
+
+    def per_mp(self) -> Dict[str, Dict[str, Any]]:
+        """Vekil bazlı aşama dökümü (histogramsız)."""
+        with self._lock:
+            return {
+                mp_id: {
+                    'name': self._mp_names.get(mp_id),
+                    'stages': {name: stats.to_dict(with_histogram=False) for name, stats in stages.items()},
+                }
+                for mp_id, stages in self._per_mp.items()
+            }
+
+    def write_report(self, job_id: str, extra: Optional[Dict[str, Any]] = None,
+                     report_dir: Optional[Path] = None) -> Path:
+        """
+        Job ve vekil bazlı metrikleri yerel JSON dosyasına yaz.
+
+        Args:
+            job_id: Job kimliği (dosya adında kullanılır)
+            extra: Rapora eklenecek ek alanlar (süre, başarı sayısı vb.)
+            report_dir: Rapor dizini (None ise varsayılan)
+
+        Returns:
+            Path: Yazılan dosyanın yolu
+        """
+        report_dir = Path(report_dir) if report_dir else get_report_dir()
+        report_dir.mkdir(parents=True, exist_ok=True)
+        path = report_dir / f"scoring_job_{job_id}.json"
+
+        report = {
+            'job_id': job_id,
+            'started_at': self.started_at.isoformat(),
+            'finished_at': datetime.now().isoformat(),
+            **(extra or {}),
+            **self.summary(),
+            'mps': self.per_mp(),
+        }
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        return path
@@ -0,0 +1,320 @@
+"""
+TBMM Sonuç Sayfası HTTP İstemcisi
+Kanun teklifi, yazılı soru ve araştırma önergesi sonuç tablolarının sayfalarını
+tarayıcı olmadan, doğrudan sayfalama endpoint'inden çeker.
+
+Sorgu formu bir kez Playwright ile gönderilir; bu sırada sonuç tablosunun
+sayfa isteği (örn. `Kanun-Teklifleri-Sonuc-Sayfa`) yakalanır ve oturum çerezleri
+kopyalanır. Sonraki sayfalar aynı isteğin sayfa parametresi değiştirilerek
+havuzlu bir `requests.Session` üzerinden paralel çekilir ve lxml ile ayrıştırılır.
+Yanıt HTML tablo parçası veya DataTables JSON'u olabilir.
+
+Sayfa isteği yakalanamazsa (tablo istemci tarafında sayfalanıyorsa) scraper'lar
+DOM sayfalamasına geri döner.
+"""
+
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit, urlunsplit
+
+import lxml.html
+import requests
+from requests.adapters import HTTPAdapter
+
+from config.scraper_config import ScraperConfig, default_config
+from services.rate_limiter import get_rate_controller, is_throttled
+from services.retry_policy import RetryPolicy
+
+logger = logging.getLogger(__name__)
+
+
+# Sayfa numarası taşıyan parametre adları (küçük harfle); DataTables 'start' ofset kullanır
+PAGE_NUMBER_PARAMS = ('page', 'sayfa', 'pagenumber', 'pageindex', 'pageno', 'p')
+OFFSET_PARAM = 'start'
+PAGE_SIZE_PARAM = 'length'
+
+# inner_text() gibi satır sonu üreten elemanlar
+_LINE_BREAK_TAGS = ('br', 'p', 'div', 'li', 'tr')
+
+TableRows = List[List[str]]
+
+
+# ============================================================================
+# AYRIŞTIRMA
+# ============================================================================
+
+def element_text(element) -> str:
+    """
+    Elemanın görünen metni (Playwright inner_text() ile aynı satır yapısında).
+
+    Satırlar boşlukları sadeleştirilerek '\\n' ile birleştirilir, boş satırlar atılır.
+    """
+    for child in element.iter(*_LINE_BREAK_TAGS):
+        if child.tag != 'br':
+            child.text = '\n' + (child.text or '')
+        child.tail = '\n' + (child.tail or '')
+    lines = (' '.join(line.split()) for line in element.text_content().split('\n'))
+    return '\n'.join(line for line in lines if line)
+
+
+def _cell_text(value) -> str:
+    if value is None:
+        return ""
+    value = str(value)
+    if '<' not in value:
+        return ' '.join(value.split())
+    return element_text(lxml.html.fragment_fromstring(value, create_parent='div'))
+
+
+def parse_table_rows(content: str) -> TableRows:
+    """
+    Sonuç sayfası yanıtındaki tablo satırlarını hücre metinlerine çevir.
+
+    Args:
+        content: HTML tablo parçası veya DataTables JSON'u ({"data": [...]})
+
+    Returns:
+        TableRows: Satır başına hücre metinleri (sayfa boşsa boş liste)
+    """
+    text = content.strip()
+    if not text:
+        return []
+
+    if text[0] in '[{':
+        payload = json.loads(text)
+        rows = payload.get('data', []) if isinstance(payload, dict) else payload
+        return [
+            [_cell_text(cell) for cell in (row.values() if isinstance(row, dict) else row)]
+            for row in rows
+        ]
+
+    document = lxml.html.fromstring(text)
+    rows = document.xpath('//table//tbody/tr') or document.xpath('//tr[td]')
+    return [[element_text(cell) for cell in row.xpath('./td')] for row in rows if row.xpath('./td')]
+
+
+# ============================================================================
+# SAYFA İSTEĞİ ŞABLONU
+# ============================================================================
+
+@dataclass
+class PagedRequest:
+    """Tarayıcıdan yakalanan sayfa isteği; sayfa parametresi değiştirilerek tekrarlanır."""
+
+    url: str                                    # Sorgu dizesi hariç URL
+    method: str = 'GET'
+    params: Dict[str, str] = field(default_factory=dict)  # Sorgu dizesi veya form alanları
+    page_param: str = 'page'
+    page_size: int = 1                          # Ofset parametresinde sayfa başına kayıt
+    first_page: int = 1                         # İlk sayfanın parametre değeri (ofset için 0)
+    headers: Dict[str, str] = field(default_factory=dict)
+
+    @classmethod
+    def from_request(cls, url: str, method: str, post_data: Optional[str],
+                     headers: Optional[Dict[str, str]] = None) -> Optional["PagedRequest"]:
+        """
+        Yakalanan isteği şablona çevir.
+
+        Returns:
+            Optional[PagedRequest]: Sayfa parametresi bulunamazsa None
+        """
+        parts = urlsplit(url)
+        params = dict(parse_qsl(parts.query, keep_blank_values=True))
+        if method.upper() == 'POST' and post_data:
+            params.update(parse_qsl(post_data, keep_blank_values=True))
+
+        base_url = urlunsplit((parts.scheme, parts.netloc, parts.path, '', ''))
+        headers = {key: value for key, value in (headers or {}).items()
+                   if key.lower() in ('x-requested-with', 'requestverificationtoken', 'accept', 'referer')}
+        lowered = {key.lower(): key for key in params}
+
+        if OFFSET_PARAM in lowered:
+            page_size = int(params.get(lowered.get(PAGE_SIZE_PARAM, ''), 0) or 0)
+            if page_size > 0:
+                return cls(base_url, method.upper(), params, lowered[OFFSET_PARAM],
+                           page_size=page_size, first_page=0, headers=headers)
+
+        for name in PAGE_NUMBER_PARAMS:
+            if name in lowered:
+                key = lowered[name]
+                try:
+                    current = int(params[key])
+                except ValueError:
+                    continue
+                return cls(base_url, method.upper(), params, key, first_page=min(current, 1), headers=headers)
+        return None
+
+    def params_for(self, page_index: int) -> Dict[str, str]:
+        """0 tabanlı sayfa sırası için istek parametreleri."""
+        params = dict(self.params)
+        params[self.page_param] = str(self.first_page + page_index * self.page_size)
+        if 'draw' in params:
+            params['draw'] = str(page_index + 1)
+        return params
+
+
+def capture_paged_request(
+    page,
+    submit: Callable[[], Any],
+    url_prefix: Optional[str] = None
+) -> Tuple[Any, Optional[PagedRequest]]:
+    """
+    Sorgu gönderilirken sonuç tablosunun sayfa isteğini yakala.
+
+    Args:
+        page: Playwright sayfası
+        submit: Sorguyu gönderen fonksiyon (form seçimi ve SORGULA tıklaması)
+        url_prefix: Verilirse sadece bu URL ile başlayan istekler dikkate alınır
+
+    Returns:
+        (submit'in dönüş değeri, sayfalanabilir ilk istek veya None)
+    """
+    captured = []
+
+    def on_request(request):
+        if request.resource_type not in ('xhr', 'fetch', 'document'):
+            return
+        if url_prefix and not request.url.startswith(url_prefix):
+            return
+        captured.append(request)
+
+    page.on('request', on_request)
+    try:
+        result = submit()
+    finally:
+        page.remove_listener('request', on_request)
+
+    for request in captured:
+        template = PagedRequest.from_request(request.url, request.method, request.post_data, request.headers)
+        if template is not None:
+            logger.info(f"  🔌 Sayfa isteği yakalandı: {template.method} {template.url} ({template.page_param})")
+            return result, template
+
+    logger.info("  ℹ️ Sayfa isteği yakalanamadı, DOM sayfalaması kullanılacak")
+    return result, None
+
+
+# ============================================================================
+# İSTEMCİ
+# ============================================================================
+
+class TBMMHttpClient:
+    """Tarayıcı oturumunu paylaşan, bağlantı havuzlu sonuç sayfası istemcisi."""
+
+    def __init__(self, cookies: Optional[List[dict]] = None, user_agent: Optional[str] = None,
+                 config: Optional[ScraperConfig] = None):
+        """
+        Args:
+            cookies: Playwright context.cookies() çıktısı
+            user_agent: Tarayıcının User-Agent değeri
+            config: Scraper konfigürasyonu (http_workers, default_timeout, retry ayarları)
+        """
+        self.config = config or default_config
+        self.rate_controller = get_rate_controller()
+        self.retry_policy = RetryPolicy.from_config(self.config)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max(1, self.config.http_workers))
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        if user_agent:
+            self.session.headers['User-Agent'] = user_agent
+        for cookie in cookies or []:
+            self.session.cookies.set(cookie['name'], cookie['value'],
+                                     domain=cookie.get('domain'), path=cookie.get('path', '/'))
+
+    @classmethod
+    def from_page(cls, page, config: Optional[ScraperConfig] = None) -> "TBMMHttpClient":
+        """Playwright sayfasının çerezleri ve User-Agent'ı ile istemci oluştur."""
+        return cls(page.context.cookies(), page.evaluate('navigator.userAgent'), config)
+
+    def close(self):
+        self.session.close()
+
+    def fetch_page(self, request: PagedRequest, page_index: int) -> TableRows:
+        """Tek bir sonuç sayfasını çek ve satırlarını döndür (0 tabanlı sayfa sırası)."""
+        params = request.params_for(page_index)
+        timeout = self.config.default_timeout / 1000
+        self.rate_controller.wait(request.url)
+        try:
+            if request.method == 'POST':
+                response = self.session.post(request.url, data=params, headers=request.headers, timeout=timeout)
+            else:
+                response = self.session.get(request.url, params=params, headers=request.headers, timeout=timeout)
+        except requests.RequestException:
+            self.rate_controller.record(request.url, timeout, ok=False)
+            raise
+        self.rate_controller.record(request.url, response.elapsed.total_seconds(),
+                                    ok=not is_throttled(response.status_code))
+        response.raise_for_status()
+        return parse_table_rows(response.text)
+
+    def fetch_pages(
+        self,
+        request: PagedRequest,
+        max_pages: int,
+        stop: Optional[Callable[[TableRows], bool]] = None,
+        start_page: int = 0
+    ) -> List[TableRows]:
+        """
+        Sayfaları http_workers'lık dalgalar halinde paralel çek.
+
+        Sayfalar sırayla değerlendirilir; boş sayfada veya `stop` True döndürdüğü
+        sayfada (o sayfa dahil) durulur, aynı dalgadaki sonraki sayfalar atılır.
+        Her sayfa isteği geçici hatalarda yeniden denenir.
+
+        Args:
+            request: Sayfa isteği şablonu
+            max_pages: En fazla çekilecek sayfa
+            stop: Sayfa satırlarını alıp sayfalamanın bitip bitmediğini söyleyen fonksiyon
+            start_page: Başlangıç sayfa sırası (0 tabanlı)
+
+        Returns:
+            List[TableRows]: Sayfa sırasıyla satırlar
+        """
+        workers = max(1, self.config.http_workers)
+        pages: List[TableRows] = []
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='tbmm-http') as executor:
+            page_index = start_page
+            while page_index < start_page + max_pages:
+                wave = range(page_index, min(page_index + workers, start_page + max_pages))
+                fetch = lambda i: self.retry_policy.call(request.url, self.fetch_page, request, i)
+                for rows in executor.map(fetch, wave):
+                    if not rows:
+                        return pages
+                    if pages and rows == pages[-1]:
+                        logger.warning("  ⚠️ Sunucu sayfa parametresini yok sayıyor, sayfalama durduruldu")
+                        return pages
+                    pages.append(rows)
+                    logger.info(f"  📄 Sayfa {start_page + len(pages)}: {len(rows)} satır (HTTP)")
+                    if stop is not None and stop(rows):
+                        return pages
+                page_index = wave.stop
+        return pages
+
+
+def fetch_rows_over_http(
+    page,
+    request: PagedRequest,
+    max_pages: int,
+    stop: Optional[Callable[[TableRows], bool]] = None,
+    config: Optional[ScraperConfig] = None
+) -> Optional[List[TableRows]]:
+    """
+    Tarayıcı oturumuyla sonuç sayfalarını HTTP üzerinden çek.
+
+    Returns:
+        Optional[List[TableRows]]: Sayfa sırasıyla satırlar; istek başarısızsa None
+            (çağıran DOM sayfalamasına döner)
+    """
+    client = TBMMHttpClient.from_page(page, config)
+    try:
+        return client.fetch_pages(request, max_pages, stop)
+    except (requests.RequestException, ValueError) as e:
+        logger.warning(f"  ⚠️ HTTP sayfalama başarısız, DOM sayfalamasına dönülüyor: {str(e)}")
+        return None
+    finally:
+        client.close()
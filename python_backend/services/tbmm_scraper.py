@@ -11,19 +11,119 @@ Tüm milletvekillerini ve yasama faaliyetlerini çeker.
 
 import re
 import hashlib
-import time
 import logging
+from collections import deque
 from typing import List, Dict, Optional, Any
 from dataclasses import dataclass, field
 from datetime import datetime
-from playwright.sync_api import sync_playwright, Page, Browser, TimeoutError as PlaywrightTimeout
+from playwright.sync_api import Page, TimeoutError as PlaywrightTimeout
 
 # Config import
 from config.scraper_config import ScraperConfig, default_config
+from services.browser_pool import BrowserPool, get_browser_pool, run_async_pages
+from services.rate_limiter import get_rate_controller, scroll_and_wait_for_growth
+from services.retry_policy import RetryPolicy, retry_navigate, retry_navigate_async
 
 # Logger setup
 logger = logging.getLogger(__name__)
 
+# Detay sayfasındaki tüm bilgileri tek seferde okuyan script (senkron ve async okuma ortak)
+_MP_DETAILS_JS = '''() => {
+    const result = {
+        party: null,
+        city: null,
+        profile_image: null,
+        law_proposals: 0
+    };
+    
+    // Profil resmi
+    const img = document.querySelector('img.mv-foto, img[src*="milletvekili"], .profile-photo img, .mv-detay img');
+    if (img) {
+        result.profile_image = img.src;
+    }
+    
+    // Parti ve Şehir bilgisi - genellikle tablo veya liste yapısında
+    const allText = document.body.innerText;
+    
+    // Parti arama
+    const partyPatterns = [
+        /Parti\\s*:\\s*([^\\n]+)/i,
+        /Siyasi Parti\\s*:\\s*([^\\n]+)/i,
+        /(AK Parti|CHP|MHP|İYİ Parti|DEM Parti|HDP|DEVA Partisi|Gelecek Partisi|Saadet Partisi|TİP|Zafer Partisi|Bağımsız)/i
+    ];
+    
+    for (const pattern of partyPatterns) {
+        const match = allText.match(pattern);
+        if (match) {
+            result.party = match[1].trim();
+            break;
+        }
+    }
+    
+    // Şehir (seçim çevresi) arama
+    const cityPatterns = [
+        /Seçim Çevresi\\s*:\\s*([^\\n]+)/i,
+        /İl\\s*:\\s*([A-ZÇĞİÖŞÜa-zçğıöşü]+)/i
+    ];
+    
+    for (const pattern of cityPatterns) {
+        const match = allText.match(pattern);
+        if (match) {
+            result.city = match[1].trim();
+            break;
+        }
+    }
+    
+    // Tablolardan bilgi çek
+    const tables = document.querySelectorAll('table');
+    tables.forEach(table => {
+        const rows = table.querySelectorAll('tr');
+        rows.forEach(row => {
+            const cells = row.querySelectorAll('td, th');
+            if (cells.length >= 2) {
+                const label = cells[0].innerText.trim().toLowerCase();
+                const value = cells[1].innerText.trim();
+                
+                if (label.includes('parti') || label.includes('siyasi')) {
+                    result.party = value;
+                }
+                if (label.includes('seçim çevresi') || label.includes('il')) {
+                    result.city = value;
+                }
+            }
+        });
+    });
+    
+    // Definition list'ten bilgi çek
+    const dts = document.querySelectorAll('dt');
+    dts.forEach(dt => {
+        const dd = dt.nextElementSibling;
+        if (dd && dd.tagName === 'DD') {
+            const label = dt.innerText.trim().toLowerCase();
+            const value = dd.innerText.trim();
+            
+            if (label.includes('parti')) {
+                result.party = value;
+            }
+            if (label.includes('seçim çevresi') || label.includes('il')) {
+                result.city = value;
+            }
+        }
+    });
+    
+    // Kanun teklifleri sayısını bul
+    const lawLink = document.querySelector('a[href*="kanun"], a[href*="teklif"]');
+    if (lawLink) {
+        const lawText = lawLink.innerText;
+        const numMatch = lawText.match(/\\d+/);
+        if (numMatch) {
+            result.law_proposals = parseInt(numMatch[0]);
+        }
+    }
+    
+    return result;
+}'''
+
 
 @dataclass
 class LegislativeActivity:
@@ -84,12 +184,15 @@ class TBMMPlaywrightScraper:
         'bağımsız': 'BAĞIMSIZ',
     }
     
-    def __init__(self, config: Optional[ScraperConfig] = None):
+    def __init__(self, config: Optional[ScraperConfig] = None, pool: Optional[BrowserPool] = None):
         self.config = config or default_config
         self.headless = self.config.headless
-        self.browser: Optional[Browser] = None
+        self.pool = pool
         self.page: Optional[Page] = None
-        self._playwright = None  # Store playwright reference for proper cleanup
+        # Tüm scraper ve worker'ların paylaştığı host bazlı uyarlanabilir hız sınırı
+        self.rate_controller = get_rate_controller()
+        # Geçici hatalarda config.max_retries kadar yeniden deneme (devre kesici paylaşılır)
+        self.retry_policy = RetryPolicy.from_config(self.config)
     
     def __enter__(self):
         """Context manager entry - start browser."""
@@ -107,22 +210,16 @@ class TBMMPlaywrightScraper:
         return self.PARTY_MAP.get(party_lower, party_raw.strip().upper())
     
     def _start_browser(self):
-        """Tarayıcıyı başlat."""
-        logger.info("🌐 Tarayıcı başlatılıyor...")
-        self._playwright = sync_playwright().start()
-        self.browser = self._playwright.chromium.launch(headless=self.headless)
-        self.page = self.browser.new_page()
-        self.page.set_default_timeout(self.config.default_timeout)
+        """Paylaşılan tarayıcı havuzundan izole bir sayfa al."""
+        if self.pool is None:
+            self.pool = get_browser_pool(self.headless)
+        self.page = self.pool.acquire_page(timeout=self.config.default_timeout)
     
     def _close_browser(self):
-        """Tarayıcıyı kapat ve kaynakları temizle."""
-        if self.browser:
-            self.browser.close()
-            self.browser = None
-        if self._playwright:
-            self._playwright.stop()
-            self._playwright = None
-        logger.info("🔒 Tarayıcı kapatıldı")
+        """Sayfayı havuza geri ver (tarayıcı açık kalır)."""
+        if self.page is not None:
+            self.pool.release_page(self.page)
+            self.page = None
     
     def fetch_all_mps(self) -> List[TBMMMember]:
         """
@@ -137,14 +234,13 @@ class TBMMPlaywrightScraper:
             self._start_browser()
             
             logger.info("📡 TBMM sitesine bağlanılıyor: %s", self.config.mp_list_url)
-            self.page.goto(self.MP_LIST_URL, wait_until='networkidle')
+            retry_navigate(self.page, self.MP_LIST_URL, self.rate_controller, self.retry_policy, wait_until='networkidle')
             
             # "TÜM LİSTE" butonuna tıkla
             try:
                 logger.debug("🔘 'Tüm Liste' butonuna tıklanıyor...")
-                self.page.click('text=TÜM LİSTE', timeout=5000)
+                self.page.click('text=TÜM LİSTE', timeout=self.config.button_click_timeout)
                 self.page.wait_for_load_state('networkidle')
-                time.sleep(2)
             except PlaywrightTimeout:
                 logger.warning("⚠️ 'Tüm Liste' butonu bulunamadı, devam ediliyor...")
             
@@ -168,14 +264,10 @@ class TBMMPlaywrightScraper:
     
     def _scroll_to_bottom(self):
         """Sayfanın sonuna kadar scroll et."""
-        previous_height = 0
-        for _ in range(10):  # Max 10 scroll
-            self.page.evaluate('window.scrollTo(0, document.body.scrollHeight)')
-            time.sleep(0.5)
-            current_height = self.page.evaluate('document.body.scrollHeight')
-            if current_height == previous_height:
+        for _ in range(self.config.max_scroll_attempts):
+            # Yeni içerik gelene kadar (en fazla scroll_wait) bekle; gelmezse sayfa bitti
+            if not scroll_and_wait_for_growth(self.page, int(self.config.scroll_wait * 1000)):
                 break
-            previous_height = current_height
     
     def _parse_mp_list(self) -> List[TBMMMember]:
         """Sayfa içeriğinden milletvekillerini parse et."""
@@ -334,124 +426,47 @@ class TBMMPlaywrightScraper:
             return mp
         
         try:
-            self.page.goto(mp.detail_url, wait_until='networkidle', timeout=20000)
-            time.sleep(0.5)
-            
-            # JavaScript ile tüm bilgileri çek
-            details = self.page.evaluate('''() => {
-                const result = {
-                    party: null,
-                    city: null,
-                    profile_image: null,
-                    law_proposals: 0
-                };
-                
-                // Profil resmi
-                const img = document.querySelector('img.mv-foto, img[src*="milletvekili"], .profile-photo img, .mv-detay img');
-                if (img) {
-                    result.profile_image = img.src;
-                }
-                
-                // Parti ve Şehir bilgisi - genellikle tablo veya liste yapısında
-                const allText = document.body.innerText;
-                
-                // Parti arama
-                const partyPatterns = [
-                    /Parti\\s*:\\s*([^\\n]+)/i,
-                    /Siyasi Parti\\s*:\\s*([^\\n]+)/i,
-                    /(AK Parti|CHP|MHP|İYİ Parti|DEM Parti|HDP|DEVA Partisi|Gelecek Partisi|Saadet Partisi|TİP|Zafer Partisi|Bağımsız)/i
-                ];
-                
-                for (const pattern of partyPatterns) {
-                    const match = allText.match(pattern);
-                    if (match) {
-                        result.party = match[1].trim();
-                        break;
-                    }
-                }
-                
-                // Şehir (seçim çevresi) arama
-                const cityPatterns = [
-                    /Seçim Çevresi\\s*:\\s*([^\\n]+)/i,
-                    /İl\\s*:\\s*([A-ZÇĞİÖŞÜa-zçğıöşü]+)/i
-                ];
-                
-                for (const pattern of cityPatterns) {
-                    const match = allText.match(pattern);
-                    if (match) {
-                        result.city = match[1].trim();
-                        break;
-                    }
-                }
-                
-                // Tablolardan bilgi çek
-                const tables = document.querySelectorAll('table');
-                tables.forEach(table => {
-                    const rows = table.querySelectorAll('tr');
-                    rows.forEach(row => {
-                        const cells = row.querySelectorAll('td, th');
-                        if (cells.length >= 2) {
-                            const label = cells[0].innerText.trim().toLowerCase();
-                            const value = cells[1].innerText.trim();
-                            
-                            if (label.includes('parti') || label.includes('siyasi')) {
-                                result.party = value;
-                            }
-                            if (label.includes('seçim çevresi') || label.includes('il')) {
-                                result.city = value;
-                            }
-                        }
-                    });
-                });
-                
-                // Definition list'ten bilgi çek
-                const dts = document.querySelectorAll('dt');
-                dts.forEach(dt => {
-                    const dd = dt.nextElementSibling;
-                    if (dd && dd.tagName === 'DD') {
-                        const label = dt.innerText.trim().toLowerCase();
-                        const value = dd.innerText.trim();
-                        
-                        if (label.includes('parti')) {
-                            result.party = value;
-                        }
-                        if (label.includes('seçim çevresi') || label.includes('il')) {
-                            result.city = value;
-                        }
-                    }
-                });
-                
-                // Kanun teklifleri sayısını bul
-                const lawLink = document.querySelector('a[href*="kanun"], a[href*="teklif"]');
-                if (lawLink) {
-                    const lawText = lawLink.innerText;
-                    const numMatch = lawText.match(/\\d+/);
-                    if (numMatch) {
-                        result.law_proposals = parseInt(numMatch[0]);
-                    }
-                }
-                
-                return result;
-            }''')
-            
-            # Bilgileri güncelle
-            if details.get('party'):
-                mp.party = self._normalize_party(details['party'])
-            
-            if details.get('city'):
-                mp.city = details['city'].title()
-            
-            if details.get('profile_image'):
-                mp.profile_image_url = details['profile_image']
-            
-            if details.get('law_proposals'):
-                mp.law_proposals = details['law_proposals']
-            
+            self._apply_details(mp, self._read_mp_details(self.page, mp.detail_url))
         except Exception as e:
             logger.warning("    ⚠️ Detay çekilemedi (%s): %s", mp.name, str(e)[:50])
         
         return mp
     
+    def _read_mp_details(self, page: Page, detail_url: str) -> Dict[str, Any]:
+        """
+        Detay sayfasını aç ve bilgileri tek evaluate ile oku.
+        
+        Nezaket beklemesi host başına paylaşılan hız sınırlayıcıyla yapılır;
+        geçici hatalarda sayfa retry_policy ile yeniden açılır.
+        
+        Returns:
+            Dict: party, city, profile_image, law_proposals
+        """
+        retry_navigate(page, detail_url, self.rate_controller, self.retry_policy, wait_until='networkidle',
+                       timeout=self.config.navigation_timeout)
+        
+        return page.evaluate(_MP_DETAILS_JS)
+    
+    async def _read_mp_details_async(self, page, detail_url: str) -> Dict[str, Any]:
+        """_read_mp_details'in async API karşılığı (paralel detay sayfaları için)."""
+        await retry_navigate_async(page, detail_url, self.rate_controller, self.retry_policy,
+                                   wait_until='networkidle', timeout=self.config.navigation_timeout)
+        return await page.evaluate(_MP_DETAILS_JS)
+    
+    def _apply_details(self, mp: TBMMMember, details: Dict[str, Any]):
+        """Detay sayfasından okunan bilgileri vekile işle."""
+        if details.get('party'):
+            mp.party = self._normalize_party(details['party'])
+        
+        if details.get('city'):
+            mp.city = details['city'].title()
+        
+        if details.get('profile_image'):
+            mp.profile_image_url = details['profile_image']
+        
+        if details.get('law_proposals'):
+            mp.law_proposals = details['law_proposals']
+    
     def _fetch_legislative_activities(self, mp: TBMMMember):
         """Milletvekilinin yasama faaliyetlerini çek."""
         try:
@@ -461,8 +476,8 @@ class TBMMPlaywrightScraper:
                 href = proposal_link.get_attribute('href')
                 if href:
                     # Kanun teklifleri sayfasına git
-                    self.page.goto(href if href.startswith('http') else f"{self.BASE_URL}{href}")
-                    time.sleep(1)
+                    retry_navigate(self.page, href if href.startswith('http') else f"{self.BASE_URL}{href}",
+                                   self.rate_controller, self.retry_policy, wait_until='networkidle')
                     
                     # Teklif sayısını bul
                     proposals = self.page.query_selector_all('tr.teklif, .kanun-teklif-item, table tbody tr')
@@ -483,43 +498,90 @@ class TBMMPlaywrightScraper:
         except Exception as e:
             logger.warning("    ⚠️ Yasama faaliyetleri çekilemedi: %s", str(e))
     
-    def fetch_all_with_details(self, max_details: int = 50) -> List[TBMMMember]:
+    def fetch_all_with_details(self, max_details: int = 50, workers: Optional[int] = None) -> List[TBMMMember]:
         """
         Tüm vekilleri çek ve detaylarını al.
         
         Args:
             max_details: En fazla kaç vekilin detayını çekecek (performans için)
+            workers: Paralel detay worker sayısı (varsayılan config.detail_workers, 1 = seri)
         """
+        workers = max(1, self.config.detail_workers if workers is None else workers)
+        started = self.page is None
         try:
-            self._start_browser()
+            if started:
+                self._start_browser()
             
             # Ana listeyi çek
             logger.info("📡 TBMM sitesine bağlanılıyor: %s", self.config.mp_list_url)
-            self.page.goto(self.MP_LIST_URL, wait_until='networkidle')
+            retry_navigate(self.page, self.MP_LIST_URL, self.rate_controller, self.retry_policy, wait_until='networkidle')
             
             try:
-                self.page.click('text=TÜM LİSTE', timeout=5000)
+                self.page.click('text=TÜM LİSTE', timeout=self.config.button_click_timeout)
                 self.page.wait_for_load_state('networkidle')
-                time.sleep(2)
             except PlaywrightTimeout:
                 logger.warning("⚠️ 'Tüm Liste' butonu bulunamadı, devam ediliyor...")
             
             self._scroll_to_bottom()
             members = self._parse_mp_list()
             
-            logger.info("📊 %d milletvekili bulundu. Detaylar çekiliyor...", len(members))
+            logger.info("📊 %d milletvekili bulundu. Detaylar çekiliyor (%d worker)...", len(members), workers)
             
             # Detayları çek (limit ile)
-            for i, member in enumerate(members[:max_details]):
-                logger.debug("  [%d/%d] %s", i+1, min(len(members), max_details), member.name)
-                self.fetch_mp_details(member, fetch_activities=True)
-                time.sleep(0.5)  # Rate limiting
+            targets = members[:max_details]
+            if workers > 1:
+                self._fetch_details_parallel(targets, workers)
+            else:
+                for i, member in enumerate(targets):
+                    logger.debug("  [%d/%d] %s", i+1, len(targets), member.name)
+                    self.fetch_mp_details(member, fetch_activities=True)
             
             return members
             
         finally:
-            self._close_browser()
-
+            if started:
+                self._close_browser()
+    
+    def _fetch_details_parallel(self, members: List[TBMMMember], workers: int):
+        """
+        Detay sayfalarını tek tarayıcıdaki paralel sayfalarla çek.
+        
+        Sayfalar run_async_pages ile ayrı bir thread'de async Playwright üzerinden
+        açılır; sayfa sayısı config.browser_max_pages ile sınırlıdır. Her sayfa
+        kuyruk boşalana kadar sıradaki vekili okur. İstekler host başına
+        paylaşılan hız sınırlayıcıdan geçer. Sonuçlar liste sırasıyla vekillere işlenir.
+        """
+        jobs = deque((index, member.detail_url) for index, member in enumerate(members)
+                     if member.detail_url)
+        if not jobs:
+            return
+        
+        results: Dict[int, Dict[str, Any]] = {}
+        errors: Dict[int, str] = {}
+        
+        async def worker(page):
+            # Tek event loop: kuyruk kilitsiz paylaşılır
+            while jobs:
+                index, url = jobs.popleft()
+                try:
+                    results[index] = await self._read_mp_details_async(page, url)
+                except Exception as e:
+                    errors[index] = str(e)
+        
+        try:
+            run_async_pages(worker, min(workers, len(jobs)), self.config, headless=self.headless,
+                            timeout=self.config.default_timeout)
+        except Exception as e:
+            logger.error("    ❌ Detay sayfaları açılamadı: %s", str(e))
+        
+        # Deterministik birleştirme: liste sırasıyla
+        for index, member in enumerate(members):
+            if index in results:
+                self._apply_details(member, results[index])
+            elif index in errors:
+                logger.warning("    ⚠️ Detay çekilemedi (%s): %s", member.name, errors[index][:50])
+        
+        logger.info("  ✅ %d/%d detay çekildi", len(results), len(members))
 
 def save_mps_to_firestore(members: List[TBMMMember]) -> int:
     """Milletvekillerini Firestore'a kaydet."""
@@ -576,6 +638,8 @@ if __name__ == "__main__":
     parser.add_argument('--save', action='store_true', help='Firestore\'a kaydet')
     parser.add_argument('--details', action='store_true', help='Detaylı bilgi çek')
     parser.add_argument('--max', type=int, default=600, help='Maksimum vekil sayısı')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Paralel detay worker sayısı (varsayılan SCRAPER_DETAIL_WORKERS)')
     parser.add_argument('--headless', action='store_true', default=True, help='Headless mod')
     parser.add_argument('--verbose', '-v', action='store_true', help='Debug log seviyesi')
     args = parser.parse_args()
@@ -584,12 +648,13 @@ if __name__ == "__main__":
         logging.getLogger().setLevel(logging.DEBUG)
     
     # Use config with CLI arguments
-    config = ScraperConfig(headless=args.headless)
+    config = ScraperConfig.from_env()
+    config.headless = args.headless
     
     # Use context manager for proper resource cleanup
     with TBMMPlaywrightScraper(config=config) as scraper:
         if args.details:
-            members = scraper.fetch_all_with_details(max_details=args.max)
+            members = scraper.fetch_all_with_details(max_details=args.max, workers=args.workers)
         else:
             members = scraper.fetch_all_mps()
     
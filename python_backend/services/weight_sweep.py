@@ -0,0 +1,262 @@
+"""
+Ağırlık Taraması (What-If) Modülü
+Aday ağırlık vektörlerinin sıralamaya etkisini toplu olarak ölçer.
+
+Binlerce aday ağırlık seti, vekil aktivite matrisiyle tek bir toplu matris
+çarpımında puanlanır. Her aday için mevcut politikaya göre Spearman sıra
+korelasyonu, ilk 20 listesindeki değişim (churn) ve parti ortalamaları raporlanır.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from services.scoring_kernel import ACTIVITY_COLUMNS, ActivityTable, ScoringPolicy
+
+
+DEFAULT_TOP_K = 20
+
+
+def perturb_weights(
+    policy: ScoringPolicy,
+    samples: int,
+    scale: float = 0.5,
+    columns: Optional[Sequence[str]] = None,
+    seed: Optional[int] = None
+) -> np.ndarray:
+    """
+    Politikanın ağırlıklarını rastgele ölçekleyerek aday setleri üret.
+
+    Args:
+        policy: Temel politika
+        samples: Aday sayısı
+        scale: Her ağırlık [1 - scale, 1 + scale] aralığında bir katsayıyla çarpılır
+        columns: Değiştirilecek sütunlar (None ise tümü)
+        seed: Rastgele tohum
+
+    Returns:
+        np.ndarray: (aday × grup × sütun) ağırlık tensörü
+    """
+    rng = np.random.default_rng(seed)
+    factors = rng.uniform(1 - scale, 1 + scale, size=(samples,) + policy.weights.shape)
+
+    if columns is not None:
+        fixed = [i for i, c in enumerate(ACTIVITY_COLUMNS) if c not in columns]
+        factors[:, :, fixed] = 1.0
+
+    return policy.weights[None, :, :] * factors
+
+
+def candidates_from_overrides(policy: ScoringPolicy, overrides: List[Dict[str, float]]) -> np.ndarray:
+    """
+    Sütun -> ağırlık sözlüklerinden aday setleri oluştur.
+
+    Verilen sütunlar tüm rol gruplarında aynı değeri alır, diğerleri politikadan gelir.
+
+    Returns:
+        np.ndarray: (aday × grup × sütun) ağırlık tensörü
+    """
+    candidates = np.repeat(policy.weights[None, :, :], len(overrides), axis=0)
+    for i, override in enumerate(overrides):
+        for column, value in override.items():
+            candidates[i, :, ACTIVITY_COLUMNS.index(column)] = value
+    return candidates
+
+
+def rank_columns(scores: np.ndarray) -> np.ndarray:
+    """
+    Her sütunu ayrı ayrı sırala (eşitliklerde ortalama sıra).
+
+    Args:
+        scores: (satır × sütun) matris
+
+    Returns:
+        np.ndarray: Aynı boyutta sıra matrisi (1'den başlar)
+    """
+    rows, cols = scores.shape
+    if rows == 0:
+        return scores.astype(float)
+
+    order = np.argsort(scores, axis=0, kind='stable')
+    sorted_scores = np.take_along_axis(scores, order, axis=0)
+
+    # Sütun içindeki eşit değer gruplarına global kimlik ver
+    starts = np.ones_like(sorted_scores, dtype=bool)
+    starts[1:] = sorted_scores[1:] != sorted_scores[:-1]
+    group_ids = np.cumsum(starts.T.ravel()).reshape(cols, rows).T - 1
+
+    positions = np.broadcast_to(np.arange(1, rows + 1, dtype=float)[:, None], (rows, cols))
+    totals = np.bincount(group_ids.ravel(), weights=positions.ravel())
+    sizes = np.bincount(group_ids.ravel())
+    average = (totals / sizes)[group_ids]
+
+    ranks = np.empty_like(average)
+    np.put_along_axis(ranks, order, average, axis=0)
+    return ranks
+
+
+def spearman_against(baseline: np.ndarray, candidates: np.ndarray) -> np.ndarray:
+    """
+    Temel puanlar ile her aday sütunu arasındaki Spearman korelasyonu.
+
+    Args:
+        baseline: (satır,) temel puanlar
+        candidates: (satır × aday) aday puanları
+
+    Returns:
+        np.ndarray: (aday,) korelasyonlar (sabit sütunlarda NaN)
+    """
+    ranks = rank_columns(np.column_stack([baseline, candidates]))
+    centered = ranks - ranks.mean(axis=0)
+    norms = np.sqrt((centered ** 2).sum(axis=0))
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return (centered[:, 1:] * centered[:, :1]).sum(axis=0) / (norms[1:] * norms[0])
+
+
+def top_k_mask(scores: np.ndarray, k: int) -> np.ndarray:
+    """Her sütunun en yüksek k satırını işaretleyen bool matris (eşitlikte satır sırası)."""
+    rows = scores.shape[0]
+    k = min(k, rows)
+    mask = np.zeros(scores.shape, dtype=bool)
+    if k == 0:
+        return mask
+
+    order = np.argsort(-scores, axis=0, kind='stable')[:k]
+    np.put_along_axis(mask, order, True, axis=0)
+    return mask
+
+
+@dataclass
+class SweepReport:
+    """Ağırlık taramasının sonucu."""
+    candidates: np.ndarray          # (aday × grup × sütun)
+    groups: Sequence[str]
+    spearman: np.ndarray            # (aday,) temel sıralamaya korelasyon
+    top_churn: np.ndarray           # (aday,) ilk k listesine giren yeni vekil sayısı
+    parties: List[str]
+    party_means: np.ndarray         # (aday × parti) ortalama puan
+    baseline_party_means: np.ndarray  # (parti,)
+    top_k: int = DEFAULT_TOP_K
+
+    def rows(self, limit: Optional[int] = None, sort_by: str = 'spearman') -> List[dict]:
+        """
+        Adayları rapor satırları olarak döndür.
+
+        Args:
+            limit: Maksimum satır sayısı
+            sort_by: 'spearman' (en az değişen önce) veya 'churn' (en çok değişen önce)
+        """
+        if sort_by == 'churn':
+            order = np.argsort(-self.top_churn, kind='stable')
+        else:
+            order = np.argsort(-np.nan_to_num(self.spearman, nan=-2.0), kind='stable')
+
+        rows = []
+        for i in order[:limit]:
+            rows.append({
+                'candidate': int(i),
+                'weights': {
+                    group: dict(zip(ACTIVITY_COLUMNS, np.round(self.candidates[i, g], 3).tolist()))
+                    for g, group in enumerate(self.groups)
+                },
+                'spearman': float(self.spearman[i]),
+                f'top{self.top_k}_churn': int(self.top_churn[i]),
+                'party_means': dict(zip(self.parties, np.round(self.party_means[i], 2).tolist())),
+            })
+        return rows
+
+
+class WeightSweep:
+    """Aday ağırlık setlerini toplu olarak değerlendiren what-if motoru."""
+
+    def __init__(self, table: ActivityTable, policy: ScoringPolicy, top_k: int = DEFAULT_TOP_K):
+        """
+        Taramayı hazırla.
+
+        Args:
+            table: Vekil aktivite tablosu (parti bilgisiyle)
+            policy: Karşılaştırılacak mevcut politika (ceza, alt sınır, gruplar buradan)
+            top_k: Churn hesaplanacak liste uzunluğu
+        """
+        self.table = table
+        self.policy = policy
+        self.top_k = top_k
+        self.group_idx = policy.group_indices(table)
+        self.baseline = policy.evaluate(table).raw_scores
+
+        # Parti ortalamaları için one-hot üyelik matrisi
+        self.parties, party_idx = np.unique(np.asarray(table.parties, dtype=object), return_inverse=True)
+        self.membership = np.zeros((len(table), len(self.parties)))
+        self.membership[np.arange(len(table)), party_idx] = 1.0
+        self.party_sizes = self.membership.sum(axis=0)
+
+        self.ghost_penalty = np.where(
+            table.individual_activity() == 0, policy.ghost_penalty[self.group_idx], 0.0
+        )
+
+    def score(self, candidates: np.ndarray) -> np.ndarray:
+        """
+        Tüm adayları tek toplu matris çarpımıyla puanla.
+
+        Args:
+            candidates: (aday × grup × sütun) veya (aday × sütun) ağırlıklar
+
+        Returns:
+            np.ndarray: (satır × aday) yuvarlanmamış puanlar
+        """
+        candidates = self._as_tensor(candidates)
+        count, groups, columns = candidates.shape
+
+        # (satır × sütun) @ (sütun × aday·grup) -> (satır × aday × grup)
+        per_group = (self.table.matrix @ candidates.reshape(count * groups, columns).T) \
+            .reshape(len(self.table), count, groups)
+        scores = np.take_along_axis(per_group, self.group_idx[:, None, None], axis=2)[:, :, 0]
+
+        scores = scores + self.ghost_penalty[:, None]
+        if self.policy.min_score is not None:
+            scores = np.maximum(scores, self.policy.min_score)
+        return scores
+
+    def run(self, candidates: np.ndarray) -> SweepReport:
+        """
+        Adayları puanla ve sıralama hassasiyet raporunu üret.
+
+        Args:
+            candidates: (aday × grup × sütun) veya (aday × sütun) ağırlıklar
+
+        Returns:
+            SweepReport
+        """
+        candidates = self._as_tensor(candidates)
+        scores = self.score(candidates)
+
+        baseline_top = top_k_mask(self.baseline[:, None], self.top_k)[:, 0]
+        candidate_top = top_k_mask(scores, self.top_k)
+        churn = (candidate_top & ~baseline_top[:, None]).sum(axis=0)
+
+        party_means = (scores.T @ self.membership) / self.party_sizes
+        baseline_means = (self.baseline @ self.membership) / self.party_sizes
+
+        return SweepReport(
+            candidates=candidates,
+            groups=self.policy.groups,
+            spearman=spearman_against(self.baseline, scores),
+            top_churn=churn,
+            parties=self.parties.tolist(),
+            party_means=party_means,
+            baseline_party_means=baseline_means,
+            top_k=self.top_k,
+        )
+
+    def _as_tensor(self, candidates: np.ndarray) -> np.ndarray:
+        """(aday × sütun) girdiyi tüm gruplara yayarak (aday × grup × sütun) yap."""
+        candidates = np.asarray(candidates, dtype=float)
+        if candidates.ndim == 2:
+            candidates = np.repeat(candidates[:, None, :], len(self.policy.groups), axis=1)
+        if candidates.shape[1:] != self.policy.weights.shape:
+            raise ValueError(
+                f"Aday boyutu {candidates.shape[1:]}, beklenen {self.policy.weights.shape}"
+            )
+        return candidates
@@ -8,8 +8,8 @@ import hashlib
 from typing import List, Optional
 from dataclasses import dataclass
 from datetime import datetime
-from playwright.sync_api import sync_playwright
-import time
+from services.browser_pool import get_browser_pool
+from services.retry_policy import retry_navigate
 
 
 @dataclass
@@ -74,10 +74,8 @@ def scrape_wikipedia_mps() -> List[TBMMMember]:
     
     members = []
     
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page()
-        page.goto(url, wait_until='networkidle', timeout=30000)
+    with get_browser_pool().page() as page:
+        retry_navigate(page, url, wait_until='networkidle', timeout=30000)
         
         print("📋 Milletvekili tabloları taranıyor...")
         
@@ -193,8 +191,6 @@ def scrape_wikipedia_mps() -> List[TBMMMember]:
         }''')
         
         print(f"  📊 {len(mp_data)} kayıt bulundu")
-        
-        browser.close()
     
     # Verileri işle ve tekrarları kaldır
     seen = set()
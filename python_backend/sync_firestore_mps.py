@@ -7,9 +7,12 @@ statik JSON'dan doğru vekil verilerini yükler.
 
 import json
 import logging
+from collections import Counter
 from pathlib import Path
 from datetime import datetime
 
+from services.mp_name_resolver import mp_id, normalize_name
+
 # Setup logging
 logging.basicConfig(
     level=logging.INFO,
@@ -23,16 +26,6 @@ def get_static_data_path() -> Path:
     return Path(__file__).parent / "data" / "mps_static.json"
 
 
-def generate_mp_id(name: str) -> str:
-    """MP için benzersiz ID oluştur."""
-    import hashlib
-    import re
-    name_normalized = name.lower().replace(' ', '_')
-    name_normalized = re.sub(r'[^a-z0-9_]', '', name_normalized)
-    hash_suffix = hashlib.sha256(name.encode()).hexdigest()[:8]
-    return f"mv_{name_normalized[:20]}_{hash_suffix}"
-
-
 def normalize_party(party: str) -> str:
     """Parti ismini standartlaştır."""
     party_map = {
@@ -67,11 +60,14 @@ def load_static_mps():
     
     mps = []
     cities = data.get('cities', {})
+    # Aynı isimli vekillerin ID'sine seçim çevresi katılır (aksi halde dokümanları çakışır)
+    namesakes = Counter(normalize_name(m['name']) for members in cities.values() for m in members)
     
     for city, members in cities.items():
         for member in members:
+            namesake_city = city if namesakes[normalize_name(member['name'])] > 1 else None
             mp_data = {
-                'id': generate_mp_id(member['name']),
+                'id': mp_id(member['name'], namesake_city),
                 'name': member['name'],
                 'party': normalize_party(member['party']),
                 'constituency': city.title(),
@@ -144,19 +140,10 @@ def upload_mps_to_firestore(db, mps: list):
 
 def sync_firestore():
     """Ana senkronizasyon fonksiyonu."""
-    import firebase_admin
-    from firebase_admin import credentials, firestore
-    
-    # Firebase'i başlat
-    if not firebase_admin._apps:
-        cred_path = Path(__file__).parent / "serviceAccountKey.json"
-        if not cred_path.exists():
-            raise FileNotFoundError(f"Firebase credentials bulunamadı: {cred_path}")
-        
-        cred = credentials.Certificate(str(cred_path))
-        firebase_admin.initialize_app(cred)
+    from config.storage_config import get_storage_client
     
-    db = firestore.client()
+    # Depolama client'ı (STORAGE_BACKEND'e göre Firestore veya yerel)
+    db = get_storage_client()
     
     logger.info("🚀 Firestore MP senkronizasyonu başlıyor...")
     
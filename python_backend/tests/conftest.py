@@ -0,0 +1,40 @@
+"""
+Shared Test Fixtures
+
+Fake clock and rate controller used by the scraper pacing, retry and network tests.
+"""
+
+import pytest
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.rate_limiter import RateController
+
+
+class FakeClock:
+    """Monotonic clock whose sleep() advances time instead of blocking."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.slept = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def fast_controller():
+    """Rate controller that never waits, for tests exercising scrapers rather than pacing."""
+    return RateController(1000.0, 1000.0, 1000.0, burst=1000, sleep=lambda seconds: None)
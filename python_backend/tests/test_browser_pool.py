@@ -0,0 +1,137 @@
+"""
+Browser Pool Tests
+
+Tests for the shared Playwright browser pool: single launch, isolated contexts and page caps.
+"""
+
+import threading
+import pytest
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.scraper_config import ScraperConfig
+from services import browser_pool
+from services.browser_pool import BrowserPool, BrowserPoolExhausted
+
+
+class FakePage:
+    def set_default_timeout(self, timeout):
+        self.timeout = timeout
+
+    def on(self, event, handler):
+        pass
+
+
+class FakeContext:
+    def __init__(self, options):
+        self.options = options
+        self.closed = False
+        self.routes = []
+
+    def route(self, pattern, handler):
+        self.routes.append(pattern)
+
+    def new_page(self):
+        return FakePage()
+
+    def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.contexts = []
+        self.connected = True
+
+    def is_connected(self):
+        return self.connected
+
+    def new_context(self, **options):
+        self.contexts.append(FakeContext(options))
+        return self.contexts[-1]
+
+    def close(self):
+        self.connected = False
+
+
+class FakePlaywright:
+    def __init__(self, launches):
+        self.launches = launches
+        self.chromium = self
+
+    def start(self):
+        return self
+
+    def launch(self, headless):
+        self.launches.append(headless)
+        return FakeBrowser()
+
+    def stop(self):
+        pass
+
+
+@pytest.fixture
+def launches(monkeypatch):
+    launches = []
+    monkeypatch.setattr(browser_pool, 'sync_playwright', lambda: FakePlaywright(launches))
+    return launches
+
+
+class TestBrowserPool:
+    """Tests for launching once and handing out isolated pages."""
+
+    def test_scrapers_share_one_browser(self, launches):
+        from services.law_proposals_scraper import LawProposalsScraper
+        from services.question_scraper import WrittenQuestionsScraper
+
+        with BrowserPool(ScraperConfig()) as pool:
+            with LawProposalsScraper(pool=pool) as first:
+                first_page = first.page
+            with WrittenQuestionsScraper(pool=pool) as second:
+                assert second.page is not first_page
+
+            assert launches == [True]
+            assert [c.closed for c in pool.browser.contexts] == [True, True]
+            assert pool.open_pages == 0
+
+    def test_page_cap(self, launches):
+        pool = BrowserPool(ScraperConfig(default_timeout=1234), max_pages=2)
+        with pool.page(locale='tr-TR') as page:
+            assert page.timeout == 1234
+            pool.acquire_page()
+            with pytest.raises(BrowserPoolExhausted):
+                pool.acquire_page()
+        assert pool.open_pages == 1
+        assert pool.browser.contexts[0].options == {'locale': 'tr-TR'}
+        assert pool.browser.contexts[0].routes == ['**/*']
+        pool.close()
+
+    def test_network_profile_can_be_disabled(self, launches):
+        pool = BrowserPool(ScraperConfig(block_resource_types=(), block_trackers=False))
+        pool.acquire_page()
+        assert pool.network_profile is None
+        assert pool.browser.contexts[0].routes == []
+        pool.close()
+
+    def test_relaunch_after_disconnect(self, launches):
+        pool = BrowserPool(ScraperConfig(headless=False))
+        pool.browser.connected = False
+        pool.acquire_page()
+        assert launches == [False, False]
+        pool.close()
+
+    def test_pool_is_per_thread(self, launches):
+        main_pool = browser_pool.get_browser_pool()
+        other = []
+        worker = threading.Thread(target=lambda: other.append(browser_pool.get_browser_pool()))
+        worker.start()
+        worker.join()
+
+        assert browser_pool.get_browser_pool() is main_pool
+        assert other[0] is not main_pool
+        with pytest.raises(RuntimeError):
+            other[0].browser
+        browser_pool.close_browser_pool()
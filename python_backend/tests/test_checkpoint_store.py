@@ -0,0 +1,174 @@
+"""
+Checkpoint Store Tests
+
+Tests for job_id keyed checkpoints and resuming scoring jobs.
+"""
+
+import pytest
+import sys
+import os
+from datetime import datetime
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.checkpoint_store import CheckpointStore
+from tests.test_scoring_engine import _make_engine_with_fakes
+
+
+def _make_result(mp_id="mv_001", new_score=42.0):
+    from services.scoring_engine import ScoringResult
+
+    return ScoringResult(
+        mp_id=mp_id,
+        mp_name="Vekil 1",
+        old_score=10.0,
+        new_score=new_score,
+        law_bonus=15.0,
+        question_bonus=0.0,
+        speech_bonus=0.0,
+        news_impact=5.0,
+        news_count=2,
+        is_passive=False,
+        success=True,
+    )
+
+
+class TestCheckpointStore:
+    """Tests for the SQLite checkpoint store."""
+
+    def test_completed_results_roundtrip(self, tmp_path):
+        """Completed MP results should survive reopening the store."""
+        db_path = tmp_path / "cp.db"
+        store = CheckpointStore("job1", db_path=db_path)
+        assert store.resumed is False
+        store.mark_completed(_make_result())
+        store.close()
+
+        reopened = CheckpointStore("job1", db_path=db_path, resume=True)
+        assert reopened.resumed is True
+        assert reopened.completed_results() == {"mv_001": _make_result()}
+        reopened.close()
+
+    def test_analysis_roundtrip_and_cleanup(self, tmp_path):
+        """Saved analyses are returned until their MP is marked completed."""
+        from models.mp_models import NewsAnalysis
+
+        store = CheckpointStore("job1", db_path=tmp_path / "cp.db")
+        analysis = NewsAnalysis(
+            mp_id="mv_001", title="Başlık", url="https://example.com/a",
+            summary="özet", sentiment_score=0.2, impact_score=7.0,
+            created_at=datetime(2025, 1, 2, 3, 4, 5),
+        )
+        store.save_analysis(analysis)
+
+        cached = store.get_analysis("mv_001", "https://example.com/a")
+        assert cached.impact_score == 7.0
+        assert cached.created_at == analysis.created_at
+        assert store.get_analysis("mv_001", "https://example.com/b") is None
+
+        store.mark_completed(_make_result())
+        assert store.get_analysis("mv_001", "https://example.com/a") is None
+        store.close()
+
+    def test_jobs_are_isolated(self, tmp_path):
+        """Checkpoints of one job must not leak into another."""
+        db_path = tmp_path / "cp.db"
+        CheckpointStore("job1", db_path=db_path).mark_completed(_make_result())
+
+        assert CheckpointStore("job2", db_path=db_path).completed_results() == {}
+
+    def test_mode_mismatch_raises(self, tmp_path):
+        """A dry-run job cannot be resumed in production mode."""
+        db_path = tmp_path / "cp.db"
+        CheckpointStore("job1", dry_run=True, db_path=db_path).close()
+
+        with pytest.raises(ValueError, match="DRY-RUN"):
+            CheckpointStore("job1", dry_run=False, db_path=db_path, resume=True)
+
+    def test_resume_unknown_job_raises(self, tmp_path):
+        """A mistyped --resume id must not silently start a fresh job."""
+        db_path = tmp_path / "cp.db"
+        with pytest.raises(ValueError):
+            CheckpointStore("typo", db_path=db_path, resume=True)
+        assert not CheckpointStore("typo", db_path=db_path).resumed  # kayıt oluşturulmadı
+
+        CheckpointStore("job1", db_path=db_path).close()
+        assert CheckpointStore("job1", db_path=db_path, resume=True).resumed
+
+    def test_existing_job_requires_resume(self, tmp_path):
+        """Reusing a job id without --resume must not silently skip its completed MPs."""
+        db_path = tmp_path / "cp.db"
+        store = CheckpointStore("gece1", db_path=db_path)
+        store.mark_completed(_make_result())
+        store.close()
+
+        with pytest.raises(ValueError, match="--resume"):
+            CheckpointStore("gece1", db_path=db_path)
+        assert CheckpointStore("gece1", db_path=db_path, resume=True).completed_results() == {
+            "mv_001": _make_result()
+        }
+
+
+class TestJobIdReuse:
+    """Tests for main.run_scoring_job with an existing --job-id."""
+
+    def test_job_id_without_resume_stops(self, tmp_path, monkeypatch):
+        """A cron run reusing its --job-id must fail instead of skipping recorded MPs."""
+        import main
+        from services import checkpoint_store
+
+        db_path = tmp_path / "cp.db"
+        monkeypatch.setattr(checkpoint_store, 'get_checkpoint_db_path', lambda: db_path)
+        monkeypatch.setattr(main, 'test_storage_connection', lambda: True)
+        monkeypatch.setattr(main, 'get_firestore_service', lambda: None)
+        monkeypatch.setattr(main, 'get_scoring_engine', lambda *args, **kwargs: pytest.fail("job started"))
+
+        store = CheckpointStore("gece1", dry_run=True, db_path=db_path)
+        store.mark_completed(_make_result())
+        store.close()
+
+        assert main.run_scoring_job(dry_run=True, job_id="gece1") is False
+
+
+class TestResume:
+    """Tests for resuming process_all_mps from a checkpoint."""
+
+    def test_resume_skips_completed_mps(self, tmp_path):
+        """A resumed run should not reprocess completed MPs and keep their results."""
+        db_path = tmp_path / "cp.db"
+        first = _make_engine_with_fakes()
+        first.firestore.get_all_mps.return_value = first.firestore.get_all_mps.return_value[:3]
+        first_results = first.process_all_mps(
+            max_news_per_mp=2, checkpoint=CheckpointStore("job1", dry_run=True, db_path=db_path)
+        )
+
+        engine = _make_engine_with_fakes()
+        results = engine.process_all_mps(
+            max_news_per_mp=2, checkpoint=CheckpointStore("job1", dry_run=True, db_path=db_path, resume=True)
+        )
+
+        assert [r.mp_id for r in results] == [f"mv_{i:03d}" for i in range(6)]
+        assert results[:3] == first_results
+        assert engine.scraper.search_news_for_mp.call_count == 3
+
+    @pytest.mark.parametrize("pipelined", [False, True])
+    def test_resume_reuses_saved_analyses(self, tmp_path, pipelined):
+        """Analyses saved before an interruption should not be sent to Gemini again."""
+        from config.pipeline_config import PipelineConfig
+
+        checkpoint = CheckpointStore("job1", dry_run=True, db_path=tmp_path / "cp.db")
+        seed = _make_engine_with_fakes(mp_count=1)
+        seed.checkpoint = checkpoint
+        item = seed.scraper.search_news_for_mp("Vekil 0", 1)[0]
+        seed._analyze_item(seed.firestore.get_all_mps.return_value[0], item)
+
+        engine = _make_engine_with_fakes(
+            mp_count=1, pipeline_config=PipelineConfig(pipelined=pipelined)
+        )
+        results = engine.process_all_mps(max_news_per_mp=3, checkpoint=checkpoint)
+
+        assert results[0].success
+        assert results[0].news_count == 3
+        assert engine.analyzer.analyze_news_impact.call_count == 2
+        assert engine.scraper.scrape_article_content.call_count == 2
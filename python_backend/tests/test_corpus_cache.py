@@ -0,0 +1,108 @@
+"""
+Corpus Cache Tests
+
+Tests for the binary (.npz) legislative corpus cache and its invalidation.
+"""
+
+import json
+import os
+import pytest
+import sys
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.corpus_cache import FIELD_SEPARATOR, decode_strings, encode_strings
+from services.legislative_corpus import PROPOSAL_CATEGORY_FIELD, LegislativeCorpus, ProposalIndex, reset_corpus
+from tests.test_legislative_corpus import PROPOSALS
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    (tmp_path / "law_proposals_28.json").write_text(json.dumps(PROPOSALS, ensure_ascii=False), encoding='utf-8')
+    (tmp_path / "written_questions_28.json").write_text(json.dumps([
+        {'subject': "İSTANBUL Milletvekili DOĞAN BEKİN\nSoru"},
+    ], ensure_ascii=False), encoding='utf-8')
+    reset_corpus()
+    yield tmp_path
+    reset_corpus()
+
+
+class TestStringColumns:
+    """Tests for the separator-joined UTF-8 string columns."""
+
+    def test_roundtrip(self):
+        values = ["Özgür ÖZEL", "", "çok\nsatırlı"]
+        assert decode_strings(encode_strings(values), 3) == values
+        assert decode_strings(encode_strings([]), 0) == []
+
+    def test_separator_not_cacheable(self):
+        assert encode_strings([f"a{FIELD_SEPARATOR}b"]) is None
+
+
+class TestCorpusCache:
+    """Tests for cache hits and invalidation."""
+
+    def test_second_load_hits_cache(self, data_dir):
+        """A fresh corpus reads the cache and rebuilds identical indexes."""
+        first = LegislativeCorpus(data_dir)
+        parsed = first.proposals
+        assert first.cache_hits == []
+        assert (data_dir / ".corpus_cache" / "law_proposals_28.json.npz").exists()
+
+        second = LegislativeCorpus(data_dir)
+        cached = second.proposals
+        assert second.cache_hits == ['law_proposals']
+        assert cached.records == parsed.records
+        assert cached.signatories == parsed.signatories
+        assert cached.first_signature == parsed.first_signature
+        assert cached.ids_by_mp == parsed.ids_by_mp
+        assert LegislativeCorpus(data_dir).question_counts == first.question_counts == {'DOGAN BEKIN': 1}
+
+    def test_invalidated_by_content_change(self, data_dir):
+        """Rewriting the source with the same size and mtime is still detected by the hash."""
+        path = data_dir / "law_proposals_28.json"
+        LegislativeCorpus(data_dir).proposals
+        stat = path.stat()
+
+        changed = path.read_text(encoding='utf-8').replace("EMİR", "EMİN")
+        path.write_text(changed, encoding='utf-8')
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert path.stat().st_size == stat.st_size
+
+        corpus = LegislativeCorpus(data_dir)
+        assert corpus.proposals.first_signature == {'OZGUR OZEL': 1, 'MURAT EMIN': 1}
+        assert corpus.cache_hits == []
+
+    def test_disabled(self, data_dir, monkeypatch):
+        """CORPUS_CACHE=0 neither reads nor writes the cache."""
+        monkeypatch.setenv('CORPUS_CACHE', '0')
+        corpus = LegislativeCorpus(data_dir)
+        corpus.proposals
+
+        assert corpus.cache is None
+        assert not (data_dir / ".corpus_cache").exists()
+
+    def test_non_string_records_fall_back(self):
+        """Records that do not fit the string-column layout are not cached."""
+        index = ProposalIndex.build([{'esas_no': '2/1', 'period': 28, 'summary': ""}])
+        assert index.to_arrays() is None
+
+
+class TestCachedCategories:
+    """Tests for classification flags stored in the cache."""
+
+    def test_categories_restored_for_same_classifier(self, data_dir):
+        """Categories are saved once and reused only with the same keyword signature."""
+        import fair_scoring
+
+        classifier = fair_scoring.get_proposal_classifier()
+        fair_scoring.load_proposals_by_mp(data_dir / "law_proposals_28.json")
+
+        index = LegislativeCorpus(data_dir).proposals
+        assert index.restore_categories(classifier.signature)
+        assert all(record[PROPOSAL_CATEGORY_FIELD] for record in index.records)
+
+        other = fair_scoring.ProposalClassifier(procedural_keywords=["Hayvan"])
+        assert other.signature != classifier.signature
+        assert not LegislativeCorpus(data_dir).proposals.restore_categories(other.signature)
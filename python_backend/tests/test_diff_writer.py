@@ -0,0 +1,88 @@
+"""
+Diff Writer Tests
+
+Tests for the diff-and-batch collection writer used by the metrics scripts.
+"""
+
+import pytest
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.diff_writer import DiffWriter, diff_fields
+from services.local_store import LocalStore
+
+
+@pytest.fixture
+def store():
+    store = LocalStore(':memory:')
+    batch = store.batch()
+    for i in range(1200):
+        batch.set(store.collection('mps').document(f'mv_{i}'),
+                  {'name': f'MP {i}', 'score': 1.0, 'bio': 'uzun metin', 'is_passive': False})
+        if len(batch) == 500:
+            batch.commit()
+            batch = store.batch()
+    batch.commit()
+
+    commits = []
+    real_batch = store.batch
+
+    def counting_batch():
+        batch = real_batch()
+        real_commit = batch.commit
+        batch.commit = lambda: commits.append(len(batch)) or real_commit()
+        return batch
+
+    store.batch = counting_batch
+    store.commits = commits
+    yield store
+    store.close()
+
+
+def make_writer(store, **kwargs):
+    return DiffWriter(store, 'mps', ('score', 'is_passive'), key=lambda data: data['name'], **kwargs)
+
+
+class TestDiffFields:
+    """Tests for field comparison."""
+
+    def test_changed_missing_and_type(self):
+        current = {'score': 1.0, 'count': 1, 'is_passive': False}
+        desired = {'score': 1.0, 'count': 2, 'is_passive': 0, 'new': 'x'}
+        assert diff_fields(current, desired) == {'count': 2, 'is_passive': 0, 'new': 'x'}
+
+
+class TestDiffWriter:
+    """Tests for snapshot, diff and batched commits."""
+
+    def test_snapshot_is_projected(self, store):
+        snapshot = make_writer(store).snapshot()
+        assert len(snapshot) == 1200
+        assert snapshot['MP 0'][0][1] == {'name': 'MP 0', 'score': 1.0, 'is_passive': False}
+
+    def test_only_changes_are_committed_in_batches(self, store):
+        """Changed documents go out in 500-operation batches; unchanged ones cost nothing."""
+        updates = {f'MP {i}': {'score': 2.0 if i < 1100 else 1.0, 'is_passive': False} for i in range(1200)}
+        updates['MP 9999'] = {'score': 5.0}
+
+        result = make_writer(store).write(updates)
+
+        assert (result.changed, result.unchanged, result.missing) == (1100, 100, ['MP 9999'])
+        assert store.commits == [500, 500, 100]
+        doc = store.collection('mps').document('mv_5').get().to_dict()
+        assert doc == {'name': 'MP 5', 'score': 2.0, 'bio': 'uzun metin', 'is_passive': False}
+
+        rerun = make_writer(store).write(updates)
+        assert (rerun.changed, rerun.unchanged, rerun.batches) == (0, 1200, 0)
+        assert len(store.commits) == 3
+
+    def test_dry_run_writes_nothing(self, store):
+        writer = make_writer(store)
+        result = writer.write({'MP 1': {'score': 3.0}}, dry_run=True)
+
+        assert result.changed == 1
+        assert store.commits == []
+        assert writer.write({'MP 1': {'score': 3.0}}, dry_run=True).changed == 1
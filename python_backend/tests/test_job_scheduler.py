@@ -0,0 +1,162 @@
+"""
+Job Scheduler Tests
+
+Tests for the --time-budget deadline scheduler and deferred MP bookkeeping.
+"""
+
+import pytest
+import sys
+import os
+from datetime import datetime, timedelta
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.mp_models import MP
+from services.job_scheduler import DeadlineScheduler, SchedulerState, parse_duration
+from services.stage_metrics import StageMetrics
+from tests.test_scoring_engine import _make_engine_with_fakes
+
+
+class _Clock:
+    """Manually advanced replacement for time.monotonic."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr('services.job_scheduler.time.monotonic', clock)
+    return clock
+
+
+def _metrics(news_ms=1000, item_ms=1000):
+    """Metrics with fixed per-MP (news) and per-item (gemini) costs."""
+    metrics = StageMetrics()
+    metrics.record('news', news_ms)
+    metrics.record('scrape', 0)
+    metrics.record('gemini', item_ms)
+    metrics.record('firestore_write', 0)
+    return metrics
+
+
+class TestParseDuration:
+    """Tests for --time-budget parsing."""
+
+    @pytest.mark.parametrize("text,seconds", [("90s", 90), ("45m", 2700), ("1h30m", 5400), ("1.5h", 5400), ("30", 1800)])
+    def test_valid(self, text, seconds):
+        assert parse_duration(text) == seconds
+
+    @pytest.mark.parametrize("text", ["", "abc", "10x", "0m", "5m ago"])
+    def test_invalid(self, text):
+        with pytest.raises(ValueError):
+            parse_duration(text)
+
+
+class TestDeadlineScheduler:
+    """Tests for ordering and per-MP budget decisions."""
+
+    def test_prioritize(self, clock):
+        """Deferred first, then stale, then news volume, then visibility."""
+        now = datetime.now()
+        mps = [
+            MP(id='fresh', name='A', party='X', last_updated=now),
+            MP(id='fresh_visible', name='B', party='X', last_updated=now, term_count=4),
+            MP(id='fresh_busy', name='C', party='X', last_updated=now),
+            MP(id='stale', name='D', party='X', last_updated=now - timedelta(days=9)),
+            MP(id='deferred', name='E', party='X', last_updated=now),
+        ]
+        scheduler = DeadlineScheduler(600, StageMetrics(), deferred_ids=['deferred'],
+                                      news_volume={'fresh_busy': 12})
+
+        order = [mp.id for mp in scheduler.prioritize(mps)]
+        assert order == ['deferred', 'stale', 'fresh_busy', 'fresh_visible', 'fresh']
+
+    def test_news_count_adapts_to_budget(self, clock):
+        """A tight budget lowers max_news; a generous one keeps the cap."""
+        mp = MP(id='mv_1', name='A', party='X')
+
+        generous = DeadlineScheduler(1000, _metrics(), max_news=5, reserve_ratio=0)
+        generous.start(2)
+        assert generous.admit(mp) == 5
+
+        tight = DeadlineScheduler(10, _metrics(), max_news=5, reserve_ratio=0)
+        tight.start(2)
+        # 10s for 2 MPs: 5s each, 1s fixed + 1s per item -> 4 items
+        assert tight.admit(mp) == 4
+
+    def test_stop_latches_and_reports(self, clock):
+        """Once the budget cannot fit an MP, all later MPs are deferred."""
+        scheduler = DeadlineScheduler(10, _metrics(), max_news=3, reserve_ratio=0)
+        scheduler.start(3)
+
+        assert scheduler.admit(MP(id='a', name='A', party='X')) is not None
+        clock.now = 9.5
+        assert scheduler.admit(MP(id='b', name='B', party='X')) is None
+        clock.now = 0.0
+        assert scheduler.admit(MP(id='c', name='C', party='X')) is None
+
+        report = scheduler.report()
+        assert report['budget_exhausted']
+        assert report['deferred'] == ['b', 'c']
+        assert report['admitted_count'] == 1
+
+
+class TestScheduledEngine:
+    """Tests for process_all_mps with a scheduler."""
+
+    def test_stops_cleanly_and_defers_rest(self, clock):
+        """MPs that do not fit are deferred and left out of the results."""
+        engine = _make_engine_with_fakes(mp_count=6)
+        search = engine.scraper.search_news_for_mp.side_effect
+
+        def slow_search(mp_name, max_results):
+            clock.now += 4
+            return search(mp_name, max_results)
+
+        engine.scraper.search_news_for_mp.side_effect = slow_search
+        scheduler = DeadlineScheduler(10, _metrics(), max_news=3, reserve_ratio=0)
+
+        results = engine.process_all_mps(max_news_per_mp=3, scheduler=scheduler)
+
+        assert len(results) == 3
+        assert len(scheduler.deferred) == 3
+        assert set(r.mp_id for r in results).isdisjoint(scheduler.deferred_ids)
+
+    def test_pipeline_defers(self, clock):
+        """The pipelined path drops deferred MPs instead of reporting errors."""
+        from config.pipeline_config import PipelineConfig
+
+        engine = _make_engine_with_fakes(mp_count=4, pipeline_config=PipelineConfig(pipelined=True))
+        scheduler = DeadlineScheduler(10, _metrics(), max_news=3, reserve_ratio=0)
+        clock.now = 100
+
+        assert engine.process_all_mps(max_news_per_mp=3, scheduler=scheduler) == []
+        assert len(scheduler.deferred) == 4
+
+
+class TestSchedulerState:
+    """Tests for persisting deferred MPs between runs."""
+
+    def test_roundtrip(self, tmp_path):
+        """Deferred order and news volume survive a reopen; saving replaces the list."""
+        from tests.test_checkpoint_store import _make_result
+
+        db_path = tmp_path / "state.db"
+        state = SchedulerState(db_path=db_path)
+        state.save(['mv_3', 'mv_1'], [_make_result('mv_2')], job_id='job1')
+        state.close()
+
+        reopened = SchedulerState(db_path=db_path)
+        assert reopened.deferred_ids() == ['mv_3', 'mv_1']
+        assert reopened.news_volume() == {'mv_2': 2}
+        assert SchedulerState(scope='shard0of2', db_path=db_path).deferred_ids() == []
+
+        reopened.save([], [], job_id='job2')
+        assert reopened.deferred_ids() == []
+        reopened.close()
@@ -0,0 +1,60 @@
+"""
+JSON Stream Tests
+
+Tests for the chunked record reader used by the legislative corpus loaders.
+"""
+
+import json
+import pytest
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.json_stream import JSONStreamError, iter_json_array, iter_records, project_record
+
+
+RECORDS = [
+    {'esas_no': '2/1', 'summary': "Manisa Milletvekili Özgür ÖZEL\nBaşlık\n\nUzun gerekçe", 'date': '01.01.2024'},
+    12345,
+    "şğü",
+    {'esas_no': '2/2', 'summary': "", 'nested': {'a': [1, 2.5, None, True]}},
+]
+
+
+def write(tmp_path, text):
+    path = tmp_path / "records.json"
+    path.write_text(text, encoding='utf-8')
+    return path
+
+
+class TestIterJsonArray:
+    """Tests for element-by-element array decoding."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 3, 64, 1 << 20])
+    def test_matches_json_load(self, tmp_path, chunk_size):
+        """Elements split across read chunks (including multi-byte characters) decode intact."""
+        path = write(tmp_path, json.dumps(RECORDS, ensure_ascii=False, indent=2))
+        assert list(iter_json_array(path, chunk_size)) == RECORDS
+
+    def test_empty_array(self, tmp_path):
+        assert list(iter_json_array(write(tmp_path, " [ ] "), 1)) == []
+
+    @pytest.mark.parametrize("text", ['{"a": 1}', '[1, 2', '[1 2]', '[{"a": '])
+    def test_malformed(self, tmp_path, text):
+        with pytest.raises(JSONStreamError):
+            list(iter_json_array(write(tmp_path, text), 2))
+
+
+class TestProjection:
+    """Tests for field projection."""
+
+    def test_fields_and_header_line(self):
+        projected = project_record(RECORDS[0], ('esas_no', 'summary', 'missing'), ('summary',))
+        assert projected == {'esas_no': '2/1', 'summary': "Manisa Milletvekili Özgür ÖZEL"}
+        assert RECORDS[0]['summary'].count('\n') == 3
+
+    def test_iter_records_skips_non_objects(self, tmp_path):
+        path = write(tmp_path, json.dumps(RECORDS, ensure_ascii=False))
+        assert list(iter_records(path, ('esas_no',))) == [{'esas_no': '2/1'}, {'esas_no': '2/2'}]
@@ -0,0 +1,165 @@
+"""
+Legislative Corpus Tests
+
+Tests for the shared one-pass loader of the data/*.json legislative sources.
+"""
+
+import json
+import pytest
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services import legislative_corpus
+from services.legislative_corpus import (
+    LegislativeCorpus, ProposalIndex, get_corpus, get_corpus_for_file, get_parse_workers,
+    parse_signatories, parse_signatory_header, parse_submitter, parse_texts, reset_corpus,
+)
+
+
+PROPOSALS = [
+    {'esas_no': '2/1', 'summary': "CHP Genel Başkanı Manisa Milletvekili Özgür ÖZEL, Ankara Milletvekili "
+                                  "Murat EMİR ve 20 Milletvekili\nHayvan Hakları Kanun Teklifi"},
+    {'esas_no': '2/2', 'summary': "Ankara Milletvekili Murat EMİR\nAsgari Ücret Kanun Teklifi"},
+]
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    """A minimal data/ directory with every corpus source."""
+    files = {
+        'law_proposals_28.json': PROPOSALS,
+        'written_questions_28.json': [
+            {'esas_no': '7/1', 'subject': "İSTANBUL Milletvekili DOĞAN BEKİN\nSoru metni"},
+            {'esas_no': '7/2', 'subject': "İstanbul Milletvekili Doğan Bekin ve 3 Milletvekili\nSoru"},
+        ],
+        'research_proposals_28.json': [
+            {'esas_no': '10/1', 'summary': "Ankara Milletvekili Murat EMİR ve 21 Milletvekilinin; ..."},
+        ],
+        'commission_members.json': {
+            'Plan ve Bütçe': [{'name': 'Murat Emir', 'role': 'SÖZCÜ'}],
+            'Adalet': [{'name': 'MURAT EMİR', 'role': 'ÜYE'}, {'name': 'Özgür Özel', 'role': 'BAŞKAN'}],
+        },
+        'mps_static.json': {'cities': {'ANKARA': [{'name': 'Murat EMİR', 'party': 'CHP'}]}},
+    }
+    for name, content in files.items():
+        (tmp_path / name).write_text(json.dumps(content, ensure_ascii=False), encoding='utf-8')
+
+    reset_corpus()
+    yield tmp_path
+    reset_corpus()
+
+
+class TestHeaderParsing:
+    """Tests for signatory/submitter header parsing."""
+
+    def test_signatories_in_order(self):
+        """The first name is the first signature; co-signer tails are dropped."""
+        assert parse_signatories(PROPOSALS[0]['summary']) == ['OZGUR OZEL', 'MURAT EMIR']
+        assert parse_signatories("") == []
+
+    def test_submitter(self):
+        """Submitters are normalized and ' ve N Milletvekili' is stripped."""
+        assert parse_submitter("İSTANBUL Milletvekili Doğan BEKİN ve 3 Milletvekili") == 'DOGAN BEKIN'
+        assert parse_submitter("Cumhurbaşkanlığı") is None
+
+
+class TestLegislativeCorpus:
+    """Tests for the per-MP indexes."""
+
+    def test_proposal_indexes(self, data_dir):
+        """Signature counts, proposal lists and esas numbers come from one pass."""
+        index = LegislativeCorpus(data_dir).proposals
+
+        assert index.first_signature == {'OZGUR OZEL': 1, 'MURAT EMIR': 1}
+        assert index.support_signature == {'MURAT EMIR': 1}
+        assert [p['esas_no'] for p in index.by_mp['MURAT EMIR']] == ['2/1', '2/2']
+        assert index.ids_by_mp['OZGUR OZEL'] == {'2/1'}
+
+    def test_other_sources(self, data_dir):
+        """Questions, research, commission roles and static MPs are indexed by name."""
+        corpus = LegislativeCorpus(data_dir)
+
+        assert corpus.question_counts == {'DOGAN BEKIN': 2}
+        assert corpus.research_counts == {'MURAT EMIR': 1}
+        assert corpus.commissions.bonuses == {'MURAT EMIR': 33, 'OZGUR OZEL': 25}
+        assert corpus.commissions.roles['MURAT EMIR'] == [('Plan ve Bütçe', 'SÖZCÜ'), ('Adalet', 'ÜYE')]
+        assert corpus.static_mps == [{'name': 'Murat EMİR', 'party': 'CHP', 'city': 'ANKARA'}]
+
+    def test_missing_source_is_empty(self, tmp_path):
+        """Missing files produce empty indexes instead of errors."""
+        corpus = LegislativeCorpus(tmp_path)
+
+        assert corpus.proposals.by_mp == {}
+        assert corpus.question_counts == {}
+        assert corpus.static_mps == []
+
+
+class TestParallelParsing:
+    """Tests for chunked process-pool header parsing."""
+
+    def test_chunks_merge_in_record_order(self):
+        texts = [p['summary'] for p in PROPOSALS] * 5
+        serial = parse_texts(parse_signatory_header, texts)
+        assert parse_texts(parse_signatory_header, texts, workers=3, chunk_size=2) == serial
+
+    def test_indexes_match_serial(self, data_dir, monkeypatch):
+        """Counters built from a parallel parse equal the serial ones."""
+        monkeypatch.setattr(legislative_corpus, 'MIN_PARSE_CHUNK', 1)
+        records = PROPOSALS * 4
+        serial = ProposalIndex.build(records)
+        parallel = ProposalIndex.build(records, workers=2)
+
+        assert parallel.signatories == serial.signatories
+        assert parallel.first_signature == serial.first_signature == {'OZGUR OZEL': 4, 'MURAT EMIR': 4}
+        assert parallel.support_signature == serial.support_signature
+        assert LegislativeCorpus(data_dir, parse_workers=2).question_counts == {'DOGAN BEKIN': 2}
+
+    def test_workers_from_env(self, monkeypatch):
+        monkeypatch.delenv('CORPUS_PARSE_WORKERS', raising=False)
+        assert get_parse_workers() == 1
+        monkeypatch.setenv('CORPUS_PARSE_WORKERS', '6')
+        assert get_parse_workers() == 6
+        monkeypatch.setenv('CORPUS_PARSE_WORKERS', 'auto')
+        assert get_parse_workers() == (os.cpu_count() or 1)
+
+
+class TestSharedCorpus:
+    """Tests for sharing one parse across the scripts."""
+
+    def test_each_file_parsed_once(self, data_dir, monkeypatch):
+        """fair_scoring and update_all_mp_metrics loaders reuse the same parse.
+
+        Per-term sources are streamed once (proposals are classified in the same
+        pass); mps_static.json is loaded once for the shared name resolver.
+        """
+        import fair_scoring
+        import update_all_mp_metrics
+
+        loads, streams = [], []
+        real_loads, real_iter_records = json.loads, legislative_corpus.iter_records
+        monkeypatch.setattr(legislative_corpus.json, 'loads', lambda s, **kw: loads.append(s) or real_loads(s, **kw))
+        monkeypatch.setattr(legislative_corpus, 'iter_records',
+                            lambda path, *args: streams.append(path.name) or real_iter_records(path, *args))
+        monkeypatch.setattr(legislative_corpus, 'DATA_DIR', data_dir)
+
+        by_mp = fair_scoring.load_proposals_by_mp(data_dir / "law_proposals_28.json")
+        fair_scoring.load_questions_by_mp(data_dir / "written_questions_28.json")
+        first_sig, support_sig = update_all_mp_metrics.load_law_proposal_counts()
+        update_all_mp_metrics.load_law_proposal_ids()
+        update_all_mp_metrics.load_question_counts()
+
+        assert len(loads) == 1
+        assert streams == ["law_proposals_28.json", "written_questions_28.json"]
+        assert set(by_mp) == set(first_sig) | set(support_sig)
+
+    def test_file_lookup_reuses_directory_corpus(self, data_dir, tmp_path):
+        """A default-named file maps to its directory's corpus; other names get their own."""
+        corpus = get_corpus(data_dir)
+        assert get_corpus_for_file('law_proposals', data_dir / "law_proposals_28.json") is corpus
+
+        other = tmp_path / "other.json"
+        other.write_text(json.dumps(PROPOSALS[1:]), encoding='utf-8')
+        assert get_corpus_for_file('law_proposals', other).proposals.first_signature == {'MURAT EMIR': 1}
@@ -0,0 +1,170 @@
+"""
+Local Store Tests
+
+Tests for the offline SQLite/in-memory storage backend and backend selection.
+"""
+
+import pytest
+import sys
+import os
+from datetime import datetime, timedelta
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.storage_config import SERVER_TIMESTAMP, StorageConfig, get_storage_client
+from services.local_store import DocumentNotFoundError, LocalStore
+
+
+@pytest.fixture
+def store():
+    store = LocalStore(':memory:')
+    yield store
+    store.close()
+
+
+class TestLocalStoreDocuments:
+    """Tests for document CRUD."""
+
+    def test_set_get_roundtrip_with_datetime(self, store):
+        """Documents keep nested values and datetimes."""
+        now = datetime(2024, 5, 1, 12, 30)
+        store.collection('mps').document('mv_1').set({'name': 'A', 'meta': {'at': now}, 'tags': [1, 2]})
+
+        doc = store.collection('mps').document('mv_1').get()
+        assert doc.exists
+        assert doc.id == 'mv_1'
+        assert doc.to_dict() == {'name': 'A', 'meta': {'at': now}, 'tags': [1, 2]}
+        assert not store.collection('mps').document('missing').get().exists
+
+    def test_update_merge_and_delete(self, store):
+        """update() edits fields (dotted paths too) and fails on missing docs."""
+        ref = store.collection('mps').document('mv_1')
+        ref.set({'score': 1, 'meta': {'a': 1}})
+        ref.update({'score': 2, 'meta.b': 3})
+        ref.set({'party': 'CHP', 'meta': {'c': 4}}, merge=True)
+
+        assert ref.get().to_dict() == {'score': 2, 'party': 'CHP', 'meta': {'a': 1, 'b': 3, 'c': 4}}
+
+        ref.delete()
+        with pytest.raises(DocumentNotFoundError):
+            ref.update({'score': 3})
+
+    def test_add_and_server_timestamp(self, store):
+        """add() generates an id; SERVER_TIMESTAMP becomes a local datetime."""
+        _, ref = store.collection('logs').add({'message': 'x', 'timestamp': SERVER_TIMESTAMP})
+        data = ref.get().to_dict()
+
+        assert ref.id
+        assert isinstance(data['timestamp'], datetime)
+
+
+class TestLocalStoreQueries:
+    """Tests for where/order_by/limit/select."""
+
+    def _seed(self, store):
+        base = datetime(2024, 1, 1)
+        for i in range(6):
+            store.collection('news_analysis').add({
+                'mp_id': 'mv_1' if i % 2 == 0 else 'mv_2',
+                'created_at': base + timedelta(days=i),
+                'score': i,
+            })
+
+    def test_where_mp_id_order_by_created_at(self, store):
+        """The news-by-MP query returns newest first and honours limit."""
+        self._seed(store)
+        docs = (store.collection('news_analysis')
+                .where('mp_id', '==', 'mv_1')
+                .order_by('created_at', direction='DESCENDING')
+                .limit(2)
+                .stream())
+
+        assert [doc.to_dict()['score'] for doc in docs] == [4, 2]
+
+    def test_range_in_and_select(self, store):
+        """Comparison and 'in' filters combine; select() projects fields."""
+        self._seed(store)
+        docs = (store.collection('news_analysis')
+                .where('score', '>=', 2)
+                .where('mp_id', 'in', ['mv_2'])
+                .order_by('score')
+                .select(['score'])
+                .get())
+
+        assert [doc.to_dict() for doc in docs] == [{'score': 3}, {'score': 5}]
+
+    def test_order_by_skips_missing_field(self, store):
+        """Like Firestore, documents without the order field are excluded."""
+        store.collection('logs').add({'level': 'INFO'})
+        store.collection('logs').add({'level': 'INFO', 'timestamp': datetime(2024, 1, 1)})
+
+        assert len(store.collection('logs').order_by('timestamp').get()) == 1
+
+
+class TestLocalStoreBatch:
+    """Tests for write batches."""
+
+    def test_batch_is_atomic(self, store):
+        """A failing operation rolls back the whole batch."""
+        batch = store.batch()
+        batch.set(store.collection('mps').document('mv_1'), {'score': 1})
+        batch.update(store.collection('mps').document('missing'), {'score': 2})
+
+        with pytest.raises(DocumentNotFoundError):
+            batch.commit()
+        assert not store.collection('mps').document('mv_1').get().exists
+
+    def test_batch_limit(self, store):
+        """Batches larger than 500 operations are rejected."""
+        batch = store.batch()
+        for i in range(501):
+            batch.set(store.collection('mps').document(f"mv_{i}"), {'i': i})
+
+        with pytest.raises(ValueError):
+            batch.commit()
+
+
+class TestStorageConfig:
+    """Tests for backend selection."""
+
+    def test_from_env(self, monkeypatch):
+        """STORAGE_BACKEND selects the backend; unknown names are rejected."""
+        monkeypatch.setenv('STORAGE_BACKEND', 'SQLite')
+        assert StorageConfig.from_env().backend == 'sqlite'
+        with pytest.raises(ValueError):
+            StorageConfig(backend='postgres')
+
+    def test_sqlite_client_persists(self, tmp_path):
+        """The sqlite backend reuses one client per file and persists data."""
+        config = StorageConfig(backend='sqlite', sqlite_path=str(tmp_path / 'store.db'))
+        client = get_storage_client(config)
+        assert get_storage_client(config) is client
+
+        client.collection('mps').document('mv_1').set({'name': 'A'})
+        reopened = LocalStore(config.resolved_sqlite_path())
+        assert reopened.collection('mps').document('mv_1').get().to_dict() == {'name': 'A'}
+        reopened.close()
+
+    def test_firestore_service_on_memory_backend(self, monkeypatch):
+        """FirestoreService runs end to end against the in-memory backend."""
+        from models.mp_models import MP, NewsAnalysis
+        from services.firestore_service import FirestoreService
+
+        monkeypatch.setattr('services.firestore_service.get_storage_client', lambda: LocalStore(':memory:'))
+        service = FirestoreService()
+
+        service.create_mp(MP(id='mv_1', name='Vekil 1', party='CHP', constituency='Ankara'))
+        assert service.update_mp_score('mv_1', 55.0, fingerprint='abc')
+        assert not service.update_mp_score('missing', 1.0)
+
+        service.batch_add_news_analysis([
+            NewsAnalysis(mp_id='mv_1', title=f"Haber {i}", url=f"https://x/{i}", sentiment_score=0.1,
+                         impact_score=5.0, created_at=datetime(2024, 1, 1) + timedelta(days=i))
+            for i in range(3)
+        ])
+
+        mp = service.get_mp_by_id('mv_1')
+        assert mp.current_score == 55.0
+        assert mp.scoring_fingerprint == 'abc'
+        assert [n.title for n in service.get_news_by_mp('mv_1', limit=2)] == ["Haber 2", "Haber 1"]
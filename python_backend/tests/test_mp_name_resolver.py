@@ -0,0 +1,173 @@
+"""
+MP Name Resolver Tests
+
+Tests for the indexed name -> static MP resolution shared by the corpus loaders.
+"""
+
+import pytest
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.legislative_corpus import parse_signatory_header, parse_submitter_header
+from services.legislative_corpus import get_corpus
+from services.mp_name_resolver import MPNameResolver, normalize_name, split_surname
+from services.static_mp_loader import StaticMP
+
+
+MPS = [
+    {'name': 'Özgür ÖZEL', 'party': 'CHP', 'city': 'MANİSA'},
+    {'name': 'Mustafa Sezgin TANRIKULU', 'party': 'CHP', 'city': 'İSTANBUL'},
+    {'name': 'Nermin YILDIRIM KARA', 'party': 'CHP', 'city': 'HATAY'},
+    {'name': 'Mustafa DEMİR', 'party': 'AK Parti', 'city': 'İSTANBUL'},
+    {'name': 'Mustafa DEMİR', 'party': 'AK Parti', 'city': 'KİLİS'},
+    {'name': 'Doğan DEMİR', 'party': 'AK Parti', 'city': 'İSTANBUL'},
+]
+
+
+@pytest.fixture
+def resolver():
+    return MPNameResolver(MPS)
+
+
+class TestNormalization:
+    """Tests for the translate-table name folding."""
+
+    def test_folds_turkish_and_circumflex(self):
+        assert normalize_name("Özgür  ÖZEL") == "OZGUR OZEL"
+        assert normalize_name("Seda KÂYA ÖSEN") == "SEDA KAYA OSEN"
+        assert normalize_name("KİLİS".title()) == "KILIS"  # 'İ' küçülünce kalan birleşik nokta
+
+    def test_split_surname(self):
+        assert split_surname("Nermin YILDIRIM KARA") == (['Nermin'], ['YILDIRIM', 'KARA'])
+        assert split_surname("Murat Emir") == (['Murat'], ['Emir'])
+
+
+class TestResolution:
+    """Tests for the resolution tiers."""
+
+    def test_exact_and_folded(self, resolver):
+        assert resolver.resolve("Özgür ÖZEL").city == 'MANİSA'
+        assert resolver.resolve("OZGUR OZEL").name == 'Özgür ÖZEL'
+        assert resolver.stats == {'exact': 1, 'folded': 1}
+
+    def test_given_name_prefix(self, resolver):
+        """A shortened given name still matches when it is unique."""
+        assert resolver.resolve("Mustafa TANRIKULU").name == 'Mustafa Sezgin TANRIKULU'
+
+    def test_surname_and_city(self, resolver):
+        assert resolver.resolve("KARA", "Hatay").name == 'Nermin YILDIRIM KARA'
+        assert resolver.resolve("KARA") is None
+
+    def test_namesakes_need_city(self, resolver):
+        """Two MPs with the same name resolve only with their constituency."""
+        assert resolver.resolve("Mustafa DEMİR") is None
+        assert resolver.resolve("Mustafa DEMİR", "Kilis").city == 'KİLİS'
+        assert resolver.resolve("MUSTAFA DEMIR", "İstanbul").city == 'İSTANBUL'
+        assert resolver.resolve("DEMİR", "İstanbul") is None
+
+    def test_namesakes_get_distinct_keys(self, resolver):
+        istanbul = resolver.resolve("Mustafa DEMİR", "İstanbul")
+        kilis = resolver.resolve("Mustafa DEMİR", "Kilis")
+        assert (istanbul.key, kilis.key) == ("MUSTAFA DEMIR (ISTANBUL)", "MUSTAFA DEMIR (KILIS)")
+        assert istanbul.id != kilis.id
+        assert resolver.canonical_key("Mustafa DEMİR") == "MUSTAFA DEMIR"  # şehirsiz: hiçbir vekile ait değil
+        assert resolver.document_key({'name': 'Mustafa DEMİR', 'constituency': 'Kilis'}) == kilis.key
+        assert resolver.resolve(kilis.key) is kilis
+
+    def test_real_namesakes(self):
+        """The two 'Mustafa DEMİR' entries in mps_static.json stay separate."""
+        from sync_firestore_mps import load_static_mps
+
+        resolver = MPNameResolver(get_corpus().static_mps)
+        istanbul = resolver.resolve("Mustafa DEMİR", "İSTANBUL")
+        kilis = resolver.resolve("Mustafa DEMİR", "KİLİS")
+        assert istanbul is not None and kilis is not None
+        assert istanbul.key != kilis.key and istanbul.id != kilis.id
+        # Resolver ID'leri benzersiz ve mps dokümanlarının ID'leriyle aynı
+        assert {mp.id for mp in resolver.mps} == {mp['id'] for mp in load_static_mps()}
+        assert len({mp.id for mp in resolver.mps}) == len(resolver.mps)
+
+    def test_memoized(self, resolver):
+        for _ in range(3):
+            resolver.resolve("Özgür ÖZEL")
+        assert sum(resolver.stats.values()) == 1
+
+    def test_stable_id_and_key(self, resolver):
+        mp = resolver.resolve("ozgur ozel")
+        assert mp.id == StaticMP(name='Özgür ÖZEL', party='CHP', city='MANİSA').id
+        assert resolver.canonical_key("Ozgur Ozel") == mp.key == "OZGUR OZEL"
+        assert resolver.canonical_key("Ali Veli") == "ALI VELI"
+
+    def test_resolve_record(self, resolver):
+        """Static records resolve by name and constituency, unknown ones fall back to the folded name."""
+        kilis = resolver.resolve_record({'name': 'Mustafa DEMİR', 'party': 'AK Parti', 'city': 'KİLİS'})
+        assert kilis.key == "MUSTAFA DEMIR (KILIS)"
+        assert resolver.resolve_record({'name': 'Özgür ÖZEL', 'city': 'MANİSA'}).key == "OZGUR OZEL"
+        unknown = resolver.resolve_record({'name': 'Ali  VELİ', 'party': 'CHP', 'city': 'ANKARA'})
+        assert (unknown.key, unknown.id) == ("ALI VELI", StaticMP(name='Ali VELİ', party='', city='').id)
+
+
+class TestNamesakeScores:
+    """The two real 'Mustafa DEMİR's keep their own activity and documents in the fair scorers."""
+
+    @pytest.fixture
+    def namesakes(self):
+        resolver = get_corpus().resolver
+        return {mp.key: mp for mp in resolver.mps if mp.key.startswith("MUSTAFA DEMIR (")}
+
+    def test_fair_activity_table(self):
+        from fair_scoring import build_fair_activity_table
+
+        corpus = get_corpus()
+        mps = [mp for mp in corpus.static_mps if mp['name'] == 'Mustafa DEMİR']
+        table = build_fair_activity_table(mps, corpus.proposals.by_mp, corpus.question_counts,
+                                          corpus.research_counts)
+        rows = {city: i for i, city in enumerate(mp['city'] for mp in mps)}
+        assert table.columns['first_signature'][rows['İSTANBUL']] == len(
+            corpus.proposals.by_mp["MUSTAFA DEMIR (ISTANBUL)"])
+        assert table.columns['question'][rows['KİLİS']] == corpus.question_counts["MUSTAFA DEMIR (KILIS)"] > 0
+
+    def test_update_fair_scores(self, monkeypatch, namesakes):
+        import update_fair_scores
+        from services.local_store import LocalStore
+
+        db = LocalStore(':memory:')
+        monkeypatch.setattr(update_fair_scores, 'init_firestore', lambda: db)
+        update_fair_scores.update_all_mps_with_fair_scoring()
+
+        docs = {mp.key: db.collection('mps').document(mp.id).get().to_dict() for mp in namesakes.values()}
+        assert docs["MUSTAFA DEMIR (KILIS)"]['question_count'] == get_corpus().question_counts["MUSTAFA DEMIR (KILIS)"]
+        assert docs["MUSTAFA DEMIR (ISTANBUL)"]['valid_proposals'] > 0
+        assert all(doc['impact_label'] != 'Ghost' for doc in docs.values())
+
+    def test_rebuild_mps_collection(self, monkeypatch, namesakes):
+        import rebuild_mps_collection
+        from services.local_store import LocalStore
+
+        db = LocalStore(':memory:')
+        monkeypatch.setattr(rebuild_mps_collection, 'init_firestore', lambda: db)
+        rebuild_mps_collection.clean_and_rebuild_mps()
+
+        resolver = get_corpus().resolver
+        for key, mp in namesakes.items():
+            doc = db.collection('mps').document(mp.id).get().to_dict()
+            assert doc['city'] == mp.city
+            # Yazılan seçim çevresi dokümanı tekrar aynı vekile eşler
+            assert resolver.document_key(doc) == key
+        kilis = db.collection('mps').document(namesakes["MUSTAFA DEMIR (KILIS)"].id).get().to_dict()
+        assert kilis['written_questions'] > 0
+
+
+class TestHeaderCities:
+    """Tests for constituency capture in corpus headers."""
+
+    def test_signatory_cities(self):
+        summary = "Manisa Milletvekili Özgür ÖZEL, Hatay Milletvekili Nermin YILDIRIM KARA ve 3 Milletvekili\nBaşlık"
+        assert parse_signatory_header(summary) == [('OZGUR OZEL', 'Manisa'), ('NERMIN YILDIRIM KARA', 'Hatay')]
+
+    def test_glued_question_subject(self):
+        """Question subjects glued to the submitter's name are split off."""
+        assert parse_submitter_header("İSTANBUL Milletvekili ORHAN SÜMERKamu kurumlarına") == ('ORHAN SUMER', 'İSTANBUL')
@@ -0,0 +1,104 @@
+"""
+Network Profile Tests
+
+Tests for request interception: which requests are aborted and how blocking is reported.
+"""
+
+import pytest
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.scraper_config import ScraperConfig
+from services.network_profile import NetworkProfile, is_tracker
+
+
+class FakeRequest:
+    def __init__(self, resource_type, url, frame):
+        self.resource_type = resource_type
+        self.url = url
+        self.frame = frame
+
+
+class FakeRoute:
+    def __init__(self, request):
+        self.request = request
+        self.outcome = None
+
+    def continue_(self):
+        self.outcome = 'continue'
+
+    def abort(self):
+        self.outcome = 'abort'
+
+
+class FakeContext:
+    def route(self, pattern, handler):
+        self.handler = handler
+
+
+class FakePage:
+    main_frame = 'main'
+
+    def on(self, event, handler):
+        self.on_load = handler
+
+
+def load(context, page, clock, requests, seconds):
+    """Route a page load's requests through the profile and fire its load event."""
+    routes = []
+    for resource_type, url, frame in requests:
+        routes.append(FakeRoute(FakeRequest(resource_type, url, frame)))
+        context.handler(routes[-1])
+    clock.now += seconds
+    page.on_load(page)
+    return [route.outcome for route in routes]
+
+
+class TestBlockReason:
+    """Tests for the blocking decision."""
+
+    def test_types_trackers_and_allow(self):
+        profile = NetworkProfile(('image', 'font'), block_trackers=True)
+        assert profile.block_reason('image', 'https://www.tbmm.gov.tr/a.jpg') == 'image'
+        assert profile.block_reason('image', 'https://www.tbmm.gov.tr/a.jpg', allow=('image',)) is None
+        assert profile.block_reason('script', 'https://www.googletagmanager.com/gtm.js') == 'tracker'
+        assert profile.block_reason('script', 'https://www.tbmm.gov.tr/app.js') is None
+        assert profile.block_reason('document', 'https://www.tbmm.gov.tr/') is None
+
+    def test_tracker_host_suffix(self):
+        assert is_tracker('https://region1.google-analytics.com/g/collect')
+        assert not is_tracker('https://notgoogle-analytics.com/')
+
+    def test_from_config(self):
+        assert NetworkProfile.from_config(ScraperConfig(block_resource_types=(), block_trackers=False)) is None
+        profile = NetworkProfile.from_config(ScraperConfig())
+        assert profile.block_types == {'image', 'media', 'font'}
+
+
+class TestPageStats:
+    """Tests for per-page counting and the summary line."""
+
+    def test_counts_and_timing(self, clock):
+        profile = NetworkProfile(('image',), block_trackers=True, baseline_ms=900, clock=clock)
+        context, page = FakeContext(), FakePage()
+        profile.attach(context, page)
+
+        outcomes = load(context, page, clock, [
+            ('document', 'https://www.tbmm.gov.tr/milletvekili/liste', 'main'),
+            ('image', 'https://www.tbmm.gov.tr/foto.jpg', 'main'),
+            ('script', 'https://www.google-analytics.com/analytics.js', 'main'),
+            ('xhr', 'https://www.tbmm.gov.tr/api', 'main'),
+        ], seconds=0.4)
+        load(context, page, clock, [
+            ('document', 'https://www.tbmm.gov.tr/milletvekili/2', 'main'),
+            ('document', 'https://www.tbmm.gov.tr/iframe', 'child'),
+        ], seconds=0.2)
+
+        assert outcomes == ['continue', 'abort', 'abort', 'continue']
+        assert [p.blocked_total for p in profile.pages] == [2, 0]
+        assert profile.pages[0].blocked == {'image': 1, 'tracker': 1}
+        assert profile.average_load_ms() == pytest.approx(300)
+        assert profile.summary().endswith("ortalama yükleme 300 ms/sayfa (kazanç 600 ms/sayfa)")
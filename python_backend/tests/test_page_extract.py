@@ -0,0 +1,76 @@
+"""
+Page Extract Tests
+
+Tests for single-evaluate table and card extraction used by the Playwright scrapers.
+"""
+
+import pytest
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.commission_scraper import CommissionScraper
+from services.page_extract import extract_cards, extract_table_rows
+
+
+class FakePage:
+    """Answers evaluate() from canned results; per-element queries are not allowed."""
+
+    def __init__(self, rows=None, cards=None):
+        self.rows = rows or []
+        self.cards = cards or []
+        self.calls = []
+
+    def goto(self, *args, **kwargs):
+        pass
+
+    def evaluate(self, script, arg):
+        self.calls.append(arg)
+        return self.cards if isinstance(arg, list) else self.rows
+
+    def query_selector_all(self, selector):
+        raise AssertionError("per-element query")
+
+
+class TestExtract:
+    """Tests for the extraction helpers."""
+
+    def test_table_rows_single_call(self):
+        page = FakePage(rows=[['28', '2/1'], ['28', '2/2']])
+        assert extract_table_rows(page) == [['28', '2/1'], ['28', '2/2']]
+        assert page.calls == ['table tbody tr']
+
+    def test_cards_pass_field_selectors(self):
+        page = FakePage(cards=[{'name': 'ALİ VELİ', 'role': None}])
+        assert extract_cards(page, '.card', {'name': 'h5', 'role': 'small'}) == [{'name': 'ALİ VELİ', 'role': None}]
+        assert page.calls == [['.card', {'name': 'h5', 'role': 'small'}]]
+
+
+class TestCommissionMembers:
+    """Tests for commission member parsing from extracted rows and cards."""
+
+    @pytest.fixture(autouse=True)
+    def controller(self, fast_controller):
+        self.fast_controller = fast_controller
+
+    def fetch(self, page):
+        scraper = CommissionScraper()
+        scraper.page = page
+        scraper.rate_controller = self.fast_controller
+        return scraper.fetch_commission_members("Adalet Komisyonu", "adalet-komisyonu")
+
+    def test_table_rows(self):
+        page = FakePage(rows=[['BAŞKAN', 'ALİ VELİ'], ['ÜYE', ''], ['ÜYE']])
+        members = self.fetch(page)
+
+        assert [(m.role, m.name) for m in members] == [('BAŞKAN', 'ALİ VELİ')]
+        assert len(page.calls) == 1
+
+    def test_card_fallback(self):
+        page = FakePage(cards=[{'name': 'AYŞE YILMAZ', 'role': None}, {'name': None, 'role': 'SÖZCÜ'}])
+        members = self.fetch(page)
+
+        assert [(m.role, m.name) for m in members] == [('ÜYE', 'AYŞE YILMAZ')]
+        assert len(page.calls) == 2
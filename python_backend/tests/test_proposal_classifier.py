@@ -0,0 +1,82 @@
+"""
+Proposal Classifier Tests
+
+Tests for the compiled procedural/omnibus proposal classifier.
+"""
+
+import pytest
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fair_scoring import (
+    PROPOSAL_CATEGORY_FIELD, PROPOSAL_OMNIBUS, PROPOSAL_PROCEDURAL, PROPOSAL_REGULAR,
+    ProposalClassifier, calculate_fair_score, fold_turkish, is_omnibus_proposal, is_procedural_proposal,
+)
+
+
+class TestFoldTurkish:
+    """Tests for Turkish-aware case folding."""
+
+    def test_dotted_and_dotless_i(self):
+        """İ/I/ı/i and the other Turkish letters fold to the same ASCII text."""
+        assert fold_turkish("IĞDIR İLİŞKİN Şırnak Çöğüş") == "igdir iliskin sirnak cogus"
+        assert fold_turkish("ONAYLANMASININ") == fold_turkish("onaylanmasının")
+
+
+class TestProposalClassifier:
+    """Tests for single-pass classification and caching."""
+
+    def test_categories(self):
+        """Procedural wins over omnibus; matching ignores Turkish casing."""
+        classifier = ProposalClassifier()
+
+        assert classifier.classify_text("... Anlaşmasının Onaylanmasının Uygun Bulunduğuna Dair Kanun Teklifi") \
+            == PROPOSAL_PROCEDURAL
+        assert classifier.classify_text("BAZI KANUNLARDA DEĞİŞİKLİK YAPILMASINA DAİR KANUN TEKLİFİ") \
+            == PROPOSAL_OMNIBUS
+        assert classifier.classify_text(
+            "Değişiklik Yapılmasına Dair ... Protokolün Onaylanması") == PROPOSAL_PROCEDURAL
+        assert classifier.classify_text("Asgari Ücret Tespit Komisyonu Kanun Teklifi") == PROPOSAL_REGULAR
+        assert classifier.classify_text("") == PROPOSAL_REGULAR
+
+    def test_wrappers_keep_old_semantics(self):
+        """is_procedural/is_omnibus behave as before for the default keywords."""
+        assert is_procedural_proposal("Mutabakat Zaptının ... mutabakat zaptı")
+        assert is_omnibus_proposal("Çeşitli Kanunlarda Değişiklik")
+        assert not is_omnibus_proposal("Sözleşmenin Onaylanması ve Bazı Kanunlarda Değişiklik")
+
+    def test_configurable_keywords(self):
+        """Custom keyword lists replace the defaults."""
+        classifier = ProposalClassifier(procedural_keywords=["İç Tüzük"], omnibus_keywords=[])
+
+        assert classifier.classify_text("İÇ TÜZÜK değişikliği") == PROPOSAL_PROCEDURAL
+        assert classifier.classify_text("Bazı Kanunlarda Değişiklik") == PROPOSAL_REGULAR
+
+    def test_classified_once_per_esas_no(self):
+        """Records are annotated and reclassification hits the esas_no cache."""
+        classifier = ProposalClassifier()
+        record = {'esas_no': '2/1', 'period': '28', 'summary': "Mutabakat Zaptı"}
+        copy = dict(record)
+
+        assert classifier.classify(record) == PROPOSAL_PROCEDURAL
+        assert record[PROPOSAL_CATEGORY_FIELD] == PROPOSAL_PROCEDURAL
+
+        classifier.classify_text = None  # any further text scan would fail
+        assert classifier.classify(copy) == PROPOSAL_PROCEDURAL
+        assert classifier.classify_corpus([record, copy]) == {PROPOSAL_PROCEDURAL: 2}
+
+    def test_fair_score_counts(self):
+        """calculate_fair_score uses the classifier for treaty/omnibus counts."""
+        proposals = [
+            {'esas_no': '2/10', 'summary': "Anlaşmanın Onaylanması"},
+            {'esas_no': '2/11', 'summary': "Bazı Kanunlarda Değişiklik"},
+            {'esas_no': '2/12', 'summary': "Hayvan Hakları Kanun Teklifi"},
+        ]
+        result = calculate_fair_score("TEST VEKIL", "CHP", proposals)
+
+        assert result.treaty_count == 1
+        assert result.omnibus_count == 1
+        assert result.valid_proposals == 2
@@ -0,0 +1,315 @@
+"""
+Rate Limiter Tests
+
+Tests for the adaptive per-host rate controller, event-driven waits and parallel MP
+detail fetching that relies on them.
+"""
+
+import asyncio
+import threading
+from contextlib import contextmanager
+import pytest
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from playwright.sync_api import TimeoutError as PlaywrightTimeout
+
+from config.scraper_config import ScraperConfig
+from services import browser_pool
+from services.rate_limiter import RateController, click_and_wait_for_change, navigate
+from services.tbmm_scraper import TBMMMember, TBMMPlaywrightScraper
+
+
+def make_controller(clock, initial=2.0, min_rate=0.2, max_rate=10.0, burst=2):
+    return RateController(initial, min_rate, max_rate, burst=burst, slow_latency=5.0,
+                          clock=clock, sleep=clock.sleep)
+
+
+class TestTokenBucket:
+    """Tests for per-host token buckets."""
+
+    def test_burst_then_rate(self, clock):
+        controller = make_controller(clock)
+
+        delays = [controller.wait('https://www.tbmm.gov.tr/a') for _ in range(4)]
+        # Burst sonrası her istek 1/rate aralıkla (saat beklemeyle ilerler)
+        assert delays == [0.0, 0.0, 0.5, 0.5]
+        assert controller.wait('https://tr.wikipedia.org/x') == 0.0
+
+        clock.now += 10
+        assert controller.wait('https://WWW.tbmm.gov.tr/b') == 0.0
+
+    def test_from_config(self):
+        controller = RateController.from_config(ScraperConfig(rate_limit_wait=0.5, rate_limit_min_wait=0.1,
+                                                              rate_limit_max_wait=4.0))
+        assert (controller.initial_rate, controller.min_rate, controller.max_rate) == (2.0, 0.25, 10.0)
+
+
+class TestAIMD:
+    """Tests for additive increase and multiplicative decrease."""
+
+    def test_increase_on_fast_success_decrease_on_error(self, clock):
+        controller = make_controller(clock)
+        url = 'https://www.tbmm.gov.tr/a'
+
+        for _ in range(4):
+            controller.record(url, latency=0.3)
+        assert controller.rate(url) == pytest.approx(3.0)
+
+        controller.record(url, latency=0.3, ok=False)
+        assert controller.rate(url) == pytest.approx(1.5)
+        controller.record(url, latency=8.0)
+        assert controller.rate(url) == pytest.approx(0.75)
+
+    def test_bounds(self, clock):
+        controller = make_controller(clock, max_rate=2.5)
+        url = 'https://www.tbmm.gov.tr/a'
+        for _ in range(10):
+            controller.record(url, latency=0.1)
+        assert controller.rate(url) == 2.5
+        for _ in range(10):
+            controller.record(url, latency=0.1, ok=False)
+        assert controller.rate(url) == 0.2
+
+
+class FakeResponse:
+    def __init__(self, status):
+        self.status = status
+
+
+class FakeNavPage:
+    url = 'https://www.tbmm.gov.tr/liste'
+
+    def __init__(self, status=200, changes=True):
+        self.status = status
+        self.changes = changes
+        self.calls = []
+
+    def goto(self, url, **kwargs):
+        self.calls.append(('goto', url, kwargs))
+        return FakeResponse(self.status)
+
+    def wait_for_selector(self, selector, **kwargs):
+        self.calls.append(('selector', selector))
+
+    def evaluate(self, script, arg):
+        return 'ilk satır'
+
+    def wait_for_function(self, script, arg, **kwargs):
+        self.calls.append(('changed', arg))
+        if not self.changes:
+            raise TimeoutError("timeout")
+
+
+class FakeButton:
+    def __init__(self, page):
+        self.page = page
+
+    def click(self):
+        self.page.calls.append(('click',))
+
+
+class TestEventWaits:
+    """Tests for navigation and pagination waits feeding the controller."""
+
+    def test_navigate_waits_for_selector_and_records(self, clock):
+        controller = make_controller(clock)
+        page = FakeNavPage()
+
+        navigate(page, 'https://www.tbmm.gov.tr/a', controller, ready_selector='table tbody tr', timeout=1000)
+
+        assert page.calls == [('goto', 'https://www.tbmm.gov.tr/a', {'wait_until': 'domcontentloaded',
+                                                                      'timeout': 1000}),
+                              ('selector', 'table tbody tr')]
+        assert controller.rate('https://www.tbmm.gov.tr/a') == pytest.approx(2.25)
+
+    def test_throttled_response_slows_down(self, clock):
+        controller = make_controller(clock)
+        navigate(FakeNavPage(status=503), 'https://www.tbmm.gov.tr/a', controller)
+        assert controller.rate('https://www.tbmm.gov.tr/a') == pytest.approx(1.0)
+
+    def test_click_waits_for_table_change(self, clock):
+        controller = make_controller(clock)
+        page = FakeNavPage()
+
+        click_and_wait_for_change(page, FakeButton(page), controller=controller)
+        assert page.calls == [('click',), ('changed', ['table tbody tr', 'ilk satır'])]
+
+        page = FakeNavPage(changes=False)
+        with pytest.raises(TimeoutError):
+            click_and_wait_for_change(page, FakeButton(page), controller=controller)
+        assert controller.rate(page.url) == pytest.approx(1.125)
+
+
+class FakeListPage:
+    """MP list page that grows twice while scrolling, then stops."""
+
+    def __init__(self):
+        self.height = 1000
+        self.growths = 2
+        self.calls = []
+
+    def goto(self, url, **kwargs):
+        self.calls.append('goto')
+        return FakeResponse(200)
+
+    def click(self, selector, **kwargs):
+        self.calls.append('click')
+
+    def wait_for_load_state(self, state):
+        pass
+
+    def evaluate(self, script, arg=None):
+        if script == 'document.body.scrollHeight':
+            return self.height
+        if 'scrollTo' in script:
+            return None
+        return ['Özgür ÖZEL', 'Nermin YILDIRIM KARA']
+
+    def wait_for_function(self, script, arg, timeout):
+        if not self.growths:
+            raise PlaywrightTimeout("Timeout exceeded")
+        self.growths -= 1
+        self.height += 500
+        self.calls.append('grew')
+
+
+class FakeListPool:
+    def __init__(self, page):
+        self._page = page
+
+    @contextmanager
+    def page(self):
+        yield self._page
+
+
+class TestListScrollWaits:
+    """Tests for the name list scraper waiting on page growth instead of sleeping."""
+
+    def test_scroll_until_no_growth(self, monkeypatch):
+        from services import mp_data_loader
+
+        page = FakeListPage()
+        monkeypatch.setattr(mp_data_loader, 'get_browser_pool', lambda: FakeListPool(page))
+
+        assert mp_data_loader.scrape_tbmm_names() == ['Özgür ÖZEL', 'Nermin YILDIRIM KARA']
+        assert page.calls == ['goto', 'click', 'grew', 'grew']
+
+
+class FakeDetailPage:
+    def __init__(self, browser):
+        self.browser = browser
+
+    def set_default_timeout(self, timeout):
+        self.timeout = timeout
+
+    def on(self, event, handler):
+        pass
+
+    async def goto(self, url, **kwargs):
+        self.url = url
+        self.browser.in_flight += 1
+        self.browser.peak = max(self.browser.peak, self.browser.in_flight)
+        await asyncio.sleep(0)
+        self.browser.in_flight -= 1
+
+    async def evaluate(self, script):
+        self.browser.visits.append((threading.current_thread().name, self.url))
+        if self.url.endswith('/3'):
+            raise RuntimeError("timeout")
+        number = int(self.url.rsplit('/', 1)[1])
+        return {'party': 'chp', 'city': f'KONYA {number}', 'profile_image': None, 'law_proposals': number}
+
+
+class FakeAsyncContext:
+    def __init__(self, browser):
+        self.browser = browser
+
+    async def route(self, pattern, handler):
+        self.browser.routes += 1
+
+    async def new_page(self):
+        self.browser.pages += 1
+        return FakeDetailPage(self.browser)
+
+
+class FakeAsyncBrowser:
+    def __init__(self):
+        self.pages = self.routes = self.in_flight = self.peak = 0
+        self.visits = []
+        self.closed = False
+
+    async def new_context(self):
+        return FakeAsyncContext(self)
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeAsyncPlaywright:
+    """Stands in for playwright.async_api.async_playwright(); records every launch."""
+
+    def __init__(self):
+        self.launches = []
+        self.chromium = self
+
+    def __call__(self):
+        return self
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+    async def launch(self, headless=True):
+        browser = FakeAsyncBrowser()
+        self.launches.append(browser)
+        return browser
+
+
+class TestParallelDetails:
+    """Tests for spreading detail pages over one shared browser and merging in order."""
+
+    def make_members(self):
+        return [TBMMMember(name=f'VEKİL {i}', party='', city='',
+                           detail_url=f'https://www.tbmm.gov.tr/milletvekili/{i}' if i != 5 else None)
+                for i in range(8)]
+
+    def test_results_merged_in_list_order(self, monkeypatch, fast_controller):
+        playwright = FakeAsyncPlaywright()
+        monkeypatch.setattr(browser_pool, 'async_playwright', playwright)
+
+        scraper = TBMMPlaywrightScraper()
+        scraper.rate_controller = fast_controller
+        members = self.make_members()
+
+        scraper._fetch_details_parallel(members, workers=3)
+
+        assert [m.law_proposals for m in members] == [0, 1, 2, 0, 4, 0, 6, 7]
+        assert members[2].city == 'Konya 2' and members[2].party == 'CHP'
+        assert members[3].city == ''
+
+        assert len(playwright.launches) == 1
+        browser = playwright.launches[0]
+        assert browser.pages == 3 and browser.routes == 3 and browser.closed
+        assert browser.peak == 3
+        assert len(browser.visits) == 7
+        assert {name for name, _ in browser.visits} == {'async-pages'}
+
+    def test_pages_capped_by_browser_max_pages(self, monkeypatch, fast_controller):
+        playwright = FakeAsyncPlaywright()
+        monkeypatch.setattr(browser_pool, 'async_playwright', playwright)
+
+        scraper = TBMMPlaywrightScraper(ScraperConfig(browser_max_pages=2))
+        scraper.rate_controller = fast_controller
+        members = self.make_members()
+
+        scraper._fetch_details_parallel(members, workers=8)
+
+        assert len(playwright.launches) == 1
+        assert playwright.launches[0].pages == 2
+        assert [m.law_proposals for m in members] == [0, 1, 2, 0, 4, 0, 6, 7]
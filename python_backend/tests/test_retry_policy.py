@@ -0,0 +1,190 @@
+"""
+Retry Policy Tests
+
+Tests for retryable-error classification, backoff retries, the per-host circuit breaker
+and retried pagination that must not skip pages.
+"""
+
+import pytest
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import requests
+from playwright.sync_api import Error as PlaywrightError, TimeoutError as PlaywrightTimeout
+
+from config.scraper_config import ScraperConfig
+from services.retry_policy import (
+    CircuitBreaker, RetryPolicy, ThrottledResponse, is_retryable, retry_navigate, retry_next_page
+)
+
+URL = 'https://www.tbmm.gov.tr/Yasama/Kanun-Teklifleri'
+
+
+def make_policy(clock, max_retries=3, threshold=5):
+    breaker = CircuitBreaker(threshold, reset_timeout=60.0, clock=clock, sleep=clock.sleep)
+    return RetryPolicy(max_retries, delay=1.0, multiplier=2.0, max_delay=30.0, breaker=breaker,
+                       sleep=clock.sleep)
+
+
+def http_error(status):
+    response = requests.Response()
+    response.status_code = status
+    return requests.HTTPError(response=response)
+
+
+class Flaky:
+    """Fails with the given errors, then returns 'ok'."""
+
+    def __init__(self, *errors):
+        self.errors = list(errors)
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return 'ok'
+
+
+class TestClassification:
+    """Tests for which errors are retried."""
+
+    def test_transient_errors(self):
+        assert is_retryable(PlaywrightTimeout("Timeout 30000ms exceeded"))
+        assert is_retryable(PlaywrightError("net::ERR_CONNECTION_RESET at https://www.tbmm.gov.tr"))
+        assert is_retryable(ThrottledResponse(URL, 503))
+        assert is_retryable(requests.ConnectionError())
+        assert is_retryable(http_error(429))
+        assert is_retryable(http_error(502))
+
+    def test_permanent_errors(self):
+        assert not is_retryable(http_error(404))
+        assert not is_retryable(PlaywrightError("Target page, context or browser has been closed"))
+        assert not is_retryable(ValueError("bad row"))
+
+
+class TestRetryPolicy:
+    """Tests for jittered exponential backoff."""
+
+    def test_retries_transient_error_with_growing_backoff(self, clock):
+        policy = make_policy(clock)
+        fn = Flaky(PlaywrightTimeout("t"), PlaywrightTimeout("t"), PlaywrightTimeout("t"))
+
+        assert policy.call(URL, fn) == 'ok'
+        assert fn.calls == 4
+        # 1, 2, 4 sn taban bekleme + [0, 1) sn jitter
+        for slept, base in zip(clock.slept, [1.0, 2.0, 4.0]):
+            assert base <= slept < base + 1.0
+
+    def test_gives_up_after_max_retries(self, clock):
+        policy = make_policy(clock, max_retries=2)
+        fn = Flaky(*[PlaywrightTimeout("t")] * 5)
+
+        with pytest.raises(PlaywrightTimeout):
+            policy.call(URL, fn)
+        assert fn.calls == 3
+
+    def test_permanent_error_not_retried(self, clock):
+        fn = Flaky(ValueError("bad row"))
+        with pytest.raises(ValueError):
+            make_policy(clock).call(URL, fn)
+        assert fn.calls == 1 and clock.slept == []
+
+    def test_from_config(self):
+        config = ScraperConfig(max_retries=5, retry_delay=0.5, retry_backoff_multiplier=3.0, retry_max_delay=10.0)
+        policy = RetryPolicy.from_config(config, breaker=CircuitBreaker())
+        assert (policy.max_retries, policy.delay, policy.multiplier, policy.max_delay) == (5, 0.5, 3.0, 10.0)
+
+
+class TestCircuitBreaker:
+    """Tests for pausing a host after consecutive failures."""
+
+    def test_opens_after_threshold_and_pauses_other_callers(self, clock):
+        policy = make_policy(clock, max_retries=0, threshold=2)
+
+        for _ in range(2):
+            with pytest.raises(PlaywrightTimeout):
+                policy.call(URL, Flaky(PlaywrightTimeout("t")))
+        assert policy.breaker.is_open(URL)
+        assert not policy.breaker.is_open('https://tr.wikipedia.org/wiki/TBMM')
+
+        # Aynı devre kesiciyi paylaşan başka bir politika da bekler
+        other = RetryPolicy(max_retries=0, breaker=policy.breaker, sleep=clock.sleep)
+        clock.slept.clear()
+        assert other.call(URL, Flaky()) == 'ok'
+        assert clock.slept == [60.0]
+        assert not policy.breaker.is_open(URL)
+
+    def test_failed_probe_reopens(self, clock):
+        breaker = CircuitBreaker(2, reset_timeout=60.0, clock=clock, sleep=clock.sleep)
+        breaker.record_failure(URL)
+        breaker.record_failure(URL)
+        clock.now += 60
+        assert not breaker.is_open(URL)
+
+        breaker.record_failure(URL)
+        assert breaker.is_open(URL)
+
+    def test_success_resets_count(self, clock):
+        breaker = CircuitBreaker(2, reset_timeout=60.0, clock=clock, sleep=clock.sleep)
+        breaker.record_failure(URL)
+        breaker.record_success(URL)
+        breaker.record_failure(URL)
+        assert not breaker.is_open(URL)
+
+
+class FakeResponse:
+    def __init__(self, status):
+        self.status = status
+
+
+class FakeTablePage:
+    """A result table whose 'next' click lands late on the first attempt."""
+
+    url = URL
+
+    def __init__(self, statuses=(200,), late_clicks=0):
+        self.statuses = list(statuses)
+        self.late_clicks = late_clicks
+        self.current = 0
+        self.clicks = 0
+
+    def goto(self, url, **kwargs):
+        return FakeResponse(self.statuses.pop(0))
+
+    def evaluate(self, script, selector):
+        return f"satır {self.current}"
+
+    def query_selector(self, selector):
+        return self if self.current < 2 else None
+
+    def click(self):
+        self.clicks += 1
+        self.current += 1
+
+    def wait_for_function(self, script, arg, **kwargs):
+        if self.late_clicks:
+            self.late_clicks -= 1
+            raise PlaywrightTimeout("Timeout 30000ms exceeded")
+
+
+class TestPageHelpers:
+    """Tests for retried navigation and pagination."""
+
+    def test_navigate_retries_server_errors(self, clock, fast_controller):
+        page = FakeTablePage(statuses=[503, 200])
+        response = retry_navigate(page, URL, fast_controller, make_policy(clock))
+        assert response.status == 200 and len(clock.slept) == 1
+
+    def test_next_page_not_clicked_twice(self, clock, fast_controller):
+        page = FakeTablePage(late_clicks=1)
+
+        assert retry_next_page(page, '.next', fast_controller, make_policy(clock))
+        assert (page.current, page.clicks) == (1, 1)
+
+        assert retry_next_page(page, '.next', fast_controller, make_policy(clock))
+        assert not retry_next_page(page, '.next', fast_controller, make_policy(clock))
+        assert page.current == 2
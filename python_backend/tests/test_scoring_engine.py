@@ -199,5 +199,221 @@ class TestDryRunMode:
             assert engine2.dry_run is False
 
 
+def _make_engine_with_fakes(dry_run=True, pipeline_config=None, mp_count=6):
+    """Build a ScoringEngine whose services are deterministic fakes."""
+    from services.scoring_engine import ScoringEngine
+    from services.news_scraper import NewsItem
+    from services.gemini_analyzer import AnalysisResult
+    from models.mp_models import MP
+
+    with patch('services.scoring_engine.get_firestore_service'), \
+         patch('services.scoring_engine.get_news_scraper'), \
+         patch('services.scoring_engine.get_gemini_analyzer'):
+        engine = ScoringEngine(dry_run=dry_run, pipeline_config=pipeline_config)
+
+    mps = [
+        MP(id=f"mv_{i:03d}", name=f"Vekil {i}", party="CHP", law_proposals=i)
+        for i in range(mp_count)
+    ]
+    engine.firestore = MagicMock()
+    engine.firestore.get_all_mps.return_value = mps
+
+    engine.scraper = MagicMock()
+    engine.scraper.search_news_for_mp.side_effect = lambda mp_name, max_results: [
+        NewsItem(title=f"{mp_name} haber {j}", url=f"https://example.com/{mp_name}/{j}")
+        for j in range(max_results)
+    ]
+    engine.scraper.scrape_article_content.side_effect = lambda url: f"içerik {url}"
+
+    engine.analyzer = MagicMock()
+    engine.analyzer.analyze_news_impact.side_effect = lambda mp_name, news_title, news_content: AnalysisResult(
+        sentiment_score=0.1,
+        impact_score=float(len(news_title) % 10),
+        summary="özet",
+        keywords=[],
+        raw_response="{}",
+    )
+    return engine
+
+
+class TestConcurrentProcessing:
+    """Tests for the concurrent process_all_mps mode."""
+
+    def test_concurrent_results_match_serial(self):
+        """Concurrent run should return the same results, in the same order."""
+        from config.pipeline_config import PipelineConfig
+
+        serial = _make_engine_with_fakes().process_all_mps(max_news_per_mp=3)
+        concurrent = _make_engine_with_fakes(
+            pipeline_config=PipelineConfig(workers=4, scrape_concurrency=2)
+        ).process_all_mps(max_news_per_mp=3)
+
+        assert len(serial) == 6
+        assert serial == concurrent
+        assert all(r.success for r in concurrent)
+
+    def test_workers_argument_overrides_config(self):
+        """Explicit workers argument should enable the concurrent path."""
+        engine = _make_engine_with_fakes()
+
+        with patch.object(engine, '_process_concurrently', wraps=engine._process_concurrently) as spy:
+            results = engine.process_all_mps(max_news_per_mp=2, workers=3)
+
+        spy.assert_called_once()
+        assert [r.mp_id for r in results] == [f"mv_{i:03d}" for i in range(6)]
+
+    def test_concurrent_writes_every_mp(self):
+        """Non dry-run concurrent mode should persist every MP once."""
+        from config.pipeline_config import PipelineConfig
+
+        engine = _make_engine_with_fakes(
+            dry_run=False, pipeline_config=PipelineConfig(workers=3, write_concurrency=1)
+        )
+        engine.process_all_mps(max_news_per_mp=2)
+
+        assert engine.firestore.update_mp_score.call_count == 6
+        assert engine.firestore.add_news_analysis.call_count == 12
+
+
+class TestScoringPipeline:
+    """Tests for the staged producer/consumer pipeline."""
+
+    def test_pipeline_results_match_serial(self):
+        """Pipelined run should return the same results, in the same order."""
+        from config.pipeline_config import PipelineConfig
+
+        serial = _make_engine_with_fakes().process_all_mps(max_news_per_mp=3)
+        pipelined = _make_engine_with_fakes(
+            pipeline_config=PipelineConfig(pipelined=True, queue_size=1, scrape_concurrency=3)
+        ).process_all_mps(max_news_per_mp=3)
+
+        assert serial == pipelined
+
+    def test_pipeline_handles_mps_without_news(self):
+        """MPs with no news should still reach the persist stage."""
+        from config.pipeline_config import PipelineConfig
+
+        engine = _make_engine_with_fakes(pipeline_config=PipelineConfig(pipelined=True))
+        results = engine.process_all_mps(max_news_per_mp=0)
+
+        assert len(results) == 6
+        assert all(r.success and r.news_count == 0 for r in results)
+
+    def test_pipeline_isolates_stage_errors(self):
+        """A failing news search should only fail that MP."""
+        from config.pipeline_config import PipelineConfig
+
+        engine = _make_engine_with_fakes(pipeline_config=PipelineConfig(pipelined=True))
+        search = engine.scraper.search_news_for_mp.side_effect
+
+        def flaky_search(mp_name, max_results):
+            if mp_name == "Vekil 2":
+                raise RuntimeError("Google News erişilemedi")
+            return search(mp_name, max_results)
+
+        engine.scraper.search_news_for_mp.side_effect = flaky_search
+        results = engine.process_all_mps(max_news_per_mp=2)
+
+        assert [r.success for r in results] == [True, True, False, True, True, True]
+        assert results[2].error_message == "Google News erişilemedi"
+
+    @staticmethod
+    def _run_with_timeout(engine, **kwargs):
+        """Run process_all_mps in a thread so a deadlocked pipeline fails instead of hanging."""
+        import threading
+
+        results = []
+        thread = threading.Thread(
+            target=lambda: results.extend(engine.process_all_mps(**kwargs)), daemon=True
+        )
+        thread.start()
+        thread.join(timeout=10)
+        assert not thread.is_alive(), "pipeline did not finish"
+        return results
+
+    def test_pipeline_survives_raising_analysis_stage(self):
+        """An exception escaping the analysis handler fails only that MP; the run still finishes."""
+        from config.pipeline_config import PipelineConfig
+        from services.scoring_pipeline import ScoringPipeline
+
+        engine = _make_engine_with_fakes(
+            pipeline_config=PipelineConfig(
+                pipelined=True, queue_size=1,
+                news_concurrency=1, scrape_concurrency=1, analysis_concurrency=1, write_concurrency=1
+            ),
+        )
+        analysis_worker = ScoringPipeline._analysis_worker
+
+        def raising_worker(self, task):
+            job, _ = task
+            if job.mp.name == "Vekil 2":
+                raise RuntimeError("analiz çöktü")
+            analysis_worker(self, task)
+
+        with patch.object(ScoringPipeline, '_analysis_worker', raising_worker):
+            results = self._run_with_timeout(engine, max_news_per_mp=3)
+
+        assert [r.success for r in results] == [True, True, False, True, True, True]
+        assert results[2].error_message == "analiz çöktü"
+
+    def test_pipeline_survives_raising_admission(self):
+        """A scheduler admission error fails only that MP instead of killing the news worker."""
+        from config.pipeline_config import PipelineConfig
+
+        engine = _make_engine_with_fakes(
+            pipeline_config=PipelineConfig(pipelined=True, queue_size=1, news_concurrency=1)
+        )
+        admit = engine._admit
+
+        def flaky_admit(mp, max_news):
+            if mp.name == "Vekil 4":
+                raise RuntimeError("zamanlayıcı hatası")
+            return admit(mp, max_news)
+
+        engine._admit = flaky_admit
+        results = self._run_with_timeout(engine, max_news_per_mp=2)
+
+        assert [r.success for r in results] == [True, True, True, True, False, True]
+        assert results[4].error_message == "zamanlayıcı hatası"
+
+    def test_pipeline_bounds_in_flight_work(self):
+        """A slow analysis stage should throttle scraping through backpressure."""
+        import threading
+        import time
+        from config.pipeline_config import PipelineConfig
+
+        engine = _make_engine_with_fakes(
+            pipeline_config=PipelineConfig(
+                pipelined=True, queue_size=2,
+                news_concurrency=1, scrape_concurrency=1, analysis_concurrency=1
+            ),
+            mp_count=4,
+        )
+        lock = threading.Lock()
+        state = {'scraped': 0, 'analyzed': 0, 'max_gap': 0}
+        scrape = engine.scraper.scrape_article_content.side_effect
+        analyze = engine.analyzer.analyze_news_impact.side_effect
+
+        def counting_scrape(url):
+            with lock:
+                state['scraped'] += 1
+                state['max_gap'] = max(state['max_gap'], state['scraped'] - state['analyzed'])
+            return scrape(url)
+
+        def slow_analyze(**kwargs):
+            time.sleep(0.005)
+            with lock:
+                state['analyzed'] += 1
+            return analyze(**kwargs)
+
+        engine.scraper.scrape_article_content.side_effect = counting_scrape
+        engine.analyzer.analyze_news_impact.side_effect = slow_analyze
+        engine.process_all_mps(max_news_per_mp=5)
+
+        # queue (2) + one item in each of the scrape/analysis workers
+        assert state['max_gap'] <= 4
+        assert state['analyzed'] == 20
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
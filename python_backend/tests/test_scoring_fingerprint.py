@@ -0,0 +1,142 @@
+"""
+Scoring Fingerprint Tests
+
+Tests for input-fingerprint based incremental scoring.
+"""
+
+import pytest
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.scoring_fingerprint import compute_fingerprint, weights_version
+from tests.test_scoring_engine import _make_engine_with_fakes
+
+
+class TestComputeFingerprint:
+    """Tests for the fingerprint function."""
+
+    def test_order_independent(self):
+        """Input sets should hash the same regardless of order."""
+        a = compute_fingerprint('fair', 'v1', proposal_ids=['2/1', '2/2'], news_urls=['a', 'b'])
+        b = compute_fingerprint('fair', 'v1', proposal_ids=['2/2', '2/1'], news_urls=['b', 'a'])
+        assert a == b
+
+    @pytest.mark.parametrize("change", [
+        {'scorer': 'metrics'},
+        {'weights_ver': 'v2'},
+        {'proposal_ids': ['2/1', '2/3']},
+        {'question_count': 1},
+        {'research_count': 1},
+        {'commission_roles': ['ÜYE']},
+        {'news_urls': ['c']},
+    ])
+    def test_any_input_change_changes_fingerprint(self, change):
+        """Changing any scoring input should produce a new fingerprint."""
+        base = dict(scorer='fair', weights_ver='v1', proposal_ids=['2/1'], news_urls=['a'])
+        assert compute_fingerprint(**base) != compute_fingerprint(**{**base, **change})
+
+    def test_weights_version_tracks_values(self):
+        """Weights version should change when a weight changes."""
+        from fair_scoring import GOVERNMENT_WEIGHTS, OPPOSITION_WEIGHTS
+
+        assert weights_version(GOVERNMENT_WEIGHTS) == weights_version(GOVERNMENT_WEIGHTS)
+        assert weights_version(GOVERNMENT_WEIGHTS) != weights_version(OPPOSITION_WEIGHTS)
+
+
+class TestIncrementalScoring:
+    """Tests for skipping MPs whose inputs did not change."""
+
+    def _stored_fingerprints(self, engine):
+        """Run once and store fingerprints on the fake MPs."""
+        results = engine.process_all_mps(max_news_per_mp=2)
+        for mp, result in zip(engine.firestore.get_all_mps.return_value, results):
+            mp.scoring_fingerprint = result.fingerprint
+        return results
+
+    def test_engine_skips_unchanged_mps(self):
+        """Second run should not analyse or write MPs with matching fingerprints."""
+        engine = _make_engine_with_fakes(dry_run=False, mp_count=3)
+        self._stored_fingerprints(engine)
+        engine.analyzer.analyze_news_impact.reset_mock()
+        engine.firestore.update_mp_score.reset_mock()
+
+        results = engine.process_all_mps(max_news_per_mp=2)
+
+        assert all(r.skipped and r.success for r in results)
+        engine.analyzer.analyze_news_impact.assert_not_called()
+        engine.firestore.update_mp_score.assert_not_called()
+
+    def test_skipped_mps_are_marked_fresh(self, monkeypatch):
+        """A fingerprint hit refreshes only last_updated, so the scheduler stops treating the MP as stale."""
+        from datetime import datetime, timedelta
+        from models.mp_models import MP
+        from services.firestore_service import FirestoreService
+        from services.job_scheduler import _staleness_days
+        from services.local_store import LocalStore
+
+        store = LocalStore(':memory:')
+        monkeypatch.setattr('services.firestore_service.get_storage_client', lambda: store)
+        service = FirestoreService()
+        for i in range(2):
+            service.create_mp(MP(id=f"mv_{i:03d}", name=f"Vekil {i}", party="CHP", law_proposals=i))
+
+        engine = _make_engine_with_fakes(dry_run=False, mp_count=2)
+        engine.firestore = service
+        engine.process_all_mps(max_news_per_mp=2)
+
+        month_ago = datetime.now() - timedelta(days=30)
+        for mp in service.get_all_mps():
+            store.collection('mps').document(mp.id).update({'last_updated': month_ago})
+        before = {mp.id: mp.to_dict() for mp in service.get_all_mps()}
+
+        results = engine.process_all_mps(max_news_per_mp=2)
+
+        assert all(r.skipped for r in results)
+        now = datetime.now()
+        for mp in service.get_all_mps():
+            assert _staleness_days(mp, now) == 0
+            changed = {k for k, v in mp.to_dict().items() if before[mp.id][k] != v}
+            assert changed == {'last_updated'}
+
+    def test_dry_run_skip_writes_nothing(self):
+        """Dry runs do not refresh last_updated either."""
+        engine = _make_engine_with_fakes(mp_count=2)
+        self._stored_fingerprints(engine)
+
+        assert all(r.skipped for r in engine.process_all_mps(max_news_per_mp=2))
+        engine.firestore.update_mp.assert_not_called()
+
+    @pytest.mark.parametrize("pipelined", [False, True])
+    def test_engine_rescores_changed_mps(self, pipelined):
+        """An MP with new activity or forced runs should be rescored."""
+        from config.pipeline_config import PipelineConfig
+
+        engine = _make_engine_with_fakes(
+            mp_count=3, pipeline_config=PipelineConfig(pipelined=pipelined)
+        )
+        self._stored_fingerprints(engine)
+        engine.firestore.get_all_mps.return_value[1].law_proposals += 1
+
+        results = engine.process_all_mps(max_news_per_mp=2)
+        assert [r.skipped for r in results] == [True, False, True]
+
+        engine.force = True
+        assert not any(r.skipped for r in engine.process_all_mps(max_news_per_mp=2))
+
+    def test_calculate_scores_skips_unchanged(self):
+        """calculate_scores should only return MPs whose inputs changed."""
+        from update_all_mp_metrics import calculate_scores
+
+        first_sig = {'A': 1, 'B': 2}
+        ids = {'A': {'1'}, 'B': {'2', '3'}}
+        scores = calculate_scores(first_sig, {}, {}, {}, proposal_ids=ids)
+        previous = {name: metrics['scoring_fingerprint'] for name, (_, _, metrics) in scores.items()}
+
+        ids['B'] = {'2', '3', '4'}
+        first_sig['B'] = 3
+        changed = calculate_scores(first_sig, {}, {}, {}, proposal_ids=ids, previous_fingerprints=previous)
+
+        assert list(changed) == ['B']
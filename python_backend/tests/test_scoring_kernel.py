@@ -0,0 +1,134 @@
+"""
+Scoring Kernel Tests
+
+Tests that the vectorized kernel matches the scalar scoring formulas.
+"""
+
+import pytest
+import sys
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from services.scoring_kernel import ActivityTable, ScoringPolicy, evaluate_policies
+from services.legislative_corpus import get_mp_resolver
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+
+
+class TestActivityTable:
+    """Tests for the columnar activity table."""
+
+    def test_columns_from_mappings_arrays_and_scalars(self):
+        """Mappings, arrays and scalars should all become row-aligned columns."""
+        table = ActivityTable(
+            ['A', 'B', 'C'],
+            first_signature={'A': 2, 'C': 1},
+            question=[0, 3, 1],
+            news=5.0,
+        )
+        assert table.matrix.shape == (3, 6)
+        assert table.columns['first_signature'].tolist() == [2, 0, 1]
+        assert table.columns['news'].tolist() == [5.0, 5.0, 5.0]
+        assert table.columns['research'].tolist() == [0, 0, 0]
+
+    def test_rejects_unknown_column(self):
+        """Unknown column names should raise ValueError."""
+        with pytest.raises(ValueError):
+            ActivityTable(['A'], speeches=[1])
+
+    def test_empty_table(self):
+        """Evaluating an empty table should return empty arrays."""
+        result = ScoringPolicy.linear('p', question=1.0).evaluate(ActivityTable([]))
+        assert result.scores.shape == (0,)
+
+
+class TestPolicyEquivalence:
+    """The kernel must reproduce each scalar formula exactly."""
+
+    def test_engine_policy_matches_calculate_score(self):
+        """ScoringEngine.calculate_scores equals calculate_score/check_passivity per MP."""
+        from services.scoring_engine import ScoringEngine
+
+        with patch('services.scoring_engine.get_firestore_service'), \
+             patch('services.scoring_engine.get_news_scraper'), \
+             patch('services.scoring_engine.get_gemini_analyzer'):
+            engine = ScoringEngine(dry_run=True)
+
+        rng = np.random.default_rng(0)
+        counts = rng.integers(0, 6, size=(50, 4))
+        news = rng.uniform(1, 10, size=50).round(1)
+        table = ActivityTable(
+            [f"mp{i}" for i in range(50)],
+            first_signature=counts[:, 0], support_signature=counts[:, 1],
+            question=counts[:, 2], research=counts[:, 3], news=news,
+        )
+        result = engine.calculate_scores(table)
+
+        for i, (t_ilk, t_imza, s, a) in enumerate(counts.tolist()):
+            expected = engine.calculate_score(t_ilk, t_imza, s, a, float(news[i]))
+            assert result.scores[i] == pytest.approx(expected)
+            assert result.is_passive[i] == engine.check_passivity(t_ilk, s, a)
+
+    def test_fair_policy_matches_calculate_fair_score(self):
+        """FAIR_POLICY equals calculate_fair_score for every MP in the static data."""
+        import json
+        from fair_scoring import (
+            FAIR_POLICY, build_fair_activity_table, calculate_fair_score,
+            load_proposals_by_mp, load_questions_by_mp, load_research_by_mp,
+        )
+
+        proposals = load_proposals_by_mp(DATA_DIR / "law_proposals_28.json")
+        questions = load_questions_by_mp(DATA_DIR / "written_questions_28.json")
+        research = load_research_by_mp(DATA_DIR / "research_proposals_28.json")
+        with open(DATA_DIR / "mps_static.json", encoding='utf-8') as f:
+            cities = json.load(f)['cities']
+        mps = [{**mp, 'city': city} for city, city_mps in cities.items() for mp in city_mps]
+        resolver = get_mp_resolver()
+        keys = [resolver.resolve_record(mp).key for mp in mps]
+        bonuses = {key: (i % 3) * 15 for i, key in enumerate(keys)}
+
+        result = FAIR_POLICY.evaluate(
+            build_fair_activity_table(mps, proposals, questions, research, bonuses)
+        )
+
+        for i, (mp, key) in enumerate(zip(mps, keys)):
+            expected = calculate_fair_score(
+                mp_name=mp['name'], party=mp['party'],
+                proposals=proposals.get(key, []),
+                question_count=questions.get(key, 0),
+                research_count=research.get(key, 0),
+                commission_count=bonuses[key],
+            )
+            assert result.scores[i] == expected.calculated_score
+            assert result.groups[i] == expected.role_strategy
+            assert result.impact_labels[i] == expected.impact_label
+
+    def test_metrics_policy_matches_formula(self):
+        """calculate_scores keeps the documented metrics formula."""
+        from update_all_mp_metrics import calculate_scores
+
+        scores = calculate_scores({'A': 2}, {'A': 3, 'B': 1}, {'A': 1}, {})
+        assert scores['A'][:2] == (2 * 15 + 3 * 2 + 1 * 3 + 5.0, False)
+        assert scores['B'][:2] == (1 * 2 + 5.0, True)
+
+
+class TestMultiPolicy:
+    """Tests for evaluating several policies side by side."""
+
+    def test_evaluate_policies(self):
+        """All policies should be evaluated over the same table."""
+        from fair_scoring import FAIR_POLICY
+        from update_all_mp_metrics import METRICS_POLICY
+
+        table = ActivityTable(['A', 'B'], parties=['AKP', 'CHP'], question=[4, 4], news=5.0)
+        results = evaluate_policies(table, [METRICS_POLICY, FAIR_POLICY])
+
+        assert results['metrics'].scores.tolist() == [17.0, 17.0]
+        assert results['fair'].scores.tolist() == [7.0, 17.0]
+        assert results['fair'].groups.tolist() == ['GOVERNMENT', 'OPPOSITION']
@@ -0,0 +1,144 @@
+"""
+Scrape Watermark Tests
+
+Tests for incremental scraping: known-page detection and merging into data files.
+"""
+
+import json
+import pytest
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.scrape_watermark import ScrapeWatermark
+
+
+EXISTING = [
+    {'esas_no': '2/3', 'summary': "Üçüncü", 'date': '03.01.2024', 'period': '28'},
+    {'esas_no': '2/2', 'summary': "İkinci", 'date': '02.01.2024', 'period': '28'},
+    {'esas_no': '2/1', 'summary': "Birinci", 'date': '01.01.2024', 'period': '28'},
+]
+
+
+@pytest.fixture
+def data_file(tmp_path):
+    path = tmp_path / "law_proposals_28.json"
+    path.write_text(json.dumps(EXISTING, ensure_ascii=False, indent=2), encoding='utf-8')
+    return path
+
+
+class FakeElement:
+    def click(self):
+        self.on_click()
+
+
+class FakeResultPage:
+    """Result table pages, newest records first, with a 'next' button."""
+
+    url = 'https://www.tbmm.gov.tr/Yasama/Kanun-Teklifleri-Sonuc'
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.current = 0
+        self.visited = 1
+
+    def goto(self, *args, **kwargs):
+        pass
+
+    def wait_for_selector(self, *args, **kwargs):
+        pass
+
+    def wait_for_function(self, *args, **kwargs):
+        pass
+
+    def click(self, *args, **kwargs):
+        pass
+
+    def wait_for_url(self, *args, **kwargs):
+        pass
+
+    def evaluate(self, script, selector):
+        rows = [['28', esas_no, '01.01.2024', 'Özet'] for esas_no in self.pages[self.current]]
+        return rows if 'querySelectorAll' in script else '\t'.join(rows[0])
+
+    def query_selector(self, selector):
+        if 'next' not in selector or self.current + 1 >= len(self.pages):
+            return None
+        button = FakeElement()
+        button.on_click = self.next_page
+        return button
+
+    def next_page(self):
+        self.current += 1
+        self.visited += 1
+
+
+class TestScrapeWatermark:
+    """Tests for the known esas_no set and file merging."""
+
+    def test_known_page(self, data_file):
+        watermark = ScrapeWatermark(data_file)
+        assert len(watermark) == 3
+        assert watermark.is_known_page(['2/3', '2/2'])
+        assert not watermark.is_known_page(['2/4', '2/3'])
+        assert not watermark.is_known_page([])
+
+    def test_missing_file_starts_empty(self, tmp_path):
+        watermark = ScrapeWatermark(tmp_path / "new.json")
+        assert watermark.merge([{'esas_no': '2/1'}]) == 1
+        assert json.loads((tmp_path / "new.json").read_text(encoding='utf-8')) == [{'esas_no': '2/1'}]
+
+    def test_merge_prepends_new_and_refreshes_known(self, data_file):
+        """New records go first; re-fetched records replace their stored copies."""
+        watermark = ScrapeWatermark(data_file)
+        fetched = [
+            {'esas_no': '2/4', 'summary': "Dördüncü", 'date': '04.01.2024', 'period': '28'},
+            {'esas_no': '2/3', 'summary': "Üçüncü (güncel)", 'date': '03.01.2024', 'period': '28'},
+        ]
+
+        assert watermark.merge(fetched) == 1
+        merged = json.loads(data_file.read_text(encoding='utf-8'))
+        assert [r['esas_no'] for r in merged] == ['2/4', '2/3', '2/2', '2/1']
+        assert merged[1]['summary'] == "Üçüncü (güncel)"
+        assert watermark.is_known_page(['2/4'])
+
+    def test_merge_keeps_json_dump_format(self, data_file):
+        before = data_file.read_text(encoding='utf-8')
+        ScrapeWatermark(data_file).merge([])
+        assert data_file.read_text(encoding='utf-8') == before
+
+
+class TestIncrementalPagination:
+    """Tests for stopping pagination at the first fully known page."""
+
+    def test_stops_after_known_page(self, data_file, fast_controller):
+        from services.law_proposals_scraper import LawProposalsScraper
+
+        scraper = LawProposalsScraper()
+        scraper.rate_controller = fast_controller
+        scraper.page = FakeResultPage([['2/5', '2/4'], ['2/3', '2/2'], ['2/1'], ['2/0']])
+
+        proposals = scraper.fetch_all_proposals(watermark=ScrapeWatermark(data_file))
+
+        assert scraper.page.visited == 2
+        assert [p.esas_no for p in proposals] == ['2/5', '2/4', '2/3', '2/2']
+
+    def test_failed_next_page_is_not_a_short_result(self, fast_controller):
+        """A page that cannot be loaded raises instead of returning the partial list."""
+        from playwright.sync_api import Error as PlaywrightError
+        from services.law_proposals_scraper import LawProposalsScraper
+        from services.retry_policy import IncompleteScrapeError
+
+        class BrokenNextPage(FakeResultPage):
+            def wait_for_function(self, *args, **kwargs):
+                raise PlaywrightError("Element is not attached to the DOM")
+
+        scraper = LawProposalsScraper()
+        scraper.rate_controller = fast_controller
+        scraper.page = BrokenNextPage([['2/5', '2/4'], ['2/3', '2/2']])
+
+        with pytest.raises(IncompleteScrapeError) as error:
+            scraper.fetch_all_proposals()
+        assert [p.esas_no for p in error.value.records] == ['2/5', '2/4']
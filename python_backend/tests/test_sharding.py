@@ -0,0 +1,103 @@
+"""
+Sharding Tests
+
+Tests for deterministic MP partitioning and merging shard summaries.
+"""
+
+import pytest
+import sys
+import os
+from datetime import timedelta
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.mp_models import SystemLog
+from services.sharding import ShardSpec, merge_shard_summaries, shard_of
+from tests.test_scoring_engine import _make_engine_with_fakes
+
+
+class TestShardSpec:
+    """Tests for parsing and partitioning."""
+
+    def test_parse(self):
+        """'i/N' should parse into a 0-based shard spec."""
+        assert ShardSpec.parse("2/4") == ShardSpec(2, 4)
+        assert str(ShardSpec(2, 4)) == "2/4"
+
+    @pytest.mark.parametrize("text", ["4/4", "-1/2", "1", "a/b", "0/0"])
+    def test_parse_rejects_invalid(self, text):
+        """Out-of-range or malformed specs should raise ValueError."""
+        with pytest.raises(ValueError):
+            ShardSpec.parse(text)
+
+    def test_shards_are_disjoint_and_complete(self):
+        """Every MP belongs to exactly one shard."""
+        ids = [f"mv_{i:04d}" for i in range(600)]
+        shards = [ShardSpec(i, 4).filter(ids, key=lambda x: x) for i in range(4)]
+
+        assert sorted(sum(shards, [])) == ids
+        assert all(len(s) > 100 for s in shards)
+
+    def test_shard_of_is_stable(self):
+        """Partitioning must not depend on the process hash seed."""
+        assert shard_of("mv_ozgur_ozel_1a2b3c4d", 8) == shard_of("mv_ozgur_ozel_1a2b3c4d", 8)
+        assert [shard_of(f"mv_{i}", 3) for i in range(6)] == [2, 2, 2, 2, 0, 0]
+
+
+class TestShardedEngine:
+    """Tests for process_all_mps with a shard."""
+
+    def test_process_only_own_shard(self):
+        """The engine should only score MPs owned by its shard, in order."""
+        results = []
+        for index in range(3):
+            engine = _make_engine_with_fakes(mp_count=12)
+            results.extend(engine.process_all_mps(max_news_per_mp=1, shard=ShardSpec(index, 3)))
+
+        assert sorted(r.mp_id for r in results) == [f"mv_{i:03d}" for i in range(12)]
+
+
+class TestMergeShardSummaries:
+    """Tests for combining per-shard job logs."""
+
+    def _log(self, shard, success, duration_ms=1000, calls=2):
+        return SystemLog.info(
+            "Puanlama job'ı tamamlandı",
+            job_id="job1",
+            duration_ms=duration_ms,
+            details={
+                'shard': shard, 'mp_count': success, 'success_count': success,
+                'fail_count': 0, 'skipped_count': 1,
+                'stages': {'gemini': {'calls': calls, 'errors': 0, 'bytes': 10, 'total_ms': 100.0,
+                                      'max_ms': 80.0, 'histogram': {'<=100ms': calls}}},
+                'slowest_mps': [{'mp_id': f"mp{shard}", 'total_ms': duration_ms}],
+            },
+        )
+
+    def test_merge_counts_stages_and_duration(self):
+        """Counts and stage metrics add up; duration is the slowest shard."""
+        logs = [self._log("0/2", 3, duration_ms=1000), self._log("1/2", 4, duration_ms=5000, calls=6)]
+        merged = merge_shard_summaries(logs)
+
+        assert merged['shards'] == ["0/2", "1/2"]
+        assert merged['missing_shards'] == []
+        assert merged['success_count'] == 7
+        assert merged['skipped_count'] == 2
+        assert merged['duration_ms'] == 5000
+        assert merged['stages']['gemini']['calls'] == 8
+        assert merged['stages']['gemini']['avg_ms'] == 25.0
+        assert merged['stages']['gemini']['histogram'] == {'<=100ms': 8}
+        assert merged['slowest_mps'][0]['mp_id'] == "mp1/2"
+
+    def test_latest_log_per_shard_and_missing(self):
+        """A resumed shard replaces its earlier log; absent shards are reported."""
+        first = self._log("0/3", 1)
+        second = self._log("0/3", 5)
+        second.timestamp = first.timestamp + timedelta(minutes=5)
+        start_log = SystemLog.info("Puanlama job'ı başlatıldı", job_id="job1", details={'shard': "1/3"})
+
+        merged = merge_shard_summaries([second, first, start_log])
+
+        assert merged['success_count'] == 5
+        assert merged['missing_shards'] == ["1/3", "2/3"]
@@ -0,0 +1,95 @@
+"""
+Stage Metrics Tests
+
+Tests for per-stage timing instrumentation of scoring jobs.
+"""
+
+import json
+import pytest
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.stage_metrics import StageMetrics
+from tests.test_scoring_engine import _make_engine_with_fakes
+
+
+class TestStageMetrics:
+    """Tests for the metrics collector."""
+
+    def test_record_histogram_and_totals(self):
+        """Durations should land in the right histogram buckets."""
+        metrics = StageMetrics()
+        metrics.record('gemini', 40, size=10, mp_id='mv_1')
+        metrics.record('gemini', 700, error=True, size=5, mp_id='mv_1')
+
+        stats = metrics.summary()['stages']['gemini']
+        assert stats['calls'] == 2
+        assert stats['errors'] == 1
+        assert stats['bytes'] == 15
+        assert stats['max_ms'] == 700
+        assert stats['histogram'] == {'<=50ms': 1, '<=1000ms': 1}
+
+    def test_measure_counts_exceptions(self):
+        """Exceptions inside measure() are counted as errors and re-raised."""
+        metrics = StageMetrics()
+        with pytest.raises(RuntimeError):
+            with metrics.measure('scrape', 'mv_1'):
+                raise RuntimeError("boom")
+        with metrics.measure('scrape', 'mv_1') as span:
+            span.add_bytes("çğ")
+
+        stats = metrics.per_mp()['mv_1']['stages']['scrape']
+        assert stats['calls'] == 2
+        assert stats['errors'] == 1
+        assert stats['bytes'] == 4
+
+    def test_write_report(self, tmp_path):
+        """The JSON report should contain job and per-MP sections."""
+        metrics = StageMetrics()
+        metrics.record('news', 120, mp_id='mv_1', mp_name='Vekil 1')
+
+        path = metrics.write_report('job1', extra={'success_count': 1}, report_dir=tmp_path)
+        report = json.loads(path.read_text(encoding='utf-8'))
+
+        assert report['job_id'] == 'job1'
+        assert report['success_count'] == 1
+        assert report['stages']['news']['calls'] == 1
+        assert report['mps']['mv_1']['name'] == 'Vekil 1'
+        assert report['slowest_mps'][0]['mp_id'] == 'mv_1'
+
+
+class TestEngineInstrumentation:
+    """Tests for metrics recorded by ScoringEngine stages."""
+
+    @pytest.mark.parametrize("pipelined", [False, True])
+    def test_stages_recorded_per_mp(self, pipelined):
+        """Every service call should be counted for the job and per MP."""
+        from config.pipeline_config import PipelineConfig
+
+        engine = _make_engine_with_fakes(
+            dry_run=False, mp_count=3, pipeline_config=PipelineConfig(pipelined=pipelined)
+        )
+        engine.process_all_mps(max_news_per_mp=2)
+
+        stages = engine.metrics.summary()['stages']
+        assert stages['firestore_read']['calls'] == 1
+        assert stages['news']['calls'] == 3
+        assert stages['scrape']['calls'] == 6
+        assert stages['gemini']['calls'] == 6
+        assert stages['firestore_write']['calls'] == 3 + 6
+        assert stages['scrape']['bytes'] > 0
+
+        per_mp = engine.metrics.per_mp()
+        assert set(per_mp) == {'mv_000', 'mv_001', 'mv_002'}
+        assert per_mp['mv_001']['stages']['gemini']['calls'] == 2
+
+    def test_failed_firestore_write_counted(self):
+        """A False return from update_mp_score counts as an error."""
+        engine = _make_engine_with_fakes(dry_run=False, mp_count=1)
+        engine.firestore.update_mp_score.return_value = False
+        engine.process_all_mps(max_news_per_mp=1)
+
+        assert engine.metrics.summary()['stages']['firestore_write']['errors'] == 1
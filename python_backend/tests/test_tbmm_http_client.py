@@ -0,0 +1,100 @@
+"""
+TBMM HTTP Client Tests
+
+Tests for result page parsing, paged request templates and parallel page fetching.
+"""
+
+import json
+import pytest
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.scraper_config import ScraperConfig
+from services.tbmm_http_client import PagedRequest, TBMMHttpClient, parse_table_rows
+
+
+HTML_PAGE = """
+<table><thead><tr><th>Dönem</th><th>Esas No</th></tr></thead>
+<tbody>
+  <tr><td> 28 </td><td>2/10</td><td>01.01.2024</td>
+      <td>ANKARA MİLLETVEKİLİ<br>ALİ   VELİ<p>Son Durumu: Cevaplandı</p></td></tr>
+  <tr><td>28</td><td>2/9</td><td>02.01.2024</td><td>Özet</td></tr>
+</tbody></table>
+"""
+
+
+class TestParseTableRows:
+    """Tests for turning result responses into cell texts."""
+
+    def test_html_rows_keep_line_breaks(self):
+        rows = parse_table_rows(HTML_PAGE)
+        assert rows[0] == ['28', '2/10', '01.01.2024', 'ANKARA MİLLETVEKİLİ\nALİ VELİ\nSon Durumu: Cevaplandı']
+        assert rows[1][1] == '2/9'
+
+    def test_datatables_json(self):
+        payload = {'draw': 1, 'data': [['28', '2/10', '01.01.2024', '<b>Özet</b><br/>ikinci satır']]}
+        assert parse_table_rows(json.dumps(payload)) == [['28', '2/10', '01.01.2024', 'Özet\nikinci satır']]
+
+    def test_empty_page(self):
+        assert parse_table_rows('  ') == []
+        assert parse_table_rows('<table><tbody></tbody></table>') == []
+
+
+class TestPagedRequest:
+    """Tests for detecting the page parameter of a captured request."""
+
+    def test_offset_style(self):
+        request = PagedRequest.from_request(
+            'https://www.tbmm.gov.tr/Yasama/Kanun-Teklifleri-Sonuc-Sayfa', 'POST',
+            'draw=1&start=0&length=25&DonemYasamaYili=abc', {'X-Requested-With': 'XMLHttpRequest', 'Cookie': 'x'})
+
+        assert (request.page_param, request.page_size, request.first_page) == ('start', 25, 0)
+        assert request.headers == {'X-Requested-With': 'XMLHttpRequest'}
+        assert request.params_for(2) == {'draw': '3', 'start': '50', 'length': '25', 'DonemYasamaYili': 'abc'}
+
+    def test_page_number_style(self):
+        request = PagedRequest.from_request(
+            'https://www.tbmm.gov.tr/Yasama/Kanun-Teklifleri-Sonuc-Sayfa?DonemYasamaYili=abc&Page=1', 'GET', None)
+
+        assert request.url == 'https://www.tbmm.gov.tr/Yasama/Kanun-Teklifleri-Sonuc-Sayfa'
+        assert request.params_for(0)['Page'] == '1'
+        assert request.params_for(3)['Page'] == '4'
+
+    def test_not_paged(self):
+        assert PagedRequest.from_request('https://www.tbmm.gov.tr/Yasama/Kanun-Teklifleri', 'GET', None) is None
+
+
+class TestFetchPages:
+    """Tests for parallel page fetching with ordered stop conditions."""
+
+    @pytest.fixture
+    def client(self, monkeypatch):
+        client = TBMMHttpClient(config=ScraperConfig(http_workers=3))
+        pages = [[['28', f'2/{10 - i}']] for i in range(5)]
+        client.requested = []
+
+        def fake_fetch_page(request, page_index):
+            client.requested.append(page_index)
+            return pages[page_index] if page_index < len(pages) else []
+
+        monkeypatch.setattr(client, 'fetch_page', fake_fetch_page)
+        yield client
+        client.close()
+
+    def test_fetches_until_empty_page_in_order(self, client):
+        pages = client.fetch_pages(PagedRequest('https://example.test'), max_pages=100)
+        assert [rows[0][1] for rows in pages] == ['2/10', '2/9', '2/8', '2/7', '2/6']
+        assert sorted(client.requested) == [0, 1, 2, 3, 4, 5]
+
+    def test_stop_includes_stopping_page(self, client):
+        """Pages after the stopping one in the same wave are dropped."""
+        pages = client.fetch_pages(PagedRequest('https://example.test'), max_pages=100,
+                                   stop=lambda rows: rows[0][1] == '2/9')
+        assert [rows[0][1] for rows in pages] == ['2/10', '2/9']
+        assert max(client.requested) == 2
+
+    def test_max_pages(self, client):
+        assert len(client.fetch_pages(PagedRequest('https://example.test'), max_pages=4)) == 4
@@ -0,0 +1,127 @@
+"""
+Weight Sweep Tests
+
+Tests for the batched what-if weight sweep.
+"""
+
+import pytest
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from services.scoring_kernel import ActivityTable, ScoringPolicy
+from services.weight_sweep import (
+    WeightSweep, candidates_from_overrides, perturb_weights, rank_columns, spearman_against
+)
+
+
+def _table(n=40, seed=0):
+    rng = np.random.default_rng(seed)
+    return ActivityTable(
+        [f"mp{i}" for i in range(n)],
+        parties=rng.choice(['AKP', 'CHP', 'MHP'], size=n).tolist(),
+        first_signature=rng.integers(0, 4, size=n),
+        question=rng.integers(0, 6, size=n),
+        research=rng.integers(0, 3, size=n),
+        news=5.0,
+    )
+
+
+class TestRanking:
+    """Tests for the rank helpers."""
+
+    def test_rank_columns_averages_ties(self):
+        """Tied values should share their average rank, per column."""
+        scores = np.array([[1.0, 3.0], [2.0, 3.0], [2.0, 1.0], [5.0, 3.0]])
+        ranks = rank_columns(scores)
+        assert ranks[:, 0].tolist() == [1.0, 2.5, 2.5, 4.0]
+        assert ranks[:, 1].tolist() == [3.0, 3.0, 1.0, 3.0]
+
+    def test_spearman_identity_and_reverse(self):
+        """Same order gives 1, reversed order gives -1."""
+        base = np.array([1.0, 2.0, 3.0, 4.0])
+        result = spearman_against(base, np.column_stack([base * 2, -base]))
+        assert result.tolist() == pytest.approx([1.0, -1.0])
+
+
+class TestWeightSweep:
+    """Tests for batched candidate scoring and reports."""
+
+    def test_batched_scores_match_policy_evaluate(self):
+        """Each candidate column equals evaluating that policy on its own."""
+        from fair_scoring import FAIR_POLICY
+
+        table = _table()
+        candidates = perturb_weights(FAIR_POLICY, samples=5, seed=3)
+        scores = WeightSweep(table, FAIR_POLICY).score(candidates)
+
+        for k in range(5):
+            policy = ScoringPolicy(
+                name='k', weights=candidates[k], groups=FAIR_POLICY.groups,
+                ghost_penalty=FAIR_POLICY.ghost_penalty, min_score=FAIR_POLICY.min_score,
+                group_of=FAIR_POLICY.group_of,
+            )
+            np.testing.assert_allclose(scores[:, k], policy.evaluate(table).raw_scores)
+
+    def test_baseline_candidate_has_no_churn(self):
+        """The current weights should correlate perfectly with themselves."""
+        from update_all_mp_metrics import METRICS_POLICY
+
+        report = WeightSweep(_table(), METRICS_POLICY, top_k=5).run(
+            candidates_from_overrides(METRICS_POLICY, [{}, {'question': 0.0, 'research': 0.0}])
+        )
+        assert report.spearman[0] == pytest.approx(1.0)
+        assert report.top_churn[0] == 0
+        assert report.spearman[1] < 1.0
+        np.testing.assert_allclose(report.party_means[0], report.baseline_party_means)
+
+    def test_report_rows(self):
+        """Rows should expose weights, correlation, churn and party means."""
+        from update_all_mp_metrics import METRICS_POLICY
+
+        report = WeightSweep(_table(), METRICS_POLICY).run(
+            perturb_weights(METRICS_POLICY, samples=20, columns=['question'], seed=1)
+        )
+        rows = report.rows(limit=3)
+
+        assert len(rows) == 3
+        assert rows[0]['spearman'] >= rows[1]['spearman']
+        assert set(rows[0]['party_means']) == {'AKP', 'CHP', 'MHP'}
+        assert rows[0]['weights']['DEFAULT']['first_signature'] == 15.0
+
+
+class TestSweepTables:
+    """Tests for the activity tables built from the local data files."""
+
+    def test_metrics_table(self):
+        """Parties line up with the corpus keys, namesakes included."""
+        import weight_sweep
+        from services.legislative_corpus import get_corpus
+
+        table = weight_sweep.build_metrics_table()
+        parties = dict(zip(table.names, table.parties))
+
+        assert parties["OZGUR OZEL"] == 'CHP'
+        assert parties["MUSTAFA DEMIR (ISTANBUL)"] == 'AK Parti'
+        assert parties["MUSTAFA DEMIR (KILIS)"] == 'BAĞIMSIZ'
+        assert "MUSTAFA DEMIR" not in parties
+        assert all(parties[mp.key] != 'Bilinmiyor' for mp in get_corpus().resolver.mps)
+        row = table.names.index("MUSTAFA DEMIR (KILIS)")
+        assert table.columns['question'][row] == get_corpus().question_counts["MUSTAFA DEMIR (KILIS)"]
+
+    def test_fair_table_has_commission_bonuses(self):
+        """The commission weight is swept over real bonuses, not an all-zero column."""
+        import weight_sweep
+        from services.legislative_corpus import get_corpus
+
+        table = weight_sweep.build_fair_table()
+        bonuses = get_corpus().commissions.bonuses
+        resolver = get_corpus().resolver
+
+        assert table.columns['commission'].sum() > 0
+        for i, mp in enumerate(get_corpus().static_mps):
+            assert table.columns['commission'][i] == bonuses.get(resolver.resolve_record(mp).key, 0)
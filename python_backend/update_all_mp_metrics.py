@@ -12,17 +12,18 @@ A: Araştırma Önergesi (şimdilik simüle)
 H: Haber Etkisi
 """
 
-import json
 import logging
-import re
-from pathlib import Path
-from collections import defaultdict
-from typing import Dict, Tuple, List
+from typing import Dict, Tuple, List, Set, Optional
 import sys
 import os
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+from services.diff_writer import DiffWriter, DiffWriteResult
+from services.legislative_corpus import get_corpus, get_mp_resolver, parse_signatories
+from services.scoring_fingerprint import FINGERPRINT_FIELD, compute_fingerprint, weights_version
+from services.scoring_kernel import ActivityTable, ScoringPolicy
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
@@ -35,25 +36,30 @@ RESEARCH_WEIGHT = 4.0           # A
 NEWS_IMPACT_WEIGHT = 1.0        # H
 DEFAULT_NEWS_IMPACT = 5.0
 
+# update_firestore'un yazdığı alanlar (fark tabanlı yazıcı sadece bunları okur)
+SCORE_FIELDS = (
+    'current_score', 'first_signature', 'support_signature', 'written_questions',
+    'research_proposals', 'is_passive', FINGERPRINT_FIELD,
+)
+
+# Vektörel puanlama politikası (aynı formül, tüm vekiller tek geçişte)
+METRICS_POLICY = ScoringPolicy.linear(
+    'metrics',
+    first_signature=FIRST_SIGNATURE_WEIGHT,
+    support_signature=SUPPORT_SIGNATURE_WEIGHT,
+    question=QUESTION_WEIGHT,
+    research=RESEARCH_WEIGHT,
+    news=NEWS_IMPACT_WEIGHT,
+)
 
-def normalize_name(name: str) -> str:
-    """İsmi normalize et - Türkçe karakterleri ASCII'ye çevir."""
-    # Türkçe karakter dönüşümü
-    tr_map = {
-        'ı': 'I', 'İ': 'I', 'i': 'I',
-        'ğ': 'G', 'Ğ': 'G',
-        'ü': 'U', 'Ü': 'U',
-        'ş': 'S', 'Ş': 'S',
-        'ö': 'O', 'Ö': 'O',
-        'ç': 'C', 'Ç': 'C'
-    }
-    name = name.strip().upper()
-    for tr, en in tr_map.items():
-        name = name.replace(tr.upper(), en)
-        name = name.replace(tr, en)
-    # Fazla boşlukları temizle
-    name = ' '.join(name.split())
-    return name
+WEIGHTS_VERSION = weights_version({
+    'first_signature': FIRST_SIGNATURE_WEIGHT,
+    'support_signature': SUPPORT_SIGNATURE_WEIGHT,
+    'question': QUESTION_WEIGHT,
+    'research': RESEARCH_WEIGHT,
+    'news_impact': NEWS_IMPACT_WEIGHT,
+    'default_news_impact': DEFAULT_NEWS_IMPACT,
+})
 
 
 def extract_all_mps_from_summary(summary: str) -> List[Tuple[str, bool]]:
@@ -66,42 +72,7 @@ def extract_all_mps_from_summary(summary: str) -> List[Tuple[str, bool]]:
     Returns:
         List[(mp_name, is_first_signature)] - İlk isim first_signature, diğerleri support
     """
-    first_line = summary.split('\n')[0] if summary else ""
-    
-    mps = []
-    
-    # Pattern: Milletvekili sonrası virgül veya " ve " e kadar olan tüm karakterler
-    # Örnek: "Milletvekili Özgür ÖZEL, CHP" -> "Özgür ÖZEL"
-    # Örnek: "Milletvekili Selma Aliye KAVAF, Manisa" -> "Selma Aliye KAVAF"
-    
-    pattern = r'Milletvekili\s+([^,]+?)(?:,|$|\s+ve\s+\d+)'
-    
-    matches = re.findall(pattern, first_line)
-    
-    for i, match in enumerate(matches):
-        is_first = (i == 0)
-        name = match.strip()
-        
-        # Fazla boşlukları temizle
-        name = ' '.join(name.split())
-        
-        # Sadece geçerli isimleri al (en az 2 kelime, 5+ karakter)
-        words = name.split()
-        if len(words) >= 2 and len(name) >= 5:
-            # Sadece isim kısımlarını al (büyük harfli kelimeler)
-            name_words = []
-            for word in words:
-                # Eğer kelime büyük harfli veya ilk harfi büyük ise isim olabilir
-                if word[0].isupper() and not any(c.islower() for c in word[1:3] if len(word) > 1):
-                    name_words.append(word)
-                elif word[0].isupper():
-                    name_words.append(word)
-            
-            if len(name_words) >= 2:
-                clean_name = ' '.join(name_words)
-                mps.append((normalize_name(clean_name), is_first))
-    
-    return mps
+    return [(name, i == 0) for i, name in enumerate(parse_signatories(summary))]
 
 
 def load_law_proposal_counts() -> Tuple[Dict[str, int], Dict[str, int]]:
@@ -111,27 +82,13 @@ def load_law_proposal_counts() -> Tuple[Dict[str, int], Dict[str, int]]:
     Returns:
         (first_signature_counts, support_signature_counts)
     """
-    proposals_file = Path(__file__).parent / "data" / "law_proposals_28.json"
-    
-    if not proposals_file.exists():
+    corpus = get_corpus()
+    if not corpus.path('law_proposals').exists():
         logger.warning("⚠️ Kanun teklifleri dosyası bulunamadı")
         return {}, {}
     
-    with open(proposals_file, 'r', encoding='utf-8') as f:
-        proposals = json.load(f)
-    
-    first_sig = defaultdict(int)
-    support_sig = defaultdict(int)
-    
-    for prop in proposals:
-        summary = prop.get('summary', '')
-        mps = extract_all_mps_from_summary(summary)
-        
-        for mp_name, is_first in mps:
-            if is_first:
-                first_sig[mp_name] += 1
-            else:
-                support_sig[mp_name] += 1
+    index = corpus.proposals
+    first_sig, support_sig = index.first_signature, index.support_signature
     
     logger.info(f"📋 İlk İmza: {sum(first_sig.values())} teklif ({len(first_sig)} vekil)")
     logger.info(f"📋 Destek İmza: {sum(support_sig.values())} teklif ({len(support_sig)} vekil)")
@@ -139,27 +96,24 @@ def load_law_proposal_counts() -> Tuple[Dict[str, int], Dict[str, int]]:
     return dict(first_sig), dict(support_sig)
 
 
+def load_law_proposal_ids() -> Dict[str, Set[str]]:
+    """
+    Her vekilin imzası bulunan kanun tekliflerinin esas numaralarını yükle.
+    
+    Returns:
+        Dict[mp_name, {esas_no, ...}] - Girdi parmak izi için kullanılır
+    """
+    return dict(get_corpus().proposals.ids_by_mp)
+
+
 def load_question_counts() -> Dict[str, int]:
     """Yazılı soru önergesi sayılarını yükle."""
-    questions_file = Path(__file__).parent / "data" / "written_questions_28.json"
-    
-    if not questions_file.exists():
+    corpus = get_corpus()
+    if not corpus.path('questions').exists():
         logger.warning("⚠️ Yazılı sorular dosyası bulunamadı")
         return {}
     
-    with open(questions_file, 'r', encoding='utf-8') as f:
-        questions = json.load(f)
-    
-    counts = defaultdict(int)
-    for q in questions:
-        subject = q.get('subject', '')
-        if 'Milletvekili' in subject:
-            first_line = subject.split('\n')[0]
-            parts = first_line.split('Milletvekili')
-            if len(parts) > 1:
-                name = parts[1].strip().split('\n')[0]
-                counts[normalize_name(name)] += 1
-    
+    counts = corpus.question_counts
     logger.info(f"❓ {sum(counts.values())} yazılı soru yüklendi ({len(counts)} vekil)")
     return dict(counts)
 
@@ -168,27 +122,12 @@ def load_research_counts() -> Dict[str, int]:
     """
     Gerçek araştırma önergesi sayılarını yükle.
     """
-    research_file = Path(__file__).parent / "data" / "research_proposals_28.json"
-    
-    if not research_file.exists():
+    corpus = get_corpus()
+    if not corpus.path('research').exists():
         logger.warning("⚠️ Araştırma önergeleri dosyası bulunamadı, simülasyon kullanılacak")
         return {}
     
-    with open(research_file, 'r', encoding='utf-8') as f:
-        proposals = json.load(f)
-    
-    counts = defaultdict(int)
-    for p in proposals:
-        summary = p.get('summary', '')
-        if 'Milletvekili' in summary:
-            first_line = summary.split('\n')[0]
-            parts = first_line.split('Milletvekili')
-            if len(parts) > 1:
-                # "ve X Milletvekili" kısmını temizle
-                name = parts[1].strip().split('\n')[0]
-                name = re.sub(r'\s+ve\s+\d+.*', '', name).strip()
-                counts[normalize_name(name)] += 1
-    
+    counts = corpus.research_counts
     logger.info(f"🔍 {sum(counts.values())} araştırma önergesi yüklendi ({len(counts)} vekil)")
     return dict(counts)
 
@@ -197,93 +136,135 @@ def calculate_scores(
     first_sig: Dict[str, int],
     support_sig: Dict[str, int],
     question_counts: Dict[str, int],
-    research_counts: Dict[str, int]
+    research_counts: Dict[str, int],
+    proposal_ids: Optional[Dict[str, Set[str]]] = None,
+    previous_fingerprints: Optional[Dict[str, str]] = None
 ) -> Dict[str, Tuple[float, bool, dict]]:
     """
     Tüm vekiller için puan hesapla.
     
+    Args:
+        proposal_ids: Vekil bazında kanun teklifi esas numaraları (parmak izi için)
+        previous_fingerprints: Firestore'daki son parmak izleri (mp_name -> parmak izi).
+            Verilirse girdileri değişmeyen vekiller sonuçtan çıkarılır.
+    
     Returns:
         Dict[mp_name, (puan, is_passive, metrics_dict)]
     """
+    proposal_ids = proposal_ids or {}
+    previous_fingerprints = previous_fingerprints or {}
     all_mps = set(first_sig.keys()) | set(support_sig.keys()) | set(question_counts.keys()) | set(research_counts.keys())
     
-    scores = {}
+    # Girdileri değişmeyen vekilleri atla
+    fingerprints = {}
     for mp_name in all_mps:
-        t_ilk = first_sig.get(mp_name, 0)
-        t_imza = support_sig.get(mp_name, 0)
-        s = question_counts.get(mp_name, 0)
-        a = research_counts.get(mp_name, 0)
-        h = DEFAULT_NEWS_IMPACT
-        
-        # Puan hesapla
-        score = (t_ilk * FIRST_SIGNATURE_WEIGHT) + (t_imza * SUPPORT_SIGNATURE_WEIGHT) + \
-                (s * QUESTION_WEIGHT) + (a * RESEARCH_WEIGHT) + (h * NEWS_IMPACT_WEIGHT)
-        
-        # Pasiflik kontrolü (ilk imza, soru, araştırmadan 2+ sıfır)
-        zero_count = sum([t_ilk == 0, s == 0, a == 0])
-        is_passive = zero_count >= 2
-        
+        fingerprint = compute_fingerprint(
+            scorer='metrics',
+            weights_ver=WEIGHTS_VERSION,
+            proposal_ids=proposal_ids.get(mp_name, ()),
+            question_count=question_counts.get(mp_name, 0),
+            research_count=research_counts.get(mp_name, 0),
+            extra={
+                'first_signature': first_sig.get(mp_name, 0),
+                'support_signature': support_sig.get(mp_name, 0),
+            },
+        )
+        if previous_fingerprints.get(mp_name) != fingerprint:
+            fingerprints[mp_name] = fingerprint
+    
+    # Puan ve pasiflik (3 ana kriterden 2+ sıfır) tek vektörel geçişte
+    names = list(fingerprints)
+    table = ActivityTable(
+        names,
+        first_signature=first_sig,
+        support_signature=support_sig,
+        question=question_counts,
+        research=research_counts,
+        news=DEFAULT_NEWS_IMPACT,
+    )
+    result = METRICS_POLICY.evaluate(table)
+    
+    scores = {}
+    for mp_name, score, is_passive in zip(names, result.scores.tolist(), result.is_passive.tolist()):
         metrics = {
-            'first_signature': t_ilk,
-            'support_signature': t_imza,
-            'written_questions': s,
-            'research_proposals': a
+            'first_signature': first_sig.get(mp_name, 0),
+            'support_signature': support_sig.get(mp_name, 0),
+            'written_questions': question_counts.get(mp_name, 0),
+            'research_proposals': research_counts.get(mp_name, 0),
+            FINGERPRINT_FIELD: fingerprints[mp_name]
         }
         
-        scores[mp_name] = (round(score, 2), is_passive, metrics)
+        scores[mp_name] = (score, is_passive, metrics)
     
     return scores
 
 
+def _get_db():
+    """Depolama client'ını döndür (STORAGE_BACKEND'e göre Firestore veya yerel)."""
+    from config.storage_config import get_storage_client
+    
+    return get_storage_client()
+
+
+def get_mps_writer() -> DiffWriter:
+    """
+    mps koleksiyonu için fark tabanlı yazıcı.
+    
+    Dokümanlar isim ve seçim çevresiyle vekillere eşlenir; sadece SCORE_FIELDS okunur.
+    """
+    return DiffWriter(
+        _get_db(), 'mps', SCORE_FIELDS,
+        key=get_mp_resolver().document_key,
+        key_fields=('name', 'constituency'),
+    )
+
+
+def load_stored_fingerprints(writer: Optional[DiffWriter] = None) -> Dict[str, str]:
+    """
+    Firestore'daki vekillerin son puanlama parmak izlerini yükle.
+    
+    Args:
+        writer: Koleksiyonu zaten okumuş yazıcı (None ise yeni okunur)
+    
+    Returns:
+        Dict[mp_name, parmak izi]
+    """
+    return (writer or get_mps_writer()).current_values(FINGERPRINT_FIELD)
+
+
 def update_firestore(
     scores: Dict[str, Tuple[float, bool, dict]],
-    dry_run: bool = True
-):
-    """Firestore'u güncelle."""
-    import firebase_admin
-    from firebase_admin import credentials, firestore
-    
-    if not firebase_admin._apps:
-        cred_path = Path(__file__).parent / "serviceAccountKey.json"
-        cred = credentials.Certificate(str(cred_path))
-        firebase_admin.initialize_app(cred)
+    dry_run: bool = True,
+    writer: Optional[DiffWriter] = None
+) -> DiffWriteResult:
+    """
+    Firestore'u güncelle (sadece değişen alanlar, 500'lük batch'lerle).
     
-    db = firestore.client()
-    mps_ref = db.collection('mps')
+    Args:
+        scores: calculate_scores çıktısı
+        dry_run: True ise farklar hesaplanır, yazılmaz
+        writer: Koleksiyonu zaten okumuş yazıcı (None ise yeni okunur)
+    """
+    updates = {}
+    for mp_name, (new_score, is_passive, metrics) in scores.items():
+        updates[mp_name] = {
+            'current_score': new_score,
+            'first_signature': metrics['first_signature'],
+            'support_signature': metrics['support_signature'],
+            'written_questions': metrics['written_questions'],
+            'research_proposals': metrics['research_proposals'],
+            'is_passive': is_passive,
+            FINGERPRINT_FIELD: metrics[FINGERPRINT_FIELD]
+        }
     
-    docs = mps_ref.stream()
+    result = (writer or get_mps_writer()).write(updates, dry_run=dry_run)
     
-    updated = 0
-    passive_count = 0
+    passive_count = sum(1 for _, is_passive, _ in scores.values() if is_passive)
+    logger.info(f"\n{result.summary()} ({passive_count} pasif)")
+    if result.missing:
+        logger.warning(f"⚠️ Firestore'da dokümanı olmayan vekiller: {', '.join(sorted(result.missing)[:10])}")
     
-    for doc in docs:
-        data = doc.to_dict()
-        mp_name = normalize_name(data.get('name', ''))
-        
-        if mp_name in scores:
-            new_score, is_passive, metrics = scores[mp_name]
-            
-            update_data = {
-                'current_score': new_score,
-                'first_signature': metrics['first_signature'],
-                'support_signature': metrics['support_signature'],
-                'written_questions': metrics['written_questions'],
-                'research_proposals': metrics['research_proposals'],
-                'is_passive': is_passive
-            }
-            
-            if not dry_run:
-                doc.reference.update(update_data)
-            
-            if is_passive:
-                passive_count += 1
-            
-            updated += 1
-    
-    mode_text = "DRY-RUN" if dry_run else "✅"
-    logger.info(f"\n{mode_text}: {updated} vekil güncellenecek ({passive_count} pasif)")
-    
-    return updated
+    return result
 
 
 def main():
@@ -291,15 +272,29 @@ def main():
     
     parser = argparse.ArgumentParser(description='MP Metrics Update (Revize)')
     parser.add_argument('--dry-run', action='store_true', default=False)
+    parser.add_argument('--force', action='store_true', default=False,
+                        help='Girdileri değişmeyen vekilleri de puanla')
     args = parser.parse_args()
     
     logger.info("📥 Veriler yükleniyor...")
     first_sig, support_sig = load_law_proposal_counts()
     question_counts = load_question_counts()
     research_counts = load_research_counts()  # Gerçek veri
+    proposal_ids = load_law_proposal_ids()
+    
+    # Koleksiyon bir kez okunur; parmak izleri ve farklar aynı görünümden gelir
+    writer = get_mps_writer()
+    previous_fingerprints = {} if args.force else load_stored_fingerprints(writer)
     
     logger.info("\n📊 Puanlar hesaplanıyor...")
-    scores = calculate_scores(first_sig, support_sig, question_counts, research_counts)
+    scores = calculate_scores(
+        first_sig, support_sig, question_counts, research_counts,
+        proposal_ids=proposal_ids,
+        previous_fingerprints=previous_fingerprints
+    )
+    
+    if previous_fingerprints:
+        logger.info(f"⏭️ {len(previous_fingerprints)} kayıtlı parmak izi, {len(scores)} vekilin girdileri değişti")
     
     sorted_scores = sorted(scores.items(), key=lambda x: -x[1][0])[:20]
     
@@ -313,7 +308,7 @@ def main():
     print(f"\n⚠️ Pasif Vekil Sayısı: {len(passive_mps)}")
     
     print(f"\n📤 Firestore güncelleniyor... (dry_run={args.dry_run})")
-    update_firestore(scores, dry_run=args.dry_run)
+    update_firestore(scores, dry_run=args.dry_run, writer=writer)
 
 
 if __name__ == "__main__":
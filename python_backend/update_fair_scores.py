@@ -5,38 +5,49 @@ Tüm MP'leri Adil Puanlama Sistemi ile Güncelle
 fair_scoring.py modülünü kullanarak Firestore'u günceller.
 """
 
-import json
 import logging
 from pathlib import Path
 from collections import defaultdict
 
-import firebase_admin
-from firebase_admin import credentials, firestore
+from config.storage_config import SERVER_TIMESTAMP, get_storage_client
 
 from fair_scoring import (
     calculate_fair_score,
     load_proposals_by_mp,
     load_questions_by_mp,
     load_research_by_mp,
-    normalize_name,
     get_scoring_strategy,
     asdict
 )
+from services.legislative_corpus import get_corpus
+from services.scoring_fingerprint import FINGERPRINT_FIELD, compute_fingerprint, weights_version
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
 def init_firestore():
-    """Firebase bağlantısını başlat."""
-    if not firebase_admin._apps:
-        cred = credentials.Certificate("serviceAccountKey.json")
-        firebase_admin.initialize_app(cred)
-    return firestore.client()
+    """Depolama client'ını döndür (STORAGE_BACKEND'e göre Firestore veya yerel)."""
+    return get_storage_client()
 
 
-def update_all_mps_with_fair_scoring():
-    """Tüm MP'leri adil puanlama ile güncelle."""
+def load_stored_fingerprints(db) -> dict:
+    """Firestore'daki son puanlama parmak izlerini yükle (doküman ID -> parmak izi)."""
+    docs = db.collection('mps').select([FINGERPRINT_FIELD]).stream()
+    return {
+        doc.id: doc.to_dict().get(FINGERPRINT_FIELD)
+        for doc in docs
+        if doc.to_dict().get(FINGERPRINT_FIELD)
+    }
+
+
+def update_all_mps_with_fair_scoring(force: bool = False):
+    """
+    Tüm MP'leri adil puanlama ile güncelle.
+    
+    Args:
+        force: True ise girdi parmak izi değişmeyen vekiller de yeniden puanlanır
+    """
     
     db = init_firestore()
     data_dir = Path(__file__).parent / "data"
@@ -47,23 +58,19 @@ def update_all_mps_with_fair_scoring():
     mp_questions = load_questions_by_mp(data_dir / "written_questions_28.json")
     mp_research = load_research_by_mp(data_dir / "research_proposals_28.json")
     
-    # MP listesi - şehir bazlı nested structure
-    with open(data_dir / "mps_static.json", 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    # Tüm MP'leri düz listeye çevir
-    mps = []
-    cities = data.get('cities', {})
-    for city, city_mps in cities.items():
-        for mp in city_mps:
-            mp['city'] = city
-            mps.append(mp)
+    # MP listesi (şehir alanı eklenmiş düz liste)
+    corpus = get_corpus(data_dir)
+    mps = corpus.static_mps
+    resolver = corpus.resolver
     
     logger.info(f"📊 {len(mps)} vekil işlenecek...")
     
+    previous_fingerprints = {} if force else load_stored_fingerprints(db)
+    
     # İstatistikler
     stats = {
         'updated': 0,
+        'unchanged': 0,
         'government': 0,
         'opposition': 0,
         'ghost': 0,
@@ -81,13 +88,27 @@ def update_all_mps_with_fair_scoring():
         if not mp_name:
             continue
         
-        # İsmi normalize et
-        normalized = normalize_name(mp_name)
+        # Korpus anahtarı ve doküman ID'si (aynı isimli vekiller seçim çevresiyle ayrılır)
+        resolved = resolver.resolve_record(mp)
         
         # Verileri bul
-        proposals = mp_proposals.get(normalized, [])
-        questions = mp_questions.get(normalized, 0)
-        research = mp_research.get(normalized, 0)
+        proposals = mp_proposals.get(resolved.key, [])
+        questions = mp_questions.get(resolved.key, 0)
+        research = mp_research.get(resolved.key, 0)
+        
+        # Girdiler değişmediyse puanlama ve yazma atlanır
+        strategy, weights = get_scoring_strategy(party)
+        fingerprint = compute_fingerprint(
+            scorer='fair',
+            weights_ver=weights_version(weights),
+            proposal_ids=[p.get('esas_no', '') for p in proposals],
+            question_count=questions,
+            research_count=research,
+            extra={'strategy': strategy},
+        )
+        if previous_fingerprints.get(resolved.id) == fingerprint:
+            stats['unchanged'] += 1
+            continue
         
         # Adil puan hesapla
         result = calculate_fair_score(
@@ -99,7 +120,7 @@ def update_all_mps_with_fair_scoring():
         )
         
         # Firestore güncelle
-        mp_ref = db.collection('mps').document(mp_name)
+        mp_ref = db.collection('mps').document(resolved.id)
         
         update_data = {
             'current_score': result.calculated_score,
@@ -111,7 +132,8 @@ def update_all_mps_with_fair_scoring():
             'research_count': result.research_count,
             'impact_label': result.impact_label,
             'score_explanation': result.explanation,
-            'last_updated': firestore.SERVER_TIMESTAMP,
+            FINGERPRINT_FIELD: fingerprint,
+            'last_updated': SERVER_TIMESTAMP,
         }
         
         batch.set(mp_ref, update_data, merge=True)
@@ -144,6 +166,7 @@ def update_all_mps_with_fair_scoring():
     
     logger.info(f"\n✅ TAMAMLANDI!")
     logger.info(f"   Güncellenen: {stats['updated']}")
+    logger.info(f"   Değişmeyen (atlanan): {stats['unchanged']}")
     logger.info(f"   İktidar: {stats['government']}")
     logger.info(f"   Muhalefet: {stats['opposition']}")
     logger.info(f"   Hayalet Vekil: {stats['ghost']}")
@@ -152,4 +175,10 @@ def update_all_mps_with_fair_scoring():
 
 
 if __name__ == "__main__":
-    update_all_mps_with_fair_scoring()
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Adil Puanlama Güncellemesi')
+    parser.add_argument('--force', action='store_true', help='Girdileri değişmeyen vekilleri de puanla')
+    args = parser.parse_args()
+    
+    update_all_mps_with_fair_scoring(force=args.force)
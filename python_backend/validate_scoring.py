@@ -9,16 +9,12 @@ import json
 from pathlib import Path
 from collections import defaultdict
 
-import firebase_admin
-from firebase_admin import credentials, firestore
+from config.storage_config import get_storage_client
 
 
 def init_firestore():
-    """Firebase bağlantısını başlat."""
-    if not firebase_admin._apps:
-        cred = credentials.Certificate("serviceAccountKey.json")
-        firebase_admin.initialize_app(cred)
-    return firestore.client()
+    """Depolama client'ını döndür (STORAGE_BACKEND'e göre Firestore veya yerel)."""
+    return get_storage_client()
 
 
 def validate_scoring():
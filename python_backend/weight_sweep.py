@@ -0,0 +1,161 @@
+"""
+Ağırlık Taraması (What-If) Scripti
+==================================
+
+Puanlama ağırlıklarını değiştirmenin sıralamaya etkisini Firestore'a
+dokunmadan ölçer. Yerel veri dosyalarından aktivite matrisi kurulur,
+aday ağırlık setleri toplu olarak puanlanır ve her aday için Spearman
+korelasyonu, ilk 20 değişimi ve parti ortalamaları raporlanır.
+
+Kullanım:
+    python weight_sweep.py --policy metrics --samples 5000 --scale 0.5
+    python weight_sweep.py --policy fair --set question=1.0 --set research=3.0
+    python weight_sweep.py --policy fair --samples 2000 --columns question research --output sweep.json
+"""
+
+import argparse
+import json
+import logging
+import time
+from pathlib import Path
+from typing import Dict, List
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from services.legislative_corpus import get_corpus
+from services.scoring_kernel import ACTIVITY_COLUMNS, ActivityTable, ScoringPolicy
+from services.weight_sweep import WeightSweep, candidates_from_overrides, perturb_weights
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+DATA_DIR = Path(__file__).parent / "data"
+
+
+def load_static_mps() -> List[dict]:
+    """mps_static.json'daki vekilleri düz liste olarak yükle."""
+    return get_corpus(DATA_DIR).static_mps
+
+
+def build_metrics_table() -> ActivityTable:
+    """update_all_mp_metrics formülü için aktivite tablosu."""
+    import update_all_mp_metrics as metrics
+
+    first_sig, support_sig = metrics.load_law_proposal_counts()
+    questions = metrics.load_question_counts()
+    research = metrics.load_research_counts()
+
+    # Korpus sayımlarıyla aynı anahtarlar (aynı isimli vekiller seçim çevresiyle ayrılır)
+    resolver = get_corpus(DATA_DIR).resolver
+    parties = {resolver.resolve_record(mp).key: mp.get('party', 'Bağımsız') for mp in load_static_mps()}
+    names = sorted(set(first_sig) | set(support_sig) | set(questions) | set(research) | set(parties))
+
+    return ActivityTable(
+        names,
+        parties=[parties.get(name, 'Bilinmiyor') for name in names],
+        first_signature=first_sig,
+        support_signature=support_sig,
+        question=questions,
+        research=research,
+        news=metrics.DEFAULT_NEWS_IMPACT,
+    )
+
+
+def build_fair_table() -> ActivityTable:
+    """fair_scoring formülü için aktivite tablosu."""
+    from fair_scoring import (
+        build_fair_activity_table, load_commission_memberships, load_proposals_by_mp,
+        load_questions_by_mp, load_research_by_mp
+    )
+
+    return build_fair_activity_table(
+        load_static_mps(),
+        load_proposals_by_mp(DATA_DIR / "law_proposals_28.json"),
+        load_questions_by_mp(DATA_DIR / "written_questions_28.json"),
+        load_research_by_mp(DATA_DIR / "research_proposals_28.json"),
+        load_commission_memberships(DATA_DIR / "commission_members.json"),
+    )
+
+
+def get_policy(name: str) -> ScoringPolicy:
+    """Politika adına göre mevcut politikayı döndür."""
+    if name == 'fair':
+        from fair_scoring import FAIR_POLICY
+        return FAIR_POLICY
+
+    from update_all_mp_metrics import METRICS_POLICY
+    return METRICS_POLICY
+
+
+def parse_override(text: str) -> Dict[str, float]:
+    """'question=1.5,research=3' biçimindeki ağırlık setini çöz."""
+    override = {}
+    for part in text.split(','):
+        column, value = part.split('=')
+        column = column.strip()
+        if column not in ACTIVITY_COLUMNS:
+            raise argparse.ArgumentTypeError(f"Bilinmeyen sütun: {column} ({', '.join(ACTIVITY_COLUMNS)})")
+        override[column] = float(value)
+    return override
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Puanlama ağırlıkları what-if taraması')
+    parser.add_argument('--policy', choices=['metrics', 'fair'], default='metrics')
+    parser.add_argument('--samples', type=int, default=1000, help='Rastgele aday sayısı')
+    parser.add_argument('--scale', type=float, default=0.5, help='Ağırlık değişim oranı (0.5 = ±%%50)')
+    parser.add_argument('--columns', nargs='+', choices=ACTIVITY_COLUMNS, help='Sadece bu ağırlıkları değiştir')
+    parser.add_argument('--set', dest='overrides', action='append', type=parse_override, default=[],
+                        help='Belirli aday (örn: question=1.0,research=3.0), tekrarlanabilir')
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--top', type=int, default=10, help='Raporlanacak aday sayısı')
+    parser.add_argument('--sort-by', choices=['spearman', 'churn'], default='spearman')
+    parser.add_argument('--output', type=str, default=None, help='JSON rapor dosyası')
+    args = parser.parse_args()
+
+    logger.info("📥 Aktivite tablosu oluşturuluyor...")
+    table = build_fair_table() if args.policy == 'fair' else build_metrics_table()
+    policy = get_policy(args.policy)
+
+    if args.overrides:
+        candidates = candidates_from_overrides(policy, args.overrides)
+    else:
+        candidates = perturb_weights(policy, args.samples, args.scale, args.columns, args.seed)
+
+    start = time.perf_counter()
+    report = WeightSweep(table, policy).run(candidates)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    logger.info(f"⚡ {len(candidates)} aday × {len(table)} vekil: {elapsed_ms:.1f} ms")
+
+    rows = report.rows(limit=args.top, sort_by=args.sort_by)
+
+    print(f"\n📊 Temel parti ortalamaları ({policy.name}):")
+    for party, mean in zip(report.parties, report.baseline_party_means):
+        print(f"   {party}: {mean:.2f}")
+
+    print(f"\n🔬 Adaylar ({args.sort_by} sırasına göre ilk {len(rows)}):")
+    print("-" * 60)
+    for row in rows:
+        print(f"  #{row['candidate']}: spearman={row['spearman']:.4f}, "
+              f"top{report.top_k} churn={row[f'top{report.top_k}_churn']}")
+        for group, weights in row['weights'].items():
+            print(f"     {group}: {weights}")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({
+                'policy': policy.name,
+                'mp_count': len(table),
+                'candidate_count': len(candidates),
+                'elapsed_ms': round(elapsed_ms, 2),
+                'baseline_party_means': dict(zip(report.parties, report.baseline_party_means.round(2).tolist())),
+                'candidates': report.rows(sort_by=args.sort_by),
+            }, f, ensure_ascii=False, indent=2)
+        logger.info(f"💾 Rapor kaydedildi: {args.output}")
+
+
+if __name__ == "__main__":
+    main()